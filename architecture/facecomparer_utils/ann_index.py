@@ -0,0 +1,169 @@
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_NPROBE = int(os.getenv("FACE_ANN_NPROBE", "8"))
+_KMEANS_ITERATIONS = 12
+_TRAINING_SAMPLES_PER_LIST = 64
+
+
+def _squared_distances(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    return (
+        np.einsum("ij,ij->i", vectors, vectors)[:, None]
+        - 2.0 * vectors @ centroids.T
+        + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+    )
+
+
+def _kmeans(vectors: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    sample_size = min(vectors.shape[0], nlist * _TRAINING_SAMPLES_PER_LIST)
+    sample = vectors[rng.choice(vectors.shape[0], size=sample_size, replace=False)]
+    centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = np.argmin(_squared_distances(sample, centroids), axis=1)
+        counts = np.bincount(assignments, minlength=nlist)
+        sums = np.stack(
+            [np.bincount(assignments, weights=sample[:, d], minlength=nlist) for d in range(sample.shape[1])],
+            axis=1,
+        )
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+        # Re-seed empty lists from random samples so every list stays usable.
+        if not filled.all():
+            centroids[~filled] = sample[rng.choice(sample_size, size=int((~filled).sum()))]
+    return centroids
+
+
+class IVFIndex:
+    """Inverted-file index over face encodings, searched exactly inside the probed lists.
+
+    Vectors are kept grouped by their coarse centroid so a query only scans
+    the ``nprobe`` closest lists instead of the whole gallery.
+    """
+
+    def __init__(self, dim: int = 128, nprobe: int = DEFAULT_NPROBE):
+        self.dim = dim
+        self.nprobe = nprobe
+        self.centroids = np.empty((0, dim), dtype=np.float64)
+        self.vectors = np.empty((0, dim), dtype=np.float64)
+        self.ids = np.empty((0,), dtype=str)
+        self.assignments = np.empty((0,), dtype=np.int64)
+        self.offsets = np.zeros((1,), dtype=np.int64)
+        self.trained_size = 0
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    @property
+    def nlist(self) -> int:
+        return int(self.centroids.shape[0])
+
+    def needs_retrain(self) -> bool:
+        """Lists drift once the gallery has doubled or halved since training."""
+        size = len(self)
+        return self.nlist == 0 or size > 2 * self.trained_size or size * 2 < self.trained_size
+
+    def train(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        vectors = np.asarray(vectors, dtype=np.float64).reshape(-1, self.dim)
+        nlist = max(1, min(int(2 * np.sqrt(vectors.shape[0])), vectors.shape[0]))
+        self.centroids = _kmeans(vectors, nlist) if vectors.shape[0] else np.empty((0, self.dim))
+        self.vectors = np.empty((0, self.dim), dtype=np.float64)
+        self.ids = np.empty((0,), dtype=str)
+        self.assignments = np.empty((0,), dtype=np.int64)
+        self.trained_size = vectors.shape[0]
+        self.add(ids, vectors)
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        vectors = np.asarray(vectors, dtype=np.float64).reshape(-1, self.dim)
+        if vectors.shape[0] == 0:
+            return
+        if self.nlist == 0:
+            raise RuntimeError("IVFIndex must be trained before adding vectors")
+        assignments = np.argmin(_squared_distances(vectors, self.centroids), axis=1)
+        self._set(
+            np.concatenate([self.ids, np.asarray(ids, dtype=str)]),
+            np.vstack([self.vectors, vectors]),
+            np.concatenate([self.assignments, assignments]),
+        )
+
+    def remove(self, ids: Iterable[str]) -> None:
+        targets = np.asarray(list(ids), dtype=str)
+        if targets.size == 0 or len(self) == 0:
+            return
+        keep = ~np.isin(self.ids, targets)
+        self._set(self.ids[keep], self.vectors[keep], self.assignments[keep])
+
+    def _set(self, ids: np.ndarray, vectors: np.ndarray, assignments: np.ndarray) -> None:
+        order = np.argsort(assignments, kind="stable")
+        self.ids = ids[order]
+        self.vectors = vectors[order]
+        self.assignments = assignments[order]
+        self.offsets = np.searchsorted(self.assignments, np.arange(self.nlist + 1))
+
+    def search(self, probe: np.ndarray, top_k: Optional[int] = 1,
+               nprobe: Optional[int] = None) -> Tuple[List[str], np.ndarray]:
+        """Return the ids and distances of the closest vectors found in the probed lists."""
+        if len(self) == 0:
+            return [], np.empty((0,), dtype=np.float64)
+
+        probe = np.asarray(probe, dtype=np.float64).reshape(1, self.dim)
+        lists_to_scan = min(nprobe or self.nprobe, self.nlist)
+        centroid_distances = _squared_distances(probe, self.centroids)[0]
+        probed = np.argpartition(centroid_distances, lists_to_scan - 1)[:lists_to_scan]
+        rows = np.concatenate([np.arange(self.offsets[l], self.offsets[l + 1]) for l in probed])
+        if rows.size == 0:
+            return [], np.empty((0,), dtype=np.float64)
+
+        distances = np.linalg.norm(self.vectors[rows] - probe, axis=1)
+        k = rows.size if top_k is None else min(int(top_k), rows.size)
+        best = np.argpartition(distances, k - 1)[:k] if k < rows.size else np.arange(rows.size)
+        best = best[np.argsort(distances[best], kind="stable")]
+        return self.ids[rows[best]].tolist(), distances[best]
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A temp file per writer, so concurrent saves of the same system never interleave before the rename.
+        partial = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.stem + ".", suffix=".tmp", delete=False) as handle:
+                partial = Path(handle.name)
+                np.savez(
+                    handle,
+                    centroids=self.centroids,
+                    vectors=self.vectors,
+                    ids=self.ids,
+                    assignments=self.assignments,
+                    trained_size=np.asarray(self.trained_size),
+                    nprobe=np.asarray(self.nprobe),
+                )
+            os.replace(partial, path)
+        except BaseException:
+            if partial is not None:
+                partial.unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["IVFIndex"]:
+        if not path.is_file():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                index = cls(dim=int(data["centroids"].shape[1]), nprobe=int(data["nprobe"]))
+                index.centroids = data["centroids"]
+                index.trained_size = int(data["trained_size"])
+                index._set(data["ids"], data["vectors"], data["assignments"])
+        except (OSError, KeyError, ValueError, IndexError, EOFError, zipfile.BadZipFile) as exc:
+            # Drop a truncated or corrupt index so the caller rebuilds it from the roster.
+            print(f"Discarding unreadable face index {path}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+        return index
+
+
+__all__ = ["DEFAULT_NPROBE", "IVFIndex"]
@@ -0,0 +1,73 @@
+"""Recall-vs-latency benchmark of the IVF face index against the exact gallery scan.
+
+Run from the repository root:
+
+    python -m architecture.facecomparer_utils.benchmark --sizes 1000 5000 20000
+
+The gallery is synthetic (clustered 128-d vectors with per-capture noise, close
+to how face encodings spread), so numbers are meant for picking
+FACE_ANN_MIN_SIZE and FACE_ANN_NPROBE, not for judging recognition accuracy.
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from .ann_index import IVFIndex
+from .matcher import match_embedding
+
+
+def _synthetic_gallery(size: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    groups = max(1, size // 50)
+    centres = rng.normal(0.0, 0.35, size=(groups, dim))
+    members = centres[rng.integers(0, groups, size=size)]
+    return members + rng.normal(0.0, 0.12, size=(size, dim))
+
+
+def _time_per_query(fn, queries: np.ndarray) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries) * 1000.0
+
+
+def run(sizes: List[int], nprobes: List[int], queries: int, top_k: int, dim: int = 128, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    print(f"{'size':>8} {'method':>12} {'ms/query':>10} {'recall@' + str(top_k):>10} {'build s':>8}")
+    for size in sizes:
+        gallery = _synthetic_gallery(size, dim, rng)
+        ids = [str(i) for i in range(size)]
+        probes = gallery[rng.integers(0, size, size=queries)] + rng.normal(0.0, 0.05, size=(queries, dim))
+
+        exact = [
+            {str(result["index"]) for result in match_embedding(probe, gallery, top_k=top_k)}
+            for probe in probes
+        ]
+        exact_ms = _time_per_query(lambda probe: match_embedding(probe, gallery, top_k=top_k), probes)
+        print(f"{size:>8} {'exact':>12} {exact_ms:>10.3f} {1.0:>10.3f} {0.0:>8.2f}")
+
+        start = time.perf_counter()
+        index = IVFIndex(dim=dim)
+        index.train(ids, gallery)
+        build_s = time.perf_counter() - start
+
+        for nprobe in nprobes:
+            found = [set(index.search(probe, top_k=top_k, nprobe=nprobe)[0]) for probe in probes]
+            recall = float(np.mean([len(f & e) / len(e) for f, e in zip(found, exact)]))
+            ivf_ms = _time_per_query(lambda probe: index.search(probe, top_k=top_k, nprobe=nprobe), probes)
+            print(f"{size:>8} {'ivf/' + str(nprobe):>12} {ivf_ms:>10.3f} {recall:>10.3f} {build_s:>8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 10000, 50000])
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.nprobe, args.queries, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
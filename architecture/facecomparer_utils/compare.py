@@ -1,20 +1,27 @@
-import requests
 import base64
-from face_comparer import FaceComparer
+import numpy as np
 import pyperclip
+from .embedding_cache import face_embedding_cache
+from .matcher import DEFAULT_MATCH_THRESHOLD, distance_to_confidence, face_distances
+from ..utils.b64_to_image import bytes_to_image
+from ..utils.frame_prep import box_iou
+from ..utils.http_client import fetch_bytes
+from ..utils.model_registry import registry
 
 def image_to_base64(url):
-    response = requests.get(url)
-    if response.status_code == 200:
-        base64_str = base64.b64encode(response.content).decode('utf-8')
-        return base64_str
-    else:
-        raise Exception(f"Failed to fetch image: {response.status_code}")
+    return base64.b64encode(fetch_bytes(url)).decode('utf-8')
 
 # Usage example:
 # base64_string = image_to_base64('https://vwljsfmrhsltzgifmibj.supabase.co/storage/v1/object/public/user_data_bucket/public/dr.sharjeel.6@gmail.com/face.jpg')
 # print(base64_string)
-comparer = FaceComparer()
+def _load_face_models():
+    # face_recognition builds its dlib detectors at import, so defer it to first use.
+    import face_recognition
+    from face_comparer import FaceComparer
+    return face_recognition, FaceComparer()
+
+
+registry.register("face", _load_face_models)
 # padded_base64 = "iVBORw0KGgoAAAANSUhEUgAAAOEAAADhCAYAAAA+s9J6AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAgAElEQVR42sy9aazt633X93nG/7zW2vucc+/1ENuZKM3QTGCTpLk2CapQh1dVCkWoEqgvI6CI9l2FaXhRiZYAIc2ckKAkQo1oRFOKShqFkBqMYzuO7dgm8XRt33uGffZe039+hr54nr2uLbUNrSzKkY7Ovcd37b32fz2/5/f7fScLIPJl/qWUIsb0ZZVUNG3NX/ov/zzf933fR1tvAfDxhk+/9r/xu5/8R6zLU9ZlQWsYxiNN3aGVQSmIcmEcRvaHE8ELbm5uefTCAx4+eIAxkmWZEUIAAq00z5494+GjR0ghUEqxrCtSCFa38vz5c+5u9+x2O1588SWUklhrWNb18t5PpxO73RUheJQqkFICnnleeO3xazx98oQXXnyRN7/pzSglcd6xLAvWWkAyjhNXuytCWHHe4b1HKY33gSePnzIMPW9805to2xalRH5OAiEE59NACIHtriNEx/l0RkSw1rKsnmfPnuKcp6wsL774AkpphEivVUpxOBxYloXdbosQAu88MUSkVJxOPZ/85Kdo25o3vekNhOjp+566LvE+YrTmc597lYcPr+k2HSF4QvBobXAusC6OV199laIo2F1tsdbw2c9+iqatIQa0NgzDwsOHj7DWIkR6njFEQoDHj5/S9z2PHj1I708KpmnAB0dYF7puw+l4ZrPpmKYZ5x1aaWKUhBDpx4Vh6NnuOq6udmitkFIyzyPTPKCk4u7ugNaKtq0JIVIUHUSJWz3Pnz9nmicePLii6xq0bjGqQ4gdb3jhW/jar/n3qOybQGic8/wvv/yP+a/+0l/ls5/7BN6/fj5CCHzZ6wV495f7i94fDK01b3nLW/jv//p/y5/9s/85VdkhGFn8Z/jtj/19Pvyxf0iMNxgzI1VE6/QAjDVoYwg4IoFhHFgXR9dtqauK7XbD+XRiXWakBClzMUpJ3/dUZUVRFBhjIML5fGYYB8qyRGvDZrNhGAbWdUUpjZLp0lBKsSwLZVlChEAEIqfDAedW6qrCGENT10zTiHMr2miWZUYpgxSGZXFUVYXza/57xfl8RiBom46qrJBSMQ4jPni01gQPUqr0p1KY0hCiJzqPUorT6YSUirqqaZqGcRqQUqC1QWsN3D+DhXVdqes6fQYIpmnieDxhbUHdVOy2G9Z1YRgGYoyUZYH3Dm0U85xev7vaESMoJZnnidPpRNtuqOua7XbL+XzCB8cwDEghiTGkn2lcqKqKuq6RUgGCoR/p+x4hoK4rHjx4wDiOrKtDqnTBxeCwtmaZF4qiBAQxpgN/Op3p+4Gm7VBKUVcV0zjhfUApBURiCChlmKYZAG1UagRBMM+OZXXsrraUlaWqCsZxQkmRLnlGjucvsD++Slk3FGaLlh1f8zX/Fi+/8zv46Ec/zJMnTwghIIS4NJd/I4swdYz0Z4wRpRXveuc7+cmf+gm++7u/Cyk1Qjie3X2QD374F3jt5p+g5JF1mhnHI0JqpDB4D9aWID2LmzmfT2itudpdUVU1y7JQ1xVd26KkZBh6xmFESYU2huc3t1RVjVKKYejp+x6Apm2QUjDPM8ba1ImkZF5m1nVFawVIvAuUVQnAOE30/Zm2aXLnUhyPR7TWbLdbBIJ+6AFBWdZobViWmaqqWJaZvj8TY6RtO+qqRqLwwdO1HdZYVrcwjiPBp0PsfQAihbUgIne3dyAETV2jtEZKiQ8BpQW7qx3B+/zzCawtcM6xritVVRNC4Hg8EkJg0zVEAt45tNZ0XYdUktPpSIxQFAXWWnyIjMNE27b05xP7/R6lJNvNDmMM8zxTliVVVVIUlqEfuLs7UlU11pREFE3TYK3Be8/5fKYsCnbbNP0sy8J2u6GqKla3cjqdGMYegUBKxeocxlpEnlxCDHSbDW3bUtcNy7LSdW26JIkcj0fmeUEKjciXUFEUCCQhwLrMdF1D3RZIqXCrp21rrNUs60zf9/gQMIXncHyFz3/+43TdQ7rmJaTSvPjSNf/Bf/gfMY4TH/3IR1mW+TK1CCG/bEPkl6UI78eh9M+KorD8iT/5H/ODf+tv8Na3fiVSQuCO1x6/l3/6vp/mMHwMYUa01GhtCHjGcUIIlVt/YFgWfIDdZoNWBiEkQsA0DRhjkEpSFBZrS4RQ7PdHQogsi6dtO8ZxRClF27YgQIiIlIFpni+jklSSqilwfqUfRgQa59I4/fz5DQjYbjdolUYfIQTruiKlpCgKZP76fT8wjStaa87nM0op+r6nKAratkNKhZIK51ZCCFhrMMZg8p/eO9bFEWNMv0OgP58pipKmqdHGoJQmElEa3LpSVRVlWWJtyTCkzhIDzPNECB63RrrNBqlg9RNVXbEuLk0OSgARpSRt23B3dyAGQQyKoZ/x3rEsM9vdjrIoMUoRg2ecR4rSIlX6zNum4bg/MfYzCIFQhrIoGYYzQgi22y1Kyss6sKwLTduglEApSdPULPPKs5vnrM4zzx4fHOe+RxvF9qpDKsU0T3k0DWlK0gprLWVZ4n1gmmaEkCzzgpCKYRhpmoarzQaZCyaEiHcRpSVKp6K3RckyBeYpIIRnmfe8+urvMq8nHjx4I1puqauWd77zZWypeP/738+yOIRIXf7fqCK8735SSsqy4s//+T/H93//93P94BqBY3Vf4F9++n/mE5/5Zcb109hCIkUJOLReUVJTVTXOBZ4+e0aMkW6bxh8lBEJAjBEhBOM4YozJnQtiDCiZiuRwOHJzc4eSgt1uS9Ok7pf2MpmKe5ioqgprC+Z5RkqBVBIlNeOw8Pi1JwgJV1dbuk2HlBKVu3yMMY9mLUVRAGCMoShSMez3e26e39C1LVfXaW+JkbyzRtw6sywzZZk6XRq7Yh6TLc9unnN3t6frWra7TX62aTSLMeK9x5g0Mmul0Lk7VlUNwJPHT7nb39K2LdcPHiKlwLmVfjjn3c5jtMZaexlfq6qiqVtA87lXXuN4OlEUmusH12m0UxqjdZosxiFfCDI9FyFZV0dZ1UzTyuMnN0jhubrast3m958+PIw19H3PpuuQMnUT7z1CCKQUrIvg5tmBuq549MLD3JlXfFhRSiJE2v+sLS+4g5SSpmlyl154/nxP07S8+MJLVFWDkuC9Z1oWEGncNkalsxBBCkXVWIwx7G8nnt8eMXZkXl/jdL7havMIaxqMMrzj7e/gq77qq3jPe/45fT980WcT/83phEJarq52fP/3/2X+i7/wF6nrjsiZfvkEv/nhn+OVz/0fKDsS/IoxFUpBECsuLkhpmfqZ1TmKpqFqGuZ5QgiBUTJ3LolSmnl21FWNVhLnVtZ1ZV5m+qEnxkhRGOq6YpomvF+RSrKsM8ZoQORxrUr/HgU+RNbVcTyesbagrGqMsYToM8AEShtW5yFGnj17ymazwVqLVgpydxzGM8aoy9de1znvbelDjzFcLs6yqkFpUBJkAneGaUFpS7vZEiX44JFaE30gxjTKLcuClOlWl1JhjCFGmKY0Whmj0+UQJToXToxpfI0RlnmFvPs65/L4VrLMjmVZKStLXVXc3u0pS5P2xeDRSiCkYBgnrLUoJfHes8wLt7e3rOuC9xGpDC88esC8TCgl08/t3eXzO53ONE2DNoZ1TVNB2lmPxCBp2oq2bQghvUYrg9YGYwqkkJd9XWtDDKC1Zhwn9vs9ZVUilKJpEqhkjEFIjY8BbdPevy6eqiyRMgF5IQhWd2acemIwtE1HDI516fHhjleffIyma2mahyix5eu+7uv41m/9Jt73vg9w+/w27aP/fxbh/Q54D8K86c1v5G//7b/Bn/yTfwKtBUKO3B5+i3/63p/k9u6jSAaklazriC0iUkmMNox9YBx6Sluy213hQqBrO8oy7TjjcEYKQQgRYwzTONE0NUpLnHP5ECQwYrvZcjqd2G631HWN847z+QykbiNE2glTh5Qsq2N1K0opNpstu6trYhQ8fPgApQR93zOOI2VZJhBHSqZposh7S4iRw+HAuq559GxZ15WmaYkxZAAi/W9CCNZlJcZIXTcIJVmduwAkTdNhTIFSmu1mQ4yeYRgQMVxGr/vbP4RwmT7O5x4pFV3XIYTAWktdNXjvORwPrOtMiI5pmpFCYbS+HMJ5ntNz1Za6bgEoCss8p3FwXVPRVmVBCIFzP3zJFHLYH1iXlbZtqOqSeVm42u0oSsu6LsxzAqaUFKyrz+81jfLrunI8HvI0InnhxQdoo3j46AFKKpZ5ZZkdVdlBTN/PuwgiFV8Ikb7vcfd77mbDOI1c7x6glOR8PjOOI0VZ5IlEEKPEFgZExPvAMIxEoG07ilIhhKftCmBlOB/o++c8ff5ZuqZl270ElLzlLW/jO/7db+ejv/MRPvvZVy7n/74e/rUV4T3yef/Pf/Df/lp++qd+hD/63S+jpEWInme3v84HP/p3OR5fYRkHnFsxJhL8hNUKv3qO+4GyrGjbGq3BGEVwjsJqlNVoJams4XA4EgIUtmYYFpRSTPPI3e1z2rZlt9shpcQYzTTPdG06kG3bYAvLfr/Po6NlWZa0PywJvey6lm7TIqVESsM4zxS1RWpBXaSu2PdpxzHGECJoY5nmif3hlq7bUNcVIXhijEzjkMcnqKuKGAL7uz0CiVSGECTGWk7jyOIcTdtRNxVSCXwIIAS20BitEsARAtO6YKRN4IIL9P2Z4/FIVVXpAOUiX3IHitFTNy11XdP3J4SEGARSKKSQ9MOZu7s9xliurx5QlkUCMtaZsjQs64I1ht3VhmkaCd4n9HFe0Nqwro7D8YAg0OZxEAHDOLLdbLDGUJQWay1jPwISYwq8j+nvxpFhGNJnd7VBINA6HeKua1FKp4tKKM7nESEkUki8D5mWSIDWbrejbdtUiEazrAt13aCNRmlNxHM4prOT9v2A0Zq+71nXlbZpqMsaKSzOr4DDGIctDHXVscyB/d1Tntz8DoUN7DZvAtHyhjc84ru/55188lOf5NOf+gwxJmT/fqf/1zqOCiH4xm/8Rn7sx3+Ut7/j2wBHjHu+8Nqv8cEP/xzz+jnWZUQqjzaBaRrpzzPRJ2Sp6zqMFih5vzfBMCQqIYrcZWNIN28UTNPC3d2eEB1SwGaTDmAIAeccUqbuWJZVKhprMUZTljXeRaZx5nhIcL8AttstUso8MhpCFJxOZ+q2SjtbCHnErBnHkXlZcudzdF3DbrdNY0/usFprvPdYay5wdl1XaJVQ3+Op53QcUcpQNg1NXSGkuOxIzq1EAkVh0vgK+WcwzKPjeDwxTRPOLZRVyYMHD9IBlfLSeQFWt1JXDVIIqspSFiW3t0fWxUMEIeDho0e0bYtW+tJd52VAKUEInmHoqes6obpC059nTrnraq2pmwqjNfM0I9JUzThPbDYtMc/dr4+OkWfPn3M6ndPhb1t2meu750pDCHjvaduWSEh7ulZUZeqafT8z9GO+DG0CzHR6L+u6ApFlXWnqhhBDxicK6rrGO8H5NHI6DUghaJqKpkl7tCABN86vxOgxhcHHfCakRBnLuNzwyuc+wXk48+Y3fy1SarrtA15++WU+/7kv8IlPfIIQwv/n0fRfvYcK0qeHBNKi/Iff/i38ws//HH/o274NJSDGEx/47f+RD37454nxhJGWpjbEOCJYWWfHPM6sy4w1BqMUIqEOBO+JPnWTdV1Z54no3AW6dz4QY8CHhXWdGcaBGFNh3y/4FyJVJBQscWUy0Rfa4lzgfB5YV4/OxRNiYPUrQqbbuCw1iPRAZ78w+4UoBXXXAgLvAlrrTEnYC2GvVNrRpJQJKRRcCPymSRD7PblubYFWqXukvU0QQgKZ1jUR1TE/8/vbVRrNGgIhBsqq+BIuNhU8GSAyeXQVCBlxzuN8oG0bpnHMdEaVxA3aXMZardMOZ4ykLA3znEZp7z1Spve4Lp518RdACCHwMbC6FRdWlBQYI9FapuKLEENCzAWSdfWZP0zHKU0PIv8G59L+671nGM4QPaubUelwsTpHWTZ07RZri/R1hfwSrjQSMnAkEBK0NlhT5J8hUBQVUia02dqS1QVCiAQRcDEyrZE1nzepoSolwUX68Tkf+Ze/zHv+xU8xTE8QIfLGl17iR37kR/nTf/o/RWtzXyT595e7EwoQUiKFSn8qxXd917fzYz/xQ/yBr/2a9ICWZ7zvgz/NBz7yi0h5xq0LQqROsj/sCT6y2WyxVlNVZYbhB4Tgi9BPyZKBE51vyPu9L8aQEcPA9fUVy7LgFkdRlBn5TL/STtakOV0I1tXR9z3D0BOCp6oL2qZmmse06Fd1GtNk+iCnZaIobe5waYQ59xNSarbdBq00ZVkyTSPzvGQgJBWQMYZxmqjrmtUtKKkJPmT6RdK0DbYoKKuC89jjg8MYc9n10o7mL+OllJJ5mjifz1hrqeqSpi6RAp4/v6GuEzcZQkQKSQgCRCraoizyJTWxv9tT1zVVVbLpNszzzM3NDYUtLkUMkmlM6KNAcTye0DrvhT7Sti22tLRtzTxPDGOfdi3S2RBC4V2kKKoLcJRogxUibLYdRWm4vr7K+9pEWVrWdWWapow+C5qmQUmFkIoQ4HQ8IYSk2zQUhaXrGk6nA87dP7tE3YQYcM7TNM1lKgohcj6NOOepq5KyKihKy/ncszqP0RYpY1oFAB/BZhTXKsOSx14pFNttQ9MGxumOJ08e83D3JspqR1lYvuudf4TzaeCDH/h4Ei6ocLkYv6xFmD6sNMZ9z/e8i5/8yR/hbV/5ZoRYmd3neP8Hfp7f+sgvc3v3KtvtFq0D/Xjg9u4Z0ziz3aYCnKYxgSbO0TQ1p9ORaZowxmKLgmVdLx2l7wfGMf33bdtm1HGlqkratqOqWtbVsboFbQwRgfOeqqqJEcZx4pylWUVpmZeF4D1VXdF1DWVV5sNmAIVQCQUtyxLnPf15YllWdtsryrJCCoFzS5ZGNRRFwfGYxlulFEppluV1IGaaZpzz7HY7qrpJ3XWeqduKuqlZlpnj8ZQ4u9wh0hhXEEOkz0qb7XaLEiSyOETqukTrdMj7vicEKIsqIZRSEaIHBHd3t2itL5eS8w5ri4xwps5wOh0pygqjS1bnscayrCuHw55nz264vt6x3W4JRMZpoK5LbGEpinSYL+CL0kzjynazQwjBMPScTieurx/QdR1KS1Y3ZTWNRBudgKc8tgshiSHStR2rcyzzQn/uadvuQv7P80RVpZ/dGMPxeEivzauRD4GyrHBuZRon5snRdRuq0hBj4iCrusQag5CS0/n0OtDjBdFHrNGcTgcIEbc6uk2F0gofIlpa6qpkXQcO+6c8eLjF2paiqHnXu76Hc7/nQx/6ECEkNU4I8cvdCQ1KKv74H/9j/PAP/y3e8NKbMnn9Cu/7wM/y2x//n9B2YplX6qplXk4o43jw4GFSO6wZUJmmjFSm7tF1LVVVM88L87ykkSTAuT8jhGS3215u6/tuYYzJhL1KXKLSDMOEWyPztFI3LeM4J9Cna9AmjQjeJ+BDa8O8jIkjaxqEkJz7CR9hdYF1DYzDhLUmFb+2aTQk4pYx71olUkqstQmQmZKaYhwXiJJpnmm7DWVVIZXKiCQ4t2LrAkgqmcImsGie5wQaRYFznnVdaJqGqqqSAgmByxdU4grTc+i6jru7A8FzGR3HMe1uu92OskzvUymJcx6IicooC6q6zmBVYFkc07QSEYzTwDxPFEXJiy8+QirFss7M85x3cM+yzBRFRYwkzeq84n2Suo1D2v12u13SkUqBEJFxHPLImCRpm80mf3YDMSpiiChlGDMu0DQ1IXqkSqDMPM9Zl5rG/bZtgCRLXGbHuqZxdp5HqrqibTaZUM87Z3BYa4A0fhdFgXeRoR9Z5hUlVZpwxpFHD68TVRWGtO8OM1IpqrpAyplpfcb+8Bpt+4i6eAElK77jO9+BUpL3vvdfXEbrfxVC//ctQiEERIkQmj/6ru/ix37sf+BNb3wDUkbG+dN84Ld/jlde/VWiOGGs4PnNgYjg4cOOuimQssjIlr9oGo2xFwXKvYC5LCu893zh1cc457m+3lIURdYlyssOdC+duie6ldYolWF5F3j11SdUZcP11cOs5BEIAggwJoE4RVFwOh7Z7rYIpSiKGluUTNPEa689pmk6rq+u0UZexop70n5dJshoWNpDFGVRoZXlfOp5+vT5RWZVFtXlM1AZVl/WhbotLqBACCErXyzH44mbmzuurq/pNm0SIQgBEbRSX1REimmZiRGqsqIsSrSy3N3ecT6dKauCzabDGINzLknwxrQ7a60vHGIIASk0XbvD+8gXPv8q3nuur64oCss0TTRNhVQQwso8u9xFBWVZYozF58ljXQI3z/ZAYHe1TeOrtQQfMnIYGMb+QhVJmbStRVFgTQlB8fkvPMbagqurK6w1+bOVGK0R+QzdX3r3I7zWKtExhzNPnj6nqio2myZzqOKy7jjniJmqep3sV2ijsbbg7vbE89s7ttuWpk1iDq0NSkdEvlzHcaTtSoSMIEf66TlPb15ju31EXe6wtuDt7/g2+mHgN9/3EbxzCBEvZ/f/dRHeL/1KKYQQvOudL/PjP/6DvPENb0YgOI+/y/s/9Hd4dvt+lF2Ypxm3BuqqZrvp8HFMt6ndJJ7ILbkTuAROmCKjY4p5nun74eJmaJqKdZ0vBRhCuMji1tVlxCJRBkJL1hA4nU8EnyDozWZD36d9U6kMeLg1L+dQ10mDqrWhqEoW5xinJYMoG8qyZJxGhEgcnVQqC5UjMThi8Lh8IIwxzNPK+XxGqqTgKMuSZVkwRmcQI71+npPA2FbpYrq/0YdhvNzy2+0WBEmqpQ1aSCQSlGL1HiRIrXHB40LmEkMi4quyYrPZME59/v4Wn8n+29vnGfQIlGVxOYiIdMBC8FRVkV9/Zl0XhEgdw1iDQLIs7lJE91zhsqSf3a2Osqq4vt6yLitKJ+6yKJITRaq0XtR1jVYmAzFpbD4ej0l8oAvqusnkf1oLRL7o7iWD91/v/lAvy8wwjGhtKcoSrTXTdE58ZqZOhJQ471ldEte/DuJE+nlgmGaM0my6DqJnniaMKTDWsiwOicrOjjSdgERgCEQOp8e89tqnub56ka55CaNb3v72d3DuT/zWhz5EjOH3pS/+H4vwHjl7+9v/MD/+k3+Tr3zbVwGRYf49fvODP8OrT3+NcbnlfJqpypq6KSkKQ1FW1I1Je1U/I/NtlGRXBmvs5Xucz2emKY2OdZUsKE3TsLtKav/D4cA0TkiVuCLn0uG3uZv248A0zXRdR2kV0zSw2WyoqoJpGhnGHqUV4zBRFA3eJWJciITCHvsTMULbbqjKCucCu6sdRmvGoc/jr807W2SdJ+Q9ZxhCdkhINttEVyzLyoMH1yidRu95nrFFcaEvQowYW2aucskOg6ThTBpTTdu1WWB9JhBR1iBksiapjOy51eG9wy0zTZ2UJgk8A6mTlrc/J34z+EiMkhgExhQUtkgazXPPNM20TUfXtYQQqOs6AybLBdCqqyQkmKbpMtrGmGih8/lM2zbZhTFRN3U+6EnI8Dr4o5inOaPKRV4/JkIIdF1HXXd4v7DZtpRl+l7jmIoriaW5XCz3dMDxeCQSabtNduAsbHdpApimiRDu1UE+gW4ZNPPeZ7HAEaEkTdOhhLhoaZVKwvzgFd6nczcvA9badAmIgmXx3O33lJVAlz2vPv4M2/YF2uZFrDV8+3f+IZ4+fcqHPvTh35e++L8twvvO883f/M38zN/5u3zNV7+NGBbO4+/xa+/5EV57+s9ZljvC4ti2G4wV+Diwupmq7LBW5wXesC5rRhCTFMmYRNhOU9IFbjZdkjlpybyMWKuzJrOgqRqCh5APkPeBsqg4nc64EDBVSddVaUQIgf3+jrouIHrKqkAqyTyO9KczZVGzLmvaw9YlWY20ZHt1nW5bKRinnqopkEpQaYORimFeCCGgRbyIsPf7PVFAUTc0m+RKCAKGeaBqSrQ12KokSkE/DvgYUSY5FaQU9Od7pUybyXKftheRkE2l097mXVJ2hJjYNykk6+LoTyfwnhdffCHrQh0xa2S1VZfn6lxgmV9fBZLDY2XI7pLNZoPSqSMnhYmmKEzSpirN/u6AFBJrauZpxmjLPM3Mc0I367rKHV2x35949OgBxrwOBiXVULIaratD62Q5Wtc1XZxlKljvV5xbkVJc7FDJozjl11nWNXkcj8cT3icktK5rRGJLmKcRrRRCkAAcqRn6KWuHFcF7CHA+nUAIqq6hLAuMVrh1STtjoYlAXTf4EDmfz8TocD4J95d5ZlgdUUY29YbSGJQWDOMtz29v2V09pCkfUJia7/yO7+S1x0/56Ec/etEe/75F+MVStBgjX//138CP/tgP8g3f8HVI6RmXV/gH/+gHeN9v/RK2GNi0HVIIxulIFA63OoZxRgqDtgl9M1rn0VPz/ObAOM744Kjrmt3uiqK4lxXFix0loW2pCxPJVpmCcRw57Pd5D6lou02iLWNy/uED5/7Mpt1cVBwhRqxNWsVxnNPtJwRNU9N2NZ4AUaB1RjTnCVsUibtcE//YVAVawrOnT7m9fQ5RsOm2bLdXKJ2KFxmJeMYhoblSgQ8OnTt/8IHD4cjpfMLohO6W1esAldbJ5pR4PJvFz5LCFpRlyTyt7O8OTNNIWZRYoykLcxnPVB5XtTUJLZRpnSiKkqKo6fuR07FnGCeauma36xIVZMxlt3WrQ2XxQPCBZVnyHmmYxoX9/i5TQDW2MJfRLhIgBm7v7thk0ft95y9sgTGW46Fnv0+Hv65LqqrOCK9I+lalLiNo6napi1lbsCwLp9OJ4+GQpHFXO6S8p7XI5LxgWZJ80ZjEY2qlKYqKdQ0c9kdOx56yrGnqmqoukVpnoYHEr54QAsboLAtMdIXWSbywvzsyjTPOBepNmvqkigilCDF1YR9vGfpnXG1fpCgfUFcN3/6d38knf+8VPv7xjwHx/1LiJr8EAo0aKSxKF3zFW97KD//wD/Gt3/KNwMK8fJ73vOcXuXn+MR49rHDznBRJRzAAACAASURBVB//SpCO1XkOx5nTaeZwuuNuf4dbA+O0cDgduTvsUcYwjCNSJXEtQqC0YvUObc0FPFFKZ65JZs3ikdUl3xjKEJUmSEGUAXOvp/Q+H/gKravL61NBq6TCkK9fND6sCCGp65aiLEB4hPTJduU8SiqMUQgRL9aeJEpWaKPohzM+rNl47PE+WZF8cIToCKtDhgjrihEClTlcJdN7SYqYJEL33mXZHHg3EdyCjKCEQKabJBHhSmKURoSAiBEhXif6hVAswbOGwOo8zoVsuYmEmDqMUoqyrDJgoRBCpQQDbYkShJHIfICFTNTIvaooRJ/+e20ZhgG3BpwLhABuTT+z0oF56XFuvGhi04HOFqI8XTkXMtYQidHj/HwpHGvtRXSR9r6A9yvD1OOCu1jPdCFRRiA0SaDOfdEm3lVrhUQgQkRLRWFsEjnIiIuBqDRSaYTUhCiIOnHgMYrkfVWaoCBqSUBRFG1WJ8Ey9EgUUkmiAElEERCcOQ4f47c+9ksc+9/Di5HrRx0/8Df/Gi+//C6UMpnTFl9Sel/UCZPCAAJX1w/4Wz/41/hjf+w78kO745+992d4evN+mm7EmEAMPo83dbq5s8jarSFpIUVgdRN9f+Lx4+es68KDB1dIJbi63qGUYL8/4IO72I3udYn38RgCQZCC/WFPjNA0HTHC9nqHkILj8ZA+TJm4Hi2Sl6zrtkiR6AAhBHf728xLtmidwI8lu8ttUaB0IoaVTM74hMqmsXFeV46HA32fkL2iSFKo/X5PiCF7FcXF1b4ugbKsLx68YRgYhoGiLGnaDcYauralHwamcUTJ19U16+IS+FFUSTKlEiBwOp1om+ayk1S2yH7HhPbFGBON4CJK6lTw+dfxmHjYpDEtaZoSbeSlq91LBKUyLKunuO9CMiGTt7d3zPPCCy+8gBCR7TatDsuyQLavee8RSIZ+yu4GQ1kmfu1Tn/w0VVVxfX1NJHJ9tWUYz/R9EgMUReJEra2TobpM47L3Hu89d3d3F0PzZrNht9syjAP9ecgHWWBsSfQC7+LF1uXWQAyB4/GM0uZiNq6qitP5xOLWhCtkm9Qye2QUGJ2KKxCSqfs80NQtWpm8Nol0wQiJLWwSsERJyFEmRVkyjBOn8x3XV2+h0FvauuId7/gj/MZv/FMeP378RT0wfmkRiozW1XXBX/lv3s2f+lPfmxmWPR//5D/ggx/+Rc79Z7Clx9rkYjdZIjUvuauUHeOUOkZRmovav7CWpqkRgjxjR6oqObSXJRWDUsng25+Hi01nGCbmeaKpG3ZXD/AhMEw9m20i7uumZRjnBBioBJYcjj1N3SYfXRbqbjZdtrAoliUpcoryXhM6sS4r3iVJ07qsWFPgvOfUn/EhATURMEazzHMWnGvKwtKfz/jVo6XGGoNfIk3d4p3jdDyjpGa3u0Jpzeodzq0UeVfWRiVUNwSMLnA+4n2iP+Z5vKQCtF2L1okblBLqqqCuq2Th6vvsMClZ1oAxFqM05/OJdV0T4rrbIrVicQu20Els0NQcjsfkIpEGqW16BrZAiRRLcTqdMsKrsIVhGkfKMo3HSRzeZ8mbobAFfT/w8OELCNRF0XR9fUW32aQsn2WmrAqUlhRZmZKok4gUqfhtUbKuafwEqJtsb4oho+WasqxysS4JZ9AGrS3TuFBWDS47SESUbDZbtM3Gaedomuayc59Op+wukQSfZHFGGdbVczqe8s6c8o6mfsIWyYHSdi1Sm8v50kazeo/SBiEVqxt5vv8843TihQdfiZE7Hj18ga//hj/I//4r/4TD8XwZwwGUEOLdSiWBtLGGP/fnvo+/+Bf/AtpopDjzu5/6h3zy0/8rSt+yrueka0xOVc7nM5vthqIomCfHs6d3OBfQSnM4HLnaXdF12+yxe70o73e6+wyWe+j8fDqzLA6jDX0WEDdNnbqikkSRFviyLC/yuaKoMNYkJHQYmSeXSNc5mX+TmDoQQiD4iHNL4p6KNFrVVYNWir4fcN7hvMe78CXAgTYpyyV6x7omI6xzLvGBVUVhLdM4Q/bsuTUV22azzWhaGu8Wl4TGVZW6l7WGorBJfD3MyR0fI/M0gogpQkOknUQIMs0CVuvLLZoAF0V/HnEhopSmP58vxub7Tod4fUc1RiOAsiqpyhT0dDr3KbdFCs6nY7Z3JYDtbn+bhAAiEdz3OlmtNUabjHSurKtju90xTTN1VXF1lXZma03CDsYxixwE2mi6NiGZh8MxUQGZijgeDzRtw3a3ZZzGTNYn21fXbXCZakigTkbYs9Aj+SRnNtuGomrSzi4EMaOr6XkIhJRUVcU4pMsuUTmRaRgvKqeiMLlhiZxpIy4Cd1tWWJuaSD/0OB8AzWF/whhBu1HM84F5Gnl0/VakrPmKN38lb/vKt/Grv/orDEN/WY2UlPLd95zg937vf8L3/9W/QlXVCDHxyqv/kPd/6GeR4kxVpNticStXuyuMtUzjSIwh6/ZgOM/cPj9kNXvy92ltUEpQfAnsrLM7vbws15vNhhgjX/j8F3B+ZbNJqOG9A1upBL+neAibwAAS2ipFCvcRAZ4+fkZhC66vdpnH0wnKX5fUXccepWGcBtqmw2S6pG07hmHk2bNnlFXJ1W6XL46IlMlBr6RMI1xVEYWkqquMYlYUZUJsb/d3bLfJ3nRPo+QFJ3F7zr0exBQjwQdETGP9s5sbDscDm82G7XaTCzBeDo/3yQVRGEsMEZcLw9oCbSw3z28ZhoGrbfJjCikSKpsPYqJ3Ms+WkwqE0hRVBULw9OkTgndcX11T2IJxGNFGvv78ZYqVUFpTVjVFmb6W0YYYJZ//3GPKynJ9fZ35NC6ooJQ6oa9FmbuaR6pEyVibLoJnz55hC8tutyMS85pD5pNTYl3XdTkTKKuoRIo5OZ/OPH16w2bTXWgKlCbmcT/kfd0W9nUtdP5dVRX7/YHz6Uzb1Gw3mywQSJpUYyzLnFwWtrCsbqWwJTF4vPM0Tcurrz1hHFfatqPbNilOhcDp8AVimLjefRWClq/+6rfRbCp+/dd/47L7KiHEu40xvPzyy/zQD/0g1w+2BI584bX38Ku//iPsj7+LFjrFC66em5ubLMQ2WQeYUKRpHi5SsaYpGYY+weVKobRCaYFW5kLW30PYIYTssE6ZMLZIO9s4DlkZkQ6BVkk9MowDVVMTgs8qFs08z+zvnmOlxuqC66srTllXmIj2mBT0ZZG0naVhWpJYWcqkZz2fThS2oKpKmq7ldDohRPI4wusKj2meKesaFwJFWYJQjNPKuT9T1jV1UyeR8PGEVjqDBEnxEe9pgIxo4gJ+dfTngXHoqZuazWabulk/YE15AVRSFk1C8EpbEmK8aBOHvscHqOqG3W5HcAvH4xFbFReEOBWhS4LnCD4LIxbnOJyOCKCqK662O9ZlZciOi6KwkGV5SqUgJ2R2SRCZ54m7u9tkFhaCh48eZO5TXBzwMSRhd0qiq3Hretnjh37ifErG6fTzbzifTzn2owJkIveJF575nrS/F+yPw5CpnjS6Ho97tLEIlcGWJPHGB48p7OV5ACzzwrk/09QtbddicwCWlCmaI4k0YFlT8JTWMqP+hnmauL25RSpL13W0XY1Unnnp0apAegFq4vndpyhsSde+Ea0rvvmbv4V+GPjA+z94T5+od7/lLW/hp37qJ3jr296MlCvH4SN86Hf+HvP8hNPhmFIYVMS7wOF4TFYZnVzmT548Tt2hTh6vdGgk3aYGAv1wYsjqlfvbMGafjrUJaRtzHGFdVSxzyvBsm4YQPHd3t3iXlBoxBJYlxRTqzPucz31+vSX4yGF/TM55JTj3Z549e8o0jRd53PF4JMY0ejy/ub0QuWV2HewPezbbLWVZcDzccjoectEoXAhMSzKOJi1qKiApFJtNkmlN08hms6EuyxyruKB1AgCc96xL6qRCQH86cz6nWIwHD67Jnzx13VBkGZ13K2WRxm/nUic02mS7z5DS55qGpmlxwWO0SulqMTDO00XqZUwCflKejiT6dPGdzmessWx3Kb2tqiqqssQ5l13vuViGtKtvNluMTUqccRzp+zNVnfx5fT98idF2mlJ4lzEJwHBryAboNNbPUxohuy6NzT54uq69xJMkcYDGmJRjuqwrdd0QQmBd09eXmfssssrp6npHWRXp2Tt/UffEbIUy1l7iQqZ5ztmzxUWV1WUj+Pl0TJ9d9lsuy4oQKXlgWRbGcWIcBryPPHz0Ei4kdLisNVIJhvOcxBUqGYZfe/pZ2m7DbvMWhKj4lm/5Jj72Ox/j937vU6iua97913/gv+Od73oZKQXD+Gk+8Ns/yzB+jNpqtpsGaRw+hrTAK0NZ1Hgf2B/uqOs6cUNCM/QDt7e3BL9kxCygVCqc/e2RYZy5vT0wzyu3t3sIAa0FTV1SV3XOyRwpMtclZcStC7e3B87HM1pZjvsTpbEc7vaIEGirMsUrFGUGVFaurq9ASqq6oKoS0jmchzwKRbQyLLNnXWeur68u42GyTq10TcqwsUqzjBNEWJcFowvWZUVLy3AeEESaHKEXYyAEzzTlHBYJMXrKoqLvx5QIlvffECOn0xlTlNRtRVUVKCVZnScEsFajVEx/HxXn44nVBaRQ+NURQroMq7qibhqUUfjgWNYkPtAy7S1FVWZVUp8UMxkWn6eZaRip6prSGqqiSLkvbk00ilEYq6nKMlvBBoZhSjf+Zsc0JQI9xYRAiC4T6yO7vMfexyiezyemacwHPSKIHI4HYhRsNtu8cqQ0vBQ9UmfEHIzVzPOUNasF87wiRQoyliKhpbawqdMJOJyP1G19wQtSKkLPsqTx1fkkiOj7pKJq6voi6PZZ1VJXBTH4C+k/jCPLuiBkWg3WNcVMSim52m7Tc7YJdEMmlFsgqcqKKCLnfmZ1C54jh8MNj67eSl09oqo2fNM3/Tv843/8K6i//Jf/63f/mT/zn6FUxPtnvPc3f44nz36Tqgw4N1OWEkSkzqjT7fMTz54eePTomt1uCyIp98uyzsS7TkR0frjJ9tNxff2Qfhi5edazLpG2Lbm63mQdYAJmDocT8zwRY6Tvz9nipBFIyrJhnhyffeWVpCsl0nU1d/tbIuISKTGOA822BRmz0sOkmIkYGccpL86W7WbHZrtJ1p6iyCibyoHAOclMyJxf06QQ32PPk1cfUxYl266jLG1Sa0iJAHwOTyqLpHmMIWBNQdtu8DHw/PaW/f6OKofoFkWRwqhyUvniFhCBojRASNpNKSlLy+IdNzfPOPVnqrqmaipMYYgyeSBFvq2llEjSHokQFGVJWZSM48zNs5uENjcNXdNAJHFuWhMzzXKfZUNM7x/AZCTx1S+8Sl0n50nKtEnxieu6YExB/0VFeE/WJ0GApj8P3Nw8v4QAl1nnmSiwOWfCrtkVIy/uCGsTsb/f3/H8eXr99fV1jru0Fxc/QD8MtF17EUwbY7PrQ3A6ntkfDhibwp/vIytF/gpCyEsDSLk1Knk/y4pxmrh59ozTqU/rStvk6UJeIkWCCHnP1JlPjBirsMYyT4GbJ08Z+lsWP/Lii1+NUdc8evQCX/O1b0P94t//xXeXZUXwJz7z6q/xiU/9EoJ0U6A8QgecdyA0w5j8dbbQSAXG3hOuEWPsZYRpmia7zwvquv0if9+SJEV1wXbb5UjyLmlBbUHbpAh0nXmddZ0RImV5+szDJG4oXPaTEBNRvq4L0zTzqU99hqrQaCVYlznL5SLzsuCDR0mRCV2NMfoSBgyvp5Cl9xtRMuWdGmuZ5zmjuA6tRUp5NhrF66S6AMIaqYrqkut5//2ncST6tEu8LiLgstumbE5PRCRtrY/EkBwsMcLQjwmEMAkQMFYhtSAAi1spjGWdV4zRWJNACyUlVhvmcWKZFqyxFEany8EmlDSNpyUqezXNvYJGCKJ/PfJ9Xhbu9nc8evgwxUBYTQgpZGnOobh9P1DV1UU4jQDnfX72SY1irbmk0BmTsljvoyPXNdB1m2xpShD+fa7qvZTyPgHgHpgRuWCD80zjSNs0SXyAICYDStIey+S2VxmMMTanCiSiF7ems2uKgpgjKgWREDxPnjxO4+olfSCJIHT+v1mIEbTUSJIaRnyR0EB4x3hekLGgKATn/jUQmhce/QGkqHnrW9+C3nQt0Y/c3v0O733fLzDNr2W/GQjtcE7S9yNCLDx48ICqrOj7ZHEZxhNKxovkKI1h6QFZm0TAIscMOhd481e8gYcPHcfTHmslr732Km94wxuyPEijZEoV67o2I1EPGIYpJ17v6Nodt7d7ikKjteR0OlFWlrJqqarqomeclxm7pPFo6O8dCgVN01ykUevqGIYT3aa7fMD3WTWQxOZ+DTmK/ZTpEoXzE1e7DfO6cDiOtFVzAQlAXFzdiBQt0fdn1sVnUXnKqqm3KZz4cDgDUFUVISHhKQMmCmRMxTBn7eRVd800TdnN7jgfE3jQbbbUdQc+4rTBSn0p8ns02q2ezWaLcxFr7828p5x8Zi7v/17bmETfr4uky7LkpZde4vnz55lysNzd3aWA4O0G7zwoUFnhtLoVrdIFl/ZCQdd1TOPEbpdi9G9vb6nr6pJmpzLwdk9jOb9mi9INTd3RdTuePn3K9fUDpmnkeEy7vyntRVR+L8wujEUAp/M5deOixmjDZFMc5rnvOR6Pl5H5/td9HmuMkeAc4zjgnEvOkiwm3243Fw5Wbjc5tW+l0iYnDAh88MSoGIeV6Aa6ncmWLIsPgY9/4lco7BVf/7X/PlY/Qou40k+f5J/9i5/B6BPLohj6BedPDOOCIBk7y0qnfcNImjaRzVX9gHmeuLm5wdqF7Xab8jlCxEpJyCPaZtPlLH+JNpFHj/5Ptt7tR7MrTfP6rbX2eX/HiIzMtMuuKtepu7q6h55Go4ZhhGa44AYJJAZphEYDAyOBEP+E/xTuuEJccQMaIaSG7lGrenraUyeXq9p2njMy4jvv4zpw8a69M1xgKWUr7Qhn7G+vtd71vs/ze64kwMTI0P/t7S11vWSzvsYkBcYUBBzn4z2jtTy6uaGMzYysMJSVDIvr5QLnhN7t/YXN5oqbmyfzeMJZebOvr6/nThoqkGYJ2jhQKaO13N7eRhpAinMCHOq6jtcv3/LBBx+wXNZkWc44DiKUDl6aD0HQFZe2Z7NcCenZOew4MtqB0/lEPSH0teRsCE9T7tqDzbi7v2O4nFhWKxQp4HDeMY521qFWdY02hjAqgnJkScLVdkvfd1wOR9CK5WKJcyJlI2jO54aua7i+viZJRLvq/QhId69elIzjyOl8wlpYrLfx/y9Et+Z8RnkvKpGJhLaquTQn1pslJjEcDtItT5KENBUplh09WsH+tCdNUzabzZQMw+nY4X1Fnqd4L5alCfzUtaOIFayUh6KmGqmqkrLKYhc+YRyHWDlJdXJpGso8xygtMQODow/SMEpjr0GQL2HWqC7qSuaObUvXtdTVSqRrTCjIjq65UEWBurVu7g5Lc2rF5XLheDwJyaEoGLqeslqQYDifTtggo4ui3IDpOZ3uUKGmLFeUpeLlq3/J46sPefroH5KMwzs++9n/Sjf+gq7v0KpgsZhc6yu6Dvp+4HzZs1jUjKOdF4T4pDI++OADXr16w/39Aec8t7e30iwpC2GGxDuWuJ77GV8xkdKePPmAy6Vjvz8J00NrhqEVY+s0okjSWLYk8/ecXNaLxZr7u3tev36Hs9D3jqFvWS5X0SKko/ojnaleItYVz1lVVfS9+NKc9VzOHc47Ht1sqRfFPDCfyqYJGqQULFdLht6x3+9RSnE6yS6ZZkkc+OazQHoYxpkBFAgkSrNdrHAuMJxHlLUQHG3To1J4tFmhVCoJUSGQKuGw4DVGKUpVsFosOHcd9/dnxhBwQeNtO2dgzCdMpJVPDFZppoihtWtHdrv72Bhy9ENHnsrdSWlBekyuhWEY3iuh8pwsS9ntdtL88SZ2Dlse3VzNPro0TXF2nFlCxhjKsiBNkxgwc6ZrRzya8/kCBGHQup62bR8gMNR7P2o8taq65nC/w9lx1qtmec5qvULHsYlTQVwoUcs6nfbLxYLROfb7Q8yZINILEq62Vxgdoq43xHc1zCZvYwxFKV3c+7t7lDJUvY2uDAEJa6VRXqNJSNMzIYykmcO5wOjv+Pxv/w/q+iP0Z7/8X/jq6z/DJAP1oqRpD5xOR7J0wdXVYx5db9luVlRlAcFzOZ158ew5b9+8pW1kllSWJU+ePJVO4LlhvztFyhZ4NzD0LUqFuXmioq6zrmo0ApAqiwVZVnA5t7RNx3q9pSiqSCjTDwS9zDthkiSoxKASQ71eU+Qlr1+/5bA/kWUVBB2tPyNpfCGmhof3Nrru5b62XCyxo+P29o6hH1kv11La9l1EU4T55Zv8dGHWpwbKouJ8ugiUCglZSYwhOCfwJe1xyhEUGAXaK7lPBk2hEtZpxXDfcH5+ID+mXPUb8l2GuVOot4HkXSC7V6QHTXoKpHtPdjeSvOmoj5qNWzDejxzvjuRR49p3XfyZ5c/uAzg8jvclN1pTLhakacnxcOR8PFEXFalJZMboPX3X4p3FaI0KMPTiEc2zDKM02/WGIs/Z73acTw2b9Xbe8CYz7pSiNI7jN7yqaZpS14t5AxuGIc5K03l8lCbS9tdGxcaN+QYEcLVZ03SCZATNZr0hTzMyI/c0JeEZKCP6aB91zy5+nqvVMsKv7gCBWqEVGI2Oc0FjVGygqTiqyHGj5WqzZblccT5feHf7liRJKBe1zHEJOBReJaANRE1qCFJN3R2+4Fdf/m+o/+l//gdBcyZgGb10BssqA18QgqKqND6MOO8oipyhtzOwaBxHlJEd8XxuyPM8yrQUu90O50aqSjge26sr0iwVRMBiIYAgZaLr2nA8NhRFjXN2htammZpxBJOb+nw+zydhmqa46EK/fXvPul7RtRIGcmkaqjKjyKVhNNHV2vZMXb/PklDRKOydR6mEcfRsNxuOpyMoaVSsVmtxe4wjt7fv2Gy2FFkWB8EqirElLerSNNRVxeVypl7ULJZLUV0kqeAeR89yXZF5hR/g/PZAf+oITSALGcN5ZDgF+mYgz3J0kOaFimAnbyxlHiiTAtWP5Cah8SO2hPTRhuxpShP2dHbEKcfV1RVVIfiJtu8xGeR5gvdSlfTOMw5BZpk6kKdiBrbDwHa7pchzcYzEuaRUQiKocE7KUTmtNMPgub66EkVJmVGW5WxrCt5xPBykW5okWGvn6kSIA4nodDfXsSuuMQmR8bqM7NGG5WIVG3SyQUyUcx2DYOQd7cjzXAJxlMInQjvvmguLuiZERmkIgX4c8U7NckqCm5tzRZGi8AxtJ7TvYWS73WK9rIHd/T1pmtA20p1Ok5SgNCbPqBbyjmpErXS5RANyUeKsx1mNDSPWlST743PKwrBa1SzLtQBkg6aopMYfBkvbXWInT5gkiTEsF0uCVpybC20kWcsMSsrJp08fy0D6fOYytoyDKA4ul0v0iI24Udq7eZmT5YaqSjmfB0wCZSV60MOhn2Vl0gCSrqEjMAwN7dCTJgkfPn0K3tO2J8oqI820YBUvjUBkyzI+jAtJksWOqpSmJtHSWifh7m4HemSxzDgcW25fvSVE8+tUSyoUWqWcj6coX6uoYzCldY56uSYrC9qmYX88U5UVhTGkPkX1jmSn6fct+5dnTi/2GGtYJAsUCdvsiiqpUUuxeukkw1pHGIXJivYwjpjBoPuRTBs+ulnx6vicNy9fEt7lbD4oGQvN7fGett9RfpChdUbbnliYDOUV3dBxOp6i2mNNnqYcL0dMmrFaL7HDSNd0uNGRFiWMFm0GykQI3W3XiaXJWTbbDQS4v9/Hz64mKMlGNNpgKhNDbYgpWoqmaTkeT6zWKzabjeSBnM9kudiG+r7jeDjgAywXKyntEM2nDmEe5ud5xmJZY8f3UWxVWfDq1QtGZ1mvNiQKXN+D9fRth0kMp8MB5z3L9Zq8FudG1zmqaiFz5Ys09YoixaAYe0vXCRwsqMB+v6drL2w2a5arhQjWrSXNcuqqoOsEX1mVVcRnmkiYEEL6+bInzWS0lywWpcwCtRgjpfTyKCCJ7niTKs7nE763FHmC84G+b9mdjtx8cENlanKTErzHRj9Y17YslgvWmw15XrLb7UCbCHQKcs88XVjUgiMchoEuMXO5IN4yuTMOw8CrV69YLleivLCetmkwiaZeLUgjzQszlY0ytqirmqqsOR4PnE6Sc5il4lY/X46U5YLtdss4duKH03oW6I62F9vRajnf86YyeHfYccku5Fkum1EIol9NFE1oMWggQeUi7m4PZy77nqRJGL460+7vOLw5g0u5Xn7I0+uPqcs1be84HHretQewDaO1uAkyFe9FOokirGGErsP3PemXhu9+/0PWywXt7kL7psUmPYnS2GvHm/vXFJsFxgRC4mmGhn4YJONRpSQatPf4wWJWCUEHjFekm4p+6Hl3Os53epOmvH3xCpMYNtsNbRthXEpR1cVMN5vGTOdTw35/lLFLMAy9pe1avPd86+OP55I1TZNYZopTQlRDJXd39xwO5zist2Rx8adpyna7jRriCHuOn/0UrbBYLmQxtE7uhs7ju4Fh7EkSw3azwcwGaqI22UbFl+QhXi5nhlaEGRMSo+ujKiqasqW8NuSFnP6JTlguinh6X2aNqvee4zDgrWO5WKC0+CkTbRzD2KMcFIV0zNIos4q6Y8qqJi8qLuczr169pshztpsNTx4/md3Rfd8Ji2McWNYLAvkDUJSmXiw4XXp++5vfcnPzmEc3j3nyWIaagUARA0AlBLSaGzF5nkerk8CBvv7qaz766GOBCBUZNtj5gxQ2ZT+XK23bkmcFi2VNmhkO+wPPn7/g6uqKpx/ckGelKPS9jqGTJ3Fv1BnODSSJlNdlIcPZw+HA27e3uOD4/g++z2KxxFuPDwGN/HmVFqVFlmhykxOcYhE23P7qLXe/vMftDI/XT/jxB39IWfIIcAAAIABJREFUWaxpWsfrZzve7D7n9vaew3mAAjw+uvbl+SZaGkFZnpGkKXliyIFlWpMMI8++2qGCIityNh88pagNh8sd98/e0tgTb90zjqFh891HfOcnn3C1zWmTC46A0h4f9Ny8SLRCG4MdR+qsoM5L7u93vHj9hnV0zRRFMbNTgveoxMwUOu89JpaLZVWSZRn73YE3r9/w9OkTtldRHI98XlPDZrov8oBMdnNzg3Oe+/s9b9/ekRUZy9XqfRYK4qyfSLsTmKxe1LRty/XVY8bR8vbtW969e8tHH32Lq+0V2kigj3NONjXv4j8rUAnOO5TybDZLTnhePntO1/WUMS25KIrIyBEObNcdRVgfRR8u9i5MHNW8ePGCEAIfPH7MZr2JoGuZfyaKmJCUpjgn+e9hEv0GGSvYYBmso+1GVivB0XXDSAaMo8CBvPOo6Cb1UWyLUgQltpX9/kw7jtw8/ZCqqmj7ntEGquiUkA81oPX4/6G95XkuMrNh5NGjm8gu6UjzFJ0YjA/z/eDu7p4PPvggdkE9XdeQpLJJgOLp0w8EBNQMlIVQna0VDeJisaBtWpQS1X6SpjJoj0AigO12S9M0HO8P1OUCP82GVPx500BQTp5dA/bOcff5mbe/OPLx5od899/5IX3b8+XzF3z59a/Yn1vOzuFSQ+c8l+C5tB4SYGRGFOZZQnAjWQt573FDh+0bcg0lijxo9BjwY0dRGK62Kz75zkd8+MHvkecZd7sdX736kuPPb/nb+y+4+WTN4sOKZJOhCnDKk2YJYRxQaYp3A4nW4EfGIYBTbLePSBLBSDSNgICPxwPW9ZR5xeFwxERC+dREs+NI23ZYa9lutzgvneTlahlN5CCPVs8GZe88aSpsVoCmbXAKrh7f0FuLGkZSxArmvWziyqjZYaOiYH8Y+rlba4zm+voaa22MTs9BqzhyEjlaCA7vFdZ68rzAaYW3lq5tKOty7qKvisUctT7dR4WCnsTINZH+vde49qxW6zj6GsiSkSzLMVrjPCRdP1DXmShk4p1nOlmmgJX96UialazXa5rzJZo6C9q25XzZU5bV7Azo+z6q9Q3WOVCwP59RJKxXa0IwUW7kOB3uaM4nVqvVN3DwsvgipDdmpqdpwXK54tJcWK/WeC/3S68dy6Kau7TCk7FS3uiE3f0dp/NeSMxliffIXKprOBz25H1OVeWCv1DpnLI0jGBj2Xx/t+O73/3uPGx/9OiG4+HEfn8kr0qKPCcARmlMq3Cj4vK2Rb90nL44U7or/uEP/5S3hwP/95//lOe7Ow7ecGhGLgoucbTgsoSQ5/SjzBqHcUAhuPfKeYkV0Ioqz/A6pfEBE6AwCYmPw3KTwDBQvLnj37y8Y6EN11XJDz/6mD/8/p+QFY4Xb3/D2798yW55z+KDjEffe4peGDJl8DrgjWgxL4MIBfK0YnN9BTuoFwWr1YqXL79mGLp4Itk5xJTIUp1mrcNgydKcq6srmksjw+7LSQzLSkKBfBRaGy1BnlUp0XIS9+1II4v0eDyw2a5omkbKxEGG71prlGdu4k1Wp2kBCmcnjyE3Zew1HNBGU61Evme0ZowIR62g62K0m9JCEDcGNw7kcaOYGoRTUO0kNMiMNAKDd/G9zVkul3O2ZLAuxgi0FLkWTON6s+TSXLi0HcvFGucVeZqRmCwOVwfW6y3KaCl3sgTnBtKsRhsBw7ZtN+PWvYc8rwgoXr18TVWVbK+2opxIBAPglUizFqsVrh949vVzHt3csF6t6dqRsNLY4Dke7klSHRdpFqOxIODQiWaxltby+dTNdLY8q1EkBG/YHQ7kecFi+WHUN2pUE+j7hkBPWUqU9Zs372IWu0KpBOega0eOpwt1XQuGPmLjQwjkWc7jx7HB0LZcjicW1ZLK1/RvLa9+/Yb7X9+zNRt+/6OfsKke8/nP/5afvXjGs7HhkGn6askl95y6nv3lgu9GMq/xdLNyJaiE0Vp6P9LbEaUsIRjStEcbxTDI3d2YEY0i1wZrEjSG1EOpPQvneH2357dv3/HXv/qCH3z0EX/8R7/Ptz/8EfvmDa+fPePZ85eMmcdc5zz50bfQ64y+P9GFjuWjK9AJve3xYQBysaXFrvH9/R3eeepNLiGrhahg2l7yL662W6mmxhHnBqyTrJAQAvvjjrv7e3CwXm9kg05LmqaJyPtSUIje040Soy581IKyzLlcLuz2OxblksxkKBK8g2F0NM2J7eY6zoklnkBpkVqictJMnCHdSbr1Co/xI1mqZxNzXS1YLERllQA+gEFRVhVVXvDm3W2kkssk4XxqKIqK+909eZ2JqCEqsXwvjCTvR0wCdVGy3x8Z7Qnzn/+Tm0/TNJ8xhH034uxUZsoFlySgNBgjruuiyGcgj/c+KiZk/NC1o2TdWc96s2a9WUXNYIbSfgYboQJpkoCH5ULmQm07cDpdogpTiyg8S75xsZ3ujEry1ET5ngu9+3KR/INJEHB1dUWWJoCb8wWdlwwM54Q5U5bCyTydzux3J7p2wFlRrTx69CjuotlcGjvnqMoShaDZ8zynyAvs3cjdz+959udvsF/DD5/+hJ/84A/pO8dPf/U5v7h9xzMHz33Ku2Bok0BvEloU3iiCUVjvCc7PlUSe5wSjxQSL3GFGZ+nHEeeDuCKURpsc66GxA+NgQaVYZTiMI+cQaJKUi0nZe8/z05l/+9sv+fL5WzJWfPvm+3y4/Q5JX/Lut/fsvnjHcHfmulqyqRcYAyoIdHiKKk/TJLpFUqqyoonvzZR37yMSZMIRGsOs7y3LTAy9Ws1CiXGwcrKN43xirFbLuTwV1rObqQaTQFvkbho7Wtpzy2F/ou8GtAlcXW1I0jwK9y8oHeLIrJrvjRKSI5vGfn+IXBtLCI7Nej27bsZxxEc5opi7ZU6ZpIJ32e8ODIO4TdIYi7e5Ws99iol5OlHcJyp5nuWSjpVlGu8NQWu6aJrNnYoocomN9j6QpJJyk5UlJAlegZu7SWbWKw6DNEZubh5R5hkELz9AmhKcwSgzO6Z98KgEmuOFqlqhlKNtOqpyYLNdx0H9QD+IqHsyAVtrxSisiDkHXmabytMPXQTYliTG4LDY3n7DqpQkkqEXAjE9F662V7wd33I4HNhsFxTFImLMFS5Yxm4g1Ykg9YPHeI1xhrF3uMZz+vWR27++sB6f8Cf/7t9jv9/z//zlZwzG8LztuC0zno0d994xOo/2Cq8tTkkZVeRrhrbDjYJn0EaTZAkJCV0cmjuvCDZEmjOz055gRODuAwSF0Y5UGwYPnYdUiy3rzo6ULrDBcL+78PzdL1j/za95siz4ox9+j7//+/+Q291Lbt++YD+eME8MxXdqsmtDrgJnHNa1VFpJ17ftqOpcKoyQ0HU9WVby+PFanPvBoyWhNL7cPhpjzdwAgvfBoZezlPrycmqcEw/o5JSQBW5jrJt8jzRJcDagjATWFKWQuJXOhHrnPU17es92DUHaoImRBWatNJWU2MM2mw1GZ+SZ5CQqPCoNnE8nsabVBSpV2N7i/BBF/tFbermgjRjGjJe+yiRKkAuwJi0ylBkgNXjrpfeglKFpLhJhpRWLuubRo6dSLuz3JKkmr1JUluKCoMQDoOoaEwIqy2ILX8YKeZFTRRfCfr9Ha0VWJmRGo9CzbMlaOQ21EYzc6bxnUS948vQR6/WarhfDalmmD9QV2fvjfZhcziF6xgbRn27WXD/acDje0XUFdV3G2YyUkkPviBrtKDa29L3svlVVzfeHrusYRhn8Z2km+Hmd4F2MnXYBe+i4/+2Bu8/PbLor/vST/wBNyU9//kte3O9pjOadH7ikBY02nPUAuaALnXco66N7P4lUgRySNC4oN+cujnGwPHUj58EysolMeleQRo4l4N0o/rkgs8vOWWmzK83gHakNvAuB66C4vTvwxZu/5KNfrPnx977Dt7/9Y6o6MLiG21++oV13rL9VkSsFyYC1Up1cjic0juPhyNX2hqdPn5IXOZfmRNuBc4sIA8tl0epWkI+TU1+bCHoS0sJqtaSuF1yado6YE36sikGgPFAAqXngb23gan3FBx9Kt77rxMxcLEtJEG6ayPyM+RvaRFeMvDsmfvZTtdQ0DV3fE4Ijz9OZauDcOI+qpvgG7wZCcCyWZdTYhmiA1tLEsz0hEhDCRLaPNMF+GBj7QHI8HmnbkZubRwQVwGu0CdRVzeAs58uZ8+WCSTOKtMTlcjL6UTo/l6j1e/TkEQCnc4tJUvK6RPeat2/fohvN1fUVRVFFVibxQXT0jeAesjxgEjDGgxopihTvR47HE8YkaJWSphKfpWJIyuVyEWd3WXF9/WjGYUgGhSbLBVLkvbgYnAeT5nFwmnM+S+bCer2ZQy3v7+9IU0NRLjmeHYfdgUVeUy/XJGnBqEE5w3g88fzfvOL8ReAn1/8+Tz78iM+//Ft+8fXPuAMOac7BBfZ2ZAw9qijJ1msqrfEELm3D0LSMfc+gDUYbwVSM75sc04xJXCh27tBOXr0keS8te98YEYq3gK3cN90RWhNSjUW8oho4qMAi1ejE8HZ/5uuf/pzHv674+HrBD7/zmB/84Pf4zYuf8erNG8a1Qz32qG1DF+DZi2f8MPmY5aKKJWqDMQWb7YZx6Hjx8jlpmvHxxx+jlaFpeoxppbveCsV7vV5TVjX9OND2HUmZUOgCax33x3uqsqIsa9K0wOgh6nZDvDf20VisUXjp0pYif7TOstvdoSOBYegGiqKStCTrZofJcrnEaE3bNQxuYFUuWa2WnE6CZTRmDUkiPJxEk6QpzgXRGbvAZr0RwXffx5DZPCI2Tux2O9I4rE+MVAUh5oacL2eKIme1WWH+yT/74NPVci0AnCATfUkuylAxPipJE9q2o296VCzh2qbBWRfxczkhErScFwGtCJ0F8JRmGU3TMgwWa21EI0jber0UHKF4xAz90M/3DtHoSc1unTj0++H9DmadZbWSBKQpeux4PFJVZbw/FLEjKoExU3kzjCPn02nOGZyE4N77yCKVOK88L6iKHGtHzm0LOkNdYHhx4vlPX5Melvx73/tHuHPOX3z2Gf/65Su+Hiz3puDeGE5oTr3FodFaxAzKiU3Gx3z64N+TrvuuY+h72a0j23P6d86JnGqM96ZpYU1Z7tNIYEo8mjrc78twK73vaVcOitE5rIJBBUKa4dKCiw3c9R1vT2cOd2cuuwvf/vh7ZDrj8G5HtkhQC0NIFFWWkykliz7A6XRGGzFkXy5n8UzqJDJZLZeLcIQmqdnV1XYOixm9ZXQjRVnMLJmqrrDW0bQ9fdfHaDtpBIqccDnf74J3jDO9XaLrsrLgfDnRHMWLmaTyjg/jQJpnMZpNgk59cCitWdYLkggRljBYEfaLA8YwjnJvnCYCPvi5PxIIUdSez3a+LsbeeRdiT6OnjRT0uq7ouw7zT/+bjz4NXsXsbiFyBa3Iy0Iig+NDKssKBbx59ZpL07C+iobcNJV89xg2MVpHnheSZSCscrI0ZVHXKDTPvvoKgOurK/I0nbHr04sylatTI2QawIoHcOTLrwQmu1yJQ6Ioskjs9vES3lJVhbS2I5YvSROSCE968fwli+WS5aKKbFQXX2A1N34mREEIBqVEKxkUXG7PvPrXz2k+b1g03+JPfvQf8tWXL/jLX/2Sz09HXqYph6TkpDStC1gnw/sQpNV0Ph3o21bsTpE5OWlifWzKeOfph36+v0yn3+RemO7E08KcTrzJZRAexBhMC/Phs53Mx9MpqhwkypCalCFAowJtqjmFwKkbOdyfePPsNX/4gz+gud/TceHmB0+pNgvqLKc9X6iXNdpkKBTbq9Us4Jjg0EVR4F3gi9/8lvV6zXa7jdcBcXIQwpw/WGSZRKTHn1NgXZrD4RRVUzWrlbCMHsaNNZcGG8v2xAgC3zrBZypvuH37jvO5Ear4Zk2SJg+i+ZgjCPKsELJ2CKRJGiVnmq+/fsZhJ/Cu7Xol0QbeY+Ji01rWTp7nc96HiwE7CsXzF88ZhoGr7Rat1WyoVlpj/rP/YvMpKMqiFiGzd6jUxNNAz2RtCbEcKcuKalHTDT0oRZEKyIYQ5Fhve9IkxSg1L0JnxRtnB0uRF9RlRde2cw6DxINdyDKZsUxJt5P6Iknk3qqNnp345/MZrRVFIdj86WVrYsCkENJMvEO6OX5L0AYZTXOmLN7fMcuynFX+y2XMUyCNL7Zj2HVwC+OzwJV9wp988vf47N9+yV9/8SUvOsuLwbJTCefe0o4DnZWxAgRGO+KVI+iARbCR1tlZbzjd+7q2xVmLnxsZYbYDTfPXh+qgqQSdXiYf/Gz9mhbsfGLODQLeo/aShOADLgiaYfSO0csm3LuRXsvBGU4XqtbxBz/+MX/78guoAuQyUJ8yB9NMkpYkniydcY9FUXI+n0mSNIbHeAEopQIUNsZg0LjgcdaKwDo6HMRtLydJWdQxMUlHk3Y64yRlwO8Y+oHFYkGI74x3jrEf6CIn5ubxjTS4giNJ38eVyUYgFZ6OcXEqGrS7ruNwOJClcrcdR8GRaCVhpwT5Zzs6oU5ESjpEY7QP9F1HUYmvdBx6dBArm9KKNMkw/+g/Np9mmYBUm6alHwayQoC1KMNoZeiYxFRYlCbNc6qyxAdP21xmzWmapoy9jVntbgYf3d/fi2VlIS93XZciK2qElDYthKmVm6Yp59OZqipnjPxisYzOeBujt9N4tF9mf6KO8dGr1WYGyU6D3aIoWCwWaA2r1QLwtK3oM70ThQQohkFi3oLzMHrOh4Z+bynflZx/cWbrHvN3fvwP+MvPPuevvvyaN97w3GtuB89xHLj0Hf04MDjHMA70Q4fzln4ccNE977zHDVZGQrFBIC9RzxAToAIhXg9kExSQ1PvT4eEp+r5zGOby7P8vlNJ5GXWgdXSBg/NiuRGrj8ETSJSgAEMs1RIXSNuev/OHf8zu9IbqWjGakcZ29GGIdh/F/nCmKMpIBE949foVGlmIy+UCH8SJU9UFp9NxTksigPVyRVksFljnYtOmE8D0akUZq5vVStg2x+NpHuUMw4iz8vzqqpJNv2tnQvZ2u2G0A1VdUVUlxmjOEcsoOI/3kscpxs6OI4f9Hq21mLJjM2W72ZBH2HSSpBJ4lOV4L40X0TwXOCvKoDzPWCyWMRezpIrk8N1hNweRJh999G32u5OgFpQmSXO00wTr2Z92KK1ZrzYxdCO2mAWFRpIa8mJBf27iTu0iGkF8c6fzEa1VdKanHM7yQ2U6QWmZpYz9MOe+p6mZQy2D97y7fQcxmGRCw0v5GKjrgqJI551K64TVcoPWmcRVdxJcWpQpjx49wo7SAR2VxlmH1oGbm8ccjkfOlzP6bKiLBcqLZ+6w3+N6yzLdoC4Jbz57wxP/hO9/9If8+V99xudv73mpAi8uDW96y+Ct1HYR5+5DDJDRGj+IytEkfu7Kzt3ZccRGQFNiDCbXcyk5qYe0c9EZHr7RgJkW36S9JIqMH25q0/hoHEfsKLQyvAG0VBD6fWNndJbB9qAMLt4wLkZxh+d103J/e2SZLPGHd9x8vOFcOHb3B86HM4+uH8c7kwzl25YIuRKv4GjHeO8Sd7y4brT4L71ivb4ieI3C0F0auq5juV7JZ2ej91MFuq6N4m3hox5PR7KkIDM5ve5kaH4+C2R5UUdrnbBxidxQk0hsXd8PnM/NLJk0RlRW5/MFby3r7UYQ+cGT+hzVNygdSLOMvMzpu57D4UC99OhIiegi1j/LMlarmrxI588W70EbFosKG3qGccA5hfmv/sUnn4JmtdrS95bd7sg4OpS2rNdLlnVNYhJSLRYM58YHoCTJsauKEqNSbm/vOR6PEowy9jGPviBJFdaNZEUuNseIUw9e5iST3WO/P/DyxWsUQtteLOo5cGXyoMnYopyBvFLyFBiTcjo27PcHgTOlRdw1wwz4kbJuiJHLkCQ5wcisUqPY3x7oL3KCaeNIfIK5Dex+fuZp8m2+/60/5i/+6hd8frfjuc54YxMa4Gyls2f9iBtDDDSx32C1aG3iyaXnEjKN95IpNptARPdn84k2JRVJ5rydT0KJAjfzSSmEL/2N33/ou5tKVKPNfAedRNAhBKx3MFjsMNJoCePRztMbS6ECV0PCh9WCq0XB/bvXFLWgOOqixDcjY+9oL52wgRIj+RlpyuAG8jKnaZsYDZ5H/6DwVafRQNO0jGPAWj/nE5okwaRmjsubcJLTiCaPYT4qKM6nC03TMQwDeZ7EbriLm5DErAeUNGPSBJQ81ynT4v7ugHOSMFWVNau1EPLQkhzWjz2j68myBJUkBBRlXUvSWDdytzsQlGRRbq82rJY1PlisFdld7yzEuDqjhUNTVrWYJSAhK0oCPr4UOuY4iJ7UByljRucIQc25EXN5E3dnO47kWYLRgdPxHq08zg4oAlql5HkVHfLCQElMhskyTJ5KRiDILo2ao6ydt8ImnRQKSRrvrcRIsBChrPI9tda0rQi1p4cvZZr82Z0Lc4PDjo5+7Ge0YcDjlefSnslIqYaK9Dm8+5t7Psq+xUfb7/Ev/9Vf81e7Hc+U4r4fOY4jvRfmS/CBsfN4Z1HI34ehpx96uqFnsAMBz2JZsd4sJZjFGIrYSfPe0w09p+bC6XKOZfSF4+nApTnPc7IpjOW9u1zFBW7mGLhJODHhIB4uQlSQxokWo+vc6LEukqrBWYe3nt46ht5y9rD3nl9+/Yyr7Yd8UH5C8+vA5ecd428s4VaTnA3DoSN0ijCmpDojy1Iup4ZEF2RJhXeSQZlkEsjivCfNMpIsxaQpzg3iqtGgsoTR25jVYPC9Q1kokhTlPJk2GEBZy9DJAj8cDiLAcI7RiWXIDiMExfFwiuM05nJ9mgRMqJQpNDZJNUrHZk1EtnlryVSKVikaNcOnvZMAVG0SrJUUZus8IRi0ivNFDZGNiU4FHSPMohFlAuaf/vPvfSqhFudZhlQvpH26Px1io6SM3TTB8ukYm2VHacgMXU9zOUYWZNRw5hn7w34GwaZphifBWZHDTZwVrRXHw5Hj4YgxAmK9urqiyDNOp8Pc4i6LGqVNxCToOTNdxhInTsdTjG3WPLq5oh9amuY8h6mEiB6cTlLHwBAGNJr93Y5+dBRVQV3lPCke0fzqxO3f3POjJ3+XrfmQP/vzX/HrY8PXqeZg4dB0+FgueoSs5pybGyAuuMhSKd9bZryULWXkoI7D8I3QyHEcxe0eRxUi72Puhk54jRn39+DX75afE75iGu5PYnwQO9Q0NJ8aON473GhRQVww2sVuq4qnolL0Q8P2esvN9Ud8dPMDFuqa4QDtfmQ4j2ivuVk9oR96BitYkLG35Il4SJu2i06EkTTNaduO02lKzlrHscOKru85X+R9dLG3YJSJp182/0yTv69pOtbx6+u65nja07YXirycO+R9Lxvi1fW1zBqViuWo5NuXlUT8CQGuoe3amJcpOMyh76JO18yEtsPhwOXSUJRCUChLibQ7HvckWkuKlx3RSTYLQowx+CjdvNvt6Noe85/+45tPnfcsFqU8tPE91CfLJaJYThtFludY6+Z01+5yZr/fkaeigwshsD/sWCwkfmqxWESIb0+iU/I0Z+xHiixHo+n7UWwlmegvsyyl71vqRcVyKZ6tNjIn86KMNDRHmqVxHNHMfrT1eiVqjcuFRaRiJ4nmfnfH0A+kiWDw+gi4tdazO+zw1lIlaxZlSUgsuvcUp5S7nx15nH/CuvoW/+eff8Zvm5F9WdAYQ987umGkHXus95Ifb+XETY0RDgmKMmIWU2Pm5Nu+62SIHpgXVV2W5KlkPozjgHfjLLmafs1dwNgdncY4ydwif3+XfLgwHzpiRLkh+QrTfXR6ob3z4npJxECsYwUUlCJojXeKzg58/eo1P/v1b3j+8h3OpTxaPeU7V9/hKr9h2Hva3YG6TNhu1/gQGFwgyQw2WE7nM8vlChf5tE1zESZLGXPkh54kNRR5RpYYmvMFHBidRM+qnFR938fGjo365lq4rcMgRluc6JzjySeg3pTj6cx2ey2J0ucL+MCyXpAnGd4N9F1DkWaCA+l7WYjOkyhNiBtsnktEgMTWSXJWUVZYZ0Unm0CaajSi1BmHkSJN6WOeY6oVl9OJ8+mMH8XeZf7Zf/ujT6dLr/ij5N6RpinKSKenyAtGKw+R2ARo2wa8iJnrspylOcM4CJ48y2L0ccKiXnC5iKpgug91XUeWi6ysKAo0auZhLuqaPE9ninJZlvFrZcf23nE4HOasPAnvlPnS6XSasxB1dNqnMfdwmpcNwyChn3XBernChAwdPKnX6J3h9OuW5LbiRx//Xf7sz/4tn+8vvCo1L8czzaXheG5ox57ODu9nWfH0SWJJOAVomhhKMrFVp9NY7s0jXdfRd70AefNM5q5zt9MJNv/BQpxOuKmZMi2w6Z40qWseMkSnof9UDUx3y2kxP5wjKi1pwEynJAGnRfrWeDjhOYaR+77hzenMy1f3vH5+QPUZf/DxT1jnK3av3qGspV4u0KXhze5WRjPdCEox9CP1YiUY/FykZdLQcXOVMJnBpwiC6cWfItKkLC/nE9EYQ9+JQMN7R5IatEoiu1TCZLu+p4/d5+ndJKiZc3o+n9+Tz42hyifb036eZZ9Op/n514sCkCZk13cYDUoHjqcddSkqIokQaLDxa9rLRa4hkUDufcD81//djz51eDwOozXW+ognELGpVjqafhOMSXjx/CXDMHK12ZIosSZN5LPpZdHGyKAzy2R4XxQkaYIdxLakVeD60TVJlorIVc1OxhmPIPM/wzgM5EVOUcoF+rd/+xuqquTRo2sJ5bSD8EwTefmbpomLUB5aiKTk1XLF6dTw5s0tZVmy3m7I0xytDHmaUicFWaM5fHFi+Ao+zL/Lb379hs++fMWbLOWtCRz6nqbp6MaBMeo1Q3y4iTHSCUXGC2Eia8cMA5GjiQM8eEk6Hq2Un13b0veCWRSRgp6ZLA+H9pNqZr6faA2LAAAgAElEQVSHRwXNtCCn/8Z5L46MB3pT771Aeh/I2B4S7AIBGxxeBUw8RV0UFAQFTgXGoBlRtMbhsoxQVgwq5f584fXtPa9f3fLo+gM++dZ32b99Q9PsKOqMXgWG0fHVsxcENDc3T0T4LGNLnLfxZxvn4B+jhRE0RSzsdve8efOGqi4jy1RwhHItGmSjvYhf0LqBfmhE/O0RRurxwJvXr1ksajbrNT7OxH3wjIPFOUvft3MvYUIbTkS429t3HI9Hlst1DGjt0ApCsBiVEpycvqlR9H1DmZWkSUaWy93vxYsXWDvy+PHjGH/g3nez/9m/+P6naCVUa22wo7wIeZ5i0gQVL/2XRoI16nrJol7SNA3ejSRmyiJXM5FrsZDO2FwDx0vzOAyUZcWiqmiHDheCBHr4MGcPOmdng+/UERtHubNOqTh1XXM6nqIaRot1KuLIz+czi0U9v2g23quaS0uaFlRVTZomnM9H8jQnK3Kp350m2cP5Ny3X6iO++NUbfvrbZ3wdPPvU0HsIgzSoBu++MWaYTjbvxAIVCODDPLtzNlpkvAykJ7tPmDqXVk6B+fvEZkGavg+a8V4sNpI3r+ZO6LzZPOiYTnfQ3y1jQbrED/96/xk5ab4pSFQUWcTZpA5BsPhRWaR0AiYnZCWthiaBMTPY1HB/uEe7kZ/84Acc73d0Q8+xPVMvK9bXWwn+bLo45IZh7An4+DnLWMdZFxGV0LY9l3NDmiUxFbqLp6ac5JKNKM9rtxM2bt+3sjhMgnOB8+XMInbqQ7z/SodfIt7SVDJBRO5WRsJDEht9LU3zPm1KGlkjdV2SpQnOWowWJunQD5KHaS1pkhE8XJoLTdNwdbVlUddyKlo7d7uN0Zj/5B9ffSr5fynKI/c3k0oQZvAMXcelFdHtZr2JJ4umrkrUlCobU199dKJPTgTnLKfjMea9aeqqluQfJAvheDxyOOy5nA4kieF8OouucBjmjIJ37+65v78jSeXF6Ps+SoYcu/tbmsslng4ijD2dTjEIU8oswfeNrNbrGF3WsNmuSbVm7AYG78kSTdqBe6lYtdc8WX+Hv/ib3/CLpuEVjkZpAS6hMHkqaiJFHHvwDWnYBKlSELM5hnia+Vguvqd4+/h7ztlY/rm5LHu/yGNzxbz//8gvP/+7KUBlopyHeeHLyauUzD7D73BY4ihQ1CpOWDkKhYo2qSmKTav3C1cr9T5eW4EDRqPktAsepwP97oDqLL//3R/y+vYV2UKha4NXoJNEZmx9j+3FSZGkGdYOcwUknWBFNwwcDidWK0l7Dt5yfX2N1giG0doY552gtGZ3v2OxWMT5m5UZYF5IPkaSRgz/lrqu6TqpPvKiJMlEAzpaRxkpDeM4cD5fSBLDZr3BB0mum3TJMvIgzrcLhsFhY1y5XDN6jqdTbEqmc9k/SdwOxyM2eOpqifnn/8PvfUpQnI4nDGp2OBAkudVozWq9FIE3xMUhJ1eWZ+BlF9vv99EY3M+77t3dHVmWUJWCgBCHQ8AHR5ombNYr6rLEOc/lJLK15tLFnUhzPJ1jd8uQJCqm1YoeL89S8iyeFmjGwZJnMnSt6lpEt6Mjz3KqqphnbeK6KFBYlvWSoljQ7c6Mzzr6FymfXP2Yf/XTn/PL84VbDKHMIRVzrSlSkmin0vMwPZ3b/LNU7IFk7OGC8d7NpmbvPdbLySmQlfCNZNuJGDedVvC+PJqQ7g/vilO6lVZG1KFBotlUDKsh/t40d1RRPO6ixcvFWWMSZ5tyagprhwcaS9ESK6GbqcgT8oEQNC4oQpHJvO2upTY5H3/yMYfzLc3YQqohEyJ2nmdkWowBbSc4inF0ZHnO8XjEOk9dR1yg1mSJdMurspyDab13cue6SOry4SBUuLZtgRAx9MWc0DWOFhNTokXVk9G0Hb2T2IGm7Siykrt39xECXMVeg2YcfLRD+ehnTNE64Xg8MwyDpPkOVhbYYU+aScUmHV77jRzMNE3Jy4J2GBgGSxK8k26U0fhh5O7dLSbNKItyFsoSoG87aQpYEbpqEwiOWfqTZil3d3ccj5fov/Jx9jJy9+4dVSXJTNaO0aGdUVVFRA9Y7OhoLgMvX74mSaW79q1vfUjbnhiGjjQrcDPIR8UXEbp+YLO9ZhhEH/r29halFfViwWq5ZBz62HSSoySLgZPKgPcDRVqR+AX7t/c8KT7iN1/u+erQY7Y3PHlSMqJ4vdtz6VtGLzkLODcLdKdYLa1NbGoNOKe/MSqYT54HXsApOCVEzS2TAHtCW8QF/FCeph+Ukg8bL7IZvGd7aqPJVCqzTy/Og6l5E4gaUy3dVWcfgLWiwgctMzSlZUFaOxKQcNJvnPrBUxrRinqt6bTBqowmCbzzgb/+9Sv+o2//EevwiOb0kiGz5KucwVvay0idS+zZ4By7e4lA8M5QVIvoA4Us17MzZHaKTAj+NIuAJs3x1HA8NiidcHW1FG5QeBDQE3QUk0sWY14WaKUpqoR2GLnbvaPrOuqipKhKlss6hu9Eo3QilUtWZBFGNmmTkxiW2hKCxvrA0w8+nD+T0Y5oO5JGcYBJjBgKgEdphgoGmf17i7cDQzdgh1F8Z0GaDkmSkyCkaec8JqgH0VV2vu9N2ept20HQXM4XijKlLIvY6DHRDSBYhCxLWS4rhkGUD+dTQwgKk4jMrWulJO26BucHrEuxlwsEI7uQEnFxsVzIADg1JJmUijJsdrjYBczzbD6dJ4RglpfQWXTn6d6MLMMjSnXN//6v/xXPvOWyrtg+eQqJ5q5t6PY72iiZSoyZBQveh1moK04UPc/nJk3rQx3npP4BCJH2ZebT5/0Cm9Qu0+jhdzWhv/s9pXMszoRpwU0lkHx9vDt6EdRj+MYoQ/kQy9OIkwgO29v5+5vf2QCEtSoRBs46PBa9rHHacHGOXa5ZUvCLz77iT//093j7/BaXNJitwqqe4DWDdnKfcgFFSpoEvDf0rcPokTRTEkLqOnRh4man8F5HJRIMXU+SFXgvWYzOCfM2zxO0jr7LNCEEjezDGhcCXimIUdg6qou894xe0sUcRP2zFw+sNmidEZSOP7+K93dHc+lIkhwXYHCOOgKSdWawIZBkOS5KE02agtEEJzPy4APmH/+XTz7d3e94d/uO1MiJVi8XZHnG/d1dpApns7h6UszIw7Ccz5c4pDY8ffKE5XLB9mpDXZfCkInc/ukEszH6Wlq8NX0n5s7jaS8KeBzb7Zrz5cgwdjg3slhIMtFqvcXojNVyM70OKKPpWznWr66uCcGzWq4Qs3L7vu0+ecl6Py8O11s4ak5f9Hx/9RP+7P/6GZ+9uOXrwfIWyxgCSVXgUVHoHX19cbxg7fs73LToEqPnRTAtojSiEx/O7eZf8f7oH5x8DxfXtIh/92ScGjFJksz8nclhP91Bp/HG+7JYnoU402Whu+DnkjUgp7IP78vrh+qbaQw1zScf4kbKquT6+pq6yPEq4POSIstxuzM3mxWLVc2b+9fky5RBWXRa0LcjTSNJtvViiVKKxzePZNg/DBiTUhYLxsEB0t3Ni4o0GrPt6Njd7zBJwqObxxhjuLm5ZujlvpemMtgvigqtMoxOqBcSQqojDbBpOpIooKhq6Zx2XScCgTiLTSNP1HlLwJOlCWkiCpv94cCjRzcs6hX1cslyteB4OjKMA2WZz5+3t9LwFJcGeOdpmpa2aTF/7+93n0r+RCkmSmcjnjunqmuSNBHuYxzga2VIkpyyKBlj0k6WZWxWm7m7qWJdtFgsOJ1OnM9nTqeLZEyco3PBi6zrcj6xWNasNyuqqp41lU8/uBHTY2R+Bm1YrB/R9YGsrDBZwv58xHlLWa0o65okIhc363V0TVS0nQz086wgTQqGXoyjdhy5u92TN4rFZQ3nBX/5F3/Da2d5i+OiLE03Mg4PhubO452cJg99fZMqQ0A+hjwrMImZZ0sPX9ypgTJpRY3SKGNQ+n2jxEc2y8NTVP9OV3M6HR8mTU33zRD8g9NSxbtlHJ1ElLwPMkx5GHKio7bx4YbxsDwmek6nBTiV11mWsVwsqLKMTCu0SdBJxtgPMPSMxx1/8Hs/5N39a+GclppmHFFBcguLssCHgWEQzHxZlhI6O3q61jIM0rhCmdjw8xyPwnwxmYhIFvVyBnzlpXgCj8cL+/1RNu2QMDhPUdUMVhp4SmnW6yuyrIhqsI6yKGLnVMzHkt4lNDXphGo5OLoREkNZV5R1zRCxL0VZUNUFwyjmXRUkl7BvB9JE3ouu67k0FwE1b7ckn3zy/XnXfDhMFhJVESO2FjSXhvO5wY2gTcrhcCIv5MW6u7tjHHpC8KKoidkPKMdiUbLdbvjyy684HiQ1J3hF04nBMk1SslRmis76GFWczDKuxWJNVdW040DfWbxT9J1jHBs260cUZRJRcpKJOKEPsyzDuZGrqytRSDQN4yg/2/ls4wm7oKYQ9b/tUZlwZBJSQt9jtZ1P00tETzjnRPsXxwHuwRgghDBLmwT+msxE8OluMi2syZQbQiA8OBmnl/13xwi/e198eEI9PDV5YOp9+PXT4F+b918fQkA9OGEnCvbvqnQmOZ6O33c6/cXwqmYK3f5wZCgK0iyjSDQGzUnD2/OZ9mgp/IL20NDrnnq9jKgRZqGItS4upCTODEWof/vulrt9y2a9YfTHGBq7xocRex5nF8QU8DNFpz1+vKBpGvaHA3laMXrPbr8DnHy9Dw+en44dZfl88ySJJDbh3hJkjNN2LalSbDbXBC1gYq0DWj/waqoQeyCB5tyy3+/BBjpawhAwqYTeSqZ6wPz3/+MffKqjzi2JWjc85Hkxzwi10WS5eKbevH1H27VsrrYslivSREts9mSqbc8Yo+bk3qZphSiVpBAMb16/5f8l7L12ZEvSLL3P1NauQhyR1V3dTXAwt3waXvBp+F58AN7PYECAZIua7q48KiJcbm1mvPhtb4/IHoAFJAqZR4RHuNs2s/Wv9a1pnjgcdhRljjFSlpFlZfIBCvdj4Yzu9oLOa7Y7xiHy8nImywo+PX9J5361JhTw0lu+aao1FJtieVRlQ9+N/PjxgzwveXzcYxTUs2H4MfB8+J/579++c44ZJ50xhoBXMhLphz4h6hwhjUMWhWzZAdcjX7pT3T/89x1zMY//x2NkTMn+iELafVS6r4RkNVu+5vJ1ncvWMcz7sO/72rGPopCISFGx7rKLkvte5InBE5PfVq2zyJgG0/c75PsFb1IOcVaRKQTMLAvQJlpe0ff81uxQOXwff9L8tsMnjus0p106SA9mkXbBRYzRGoo853preTseyYucw8MDgYmgZqZ5RDupDu/HgaLKid6jdFzbccuy4u144ny5st/v1krvRVCTmrQRpRXlAhNWMiFwmaiz379/53oTUHVZN8Lh1UGCD1mesPnyMNHG4OPM7D1N1TDPMz9/vTHOM4enB8qqZPZzGmUpzP/6v33932/tbbXUXE5nXMqBaSM7owqB/tZKkUVds6kr+r6ju13JC2FtEEm+Ok9dbSiLGq3s6hY/n8/pw6fZ7w/S2RegbjYYk1EWtXywjGa/3yeQcKCqN2htuVx7tLbUdUnTlHT9Ld1XzeqG15HUblumxH66cHvP9XqjLCqqZNTtuh6LxkXD8NIR2ozD7m/5v//5X/g2drTey9HTe4osp6lq2bHT/W61e8T70XChMcvCmlZ72HtXy/vj5JoMfy92pB1H/WEssCwwl17DsoiX0cQfVdP7jqrWX1dKocLy0iP84bgprzHc+yDWO6kkANQfduj3u29IiAgTBOkhJ5IMP0/oy42dMfzdP3zhpf3JTbdMJpAZgwqBqHQqGZI6OHHeChZk6Adut5aqKDns97jcrTQzISzcsCYjczl9JzPqeepljKYdbTvSTyN5KSQ9YzSX6wm3xsViUpHTPFYtDUqaeZZCl67vqauapqlWq+FiqTTGYbBM/YTVFpfGV/M8MnTCVZqmiWYjKJYxXRmWk4zWBtt2HeM4URSGbbNBA1My74ZJzs7GaJq6Zl/WnE9nZu95enoQP9/1gsscOr1pIUBVNam3XXF8e0NrzdfffoMIXd9hjZiOfRBHSZ5naGsx3nE+n6QpaRQg1D/+4z/x+fNnNs0OpdKcLzPUZSbVY7/eKBMaL6YoFDGxcoj8/PWTsqx4eHxAKZcS1iWokvHc83a+oqeRl58/+PT4v4D3MHZonWNX/6vcu4aUQljud7LA5vVYuSwYgTEJjmLZwP646yxOmxACaL1OCWMEvyzWd30cy6J01qXCFLWyXIzRaD2lUHVInQp3DOIa+o1LW68iRLUWhy5HMqm+k+S9/P6ATzNbMQGFDzlHWYCakHZs7SPaKVyWoV3GFAIqRno0r6czVfmf2BYbXDlwCj3n05m6qUEZ+mGCKEbx4EnXhgtaq1TZLR7YTb1PO79kAGOUIIA1Y+qZjBCF5He9nKnrhroW1fRyuVAUGdoIZuJ6OVOW4l0maKJX2FycOm3XMo7DivAcxpHgfUqBiIvGe09V1QxTJ++ZDzg04zDSdyPn85mnp8/rcX2eZ+qmYZymdEIUlIqtmwbTS+/8LS8wVqTdEIX7YjPpfwvBS3rcGvLcpcG5X3est7djuj/uMFYKOC+XSzLqSufb29vrym1UWtN3A9vNnpAYpWVRUJUbYlDc+ltCjEsSwVrFPI3iyVQKFSNVWUqUahhprzfKspZkflB07cTkBw4PD/JDTh/EmApwAOqqwowlb8N3TMy53nomBMXeFBtsmSd8wrjeDUl9BQuIaLkf3V0oYYXzhiBtvlqb5Ea5izLv54iyWGUe9f4+uFj33o8nFnYr6v1uZFDKYwwpsrQM8D/ugijW3UyUUtkZ3ws/S4NtDKKUKiWUAzGOhw+7331jV6kQRb5Xay1VWRP9iEczWctb1zGNnsoUDNNAXVcEF5nGmX5q5ZgbNSEoLhf59+1mj9JBrjLKrw8LEb8kpnQ6nei7CWcDIWimKdJeW6yFp6dHOSUpmIJQv1XiEoEAyH79+iWlszqHpN4vMartdntPoyz393TqkcC44Xh8o+/HleZ969qEaLFsU33C/WGo0s8HNhspR317fcN6L1abw+EBbSw/f7zgY6TebDk8PqGtwujkpFEaE0JKPMQP9dVNveXbt29cLhf6XhpNd9tDMtr6FcO3iAQhzFijadsbh/0DIciR8e3tyDR5Pn16ZLvd0vZ9GkTL+XucBkL0WJ2OygrqpsLPwoL8+fMnVkuyurYVs+/Xi3eIHjGfiBfSogmtx0wlf/r0d/wf/+d/4zRMuLpm++UrXgsCcepm+qFPifDkKEogoLvAEpK45Ne0v1KKcRY/qDhskrUMlQgDkk0zwTN7zzzJfXOdBwZPDFoWsjEpgZ+Crsqu98D1DU6zL2Vtcu3EdUmvXetKBvar6vouaxmWmrPkMV3/7hT2VankUml5TSFBq4ICq5Z5ZWT0M+M0kmvNpA19hHM3cj211EXFqTuiNxqspmwqVNoZfv54YR49+8NewM5pwUn57CjK8Szf8zxFsqzgcBDWUN9PvPx6w9mMoqrIckNUwshRicCw0AQWz6bg9mWhvLwc6bqOz58/s9vtkrId1tSKtctiCoi1NmCNY7fdcb38zul44nK+8PDwkP585HjqP6BI3qdeYozUdU1d1djFwrMcR6qyRGUi0OSxQKfqqmkSCtrs/Rq3WeZ+xhisU2S5YaNqstwwjh0hJkXQS4nLEiOqm5Kul6ddXdeCflPyVouvUiA5Ep6Mq0FXVFOxdGFFrcpyl5w4sitVVUUkMIwdNqqEY2RF4JPAwMSAHj39j45G7/n9337yf/3zP9PnJcXjgd3Djil4rgkW1A9Dmh8ldLmx67levIusvNT7nc9Ar9BmFnS+FnK0LB4+iiqkVqXFwhaF5Rm8Wp/6S5feIpaIpTOsJIFlyVmTEXzApw6O98flPyqsKtURLIs/xg8OuvXnL8feJMyk+6QPkp2b51nQ80rT9QPRtdhomG3GGEbp6IuW87nn83ZDPjsmrxiZMVoxDSN+mmjqWqrLbi3bXb2KU/L+ppHJHCSZwCzmhBjpE9ezLAXua6xC+YBbBLI/zFQX9XWxmy3E7u12Kw6haV5JcIuqPc/3H8x6f9SKGTEJhKQWD+OwVs7LvfI+4lr0BK11+tpOvNrDMMjc4iZG2e12h3ZattZWFlJZFqkpVeT2CVBp4c7TxPV6QSlommpNrltr5VLb9Tw8POCsoyhEAe1aCVkaa+i7nqEX+1ZVlXz9+pUsc1wuJ77/+CYdFOkblVTBR2FgrU3OKvb7HeM4st9v5M1sb9IgZDOcM2gd7og6H5j7ke7lxkP2N/zrr2/0EVptKI3lNtzo2oHb7ZYc/tM70rUQ2rIsw2UyYjHrk1JAV/3Q36V9ZH6o0qJY72Ap/0dMnRrL70u7k9aaIs8TQo87dZuAVjE10waIBqNkOwo+ivJmZF6n0rE0JMGIILa2JVQc4p3qppHj2jKwDPF+rE2wH1nEIRJUlAeAUoJOjOKKmsaJ+XKlxBLVxBBGrI502nC8jnyZS/QI1gv86dq1ZNax2TRcb5E8y/DB8/r6Slnm1HXFOE5MXhZnnotyOvqJq78JvtAqNtsNWneS0uhOHN+OhABlURJ0XI0MS4RoGCbe3t5SIVDB4+Mjfg5stxshtb1dqeuKLJW2LOq0c47ZS37xdDoSguLx8ZB6CgXodDqduF1nijLDh3vR7SLUWeeY54mXlysKjZX4R8V2u03O/ogOBqsVm23DMIycTifyfFijHWVR4EdRPMe+47fffiPLMy5X8f8tLhHpdyj5/fe/stvtqKoqee4sbduvYczD4bCyRotCdr/Dw269b7y9vvH49LyqoMux8HK5EEKgaZrELBVhwjqD9xO73Zbz5czx+JZoXkZIyD4yDjMvv34RuoCqSrwyUh9kDN2l5TU5brquW3f7ReyQobYTL2KZrbzSeRYPrDB3ZubUKTGMA4qI0ffk+/qBSENyo6WrIwTWn90CfVp2TBFI5Fi+rAGNSrk7jSe5ZUgVcotRwCnAEMLieonp9BNRUYp+ogINxLt7LqEWxaJljEZFLeMEnxZhSlcsiq3LJD8nivTINHu60JNbw4TifGmx+jPtpedUTUwFbPc7NCHFw2ZQlrLMgZyu63h9PVGUBVOUSj2lNNdry629YnLH4/MjSnuMhra78agOciQtytQwFinLPA3bI34WDuz12mJtztPTI96P/P77TzbNDm0MTdNQ5IV8vseZsijRWmra5znQ3gRV+fC4T/RtiVxJk1YlRardxO08MEXY7Xb3HXAameZ5jdzVdY09HA5Yq9dQozxx75K1s5bnpyfark2ZucA4jBglPMbsIGfqYWyJzMy+Z/aG2VuyTDOOE09PT+uupZRexxXiKxUMgBDUWOG/Eu6O5EWJ0RlDgiZN08Tr6yu73S5xSP07IQO0iaDCCusRKJKl70Wx6jupXovph3PNe6Jx3PqemMy111vLqb/RjcOH+dtSAScBZydNq0n16rouKWhhPVJKGcu85hqnQXy51n6EMRmlJcibarulSyOFhEOKFHE3A8QY8ARZNIuiOqfDUrobvmfLrDGnRKhTINYypZjRCdEY1/tT8PHDnPNumYurCr7cb5ZfzxOvM8ZIkedULmduZZh+63umrGAYZqzJCV5g07bmI8oxSCB5aTMqy1LIA8PI4KUd2ClN3dRsNxvm1LkRgwfL2rxkncO6RgTGEFIyJzB7uN06nLM8PDysrFFjITIJsjIFA4wxHB4OjINQGIZkRrndbvg50SOcUMej99yuVw4PD6ikkVgkTHy83LheLowJ1KWNpW6a1HkpJxJrTQ5R3BTO5Gg8Pt2xpBEHCJ7SWZxSnF6OjFh++/qFrDCEIOlwl2XpTnIlW0pXjCJXZlXMpilwvf4rzmj+/h/+TNtepN13vDH7hhikDkxbzTin7nlluLZXmmaTFuDL2rq72LYWVIPssjpVuWWrhzIQyApHe7lxfDlSZiWPhwNm8ER/ZVYzl9sVHyURPyJD5OUIunyYXeqjW4jYUxzXOd8wTkyzX2X8uIJ6k7iQILsSYFY4ljlhRGswGqEbKIU1Aau9rCyvcGnY7sWhjU4O/jTdkEhSUo1tqq1zGDHOG51+r8cbjzVagtRRFneMkdHDMEdGL68/aoX36j8wa2SeIUKNWeSadGmL6YG9LPguRnCCC1Re2ryGa0+wDmsr+cD7mcnArDRThKAzdFbhk+EhRNCZI3cZw/HM9dKz3z1gsoKgEWDSFFKkakYxM88DMaRxTiYLoqoLXl5OnE9XNn/eURQOY6HrzlICGgJEnYLC8cOM1WUO0JxPLf3Q8vnLI3EyGCIm6lVkC+OImmcwBhMj2sqdsk7twf/P7/9M3TQ8P2/IrLSECQcWrIgVctzxk4RQXf7OeBqC7ILjiPeBp8cnYtSM08Tr8ScPD0K5ylyO0Q5nc8CQuTzNwMJ6pJumwNevX5nHIeUP9Rp0FESEW3dFbWAYhvXD//b2xm6349OnT1gr/57n+Zp2HsdRsoof0O+SzB/nCdCUVc2f//xnyrLker1gb5Fp9IRcMfSjtEQZi7LZSol7b6FbFt97ANOCk/DJTxqXmeCCvdA6jVUAKztwFiMuYSQWkcUoUFZ2KmMUecK0zymRf+eD6jUbGJPw4FGSI1QKfCTLFLkxOAVlLnhBZy1ZysbJHXFe1d1rN9L2M904MviZCS/B3qg/iDlBJ9O89ys8eNlpFy2grmsRssYR5e9ZxzkGrn3HMHuGfqK79lijielBr9Q95e/9jI6iiPf9wNB7iqLgy5cvWGs5n89Yq2iaRmaLSSzzs8LPYK3mer0SydL7JTa1IhfNYpo7UU8jjOP987IM4Zf+i2mauZwv0l/5+Mg814xjT3s+sdlsqOrU4aIteb0hakc0Dp1JCmma5hQyz/j0+RN13TDPI+dzT1mV5HmG0Ro7DB390NLUDVleE6JY0KzJ6KeJW2+1Ju8AACAASURBVHehv115fvxEP8yEVGZR1zVKS8+czE4yYlRpUG8B2QFPp1dCEJDw9dqK4JA7tA7kRc7peMLajGkMTEhHOigyV9J3E8ej1C4/Pj6s6DpjVLpfws+f39+hyl3qGp+YJmF+nM9n8qLg6fkB5SOvP17ZbiusKpjfBtrrgK80KIuPCp8yaMB6T10W4PKhXRws0yitvoKQl7CrX1iUWlNYS/Az1mmMtXLa8RPOaDKTUgtWjqd5nklNubUUeUZZ5O+IafeSzGs7MgYYZ6mmG4cBQdHK0Bzlya2lyhy7pmS73ax3tryQVLc1Fj3Lw/XS3nCqxaoBayPZDPNkmObI6AOj18xB7mw+CbfLDh78jAuzjFK8x48TMffCHpqF2mcwZJll7gbayRMmqEzBiOd4PuIoyKtdEo0i0cs9dejl3iSioLQ8ey8Yfa1LprnnfL5S15JemcZI8Jp5kkWotOL15cjz8zNZ5Qheo9TMZlOBmrlcT5xOJw4HOfZWWS0Pfa8gKBHkxp6yzFAseE1Hnlucktn06/lCVdfiYMozPHE1dIyDJ8SJ7cNWEhvnK0pFqrrEe8fpeKZrLZvNFls3FWWVc7u1BD+vw+G2bRnCRLMpedzvMMqh9Ew/jevgWziPopqez+c1xq+USmh6sagpFZj9yH6/53Q6gZLjkUlFin0/8vb2xsPD4/qhX/rnNpstdV0l0paIIotYIajxbULgXSiKav0BvL7+Yn/YyNk9QaNIOQKTQFRmX3Ks+7VibMHv6/R9hBDWIf17uvUdJaFS+UxyGIWAUpOwS7TsSiiFVYHMgHPSVJUZS+E0ymjKoiQvhH1T5HlaiJrM6cRAuReXjOPI6+nCuR243nq6zjNEQ8SJ4OIFG1JUhl1dc9jtOOz3bDYNRZlL21C6f+qomP3MtWv58XrkeLxw6TuGaaJtR7p+ZJgC/ewZxgkdIt3I2pOhkmcvpMH+NE7rw2r5+cQYiVqBMQQtJofpNlDaipsaqaotY5Cukymq1GGiuLWCE9xsG6GZMWON+2D1y1xJXcl7P43JBYVhniPnU4s2+l59tohQSeQ1xrDf7ymKktu1I4Ze4Mch0ne9YDgrUdvFfij36QVQkGVSQqTzfBXvllOLJI4Cm82Wbb1nTDrL8j4u4e2HxwcJsrctVl6cDC37fuTH918EFXl8fOJw2Mt5WymMs1ilUEGOrzGR0UJgLcTQWvNv//ZvhBD47bffKMuSLHNMkwgqmSvW+5K1Jc6VvL6+Mic70DRN/Pjxk3n2fP36hcPh8K4qza33vqW9ddmtqkoapU7HM8e3E5kr+Nu//Ruy3Ai7JAF0LXqd1zhtQHkKm+OsoR+lyKVFJZ6ITj4/v/oUl2PvOE1r+UdUCLnLSzIjKhkf4GeUj+RWUzhDlVuawlHljqrI2DQ1mbPCILFOxARryaxDKbBGzmg25c+maaZrFUPXMo0KMkOhcnRTr6ArEdIMdZWx3+3YbRoeH3Y8Pj9JXEhmIfK9JPy+D5FPtyu/Xl44Ho/c2o63twu3m2AnLt1A7ybaaUCpkX6aISqiMmgi0c/pLqUZ+jEFanNilMypCnAbB0wIROPobwNVXsL4Rr7JIAvkJuN0bvn56xX/CGWVYYwCPNqQxCmVGD1hFbbk/S+JES7nKy+vv5LJo5EKbyVKvHUq4SkkPK2TSl3kNZkT5um304W//vWvbPZ79o8PSeSKCYFoGAcxtns80cuMsSkbNnXGHGb+8pd/YZ5nnp+fKcsyBcllVuzHGeYZZRUmCWGkzSTLCqzI0NB1N9pbJwWfZc4cAtdLR1VXaBSz96kfnneCglp3h9vtFa2lukwptSqgIrebFUkIrEponhc8Pj7J06TvU6OSeESPx+MqguxSPlCqlf3a1bB2y/lE65pnDgexqZ3Pp0QDz1BGkh4mqpWe7ENAhQBRymHGaWD2M0NUBGVQzqy9iO+VwrAQ09Z0uUIF6WdXOhKDGBKcjjR5ybYpaMqMXVNy2FTsG9mh6rrGJIP8IvPf77JqNXGv2UEtH3AdA04HXF2Quy1a6zRszlar2zaNnDabLQ8PD2y2G/FzpoeGHLPl5zeFSFbJXe7x4YHb7cqvzSuXc0vfT7ydb7ydz5ibzCWt8sw+Mqdhvfdyl6oqGWxfL9dkwEYq0DDEkLzuc2C4tOwKiwusD9Jh7FB4trsGl8kguyiyVD/90W0yTdPdmB9A65jm14HdVo611+uF3X7D2E9oU6ad+a7ELnEnqVKQ3aisKknmx8D1dqOum/QgSfTyKRKWq0pSVUsv9sVb266inQTfJf63CDySQ/Uoa5nGCZUeIsFHuu6KnYOn7XqslozTME7YvKCqK07HE2+vJ3aHBmOzDx5Dow2zlhnV2+lEVVXri1he+O0m6Yy6LsmyMiHoxJ71/u8aUn5xs9kyTSH10Akoqu8HyrL60LvgfWSaJHfmvef4dqEsS/b7HWetJEOYKt3GyVNaR0g4gYBQrp3JxcEfPSH6D8xTYzXjLH0GxhjyxFX1s2caJ4ZxFK5nCOio0j1LYf2Mip5Ma5rcsN3kHHY1D9uG54cdj/stD7stdb3BaEtMjqNITNGtmeiDELDTwH4F/dogQ+2qkrmVWiBTnjGXlPg8z+RZxv4gBa673YHNdotN4szSv2C1k6NfCKg0cHcbgW712w3bZsPb64m340XC3WVGfnQUlwvnFvphpps8Q1JTPR4/e0yuIAbGocdHwYvIru6wwaDnwNx2MGiCmRn6wKXrKDc1VZ0zno5URc3sDbdbi7GGum6k1yQMaHN3aGlluV07CXWXAgK+3RYVveft9YTSkbLKATE4xBhFrVWC5rh1Qtmu65o8D2JW2exkkP76sraJEe8WtizL8EkBP55eMCnbKHkFifzdbjd+/vyZInkWm9p7dfr1bhzxUdquldLYaysvoipKpn5gHDtMZjFG0Wwq5jnjdpM0fFGUaGVT0Uqk60d0nKk3FXkmT5xhGFY0u/gn4XKRIKazBZvNXhgts+f15Y0QPdvNBusct1ubnv4BMOJi8JHbrV3/bnnaixtHOsILDg8HnLXJfiVZHZdpHh/3vL688NpecZnjcDiQ5ZVcmtVIuLQygPaBLJNOcpX4qdPo6adeGp+03CukP3BgSri7hRMTopLFQ8RZaJzjUJc8Pex4enrk+fHAl6dHHg57SW0n4SqosBLJlZI7WpwDVsnsyXsv6MQYpTpgv6epS3yQbKKMJgJTllRgAnVVsN1u5Z/dVt4DY0mm2TU/Z7QR2FOMuORpHZ3FZdKnt9sdOJzOnE4nfv16oShy3nJHcbGcbj3qNhDiwDjLyCR4GZNk2jJOo7Q8AVlmxc0TSQshoLTjdm4JjWX3uGXWManj8n1bI0S0vu+5XK5Sb2YsRIvC4GfoJ6Fwl1mxEgzuNeFSi/D69pJYpBvyLIcowKfr9UaMIZ3EHpLq3VNVBdPUU9UVWe64XC7cbq2c7rRGJY7S9XSRuu9PD+9KUR0RtYp5yyY0DAsLFhlPhcj1elsN4jGCfXx8FpN1DBinyQrH7AU1INKvlm0+wul4xntx12eZpSxrXAbjODCOw920nDrVBf3u2O12zPPMj+8vIkEnPmezKSnL5l3v3rzi6xc2Z5ZV7HcHfBAM+pxYk97PNM0m0apnfIjYtFur5BcNfmbbVNzalkub4ieT4jh7fnv+xL5u8Jmiu10FduWlmanruiTPJ0FkGpnGka7v5D64gJc04k4hYLX0DOwLx+OmYlMWPDQNf/P5mT/96Su7TUOWy53YGkvwC1zXr8Fjow1Ry6wwJlRICAGbolTWObSpUvmqcFTmeSa2M+OlA60oK6kN2Gy2VFUl/lWtpVMiPTRiShMs1wO7AIeCxcXA7GeMNpRVwW7XsKlL9vsbv5qKzanix/GKOZ7xbzBf+7W3MoTAHKX6zljp3yDxWqdpYpxnTOawrqAIGdd5wncDg5GdZRgG4YaOIyGmHkCtZVh/m9JJ5Cbm/KpODFR5HwQRKQ8tpSMRL43LSnCYXSsFO8M4sNs1uFxhncb7QXAfYaYfOrreUDfZqrgHH7herszeE4Picj0RxzlZCUXMm1OSRgqL/Nr+K3fjyOvrK2GeGIeRvOik7bqS7peu67Ehevy8nH2NDBm1BXRqMZXzuNUiElxOR7I8Y7M5oLXMk51zjLeOeTYpDS1FkCHMa4ARFFmW8/r6SpZZmk0pHJbE8liwFC8vrxgj7TrOSfJ+nuaESKz4r//1v/Kf//N/oqrK1RHvHGuz0AKOXRguSgn+sKgFdfD7v3+jzgq0RgpQgOPxyOl0Yp4jHQMDBu1y4hwYxx4Qq9w0j0Q82qi0ACMxeRcLZ9hkjq+HPX/6/ExdOHb7Lb99/sTj4ZC6PeSeaZXB43HaflASl7mjRJY+ou/F8GvvFeJZTj4NXK9Xbp0gIY1xZLnUMouZIdV9qztvRimNUXoV15QyspOpuJrIrcnx1gs3JUYenp7Y7p/Y73fs317ZHs80v14J8a/0/cQUIlF5Sdd7T5YZtJMK6WGe5ZSiFV5DO3WMISevc9ShZC4d3ktbc15UuLxEx7BWwWmlyJ1j6EZu1wuHh70o1ckgMPgRkx7KQjCfpe+CSUwbViW7pZCwv3z5dKcBeI8PE3hS0l16MmIiCs7TjEmoll8vv5inme1mg/KBrrtgjJUuzWQRjCl7ueRPF0RIWZa8/moZhlGYMonZqpeOknHoiNHI2Rf54spYjMnQ6ZgwTzO39kZuM75+ekKnGuVfv16o6yo1khZrc05ZVmmBTOuHTO4rJY9POxSaaR74/fe/8uXL57VbryiKFfQzjmPixIyczscE5dnyd3/3ZzYbcc9crhessVRVvSIN3buEx+K6aNuW0XuapuHrb19RU+B4PDK8WUp3oNg/0vYTM5agFB5JKCxjCqm0BqUCzikhfXkZyGdWUeeOfZ7xUJd8eXrgz3/6wn5Tsdk0NNutDP0TxNYaCyGuAsMSEF6eoHeymf/QzLtY5t7j7o2W+dc0RjJXY63Mb+u6SfwX3gGZVOrIU2uW8Y8IxYXkbY3BYFZvqLWWGAxFYam3FfVG3o9fL2/8zA1LD/g4TQQDRmW4PEPPiGVsEm9nzC3earzTdGFC25KQ7lI+RqLRTGl0lec5fvYMbUtEreKcdQLzUsFSFrl8FlVcK+MEpWLQJjLPYjkTvWAvaIpS7myonLxwOJOlzKRiu9kyzQkslkLP19MVay2H/WEtrjn+fF3NDmJSKFKIXa/CWghxtTM6a9kf9kmZVZyOJ7a7rczalcKGUaw+hpKs2TDPLcZKwnocJUWgYqDOc4oiZxw8zuW4Ise5nLa9crm0FE6YitM0IVlb6S2c55myLDns9vgIt9sN5yTLVzcVP35+l4qp7SF11g1st/LN/uUvf2GaJooiZ7PZ0vct5/MbWS4zoPbccew6pmmirrZrIvuS8OOn1zfGfsDlGfV2kxLvPblxbLcN7cuFwsrT1CemCioQPUQvfQiL5/Vuhk64v3FgVpBlhibP2e9Knndbvnw+8On5gYf9QRwRmfR6ZHlGRLo9AoEiRSXe09RWAFMITO+KPYuiWKHB91mlWlMbzmViHk/ttUpbZh/RMaSmYtn9ooI5zngPRuVp0nf33lqlMMTVxS2ohnztpLCuEhuXMtyGmf33bxQ/MkKfOjfijI02dW5EwTl0PcPUE4sCbQ3KaIzTGAzX7sYcC3rE/E7UQvL2soC6vhd6e1EkAcunGV1BmD3XW4dxlqLKsVYejiGIWj5OI/PkKYpydVUNgyTla1vSDzfOpzN5nlOWJUpZrM2kzm0MH1ROa+1KQciznKYpeX29cDq/YU0ujc8xxcuU0O2kErBn22zTnbOTurw8RzeRPpHcQGHLMsd7uN6uvJ3PxCBDbbGZyRnd4CEG+v4msnBQxElW9f7Q4L3n5duP9QNbVTXXywWtWGvS5MMT8X7EWMfx9MZ+v2O73UjV2fFK1w3rbvrjx4+0mDKu1ws/fnxjf9gn14deZ3e73Y7gI5frhSxxJhe6WlkU1GW1Ngpfr9cP/JYsz8jznCHNLr33eBVWOdsY+w6Qu/goWQ3WWkFTOHabki/Pj/z50zNfv3zm0/MnyrpEWzlhLBAtSY7Lkc+luvC1ySotQjEaz6sxfUlUvAf+aq3XIG6WZWvLz9K9KPfkj7Vp6z/h3o1oExf2XTjsfjxOKfAlEP2eo1Nkln1T8rQ/sK1+MM8toxcs5d3M4FFWnDqTF5PEnGr3ZLe1bJqcCzC1Hb9+vvL0/ChFqb1wgrabzfogel8NF0JAO0uZORFKLhepZIhOkvVtT1Vl5IVFqTu6Uel7lUBd14SYM/Q9x9MRqysUGW37BjGyP+wTcEsedkbLCKYoC9SmQZuIcobrteN8PqUHtGOcjlhr1qR99Kw7pveewsnntyorTOY4ny/Yy/mNqtpSFRV6GPnLv/wb8xz48uWJp+dH4jyI4z4EhkH+ouv1wn67l1mbihL/qGuulysvP1/wk18X1zSNqXp4pihzrFFk1vL5+VmUrAjBizng5eWNv/71X7ndbvz221e+fPksu8I0iTlA3e9vZVmgYsBqhXIZzuVcry2vr69oZfjy+QtF6srwiZwmRoEZNQcJJpeaqCKucGA1fvRE5TEoLDk+pmJNbVEEFDopmBFNxFmJXj087PnTly98+fzM4eGRardbHxbW2SSIaClWSU6bqCMEhUavXYDRe/CgseTvmohXJIYSTIbVNvlJE4ICyKxJxzAjTT/v8BliSk5PXSWM05DEi5j8oe+op/KaSEl+a1NECowy2LyQujrnaMqCsszQ3SBB4nDPeRrkeOpTNV3wnhlP9AFSdCkGsR9a5/j+7Ts/fvzk6emJw36XqNlhfVUxJVF8FP6rM3K0tkWO9Y7b+cLr8cjXr19EbzAizCntV+FoCfIakxODQispKHW25Nu3n7RtS5Zrdl+3Kbiu1hC18HdS6NoaolGURYmzFSFEManEyNPzI1VVrg/vKYwYo1LTlXiIxXMUMKZgu91jl91rHGbavmW/Fw9mXhjmaaTZVHg/pZpqGQ0s7pG+69ZE+fVyu9eiWcu3b9/p+zaZhlXKxlmhnpXFhzuOcxnny3eCl0FyCIH/9//9J7bbis+fPq2Y96WUZin9cInfEXyg7ya0thwOB8qy5OfPnzweDmISFglQfijzzL7Z4MWDRQg+9Ro4jAkYBXP4IwlbC0YeRZynFWtotabKch62Ox4eH9nv95SbBlPk6MxKQFapFO5XH1gxMUaCkie0XuxYyWI1T9L7uOx8y2xsZZyg8USccaKsJlamWqJR72BM75XnEEL6M/d6bdI8Uj7Tak0PLKBfwWZIkY8KEjrM85y6qtlsRYG1515ASVGnAPCdWyN4RVBRRhnrKQLNvPCBBoH+Ki2Lsut7Kl2m04i5hwneHd8l+iTfQ3e7kbmFCaNpby11U67f2x97PEII9P0ISk5mfT+nWWHB2/EHv369yOcuGcoXm+b7ktZ5Fvq8VtLCVDd1+nxJ2eiijKr09ZfkvRj05f3TWglC/9vvv2S0oKGqCsHOFYb9fssweV6OJ4rMUZUF1opJ22iDs5ZxnDidxWC922/Z73fi4SxL9vsN375/T+6HnN1uh7X3EOjSY9+2HSFEiqKgrmv+/d//nTy37PdbXl7e+Nf//m8rDbyde+ktUFFULCu7s1KG3e6RoizlyJBnFHnG+XpBobDO8vTpWXKJw0RE0w09agowRZpCU5YNeX8VWFGa3c+pJjz6sNadWS2ZO6cMuTHs6oZdVbKpK7aHBzZNSZZbrHHvMBL3hfe+Q+KP/1NKgVFYrIwSFldOWoCriBIVGrkXKoQ/A0ocQPAHkPASupCB8zgNkoQ3Riqe0yJjoaopEaACMzFqVLSps16LD3S1gmVit7MWZw3Ry+3SOZt2gDmdIiLOGkyIzFGjjJMRSdQM08RtbCmrkqfnA6fjmSJ10vdtl7y5JWL2AqdFKbfWEpOnNUZpb7JGM3nPZtPg/UTXtRirUnMvKUtp7h7iGBnHAbRns6uYR4/SE0/PMqx/e3ulKCuqskIbnWbQadg/K4zJpOXJzBwe9pzPZ4ahZ7/fMk8Tt1tL3400dUlZVkxA9JHbrSfGwDCNXG+dsGuPxwtfvhTs9zusXUzLLUWR02w2lEXG7Xrjx4+fqWBToLzzJGHLTbORRIOK0i04T6hBhpYPDwe5h2nN6XTit9/EDzpNk+ye1xuHwyF1ysmsZbeTQfNut+Prl98Y+lGob87RNA2bTUtZFtyuV9r2SllUfPr8ScA/qTq7WBp3Cil8HMaBy+WKswXBG5RyjKMni3J2d85SZgWWa/owmmSgSTyWsGAcDNpkAnxVUKTuCaNV2h0q6kpmgYqlzizdJXlvm1L/YaeK96LDD/fDhT9DmvMtlDO1dAauT+i7OXj5u1eKtiIdq1h3xZjUSMnKy4lAR/1ut5b0fFw6743MGlciQFwS9RnWSid9VHpF5M9RWqcMSTUMsnPlLqfrO/o44J4KdpWwaWYVmcaBOX02yqUy79Ym2V9SOdM4MY1Twg1W5HklI4K0syxzZOtqpmngdDyz2zeC1Uw/s9NJLI11XeOK9LOeA6hAkecMQ2S7lTLTb9++pWZg4aqGEBJCX7Hf71fYGMiijqk5LC9LXn6dOB5PYs4vCkxU+MQyjUrxsNuJmuucgG8WTNv9yQ3n46vEPKqCPMu4tS3X6w2jxfGy3W7QBspK8IfClOlWJorE/fNVRDmfr8QYuF6vbDYbwdDXdbowB0L0KA3D2BPCBpdrsixnuz2I3NsLNk+piaKoeXx4om2vgoTIXFLYBD2xGK/FVZMLqKnrGLuJExeKcsOWguko9d6bpsb+/gOjAyFh8pZUyPLBcs4QEWS+SUqpsQabyWigKMU9YbRZ40f3Sq/4oXnpjzvWwiVV3EFLf9w1l3/TKQEfkft0WP6uVH1GDCu5e1mnC2BYrbjEhGUECHHtDyEGolFSj2bUehQLIaCEoS+HVSWjDHkIgbHiAlqSFctRcaF9mwguQJ5lRMRlNWUK7xQ+cHcMkejEUYBc0kcycLt1zPOIUlDVZeIYmdS/MZHlwm1ZeDo6daRYa5nGQNfe8GHEh0BdlZRVscajrLE4Z5kmKQ46Ht94fv5EnhfUdcP1euV6vSYi4JWiyFJ2dRnMF+uDdElLKAUPjwe2m4rz+czldkXNct3Z7/e0XQvBY6zFFkXB+XJeGTNd1yUBQ75A3/crxt4aSx/HFOdwK3rhFI5YK0+WxWS9DJWrqko9EBN5njNNXnbQjVppbSqo5N8UWND5fMLZjKene222WK5GpkksZmXRoDVilFUa6xxMiRqmdXKBiNk6Rr3ySbtrR2Y15aYgjhpXaFQMNHVJYTTlInXjEir9PnvMnAXlsJPGBk/pHE1RcNjtaJqGPC+wKX60zP3EsRUgfsTT/4+OpZHl8/eH3fEj5PPDfW2tZ0tMVVlo4d6uuyzAhUWTDrHSUxixyqQv+h67H9KfSwj8ZCpYhvkmJcOj9xjxjaARpxMqvgNEaXQEfMCGSKYUWW6Z6JjVTEQIcT7dUa019H0nu5aRV+rn5YGiE/HPpe4UD5hEULtvHCF4nDHrrr+wPr2fGCefpi+aefYYK9+rSyKMMRnWOra7DbOfcNbgnCQdlOpQKlCVlWRj25M8iKxFpQf2euVYX8v8ATEyTRPVVgIOmXO4tM6s2Me2OOe43S5pMC0X5Lquk9ug53Q641xGWRYUuSDepCjSJylf6p6qskqJdJcWtfg+b7crztkUxpVxwfl8Yr/fY9M9YrPZYIzwPyShPWJNweVyZg4iK2/T/w9DzzBO4rbPnOT5SJ3GiVszJQT5NA4Ybdk0e/TBsT9sOF2ODFfPXm2Zp4H9fkPhHIUOBG2ZcevAHyMkMuuEhu10xPiZTGuqvGBbN+Spots6lxgv4tBHLc4deTgs9WIRVlPwyvWLy3Exue6TCPB+oK6Wm2CIoO8Nve9dNx9W9boQ07FS3f/b0lGx0NKXP7CIIHfMQ1yPvwvJWyq+A1ZBpuX3exUFaZ8YLfM0E6aZiMb4QJ4ZmqbgX6//ylSOqJARghg/skw6I+ZpXkHCIXh5qIdI09Q4pzFWcbtd14eRc04eXinpHxMlTsfIPPt0wsvZ7/dMU09d55wvJ6oqp9kUa9NyCGp9EIGEenMX6LqRLMt5fHog+BkUnM5nwEsvfVy+thGlNaEpldJM00B7vYlY6Rx+GLleznSdUOO8D7JhLEbVzWbDb1//hp8/f/Hr1y/atuV6vaa/XI6kZVlxvlw59i2busE6TYyG4/FI02zZNDuGYWaaPNZC1/f8/PmDw+GRr19/A+Q8rbVisxGIz+12JkZFs9kRgsIaqbX23qfOgU68go0k9qOJKAelK8BL3fLQ9uz3e5SxRC3P5cyJsUBry6fPO6qskh0x3Mgyy3ZTEaee4TRghhuHhx1FZshmTxciQUeB9ThHtJrCOElKqCCI/GCorGbT1DTNltzlcmdaYmhRC5J+uQsi3RuEpNTFVC767k54nxv6dbap/nB0VVrj0h1roaHxblfUC1I/3lXENY+q3u3A73Zi+TrxP1SvydWEdXSRvhROG6xRIt7gyZ0l6EgXUo7SiO1RR4WKsohthE1VYjPDcJkoy5LjeGWaNbau0QuLB7G7dW2PNgqX2ZSCuXd+SFwOuq5bsRqkPVmn8c21vaK1paqalbhtjDhxXPZAjKJuutwlj2mihxtH5grx5eqZ/WGL1ibFpSJFXlKVFefLG8fjhTwvyFyJ0S4VxEb6YaQ7ifl/u91ijaEfJXwgfl6V5tY3qqrG5oXsWuM4Mc83Ipqnp0cinr4f2Gw261N2mke0jmw2Fc7KDinoiSdeXl45n64YLYj7t7cT1pG6AOrkOJBjalVldH1H09QMw8hu/8Dr65Fv374xjYHtbsv5/EJV1RweNiig6y5UdUOMIgy4NBNrNg1Zuo9akzFP3hEMxwAAIABJREFU0mfXtwNFUVLVpbjz5+VeEwDP+fLGQ97gtgV6NuR5Elr8jEJ2F5dl2DwDK2l4pkk8tMpgYqDMC3bb3Wo/iiGKHzFKg5GMMu5zJmF8pg/muwR6CHfSc3iHTFfpOLgm+1HvgFb3+5qP/uMu+IcW39U/ej/0rr5MGcSH9YgqIxDWUhj1TtZfF3Sy38V3DBmT/lyIgpf3AbSTo6oNAaVmtIW8dCgbUZmRyrsYuN4GbFpAIYilcLfbkeeZHG+X00MKWw+DhAUk+jauPYIyehDea1lW5MVymgkrxFjI2QZjLVVdcGt73l4vWC1XjuPbFaUDVd0kxqn+AEvWSSGuqooib2jbjtP5TIzLBiPkgv1+L8aTrmdOjFmtFYXL16tZUZaSrDdas9lvRUlMXXDTMPCnP/3G8/NnxnGk77vVoLrI1YtJ+nK5YrTFmpyyKfnHf/wnrHU8PT2Q546u7+6Dy0mGpdttQ1nI7C3ESFmUPD/Ljvz9+78S4kxdV+IRHcX2ZjKzfr7EICC7AclR0TQ72vbG9x/fyYzl6fFxTVt4T0orRCIy8K02DcMloNRAbgJl5igyRzGOlLrAZhnGabS1YAUXH0xEq4BLZaBZbinLjLLMsAYypVFeMcdpze6td7K0CqKW9IQKKUWRdkmZ94l54X05aEiJEB1FmVQ+4SJYeLxiT5OrXFxujKuius7sUGtHhjZaRJZ3au3S6La8VynYL0JL+j1+eZ1I0YvTYq7W2qLCLH5bLRSEeQp4KwvdJpeMthpjIS80gwJlLBmRjSm43W68vr5JCHkj6ZgQQ8Lxy8Msxhlwq8f13owkc+O3tzeccyIYptMGKqyOn3RESS1M8jOo65IYC77/Lqe/T5+eZOdMbcVixk5VcSxCmnCQjFVUlfSc/OVf/iKz6ccnNpuGmAwuLperlu0TPpKF2uAxztHs9tjl6fPz5w8IgabMsVshWF8ul8SRqQUydL3y9va28vr3+30qSxn5/v2bWJqKLJ2LZ5IR/oNs/vr6irUSExHCdME4jrSdPME+fX6kqRve3o7cbjceHh7WF60D69NeHCSaEGU00rUj1lm+fv1KXdecz2eZH6Wxi5JHNlMMRKMJXhTVIV4p5gmV1bJzDhODdYxOZmlRa9DyBmSZw4SZzCgyIHcabcFagV9J1fTS5DulYyLrTshSi829nHO5Y61dgu9EmwiCygDS9iq9eEvP/JKMkH2EmGaZC/qfPxSLrjY2AbSmmWP4KL0uR9vF/P3uaEpKpC+LclE+l2/AZQ6MI/MOxUR0CpMrslZEN5NnBAPRBAY/E2LO6INg7EPg8fGRLMv49esXTVOjNFhr5PMXZ7RhxcovxOtxHBmGgSzLeHiQTpPb7ZaiQvcHjaAxEpI+yolMeUXfdSl0UKZjruRXy8pibLaWEi1PqfeC2Tx7+i4R4POcL1+/ME0Tp9OZelPdH3r6XmunjcGPg5wkgmgXtr213G4XmqZhv3/gerkwe09R3kljS2niwvn8+fMnXdfx/PxM3wt5+M9//lu6vuPt9VWOIjpnmnqBCV2vIt+anKfHz8SouN0kRDnPnnGaE725xvWOqq5SQlrqpfb7PZnJcDbj5m+JnmyJ0XM5vjHMnufnT9JXd7lKU3DR0PU3rreRupKdXnAURiq/VYGxgW+vv7DXhl35hSorMeoi/QoqEBD5HetwSpRE6+VOVOWaqs6RcEJyqWiNjpEYtQgOMbnxEw2NFZAU5A6WsnZLQY3U6KrU/ZAw9OtdT3bAP9ZmL44ea0WJjEGUyqAEkZQOtSu0F/3RPRKjut891WLTEjVX7H5ACgKHkDoyAGUNHiTuo8FYvd6HvYqCb5R9lCmMokJqUAS0kczpeB6YYqCpG6IuOF3O5HlGWeWMU5/gXQVVVeF9SHPXkBbhvBLcq1SN1/fdupCGoWecxARibCoz0jYVq6ZkzdSRZY7Dfie4RO+pqow5aF5eflCWBd5HnM3xfoEja2KAfhi4XE9SFf+wo73dEtC6ZBgHTqfTis2Uz4KIdUSxy91uLUSEwH25nBOGzXM8/qRtZc6X52I/izjGwa9WnIfDM9ZZjm9v/Jf/8t94enrkH/7hH9BaUY45VVWKIjmNEEX1WniOedPQNIJ567orf/nv/8Tf//3fsd1tmb0XVkw3oFDUTck0WYyWGaafO3a7gyAB64p+GBgGISHrlDUUdVKtF99F4X17Pa9UZaJh6GfaviP38Pj5M1m0uEFT24w6KFo8vTFkzqGsIURJF+gYcWicMam3riTLcwnjRj4wYsTRrz6Q2eSXEyw3BlCCZVTRLN6XtAhFzIghHVXfNeL+QT/5METUSrywa6fE8meX46jig4jzP/rf+ye9TvPSEO84/Pf32LUiLYiI5VES8QqzDOdjwMeZTCmctZRFIQUufmaYJqpdQ5W5RA9Qq0F+s9nQde26e/S9eFOtAWs04yCtvb/99vVdLIt1JLQsTB+k0BOy1Ckhxviul4rr/X6/so+8H9E6oI3GacvT0xPez3z//lNSQy5LA3mJRxljEkZFeuwXHKdE9nJcltG27codXexr0rt4Jcuy1J+hsV+//gml4eFB8G4hRMZp5ng6M40Du92WsmzY77dcLjdu15Y8zzkcHvj8+Qsvrz94efnJ4bBjniXIm+cZWWbXssyyLPFz5Hy68PZ24tMnz3bb8Pd/9z9hjObl1ytFWVKU5R0mO4ypFFNIcNMozJjj+cwmQtPU7PdbwjgQ1D1V4Zwjy20iXct/f3g4MM+e9jbw+vrG09OjJCxshmJievGo4Nk1NRvnOC1ztSg4AtnL7oKJRVFYR55l1EUpZt8Y5U5n9AeL2mofe6d+aqNRclJKPkrZrWJId8c0FpA+xfDOEJNGGWqJrr3vt3/X6psW7/sewUVnXe6qy4MqhOVriFhk0mUwoghqOWomysDiwAlRat2cIBqzVMWml3GKUniVZo5+xgjMA2ukllobRdNUQvFDaH6oiDxjAnmecbtd125KGTVIaahwXwox90fJZVorX2EtLJpGEUisWn3Ob2+vjNMgYmFTpbBvXGe609Qnl9EkIw4ts/Hnp2d+/nwRQ7mC3XaX7qxmXeRGm/XEKKJQmaqya6qi4nK5cjweUQnt32y261gJQF8ul3SHkTciz6WZNHNZUv00v//+17WZdImW6BS8PBwOH5pe27ZdU8POOQ6HhzQT8cx+wAfPy8uLXJi1bMfb3YFhmLlepLkmy8SXdzyexQoU3wkIq6lZ4ELLkHSa5vVDtXwoxYKl0+te6qnseq/RxqByw5yNmHrm6bGh0ZrCe7L5Hp61aeE5ZTBJANHp6FFV1epyubfjqg/3YDEcSJ2a0QazuEi0FXI2//870/37/2gmFpKB+iDm6D8cOUnHKJWqr5cKbJVCvmJQF7VZa5MM22ptBH5vEFiH0WimcUqQKwOzh4SVzLSBxJ4xEXSI5FpR1xkjE1F7Ap5h6BOOQq/144vossTfFtNDCP5dplI4Q8v16L0JYjnxLGqm7FA9fd8JoqTrE61dvQs869VcEmOkbVtxV42SaZzm6f+j682aJLnS9LznLL7HnplVhUJh6wZ6pntEDskRZTKZrvTHJZNRJtEkmiSSM+JwegUKteYSq69n0cV3wqsgGS9ghipkJiIj3P18y/s+76dcyc+m2p/CcOxMa7+66m2S/10HmBF+Md2+Qs8AbNd3FGUxq/wlfWac2YlXB/iHD+/Ybm9omjr9gMDT/hHvx+SGkDdGeIueLMspinJG0InNY8tqtaQsK5wb2O+fGAbH3e0zXjyTEuR0PBBDlIdAHQUYOx3RKmOxWKKzjHohqIrD4cCqrrGZ5CbOAZukG0+JOqdtW/K8ZLVeorU0+n1/4enpQGNzzFLz4ccf+c2vf+A//D//hD1cqJqSXmmCD6h49aF5bIoGF1brikXTzMlKWml8DKn407Nc5erLI134Ia0Ern/96bHxKQswxvhfrjw/cxJ8HhSqUfNCPqgoapUUHKqTz++6XL5eRIp0A/DLMlWlL5YoA/OLjHpjDGPmPqHwU16JGx1GezAGFYTQrYLHhohRkbvnN7TjhUE5+skxmYALciLGmDIwc9lZiidVPKbWGJbLBcZo6qakvVzoetGILpfL9FCePqMO6JR90tN1QkBfb5Zp76w4Hvacz4rlSnLor+SHa/5jVVYoDW3b8fT4lHp+0SJn1so1GiNlVeAmT5GVqY1AYiSsmNsvlwtucpRFRljWMkLLLafTgSLPKZNzxN7sbmi7Cx8/3lMU4mAWYJLm/v6RcRxYLhc8e3aXMgc8wYuOclEWHI8HpmlkHEV4OwwT1haMw8R+f2SapqQTFQ1pPxzlexcLyirn6enITz/9xN2dMEy2mxsUhqHveXh4IMTId999T56LRyu0osBZrZZ4XzG2PX0nCIOrR0zrLOn82hkIdX0gKB0xVsohGs356UTUEyEO5O0T33z5BX887jEuon0gpB4jNxblHc6PqEysT1VZU5YNmc3nJF2jzKzVTDv19JBXc3CoilcMQgroDMm2dB2hp2meCMc/3aBEfpkNET7FV6tZ2fL5jZTK3Pl7VNqB6tQ3fnIHfC6nuyYwxesQ5rPJ6rU6yLJ8DubRRuODIwSHG3uUSSVsKtG1D5SZYbtb8zT8jGkyqiaj704cTyfyRibl3gXJnQ9xJltfsRZykwggTGmVzN7nWch9fW1SWg6yxK8tTV1hczULDooyx1rZ1R32R4ahm/MzhC8qCMr+3JPlGS+/fJkyMXryLMMak/bbA4f9nrJsJAoBlXTLlq7vOR4PLBaLObPTXaaEcGkwZsUwCAGiqWvs7mZLM8gwZRgGUZkYx/ncUjcFTfpBSiecghIzqNJSE4uT2zBNjqfHC+/f3bNcCpRosRQJmzF6XlCSkAptd5YJ2dgRPLx58zP39w/0/ciXX75kHCbRBVqThhMJomMtWXK8k5b1KipOpxPH8wXnIpdzL/S3Ime5XMwTMSlBhMAMkRFHs90RTcvh9Ts+Pr7m6+dfUf79f4ZpQuU5RVlgNRjE8Cs3TEZVl5RVRZYLUjCkkshcSxajhHDmRUysrtnUV6ravDbQoD8JuK/TvzifVP9/Cdr1SJu7x+TyiFfAlZL/17x/TH2cdIYhKT3V3Dte+9BrWnJ6sZIYlCjrzGsJ+VmZNSwXNdv1moenR/b7g7hrcBA0Wsk+L0yR6CaWqyVVU/DuMBCziMksjV7gg0pDGItShq7rKfKMRdNgjU7WppBufDvDkdo2eRCVouu6X8QnKCWnVF2X8+TXWOnxrm2UhNfUTG7g0naM/ZgIBSeKMk+BLQVd184IT2ttyl+8AognxtHx8Pgo7891IFhV7Ha7VOKmCg01ozO1NjPG0aV4dTHd5hZtFJd24HRqubm9FZ5nnhGAyTm0MQxjj8kUgSAsyLTfapom0bMtp2NHnpUCNUJqeAEAy+DE2pzlcs3d3TOePbvj5nYrjujFkr6X3Pmyavjqq68l7cnI9GtMVhe8CJGNMUkrGlmtluQ24/HjI13bs9msk6HY4v0nNMV8yigRIuMjVb1k++yGSXdUZUXukEBPgc3ggwSv+GkSE3Bm2e5WNMsam0mwqNI29VyfTLUxfuYLT/HWSiNTw+CTzy/FYofI5AOT97LET18TQ0gig3n0km5CiUmLokQQF8TV7BrDJ40pn083AyE6QpgEehxcuunjLN6+KnsCEW0sRVaQW4tRInRXyYlhNDRVxs12w269pS5qVFS44PHRM0VPcB6rIMOzzAtUjExhJBpZqxRFhY8yrFAY9vsTIUSauqLMLE1VopLoXNolPYumiyKnKIRtu1gIYuX+/kG+v1mQZWZGeMQrEkN/4oJekYSr9SZloBju7x/J85JF00ikdoJUX6kS13zOawVSFPK1i6bhfDnz4cMH2Scn59B1laKUpiwqrMlkPaZlNmCTJNS2bZv4Fw60oa6rxIDsuX84sFg01FWDi36me/W9J7OKIhdne9d1nE5n6nrFdrtit7vhfD5yvpyxVs8ujGEYZ6f409OjONGrmrpRnI8t1hpevXpFWZW4aeLnn3+GtJDNsyKh8Pv0dEvDFa3wo09Uq4znz5+z2Ww4HU9oQxKhq886nfSPVynG2tKde/qhJVgxoRql5URTSWSdLD7XYykvcm5vblgsFr+guyml0FdhNH7e2XnnP2X5KVkYhBjQQc9OEu+cCIQR6dvVWX8ts64qJT5Xo/4XHBnXsuxKV7u6DuTLPp+mRknvTaWquNWd7Ce1ptDmF24N5z2Zut4MEmG+Wq948fw5j/sj+4sEyoQIOKGJ11qxVIrdciE3MIiiJiqcg2nwTC5QFBl3dzeEICKRIssoilLKeqVxifb9//09ZcjCHLVurWF/OJBlisVCPInWymcWroqv1NeGZKtzbkrE8hUxeh6fHqmrGqV1cgDJuq3IS0IMHI/HFI8QOZ0vBB9YLhYsFgsmN/HwcM9yuZhtfNfBz5XHe/2zD/KzrORQdOnUK7CmZb8/UceM3W5D30385S/Ss8Uo+RFXFcg4jnTDmIYuO+pKdJ5VVaD1EptpHp4+MroMY3OyqKjqkAS14EPk7ft3lEXOdntDnle07SWl6xqW6yWPj48inbMjVSkqeVnUS8rP5XKhtNJjTlOAVgZFkl1+4enpKeHI0/BIFxhdEJRn8uD2kpmxuNsw3ra4ASZzXbLLTWi1QgnlgMwY6qZmtVpTpgme1np2wqsoUi0dIjqtJIbPaG3X02oIHpNMsKS0We/TjRiRUjEGUHIzZkZKqZAmhQSfJoYqJfzmsmSXxMy5JL2eajHZkNR1oJOMvZOXm8tNcvPF2SeZ4ZO7febPYvDRpPWGLOyb5YJnzyPHy4Wn84nz4yPOI6CoGLHes9CKFy9veApnaHKMcXQxcr6cyK1ELsQQmXRP3VQYNG4c08WedrFGMwyf9KNAypyvZFesNc65eVDT9z1dN1AUCu/BOeHGTtOEDzLI6YeeZllSNxVhAuc7mTWEksvlTJhi2nvb2Ummlaw9RCkm/WRZlnNqWFUVc6rZtV8186SUedp7BUk3iwX2fL7M9guT8HrPnpVsd2tCmNhuMo7HQyJif9pFdV3H8Tiw2a4TqVjCMa4hJ1Vdo1Tgy5df0naSe/9ppJzRdz0hDiyaRj6EmDDzKZfiGjv27O4ZXd/hnUtDoxSB3PdM3onFJZWZc7xZWtpeMwynaaLrulQey5/b4YKyOZvNGm005uSobgv2Pw4MFtysHbTz6RN8wOY5292OKsGH55vwOrHUEqbphsDxcKLr+1lBfy2FtTFEI+Wd5NXLmD8GSf4xKHSQDzxEL2Vldh29JyF1OqGv2fMxuHlxHVPfNgOSgk+ns/Sp3nliVEIWn6BNIa7XnvBKAx+HaXYpPHv2jKKW/ix4cdrnRZEIcopvvvmaY9ez7weeDj0mKDLR+0lew8tb3vX3+K3m0B9wRlE3VVKjjLMuWFYBMU3nS87nC+M0kZXFjLm/TjlXq9UvJHmfr4WWyyWRMoGdSMwXCXJpuzNNI0gWm4kOuB/GeW5greSy9H0vfNp+YJ3c9ZdLK9FpZcnNzc0n36T+JCe8Oj3GceT+/n4W+Cul0snrWCZnkJsc9ubmRrR3abJ5OXVpghjn8W2eS/zY8Xjk/v6eLMu4ublhuVzhg6wAsqzARnFju+AxytClZrcsRM3SXgbevPvAarWSD7UomFw/e9q6rp9d99eeahhGFCY5nC98/HDPOHh2NztMYVDKo1KN7ibmoQv4VIoIENYl4O9+f+Tu7o5muYTCgM+IymFKTXWz5I//+UCwuQSGaiupQteSLgiWf7u5oSyWGJPLUCVNRVFy6rRdz9s3b3j75i1t18+L9usHVC8a8dt5uTkzq6nKUjyJ0aMTFMkYg4rSoznvfoEutPpTNr3or30SqkuevUxbDUFr+V18Qikmv2I/OYa+T4jAln50xOCwVs9Yd9EPn1FK88255fnL56xS+ImxmswaQh7x3rDdbnnx/Ev+8Podh/0pHVlGlt51yXGaeGj3ZEWg2jZMJpKZnIjsj4u8wkRFZXM8QTSmWrHYrJnGifOl5XK5SEJuLctu54dPnkw+39NKfrGxOk0+hVTedS1ltePm5o7rOOGanSJENodzHqXl4WitFcxF1vPxwwPW5tze3rJe3UjOfXTJr5h/Jhywc9lf5DXFrqRtOz58fI/3ntvbW8qypijKedprQWRC2mhyLw7rYegg/VCfTsBrKOh1QX0NaFksqzQi12noks07qLIsk8D2ImlNKp+d8sMwSJxUURKin5f73odf8Feqqk6+w0vazVRpDNxRZRXGxNkWZK39TK6l5qea7KAEjz9nzo8jmc0hOJSaxOdnjQByjULZnNyKw1uuZ4NFFBO73S4tkw1XJZr3EoryuN/zpz/9kb/8+COn0wnvAzGQMPpO+sgyZxxGnO+x1lKVOavlks16Q1MWlJkS+pnTxFQ25kYir6/vk/4MiSgVShrgxIiL6UJUIkBv+4nzuePxsOeSILanc5uqG03f9QyjY/IDRoAtsxjhKq4/tQPv7t/z1Vdf8fLFM7abtWRWWiNSr1yz2W5Yrze8ffsWopcHsjJ0EYYhUhcrlBrw4wWdazB8JgJPrNJk4XLOJUe/ZIFcy+LrFDTLZFo6jsOn2PLPGKXGyu/vnJPrGdGRXr9WxNSa3KT8EqNmmaEIAux8Ywldwsw2qhgDWRCLVAh+3rFftazjOCYCvZ/zL8qyxE0O76SyGYeBqCLeOWzfCxnYmJxASCbeRspJIl6lyaAPNE3DYiE1sLWWx8dHTicnNbkxsyu5rpvZp5ZlGuciZSn4O6Wl1Agh8vHje+qmnB0V14b1mj8YQmDoBl7/9Jqb21tubm5RyILWe8f+/lHGyUWeHNZyAYUoJZ30Bh1t1xFQrG9W2FPPbrOl6weOhz0mh0ZXdKcef5po8pq8aQhTSIlLEUKkUIKBv7m7YbVciOE30Uidc5wuF37++Wf+8uOPvH79E/vjKbn6JybnmYLkvNv9UZ7+zjH5FMtt5CRcbZZsVgsWdU2VZwiczsuksBSYbFEKaAovKwSdxAkhKCLyJG/7jkvf0fYDRdkQouLN+w/85ec3PJ1O9KPD+YnJQwzi9g8KCA6T5jbWCFFPG41WhsvlwtP+gcPhRHs688P337O52Qq52uQMbqJqam63K4rCMvQjXkWGGHh/ann3cOJf/90P+OLIx/4NH44P6IUhLxXTNSpbG0JSOGmjGceBrhNzbK4ztNXUZS1Z8Ocji0X9C7yjQKeyVBnIzTdNI1VVJynZyHJV0/UX9oeWG7vFZILIGFwPKkMZmAaHNppLSoterZb42jOOjqapOJ72dH1MKxIz3/hlWc6KGVHeHBmmkUUjjhBdi5O/bVu6vmW1XpHZHLterzmfLjJJXDRcBzVuckzO07Vixb9GSDk3zWP45XKJDxOHw4GybKD6RIeWlYL0FJvNZuYw7vd7tIlMU08/dDw8fiTGyM3NDZvN9tPgIvWHGsXd3Za8tJKEm05NmxXkxY7L5cLpJLiD1fImEZ4jfT8wDD1aKxaLhtEHgRfpgFKeRaNZVluG+4LzvUGdS8puxaZWvPrma/70hz8zThNVXpCpQK6gLjKe7dbUZYbWAYVDeTjtH/lPf/w9P/30mqfHozTpk2PohEg3eY+LEjIdu8gYHcF7+tElALLGmAv23SNVnlEVOYVVFFbR1BnrpmS9XHJ7c8PNboMpSkwuoTIR4YHGaAhe0bYt9/s9H58eeDwcaeoli+Wadx8/8ubdW47nC5fBMYXAFBUhXqPSNJaITpBk4clIr1oXOZk2TC71wEr2fN9nlsVSVEhae/KiYLddkxcZ/RTwCJrw6D2XIVC4BVXWsFltWI7veT28ZQg9ZIpxcoSocR76XjTHWWbZbNZMkxNheBRDdp5rjJUK6VriN81i7ru89/RDS1Gka9RPhDjhg4TFNAtJhe76Hn9x1PUn21GMCjdFxvGCtYZNvWboO0kMjhMRN8N9j8cjIQSWy+VssbpaqyQ0tCCqSFlJbifJFLxaLTkejzw9PpLnhaQyLVZLvIv8+c9/ScS1QN+37LY3rNdbIMzDjfP5wm63JcvyJCkbJfDSex4+PhCBLMvJMiGQmaIUlfw0kuXFrLVbr9fc3MhNJCSryD/90++5XHq2mw3b3Yr1ekNTV2graPxYBCIB50cyLU+8xaIhhOrTk/oomYd5lrG72WKMxgWPm1pyldF2J4rMUOY5uVtQ9QvUYGVpPCic0Xzz6x/4Pz888PDuPaXNhMo1jVRFzXpZY5SXXRtaTurXf+Htm9f0aZwtapeYBDDX/VxgmjyTc4zBM3mRbgVPCpiUMjrXmjLLacqMMtP0F+iOlvPhQH+5oEPAVSVlYckKk/oPTQyasRv5+PGR948P7M8n2kGQf1V95PF05nS60PY97TAxBfDKohO2Ij0iMEZuSK0VRWYl4WiayEqLNpJD8XQ48cc//5mqqfk2/1Z0kqJPkGlmXhLVhPOROE6sFhW3r15QrBb44z3ueGa7aXDlDQ8cufgLx9NBfn68oLRisViR51aEIUrNZDUXJvIsx2o77wcfHh5TXqUQ9xaLWgQmSgTa2sihcE1uMkbmBlWVE6Jlv38ieIkUGIcOm1mapk5qPT8T2VyKT7+KtNfrzey7naaJPJdog6sYQCdFUki5JlehwHXAKKXrhG27jqKAzOa8ePGcN2/e0Pctz58/Jy+yVEMHjM4Sf1HEp1fxqjXXnAJNZgvev/9Ar3pubm7QSpOVGSaN7733c7CGTeDYqmpompUEapBBfBAVpJIYaOfGORK6LJsk3k1ua+KM9svzAu8Dp9ORRbNksVjNEW0+Bqq6RBudYE0iqZqePObnkctPB0xREZtbqHNWNud3P3zPh4cHLsc9obCUSB58WWYQJ6YJos64dBcmN1FkBReGWQFhjCHLc5z3DG5K2R4Tk3NMPjArVk36AAAgAElEQVT4CRdEAqhDQiIGT0ixX1YL9t4qSz9OIk6IJ+r8nq7MqKucsspFZKEsISjO5wv7w572cpnxf30/cjh/oB0dw+ToXZAdXQxMfkpBJszLfhPEoFxmkixrtUHpjBDEpjQ5me7ujwfevHnDaimc2CCKgxQXJv1RCJr1ZsW/+pf/nF//1V9hMkV7aXn35z8Q6sDm++dcipyQQ58P3D/es9vtWC2WaWgh0+EQPHHGLNo5Iv0qRF8sBEt4RRVeE6mEBuhQWmR08oDIPkWkj71gDeuKx4c9p+ORF188Y7lYytTaRqYp7XszOW2vrgspQeMshA8hcjzK0K8qq/Q1nsxm0gemXva6YbjOJrIsx57PJ8qi4ng6YUzGze0tJhOGyPF8IvpAkWV0zrPKxJclJ530bW4cubQXzqeOGDV3d3dzMMz9/T11XVPXJT4E8uL65kk4SJ6J5Ou671sslihj2G23nNsjIUZMlhO843g8JbVIxnLNXC5preguPR8/fmS1WvLy5Rfc3txyvlxEXJ5nCXceUjipDH5ykzOeI+3PZ/74b/+JZ999xc3fvsLYAj1N/Mt/9lt6N/J///v/wOV8TPs1+fBC9AQHPo28r86Josi52W2lN1aKoR84nk4UXccYPP0wMkwjwzhx7ju6UWSCMXyaxtlEwXbe47zGW0XUglp0XiavRon8bEjZiTaTbIVxGHHOMzkZJowxMkyOYZBSzxg5Pb0RvWr0QcTdSmOT568oC1bLhvVyKalOLs4EbGWgKEuKPKOs5NQ5HA7yVE9+O2u0rFZCZLVc8Zsfvudf/N2/YrFZ8vEvf+TpD3/g/Ppngvbsdhv0OtCaM3mRJXG/7OjErVHPWSfOCV6Ta6SAlsHHMPRc2jNlWWCtCL1PpwNZbuS68x68GAGM1UxThlIBFRwQeHh4wHvParVKs46Mx8dHmqZKPael7wfyvEw72jAPYZTSnE5HFCoF6UqM4H4QKr35LGlLHkopWTllNorI5YSdJhmzLhYr8qrieDyiDFRNw9KsOD8d8JOTWLQx4b37gWGcyLOM9iw04t3NDd7Jk0OlNCYB73S8f39gsVzivRLVeV6iteVykZ0JSrPdbkApnIoErVikKLNL12FTvltV1BzPPcPkYZL6fOh7Spvz8uULtNa07YXJDcL+INJ1F2yeE7MUDxZEaDuME+3pjOot42HP/ZtI/u2XsNphtOb5yzv+h+V/T1GU/MPf/3tOT3uiynBOMQxh3r/1vZTjm82OqhJTp/wTcLXwcVbTxOgd/TQxBo8bPafuwuF0om3HRPpKjvok3NYqoNLNFwIMPqK059SNM57CRhETmOBQKCYXGUKkD5HOB9pxxDtw4hGiqHI5ZT2EhDnU1mAQX5+1AjPOLBBEonW1JPkIyik6JvxU4L0huImhHzgc9jSLJQ7DODlutluizvnmm2/53W++Z9NUDOcjp6d7LvtH7ORw44Q/DOQLzWZR0WWe8+VElhnKcinL9rbFWNlHXmV13se5rHTOyb5ud4MPjuPxKJCl7XqeakrcQkpXCl7A0E5u3L5vqeuaxbJOe1VPWRZUVUnbntnvD1R1hTES/zAOstfuuk6m/VpT1xVV1UjPF4FMPpNh6OYb9vOw3X4QHEbwDq2UhN3udjvqekFms/kbogrzhOzm5obz8cTjoxhvm7rBecfT46M4hK3h2fNnoiSoSsbxyDBOFMnZXtcVj4+Ry/mC0uOsbHj79i3GwHa3oa5L8lyCIrPkyfJph9Y0smO8Px6IXkkeRoi07YWqycWNYXMJBE17weu6Qie1fTcM7Pd7Vsu1NN4OzscL2gfqzFJmmqk70z19FP1n1WDw3OzW/N1//bdE5fjj7/+ALRdcBsh7RwSmKdCfB7xPaKUY8c6nsbgMpcbJycJ+Ghkmhyek0lulUE9LnlilqEgmdRTBT+ikDglupHcRcJiul2wErbDRkBmNGlMwyjByGifOztMFCDpDZZqiMExRMU1yKoQgZaXSaQXiPIQJopTcuVbkVlFmObkyRGwSLSimfmDqW7pL5AnFTz/+KO2J1gRlyYqSKSjKvCaMPR9e/8SNcny5LNFDTxYdGZHoPeHcs8pvuIQOFSLTOH1ab1Ul2iiGoU+so2JuaaQ1KbBZKSKHtGc2RvpGpeU6rusiKWfkQZ7lIhIZhjOLZU1V58ToyaxOVZadjQLL1ZLgHfvDgccHIdG3rSQKn04nbm9vsdYm536cvY7eO/IsZ7PZ4L3j48f7NLiUU/np6QmAzXpFmR4utqlXaaIZRBhtjTBS0q5pmiZMZtnd3qKU5sc//0SW53zx8gWvXn3FOAz0/YXD6cg4ep6e9rx69WpeuIPi+YtXjOPE8XiaX4SoDSRu2rmJLkI/jDjvU0OdpyeQ9FjPn3/B08OB+3cfwCtu7m6wpUHrgEvJtyEEvBadoLWfTK5VVaFtxv39PfvHA7kquVmtYTMRCsdiXfLUXaiVploseBpG+ssFKkVV5vzut7/j5vY558OJy+hx+44wjJyPJ54Oe1FBdC1d3zOO/Twh6/3E4Dzd5Bick0kpXmRtKsMnbSdRo7zEZhW5kYti9u4liVi6sYdJwklHBaXLZpy91pru0nPuRwYfCdoyTBN4h58mumli9J6gDT5q0FqcBZnB1CXBO8I4UtmMzaJhtSjYrBqassKqTPAQyayNBpN669P5wru39zzu95xOey6nljGCsjU///lHFrkh/M1fsf3tD6hxQKuAsaK4CWOgiFpE2lZR1SXTNMoaJjkPqrIhxsjT4cjj4yNffvEiwXQN4zigDQzDlPbWHT4U2Jgn251LTFJ48+YNWivunu1YLpYYK3vVzBhCSAOyEMh1JPiRGBVFWbBRMp19fHjETYGyrD9bqUHXyZBuHNs5esEHiFHQh7vdjo8fP/Lhw0e8d3z51SvqumZMcCutDfa6KM2yLCWyJhez0QzjSHc8Y02Bc56o4Ob5HSFE2stAntfY0rAsC7JCM/RTaoA/2ZvkGrN0nbzI7VYmll3XkRc5WaaTpanFZsLluDqUZYJU0LUtQ3dJIY0S/th1Fxb5MqEi1LxQvZK4zOxoN4REYo4xcnt7i9KKU39iVy2YSlguV1IKBc8iz/A64/x0QLcd0eRs1muGyfP69Vv+/Kc/0Z0O9Ocz3fnC0Iu/MU8K/bKUXrmpahqj6CfP/nKBvkskNo3CkNkSnQmjdZom4jSK1lIpciVaVa0iV2Sdc57L4DlcRu5PA2VRUOS5ULAzjU2i+8EFnPd00yiKJZNxs9vx8sULgTOFSDdKZl80aubG9G1L2/U4XLK1wTAYdISqCNRZQVPWLBYNeZmT5RlV3RCi5qftG/phZH8+8R/+4z/w07v3eH9hDBFH4Ph0A+47FmWFy0u8Ggk4pr6lcgPBBpwTr6cPEzFmMwbETdJ3V2XJ3Z14Wruuo9blbEK/ygdtSorO82xeo8lwz6UdnliLJjdhc3HXXNOjpikNcZSEzwx+mk/d0/HIOkUdTONETM6PGEUbet0TfkpS/nQAXAHF6/Vq5tNITKAgUYZhwO73+xnFFpTCT1IOTIOjXhSEouR0aYnA7e0z+mFMYJuMSycStyzT2FhKk59lRGOJypBnhnGaeDofMZlhu9wxuYmmqCBGTqcLzkFmLYumIgQojPx3m5b//dRzvhyp85I+dng/UdcCLD4+PlHVGVklBGRRXUCel4zjRFkazmeJLc6Lkuc3t/R9z3K5YBxGjvszfpioljXr4yZZl6CwOd4F9sdHVLFgfzzwb/7X/4N//x//ge58xnc91juaPOP27pbnL+64vd1QVaKymbqB8/HEuWuxbiJaBUajpwk1jLMqyAfxAoaoyIuSXEd0cOSZocotpVVYK+wcbwru92fefHhP1/Uc2x6NnCI2E55nvMJ8A7TTQETx4uWX/OaH78Fqju2Fvuux+UQ3DAwegvOyW9CWqDICUegBxtJeOuI0oSaHDpHYjFRlhs1KGfsTKaxlu1pxaQeWqx1DH8RR0V7ICFTWsqoq8syShwKyHKc1yhqywjKFQB9lYiwXspuzR6bRzYDpIs8IXk42wQrKQOiah3n18QnI2gnVJoyEONHUNc6NeD+xWm3phwuXy0CRi6wOA+MYktH2TNM0xADnviXEwPMXd3MpXFV1cgE9yQoutXBlKdNY2QB4xrFNS/mexWIxV2R1LQExvbo+tEvsYrHg/v6eru9ZbW6JQRGioy4LHu8fmCbP9uYWtGQx6NGhjeS2X5f1x9MT5/OFpmnmIM8QAufTGecdWSVyoWtTWhiBJIkAN3A8HZgmT9MsKfMaawpiTG90VYjO1GZM48jT0xNd17FcZjSLBu8H3r57S5E3rNIwZxgHxn7gcjlTVSWr1Xq28FxV7NpayucF+5/uMeuar6tfMyjFdLkwWYfRFj+MHA4f+dD3/PTjT3y8/wjOYwPUZc4PP/yav/vX/5KbmzWFNQzDhcux5XHocUPLNLRCGcsNoS7ZFjvO/cDT8QjRME2ecRpwk0NbTVXlEB3TMBKdIaQk4CwT0fj27gtOfYd7esIEUF6I3uLYUJiUqjUhPdKyXvL9t9/RFBX3+0fcOGCT3807z9APiTRe4F3EZhllbvjqq6949eKO4/6Bx/dvAU+ME30vYoCiKalslThBkWZRMkwDGM0XXzyjLDPicaCuK77+4o5vv3pOnomybtAeR6BcNjQvNjwg+lVd5Sk33nA+y761LMVYG7xUN9fVgDHimun7Pt0M9YxiWSwXHA5PTGmYKAR5ydxsu5ZhbCU5NyvouhNP5zM3NzfzzR1CkHlFnrFYLVkv1nSdBBpJrz+gE7Cp7/tZjPL5sn4cxcmzXC4FgTgMn5AlMc7C87ZtE4fX2nTMK8bRMXYSb926M1jNi+fPha/f9wxDjw8jU9+TZas0ANHsdjccD6c0OR1FppbnLJslIXqy6lNizfG4T0+lEWUsVV2xublh6Ecu/UDX97IrU1At1mjLDPpZrhY8PFqs1Xg/URQlpsyp6xXH44nz0wkmOB5PKKO43e3I06DmKqC+CnyjCvjcsftux/n+QpOvid1AdzhwAvbDxMOhZd+PXIxwR3WMeIHpsFgv+Zt/9lu+/9WvUHHCjz2MiiF6lHfURYHzjkMr0QK/+vZrnr38kj/+5TXtP54ZvUSNZ9agoqcwsF0tGPsLU9eSqUhhDVZrMf06x93tc9bLJfvHJ7TSVFVGUxYsE/ng0l44tT2THyB4NusVu+2W7nLBKCXrjxhSnnoNPNGl0JbgxGRclBXPX7zku+9e8fixoDs+SqmsIhiRMUKKSddQZAZbV5xPZ4boycuMPLM0ecHXL57xt7/7Dc9uVkR6QqmwZcWkHzEV6F2JX43EITK2E9MQiZkI1Z+lhOYr8SHLLT44tFG/kInlecY0OTl1uguC0olUdUZRZBLcIuNn6jzHqkjXndGUNGVFlWU4B+PYzTu8zWZDVuZ0Q0fft8mPGpOJuKDvB6ZpJMsMxjQc9ifxHCpFe5HMzWZRz9rTz4FdWZbNLddqtZJ/v8p8yrJCKyXEs2lkua5ZLBcYa+b4KGsN3musNXM4R0h8lOVylVwKH6nricXzFyJVIxJ1mJ3GIsqWej6QEnS0QWmDNnA8nVBas16vyYuSYTzPBsziGpediabxSogzxrBeLXm4P9B3PUVdUBVlwlp8ynL4hacvCKY93+Vkzxy6LbFBfGin9sxxnDieHPu24wKURrFuKk7nCwZYVBVfPH9GUVr84IgmYi1kBsoqQ1Ex+B6/7ynqJc+2G15s1xyfnqiMZ+w6jBccRm4U22XD85sN7UXTGclwWFSihbRFwbKu2SxXNEWJQZFpxaqp+OLZDTe7Ld55Hp8eCO5BBhYRCptRmIwBRWlzovd4H8mVxpQZbV3iDkcmN5FFTyCyWTQsqoKHjx94ePeeRVnS7CSCfFKRoiwkkzEpPozW5IXAnjQKoxSZUtysljzbrVlVJWN3oo/ZjHSYMo2+WTCuNF3msTqnbQf6YaBUlrIqfkElKFLk+jX+zBgZWH0iyxkulzPny4WyylivV59FckSmZKZVSjyVy8VCCPEp6TfPc96//5imrpIYbXMLmkSSH9NNl81rCZFVTrP9qW07IvEX84zwWXLytZy9uv2va4siL7AfP36cMW9FvmC5kLSlYWw5n08oZT6LjwozXkFisMu5+RyGEWszvnr1SsTcwP39PWVVUi7KOSdus90xTR5jJL978p62vRBCJM8KXr58KUf90LHfP1LX6WbyIbFEDX030CxyIUD7kf5ywrtIs6i5CzeUSzEH74971qtVUuqblGMnK5KghJ05WsdYO5Qx0GYMhwPd6Ug/RdwEl/OJ0+R5+eIFX379LX/6wx95+/oNmTHYPCfPM0Y/oKJBlzlqLe/fOHpWuw23d3ccjicePrxh6i8Y51kWGcPlhNcxIQ81dWZQbiSTppQ4OSyKusixZUFdFGRWY7QmU5FFmfPF7ZYfvv2a9WrJ6CZWy0qexv0ggZteshyqImecehQB7ybOpyO2NxQ6si4yBgITihHFIs853N8zdWeKXPHN118nBYnGKykFi7qeEX/K6kQRy8iyCvd0oNCWm2d3LKqSoe04ux5Gy26zJitzTFOw+u4552xi3x/opgGb5Ww2S6w1dP0lCa+rpAYSJ0pI5bcgK0WsPo4jENluVmQGNssVl/MZ7x3Pnj9Dpa8fhlaACt5hk3xsHEcOB2Ed7XY3jOOAtYaHh3vq1YKyKiVz0gpdUCjgOjk35KY6nyUEZr1eotMg6MPH99yEXaJvfzqArjex4DL61D9OWO+90MTynOWq4nS8ZsgXmFKsRYfDI1ozxwODou87tNacz2L1X6/XDMNI0FAWJU1VEZzn3F54etrP7ufgAzoTt0PbdpyTk/56s3XthDGaxUKy6o6nI33f8+L2DoVKOHtR3gzDyDi1VFXNarkmV5rL5SypQKU4nI/nE7nNWNbLX/SFWEt7GTDTwOrZivAoPdg4jXgX8SN0bU97voAt+PrLr/ir3/6OH199w//8P/2PhOjnZFaV53gdCDpgtCUvS0DjfZAB0OnI27fv2D/di7hAR56t6qQykf2bNZYwjWjk/dN5pMoyKbmqirLIRYfoHLlWvLjZ8M9/+1f85lffkBc5Y/Bcuo7FekXbD/zl9U+4sUOrQFVkXFqFNRqV57L+UEoGQGuLUkvc6DkejhQqwjiwrCs264amruUBmWfUlTzhbVF+WqFYKyLvRUWgmAnUX716hY0D7eUiLpXBE0ZHpg3LZzviruJj9xqKgNUahWcce/KiSaqXE10rAbVXi9sVq0mE0/k0G7eVisQwEZyIFm53OwF/PR0pSsNyWeGDrL667kLm7Wd924oQB5wb5xyV9XpFnyIYZN9Y45wnz6++QTdTuIsiZ71es9/vIZC4tjXOTbTthaKoZnvTFXQ2jCNdK3kZq9VSTL1iSvQp+9vhnKYoBQtX14ILOB4PtJcWazIBFPnI0HXcpieIUUJCO58vIpr2OVlmWK6W2DHjmOQ9l8tF8gpOR3TCUtjEoBHgUBqcJP/YarVCK8XxdMBq8Yedz2d8CGRlmZrfWvyDUYlmUsnkTivYrNYM/cD9vSAdQXE5twzOsd5sWG0qrC7wZ4jGJi+aBWeYXM84inql0IZNVVF99w0//f4rfvr5J8LkpF/ILEplBDwmy8ljnOG4ITiqIuN2u0bjeXIjm8riC01e1Gid40KcrU1ZnpFZQ1OWlHme4pRrSVI2BjcM1HnB999+y3/129/w/HaHUjDFQO8d1VLMz4fDA0N7om+P7DZb+r6kLLJZwzpzZpVAoTwaypwqt1SZODmaqkJHRUhwJbkhcrkYE5VNNJaWsqo5XySWrqkbXn7xksvTB7qHj0wuF2raFNBKsX55x0ENjMYxuYF2HNBKFvNZIdmSsnaQWIDL5ZJcONIuXMl9UqZqgVYpGSwpLSzJ9WaD846+b3l6OojrRUPXi9JGGLRXXqtBqcDkBrKYMUwD2hhWqxWn04n7+4e0xlO0bU/fy9DJWkPXdQJKy+w8kLxmrpZlxel0nl33zsnNO40ji8UitWUafRWfOhdmMOz1g2rbC87L3kUWjCP37z9w//4Di6phUVWYCIXJMEhUlrVitvRR1CEYSevZJFL3u3fv+HD/UaZPiQcyThPehYQHSBSwdNxbo6nqUnZ1w8C7t2/ZPz2xXW9YNou0Z3OJxyJCcqORIco4gg9URcVms6a9dPzh938iBNiuNjRFJYD7zEE+kOWGLM8wlWHUcOh6ejeBURSZxqpAVeW8+uoFTVPiplEc7ppZHH714akrqj6VQBoojKXKpV+1eYbRYI0CP0FwWCJVplk1FU1VUBTCytlut6xWK1QQK9l6ueDXv/qOF1+8oK4rFk3NarFg1TQ8v73ld7/9a7599RXae7rzieWiZrNsWBQ5i6Jg3dRsVjV1mWG1woRIZjR1WVBaUeHEFCVnsoy6qiiLAqMlGyTTmsJaUeskw3PVLLA2EwnkcsXNbkdVNPhJdLYm5qig0aUh3+ac3QmVKcqipG4aFqsVVV2TZZIJeCVw57nwTYdhSgtvz3K5nDlF1xRhYzKiUYx+wkfxgqI1q82O9fqG47Hlw/tHMlNweyt59HmeCft1zs2s8QRGP80ZIKvlmrpq+Muff+T1T2/JbMnz519QlgVZbkAFxrFPFj8SjVswINZmKczG8/r1a16/fk1Zlmy3W/I8T6ZqpBy9irGVylA6o65z8txw7i9y9J9OtO2Fw9OBZbMkxsibN28oq4xFXVPXNVZlCTEho9yYGtDgBN13DcJ49erVXI/PwR0pbPI6Tbpq7Nw0EQlCUtOyiP/6m29w08TT0xP1aokpTOrzvCAR5/SeSF3VM93tdDqhtOJXv/pVYn2cyKzF5BaKQKgcalFhFzXlaHFPR7pRUoOUDuSFRuuAMZq7ZzvqpmAc++RCN0hum+YTZDQkd7jwTdwwzqg+5zK8g9yKO19pqIuSPMtYLlZCMY9iiVlvtuT1gma95u3HB9w08dWrl3z1zVc0iwYTvOxt57CXjG9evuKvv/+B92/ecNo/UuYZN5ttmnBLFEFMXsTJlXKiE8gNlFXFZrNEpded53lKt81QV1ljuvCtzUTfCiwWCy5nwWFs1mu22x2nh3t0NNhoqVWNiZF6XXDfP9LZTrg8WmMQEXkMSrS9RiR94zAS9CemzO5mN8cilFU+92o2UQauxt4+7eaujofj/ilFNqxx3jEMPc2iBqXIdSLjJQRJlqXo9atQe3Rc2gubzZbd7pbT6ZRsbCIcMdpgs5wYW3lPjGWKcWacXpk4d3d3DINUZFfhgLQzAXs47AkhUpQlxigJxYxySJe2II6B8+FEWeb85ofvmUaJoNYaHh8fefPurcRZ1wvyvKA9XShszhQDl7adX0jTNDx//pzLRWjZkrYjIJ2yrMgzwcOVZSnHt45YW4jB2LkUyFjL11cVNs/ox57p4lgt11R1hSfDxRNtNzH0HsWIcxdA0TQCAT6fWuGOuJbuvMdHWG1v0IUibzTlokKNNbk9g7JEq/BaYTORKWkl4Tmb7Yb20uEGT5YZrAo4LVJoo0kRMobCWlSRwaKG4IWIpqGOUXx3UcqoK5O1qoTPqrXwUbK8IC9LyjLndDpgDfzqV99yc7dFW4VGMHCS7CSw3kWt+eHX3/P7P/yBx8c9p+OZ29vbRIAWtsnoRDZVeo9ZJLBWVVKUBeu1hHTmeSYSwKTwiCmbPZoo1AFl0MqmvlYwGZfjmS+/+zV1tSIzJW6ciKMjc56sUDSrijftBy5TS3BJceI9RueSGR+UwLuJKd3LUZTFHI9dVk2aRrbz9eJ9yl3UWZo6fsJSWGvZ7tZMo/R96/WCED2Hwx7vHdvdSoYt6SFZLnJIB8n9/X2CPkk899UnOIxn7j8+pDTeDI2lrpbSs0eJkNdahCLXlcdVlVaW5fzaRDlTioC772UJXo4jREOupXFt2w7v4PmzZ4JDSExJmzSN2+2W1XohMjFrZ+XC4+MjeVVyupxZrVZst9tfBHecz/L3QtQqhN7sZH+l0kkyDuMsvH358qWgJHzgcDiITcQa8lp8W1dRQF0J2rCpG4Jz/Pzzzzx//oxm0czckuvY2FrLYlPx8PDE08cHtkGR6yW5yhgBosUhFxtWo/NM8O7BsV41bFcLTocDQ99TFA3RW7QSPaLWEBML5gpHzvKcrMhp1ituriNzbZjGiebSpovIzOPrspK0J60tVdMQRsfj+3t2uw2//v4b6rqcQzxdcClgxhB1hEzz4sULfvvXf83/9m//LR8+vOfVq1efkRFyylikeO5hzh7UJs4LcimtMvIsx2SCHAkxcVAznRxFOoW1Suvw5u1b+r7n7u5OylcjvFDf9phm5NX3X/Gnxz9z5kSxy/E6ckgDFq2y9PoczkWGsZ9F+FJVhPlUkf1gPtvlriDfy/lMlkHbSlZgs5Bd7TSG5GOVNkubOKc4v379mrqumcY0oGwKLhd5cO92NxgjaI9xHMnsNONd7u7uPlVYyqT8TZsgxPfkuWW73c5cmv1+n34fPS/79/u9XOMoRV5XZFXJpRu4nM+oGFkshQeZ2YKYoprPpxPew83tHaashQdjKqrE+jseDyIuHgcWqyXfvfoaHzxDWnqOo8RYhXGUBbCW2JTVosFHRT/0HPYHaXozw3q9/pT3rhToyGloWeg1jw8PvLQvJK55vcRNcvMfDgcpM/KM3fPn5E2JjwGrtEB5lCcimXJeRfoxsilr/P2eeFoS2kD71DO2Qtwm7UOttZJLoUGjqauSNz+/43g6sN6sZge47IQUUcmQRmmT9IiifJH4bp+mfbLDygq5AKPSWJunoUNJ8GAy+fNffvqZ8+mJb7/5hme3d7P7XaK0xUgrgxLZrS0WC77/1a/50x//xPt37zmdTmy3W9r2kt53n6BQnxRO05SnSblNToQcYzNsMurOongjVPaQphz0PVAAACAASURBVIExan7++R3/+I9/T1PnbDcbKZGNJbcFvu1YLRec+xNv9m+IzyF4jc0qmnWG6y8yDe16KX/LXJCFKQPimhUviU0i3Lie1Fl2DV85czgcki/TUNXXkNueNu36wBNCPdugQvCURU17GXh6PKK1YQyevBA1l0CxfRpkiZXMh3FO/LpapK5+2OsDN88zdrvtrF/NkzpMHPXZTAE3xnA+X7BRa3H/+kBRwP7pRPSOojSsmpWUOUnnNg4jeV7OAtUszxmGTl4Meg5d8d4LPj8EqqqiNNV8Cp5OJ6Lzc++XZZmEcGghsEk8cU6VcgRMShMKKeykqmomN1E3dUK8h4TUyDBG8IuL5YK6qRkGKWWbukEHNafvXINZpAcdGLSiwdEeP7JrvuHtj4/EbiROnuCmX4SwKKXRBjbbLd7/nrdv3/Llyy8xOkc8slcyuKTSGh3RpKmr9kKSTtI5pTRTNpLn05Usi81kf+qcLJGrRuRZv/9P/0hpM/7mr/6a7WoNQdJwr5Ajop7d5iRg1xdffMHvfvtb/vd/9+/4+7//e/7Fv/hbFotFyq8QglnU8r4GLyJxkLJLXTk+eTYj6NHiDAjazoS9cZx4++4t/+bf/C98eP+B/+6/+W9llRWEjo6PWDTPXz7j//rp3/He7LnJ1xjzCekB8nuHSztfyCIEUXNpfv3crtXW9bM0RrhBQnqXB0dR5smXmNMpT5FWCcPQphlEnpztMsyrqpH2Ms5Ju1UtLcH1tQi3SAY4w9Ankpqb47q9C7SXFqUVy8UyeR/DvCe8mtyvmI7rmuz6e1ptDW3f07U9db3g2d0twcuJ8XC/J7MZdd3Im5ZU7iFmYoJM6a3n0wWUosgLbm/vIIoVSWKyA1VTYrTBJyvMer2WkXdyEOyfnogRdrsbsttnrFZL+uEyR5otmobRjZLGU8pTpEn7oRA8x/P/S9abdldypdeZzxliviOQQJJF1STLli211fb//xmtVd1WL1XXxGQykcAdYz5Df3hPBJLyB66qYpEAEjfinHfY+9nCxtxtjzx9+ECz2Qi1exhQKrCpm5SZqNIppokqEL1D28DL5YWqOjAVA7Up2OYZpXdoP6I8ZEjMslHZmn708PiB3X7Hn//8Z37961/Li2iWsBAhofkouymTQZwdJqQkJCUkbZ32dSTHh/oGImtsJM+E7Pyv//qv/OUvf+Zf/vmf+U+//TVlJmoOjbjYVSJiS7KuJgRNTLKuf/zH/8r5cuX//l//i9vtzu///rd8//0T++2OIvXfQcn3fs9YF/yHNlYyNpRFGZlALsO38+3Ky9cXPv/0mb/89S+0/Z1/+Zd/4l/+6Z+oykIi4pSkGj80G0yecQ53pmpmViN+0gzjTOdnTAgUuWTGF0WxckKXcl4W8gsSMVthXm1753o70zQVWSZL9SqpWYa+x344YG2BmwfGYWAce7q2o8gLCPIZ9H1LnuerQ6OqpBx1TgBQeZ5Rlrl8jun2VWoZuLT0veypHx6PNI3sVN1pXtcoy4S3LEsBD3ddCi5d+tKIPZ+uFCkXfFPVcq1qzWbboLcbbtcbp/NXvPcc9o+09x6tc7R1Cfx0Z7vbJju/YUopqXmWUz8+0vUdl/OF3X4PRqaC55RD344tw9iTZxmHw5Gyqvh6koZ5UWTMk+P19Y3NdktAkWcF0TuM0pzOJ7Qx1BuZ2MqKwVCVGSFarD3w9eULRhmOuyNa22Td0Tg3cb/csEphckV2rIlnw+XzT3z/4cD/87/+Sj6noJUkTSKGNWhzu93xX/7Lf+Ff/69/5Q9/+AMhBB4fH+XkVnJLCBH83d4SFETnBJSYbnClLYU1v8gc9MHTtj1/ff3En/78J/72t7/x9PSBf/pv/43j8ZCM10uo5rJPi7jokqxLkWWaABwftvzP//HficHxb//2b/yhPfHjXzYc9weenp7kQbEFdb0VUNGavyY41xAjEbkNhn5K0QcDl/bOMHbkmeF3v/4VH54f+fUP37OvdigtB5wykUzJJNObiZiBLgpcFCbO7GaKuqBQcpMvfB6ht5MAYCElMRUoZdebSYDTGY8PT2t02jy51G9lDIPn5eUrNkNgylqhbY4LCpzn9vZKZg2HwzaZnId0s9brZPVyubDb7cizgtvY0WwqjMkYhj4t63XK68xI5wVVVTIMJUVRcLvdVgziImVbOEv3+00qvqrG7nd7jDX42eHGEasU4zSgglzX+/2Ozabhr3/5xO0mDepuv6ft2nXykxcZ49iT5yV+DmSFIfgZTEZmM5q6pms75jihlGF0gdv9jtEy2hZbj2Oek+lTBYhgtSLfNMzTnFYMEkBzvQhyw2qbwMU2ecEEUaCNkjTdpPLJTMb5dJWSOChu1xYfJppqy24T+duPHWQG2yheL5/5z8f/wT4v2GjDaZ5lKOCCTDaNYOsrCv7zP/wDmc349OkT//7v/86nT5/YH45sNhtya8gzizV6TfEF6Q/jmgkh7oAxOT76tqXrWq7XG5fLFecCRVHxD//pH/iH3/2WH374fg0jjSoKQk+9815NWndIDrcmBIM3mg8PR/7n//l/sNtU3O8X3Dzgp4HXLz+laLaMPBMbkIxa1crJEdmDFUCWtuRFznG35fvvPlLVxZq2ZXIwVmGiwkcPRvpn5WdsYRgZ8MoR0FzvM7v9lkNTMxESQV2mz9bKgEqqnc2aUyghVgv8y6dsxFIQFFWT9s1LXLulKHZEAtM0ymomAYTP15a6Lmg2FU1TEhOaM6TJtSJQZhlozePjI8Mw8dPXL4zjSFk2fH05kReW3e6A1sm7aizDMK1BoXUtqU5ZltH3A6e3M8ZaQTc6MR48P38kxiBzEqUERyg5eoIDz6yWX33aH2rteXp6xrnAX/7yZ/SL5je//10aDwe08dzvA2VRkRmJ0eraK94XuDmm061BO/jTn/5EVVdoY6iqXCZozqWEWhj7DleVax9gC1mEV7XgBf74xz/y9OGRsq4lilkZrDZrxt+C5ZhDoMjFBiM3l/i4/vznP/P3f//3bHebVHZ58ixHmwxTBobYce3O/PDbj+y+fKZwMzpqtCehCxFWZ/KH/eM//iM//PADb29vvL29cTq/8eXlZ6Kb5Z8pC8mBUnqVYC09wTxLedL1LX0nwnlZ9pZ8/CDlbl01NE3D0+MD1qYyUSnQJqVG8YtQUEmbVqklsGQ+w9uZ42HPb/7uBy7nmmnuBJmVZRJ8aUtMWhEpbVK0tojqrc0wtlgHDFmWYdLJHhAWqKTey043JiAyPqCjQkXE6eBnXt++YrZbeUhzi4+SgOWCJ8v0GhW3lMVCUttizAKavvGrH76jrhfURUjm2rhGkos0TabqRSnl8+EgVPCvX1/57//9n3h42Iv21KesESOfjU8xbNZolLWECJnNeHh45A9/+APOeX7/+99TlDalQS3gp0Q+d56qssxzJy1PlJi2eZ750//3J6y1fPz4kbIqU6ZklMSyuMQ5K808JTK0k1itECF6aYD/9uPfkgWmlCt37OmHXtiPzrPb7SULMA5pMGHIbEZmpX5+e3mhnxyPj0eU0by+fiUcduz3O7z3K79jkaUdDocVPOSc536/o5Tid7/9LW17509//CPff3wmy0yCwmqCF13fYpqVQJeM6/nK3bUUec7vf/9blI5crlcJ+jQSex1RhAyKveV8+crucKAASgy50umhSlnvWhwDgkAX9mnT1Hz//XcM45jI2yPT0BO9I/ggzEzv5YUMkWgsdWnYb2pifJAXC+GqxiDBnMYarLGUufBRllJxDYRZIri/idteDiKIK41OC+eJzaZmHgfGQZCIFog6YmyGMRFtwFrpYYzNMGkZr5TFZtIXKSWIeaUDRL++hEvkXEyzlug9ynsp9zPpKT9+/I5LPnO5nNH2ILmB+ts8R4E5LQlYC51hnt0v+jaB69qVBB9jlJcC0uBQMU1jUlKJRvnh4YE8E5XK9XqlrArKMkuBnSWDlywOFyKF0vjk0JGbN/Lx40eOxweu1xvlbNOw0iYSRaTrejab7Up1aFvx17Zti3ee5+fn9Wd33lFVZYpdV9i31xN1UwnS20bcHIha42JM1OWZ8+VCXuccjnsupwtlWVDXlTiML28AHI9H6Z2sQRlNXTdYa9cm9+F4xFayfLd5xr6p8G7my5cvq8C1rus163u73TJOE1Pbyg6wlry38+VCnmUcD3va7sbsRva7I3lep94tYdS1WinJwzjw/dN3aK04nd5omhqvNPf2ikORaaGEbeqSfFtA78mNxcRAro2sN3zEO7BZ0qVqKQkXy42Ky8jcrvu7RY5GiL/MRU/rCYmYFmfDOI7M08g4DczzlGxfGYUtKAvB+S0hmZI7kV69lL4kGQ4S4ImKq41HEzBahmZqmw4P77lfXpkT+l0rK/I1a7E2onUijCvZASojZO5ASLsuQU9otHyHEIShGjTBSDRbDIE4T0Tn8GEiKwQkvNk1hEkwKrPz5ImKt6RqLb205F4OhBDZbLZkmV2tRiEEvn59EQ3obvG1mmRRE63r0jcu0Q0yAQ4pJk8zjEMSkYitzmQ5PoK2GS5GplEUXkVRcXzYUxTimGmamhBnPn/+zH6/S7aqLE3xo1wanePl5YVxHKnrDfW2puvExZFnOX3fp7SmWt6T/X7POIlDecldW1YJ3jvKUvLfmqamvUkzurjn8zznkFtut7ucLkWzxlSNg1CyjJGYKaVZ3dHaCwFb55K22ratPITzTJ4L23QYRuHQVCX7ZocPctqRiGzX243jg+wR5faJ2LJYE5Du945pGiU/rsjRJqyeMpUyHOqmJg+GT3/7RFb05IeP6MKicjBes6kqauNAWeZ5AQ3Lot+q91F5jFGUHsTV6hWlxJAbOt2YS9hn1EhSb/r3Q5jxfsT5OQFrZ7QS29K2bnjcH8mqEqXV/xYIGoMMaGIIEqcmSRXrz7YEqWRZRl3V7NNn+fMnxc8//5SGQzo5IqSkW9gtanm5tQTOiHfvvWfTWpb2WmsISphCKbI7JrOwMKvkhidF2IUYqOqKzAfacYDoU66DTvkhI9M0UhTlKvKQqem08mQeHx9lPnC9rgORkCb2t1uLUn71Bqq01xMVzoQ2Gfv9XqSYiYQWkVTdcZgkm9AHDsdDuqUjSgecH9FGyvzj8UgIjvu9lYsrRIIPDP3AMI5sNhsOhwPGZBIYFITivUz48yJjnidutyu2KAtsJorxcZw4ny7MTl7E7bahaSpxUmtF39/xs1hOKlLmWog8HPY4HxmGmdeXN4oioyxMyq/QeCJKeYxWODfJUjmCVZoYFXW1wc2BaXRczje67mf++Z//mYdjjc1kZD95hw8BFT1lUfC2sEiMpik3aJXx9Xzl9fWE0prNpuHh4YEQHEbHdUoZCRgrlipMRGWW7z5+TzvNvJ5fifeRatiyyyMqDyhl8Cpy73omP1HEGqMUxiSViZaXkdR7gk7hmx4wMlGNXjDx6cR2AfBye8bg8UspFz3eTwQ/o5Rht9nx8PxAvduu1qHVmJymtu+TzIhbPZ/LzQhGGXTyIQqW3fH4YUeIz1zaKyg5vLIiRxuDUjYdJCr9d4XkW7MmXS1R3yqdaEL7TyIFYho6gZ/EmlXkuUR4q4jJLeMoBmJtLbkuccPA9dILxrKq2G4l9XYRHyzEvYX8LtPSfDVrC+bizDiKz2+73QjOortzv99XxotSnhDnlPYkJvGmkeX9AgGOAR4/SPyb9yMxCu3duSn1nJlgEjODMblQ83zkcrlzu3Xs9ht2u81qJpfdumA6fRJ03G93Ntsm9bNgl/jgGGGeAtYK2m6xrqynHZJL37c9WguBeGEtOucIEZwLq+NaGc0UHFrlazrs8gCFELDG4KZZ0nK+Cf+sqirFYvcpXTemDL8MtYRdxkgMQSKmklh8TEGTy9cf+oHMGmym12i0LH1wgi4PKcxWkVUV3ewo8pxRz5SlDHQcEQeMfubWt6tbw/sA0aWvw/pgLOORNbRSywOsTEgBuvEbJqrGsThFRJHjncEZIzeSzdgd92y321/kri9f/z8m/85J3fNtlDTq/WfRCRmik3dxv9+z2wllTv6/DGuy9JCZVYv67fdQUeNmUDb8b6QCWWynsNRUDnvv0Yh6acEBkpQ0MURi+gyIhjzLGZToKWVV8P7cLOuS5VlbDOI+pVotMrAFLy8cIf1Nvygs0oXgPc+Oooira0e+nyzOUaRg1EL6vehS8O374bbscr33iT3avadDpfTlhbwWg2RLGmvW3fqSTBy1zDBsRLiNY+rJ9mbLMErT2w+SrXA47FBo8rIiYiBJdkIIKGN5+/wFjWhJ9VYmn3luefnyM1VZsd+I5cijkqNeSxZCmJlvI5fLRerzuma/21BVFd5HzqcTWS4gVZ1MsspDXom9JniPiZGfv/xMXTfs6i3RbXl6fGSYRk7nM3UtE1uJANOiDJl9GjhERhfo7y2KQLOpsQcoVEO8BKL1jENG2zvO9yvDPOECOCfIDmv1+uHEqJdXEKM0PrrUOyqUzsBrZqXxwaMTlgFjCImBk/lIMB6vPEEH8qJcxewxsW1mN2MwhNSLRiIE8D6mAUlAeQkgURLcgNJ6XfpJSSYTzVwbqiyndd++u7J+MSkUNRlHIUjJSjTEADpIBSS53KvYh5C+lUc0qqEbKAjU2nL/+oILd+YBpnvPPamfLl3LOI08bh8TuXqk72faTiUzrUsJxZF+aFGalcq2vJSLt1ApaBqZonftQFEWZJkmy95TgEOUP3/fS2ZhP7Ts9weOxwfa9srxuGWcRu7tnbquMEbcIsZMaC3yPYkccLTdXaRvZc3hsGOcBuq64HK54IJP+8aUyTkFtJWeF8B5R9sNAqy+nAUdd9jvBY2QIDTGGDaHhillhy+SscvlRt00CTnfMTtHVVY0CXkwuTZN1xSbzQY3SxOb5wXlpsE5T9M0wnTsJQb74eFBbtOUFyG5FBI08nY6rSk4i6rEGpuilO+rCHy3k1G2unlJ9Wk25HlG17UMXU+VF6skK89z+m6kHW8YI3423IybBmKck+wLqirD9JG+63l7e+N6ubDfbdBKsuvXG0ALA0cW+inhSCmhTEcZjMgebBm/vwehLqzUlaFpLM7YVYcqPaPDO8c4jEnDGNLJKoQBObGDtA1edl0yiJAJN0qwkks5Bw4VXLpho2QwolZY8zufJb1gIaJiwKUsDryUnSY569FqXS3oACYqnPfM/UCmDLmxvH19ZbQjOspe+HI+EwJUdUmWK7JcU9U5VVUSKdFaMU3TGry53DTn82nVdWaLsDyEhKEPq1ysbVuGy4U81+z2jbBuuxFjbEIbXvjw4ZHNriDPNe19SHODmaIwxGi4XC4rNW0cJ/JcJu5d3yXhuE5tXJcEA1OKEc+Zu46XlxfKoubh4Zg0r9LeXC4X+r7jw4dHyrLCbnZ1UhOQxrWZINgR5YWYJ0Wx/vb2tk4v53mmaVJdG6IsaHMDVjLTVdIX7jYb6rKmG2e6bhRV+r2Tpf9hhyEIA2VSkjOokv4uLXC3G/kFdn1H13agFO1dkpDywrDb7zhfroTkJHBOMgynWW6D7WbHYAeubycJS5lnzucrRNjWDUVRMk8OY8H3MzE6tJkxJgpmgo5+7Dhd3vj6duLD04O40bN8DekMUaaVxkjJQUSoZEr2Tj4BlYMPLBsEpSAqLSuGlFarrUXZDBsCubYoH3DTxDx3uHmm74d0AwZsZpN5WCXLz4wmrgJnrRU6kQJ8gMlmZMamPjzIonmc8FHCeUIeflFeSvSorA1iGqgQhOcZVVL/aFERERR+IdkFD3MkTCN6GqnLgqYuuH46YT+WDDEIOLjK2WwbZgLT4ImF8FOzXCSRoGnqgrKM9F1H1FDkNW6WHeJm06zR1HKwOU7nM5tdTZYZlPbsNxumaeR2bWWaqy0vL1/ZbKXv9GEmhpzb/YJzgczaFMYzJhralhAUb29n7rcbeV5w0zeqquL5+ZlpGtLgK0+riiCOi3laV2rzPPPy8pU8ywk+cG9dCpoRPbZEn+u090okK21EQpTn2bo0tdak6GRxNwOrOVdrLWGVXtgZUifHVKJo2VXlOdiCeRr59OkT282Wp6cncQ+4ce0XZKUhY2WtBFUh5YClLEqmceLLly/sDwceHx85nb8yO4f3LpUt7ympyxTRpWjksqyYZ8ff/vYjv/nNb2SvadJ0M62ZMTq5A+Q2FS+k3GZt2/L5ywvf//A9NqEIvRb7vNbvA5klsjomb2+IARXlP11q/JfsghDWzd86ZDDWpoU8jMNApjTTPNH3XTKUhtXpsGgTpTRLe7sg2esohUtA264fmZ3HaJMy3ytsppinKcns3jGCy+9v7QNXZ8j7OoaYbs81H55vXkKhNEzTyNh3HKuMQU9MpeK1vZK7jN1+z9Ddk5tDU5X1egtLL63XvWNmLbrZcLleuV4u1HVDVZaY5Oi4XM40Tb26EuZ5oq637HbbJC6Qg+h2uzG7mcNhz/PzB44PO6a5J88tzg9Mo/vFn9N7h8myVYR9vVzp+o4ffvhBRODOE9NUd+nJZf2RyeVUS6JwkUuP+vmnnwB4fn4S03ZaWUFy1usApJjh4Pw6YQtpnOxGv64Rnj8+SzhG39MPEui5/ALkC3vKUq3LY51lnM9XGdzMnu+++4g1hvP5jazIaKpSbl2tqaqacZzkFLYGN8+iWveWz59f2G13fPz4kWaz4dOnH+n6O8fjw9rMl6XGphfRZhlu9rh0m7y8fOHp6YkffvV3VGXN6+tXml1NXgriwoBgNYipxNPMvWOaHahIP4x8PV24dxPHwzstOqZgF/WtekUtQ0t5MdL4cP17cjv5NA1NzooQhEagDSYDFQJj36O8HAA///yJL19+FnhynvPw8MCvfvU9eZEzjkNipZAGF9B2LT/99MLpdOLe9jIAyHKOx0d+89vfSBKR0hRlneLR5PZT3wxilpdwWXXInzGsf8Dln1nUKwGYw4z3jvZ+px9m6o8H3oYLoTZst0ds03C9X/DzSM1uPSyVkkX2sqpQaRo7TeIr3TQNRRI+n05nHh4PKS16l+xLGeM0kdl8fR7FZjQx9gPH3YEis4xTR3u7sG0KrBW5ZAyyTXLeMc9RoMYInLnv78zTJMv+ImeeZr62X9ntd6uqJ8awHqJLO6K1ZhpHplEGmB8+fMA7z+12Y5oWJZpcNPbry1dhmURFnlcSTqKsoAbWoc0ofdd+v/aMK478epWkVqOT7URuEJ8iwr6+vRJ8lEhhJZNMYy2bqmaYB17f3tg2W5qyYRy7FOqYdk3A2+mNuq751a++x82ee9tireX5+ZnPP3u+fHnh8fEoIKAgN7dzLmEXA113xyjF8/NTmrZK8EhWGC7tjWGaaeqNWK9UxugdcVbEWXN+uzMMMz7IbnIYPT///MrzY02T55LCFAMSLva+l1untN6Dd2gWRmri56RIs+Bm+T1Nk8jr0g2orUwnnXOch4GXr1/593//f3l7e8WmMv/Ly1cutxvfffedyKe8UMsA7m3Ljz/+yJeXr0QE6KuMyMS8Ao/CoTE2T0DgxMb8D7fgAkrW2rzvQhbz0TfVhjCKPGOQ5GbXj1zfTozdSN1smPSAqizBzNjcsFEbXl9abvc7eVmilcY5GZYsYSvee6ZxxtqMzWaJs/aJYZRzv4svUqahMAw90ziRJZbRPM/rzGDXNGk9ZqnKHXWTc72cMTYSrQgZjLGYKFFlPkjYrFaBTbOlKkuutytudjQbUcG8JvhTnhVpSCkrHe8Deo7c7je+vn7lN7/+HUVZyFYh0zSbmnEc+Pz5M2WZczgcsR8/PjNNE7d7S1EoUEZIapPjerux3+/Z76o1pWk5ZZaTpswlfupyvYoRM5WA0ygCgKenB1SUEMp7cjyblJmwqSVzQqH5/PlL2klqvAvJWziw3+9XR4WYgu1akj0+PJBlObOb+fnzFz58+E54kC5w6s4YrSTeWhvaW8s0jemhAh0VTVVj85zb9Y5re2qvUbNhvDs2KYvF6gKTQlLeXs/8+c9/4+mxoDSaInFElFLkWcqB+GZvFwPryUgMRGbhmnkpefET0TsIDhXDaksyWpweKigckbKpOHz4QEwL9eA993vHH//8V863luPDg8iftGEYRz7/9Im3tzd8FCRgzAqMtWybDceHB2xREHWGyXNUKqNXFdB/WH+E1JvHGAlKpqQqynJaYfBBDMrBB6bZ07d37tcbrz+/MLcjVhlGDTEDVShQsp46Hh8I1jAFx9zKZH6z2a7ueQFKb1fQtPfC+snygsJLmam1DBKdE1mbMRIc2p0kNPRwOEh/GL3EultJ/rVZTl6KgKPtO9q2Y787orUheMXlIn3f4SDOG5dEJMsgbbvZUpUVkcj1ciXLijVI5t62hHhnu9vw8dkm21TCbMaIVjl1WfKr77/jcj1zuZyxShmKvKYoGmYf+enTJ5QSec/T04f3Ugv9i/IjhCDyojQi/vj8TNd1nN5OdGXHbrfj4fFRhNe3O2EWwfP9fsPazXodb5sGa0p0Usj//PkFoma/27BpNtzu5+TtMmy2Dae3c+I3SoJv0zSMs2fT7GjbjtfXN4LSPD49UhUFCdSMUpq6Lld7jNGGwkr098fjI3M30P7tjfunC+WrJ+fKPHl81ESlmULg0vfUbydeXr7yYb9D1Y0k06YbaFWTIA2hSn1NCBI7F0Ig+ijwqxSnHEJSkijWBXjU0hcZZcisYW8fMFlJs33j7fzK6+srt2Gk7zouXc/brZd8idS73i4X+YxQDN3IxmQ0TUZW1yibiYvDWrx0sr/o+8I3kKNvd4RL3xcRCZtCrcOzEAKTcwzjyO1y4/T1xNe3E9oN6240S7+jmKqU2UvFU+QFaobr9Zpi5YTjubRECwTsvW+GLDOJ2ZJzOBTvEQ0+MAwj2912zVNERVzwzMERdKBpNoQF1ZhZNkYc7y8vr0zTxHe/+sDT07OYbU22xgYuFjVjjDhYUr9/NYZa6gAAIABJREFUPB5pu4Hz6YzWsis9PhzJs4y+64W0t1IBkj09Csd1s93KXnERcMcI09ilpadfG0eJnDLJKa3Xv5YeYXkAF3hNledURUV0HlsYcc2HQFSRZtNwv9/wPtD3A1khkjbvZOkpnNM6SZRmjDaYNAEkaR5lCaoljyKl4OhUfngvnJrMGrr7Has0tpBd22azWxeoi6t5icKKRPzkMU5TjpqP2w/8/KcLwzQz5yXaZoR+YAqOvu+4nK6cLje0MlR5tt4Y8sGlYE8ceFHKJOsFwSvmORCTaySpTkVjorQ4I7SBlGoVIgQlggGPph9n7v1EO8yc7j2TcwQ/89Z9pihLWMb67puyMQTmbmBGUdw7bJbRsCMo6fd1TLeb86gQ1/2vTnYrGdSQlDHfeA2JeNwqhGiHkfP9zuV25XYeGYaRInM4E7HGYFzaLQaRiBhjUnLy+1AqLwTlsdxsiwA/poNKLTexUgzDmA5y/Q25r0r7QMm7l2Qm2Vk65xKBIedyObE/bMkySZ8WwT8cjgcUhrbtKROoV25Ys37GbnZJXGEIUb73OPQURY7NLNM00PcdWpd03VWiEbJM1kzeY7N6jVdXyPDThuhp2zugKItk70F0d+39jptm6k0lOYCpSV9LldQTDePIlCKsZuvEiW81b8k4aYnMOIx3oBVt39PUDcYI2FUmU4bHxw+SJrTZyjj3fiMoSddRmIQvKNPSNbLZbrnf7/TdSF3Xa0T3w3HPMHR07ZXgZjabDTH6dAqpJDUDVGSaZ8ZBpEz744FT1rOpjvxb/0dGY3BKMYXI7COZhWEa+fr1wn77WTrB/QHvPXme2CGJeeYldQYV5KVTIeD8jPOzyL7S7exjJEa7Gn+N0SIiDopAwBMIaKLR2CJHGcvsA8pk+MkxOY+PkTEMmDwjePAuHVZGytdhEnvOrWspqoKy68GmUkkp/CwbexMikVlWEgiLFJTIDlG4GDF+MW+kfAUn+96267jdJQ/iPnYMwdPkGVoJfWF0gUl7LAjKUmv6aUg5hJb98YG+u1PX5ep0WHSiWmtpYZB1TpYXdJ2gS6ZpSu73Au9z6rrkdpdbyQdFbiqKYisMXRewxkrWhBGciveOuhZnUIyRw3HH5Xym7e7YbP8O9FX6fWI+izrrdLsyTiOZFUteVZXUdcHLy2eGIb1gNkta25SFgSavC6ZZwMTeOez1ehUhc16kMNB5ZTAeDgep0fsWnxQA35Yo1+t1xc41VSUysukujumi4fHxkXkauV9OjONI02xllaAzzuczSkdhelQVZVESomd2PegtuTUcMskGfHl5Qaucpt6uioNhGPj555+5XC78+u9+K+oSI32XUqQbXREDvLy8sNvt1hNtGTr0fU9VNez2ewKKOI6oTFJdLkPHmFnuEcbRE4NiniR27Hrr+PTl6wqqrXJDk5g33gTKUhwWahF4hwAhrIEg7/pO/c3vE2SrKGyVWWTYzMFLyu8cqbdHslvHLFG56CyimPBuFlFA0nRiNCqFp8rEMuKVZfJwufcEdWJGsdsZ8kQviF5E19ZA4TOqWFIVeSqL9WpWWtmwcsasqcT3tuV0OnG5XujaicFNTFEmv4sATicqwTQN6dkRIbbSIhyfUmm/WJTatuVyEQqDVwaXJHvjOK4v4H6/S6V0CulMYm+ZmMtwZrvdUhYbRjWuF0nf92x3JWWSu81TTHLHnqqusLMV3m7b0WwaiWNPAbRjKy1NVmQJpzExjXLbFmWexN1S7bX3gePxgSm6VIXB/dziYxAiXV1jj+lFUxFCmNMbq1e8uNaKuqro+57r+Sp+vSkw2okiFyKb0QbnEzgoek6n17SQNOiyIssz3t7eeDmdaccJa2SMvNhM5nlmTkClRa2TttkpHTXg5sD1eqPrhqRO8Wuu3OG4W3F5ggy0K94wyzN2Zpt4N6LQv9/vaGXZbvfopMuc3UyuDZNXBGUZ5kA3z0ykIEvvULOniIF2ynk9X6mbRuhZVuFjYA+QRWatUMaIrShlxDsvEsBlN7SM/xcokEgkFSpAMAGfSjQfxCVy71pZBned4BRKmBWUeYaa3SrvCj4QtUSu5cZCElK46Ln3PSqzTJcrAU3Xj2QJeIVSuHGgsJr9bpsi4N6F0uv+ZYmWSx6+dhwY3MjleuPtdONyvdOfR2LfgvYURUE3XZnmmckGGCYCkd1uu07CfXBSnciYFhJEbJcAZOM4EebANHnuYUDpkMT5YdXhzvO4smGXoKKilNuovfcSOuoG5rkH5Xl43K7ChmUS78OM8xqLPEOS/KS43W6rDY2IOOtTLssCNvNeBB9KiZAixsDx+Mg0zZzOb3gnrdDAzPZwIC9yCejxXvaE1orXa9HoLT2fKCt0ioOqMWbi9PbTuveom3od1Cx7Qmstj4+Pv9gtCch2825P0pZf/93fJR1jTILZ6he7nbJM1p1E3MrznK7ruVwuRBoOB+HK9H3/Hvyp34cky7BhaWK22y2vr6+8vLzIz/jwhE4lVYiy39ROJQe8+Bv7YWA2JbOTJbgPMPkUN33vqN7OxOAprSIER6Y0qpGSxSqFljfsF/mI3w4/lj3h5IQAneW5pEOlG8E5x+3eMQwjbdvRti3tvZX+yVqMbkRvOY2ME6mvdkz9QBYUTS0a23F2hBipi5JNkWK9up6xk69prcWWBd6NFEYzR8cuLAMFs+691DdOjkUq1vYt7dBzPp85nU6czmfcPVAPE1mdURrLaZ4Y55nTcOKh+EC92+D8yDjKQx1DWP2fy2e4CvdTivTpfKVtW/L9niZpOn2iwy0H7vV6TXmFoxAAkm6zKBWnt1cu1ysPD3s+PB1SwItJiU0jZVlLeZq+pkHjvRN6W1Hw9vYmg5uP39FsqvVGXXCYy0tqrRH+K0ryI2uh5X358gVjDR8/fJRQIxXxC6l+HGe0MmgjuxnREnoZ5X4zdOn7HmMM333/nD6AjtNJdKC6eHcJSxM8rzpNsfXM3NuW6OH773/ABFE6zPPIYX/AaoubPFmVJ42USuN9hdGGrpf4qs1mx8ePTxRlweX6htGaIq8BzTxNQoPzPhlwQ3qpTSKv3anrmh9++BV1XXFvz0LBajbrgbGMkUEzDhOu6/GlFr+7CgStmb2ibSecj1w2LehIkxmyzNBsSpQBdERnsnoRBYuXyeI6ZZwI3jPNAkK+9z3aZFTN5hunh6Ifei5tS2Yt3TjQTYMEnxhNrg1FVRKCp+tbQqioq0r6wXGibmr2+53Is7xYq4qqIsbA7XYnM8LruV9PXNorqlWoGIkaRieazcwY6rISh31Uv3SpDOKbG4eR6/XK7Xbnfh/o2wGGiPHiULdKMbiRsql4yi1ZU9H1HZG4UtNMugT+4wu4xO4J4rIkLzIKa5LZNpdD2oNzsyhr0kFRVnmC7k6AYxh6trstykTqppD49bpIBbZcMDHIs7b4F2Vx73l9+Ykqz/n4+AGfsCSnt1tqbzTexdQiLYe/xKMZaxj6ThKs65qHxweMNozTSD+PCUgtAy87DAP3+13GwjEyDH1SdXgyY9eXb7PZrCmjxgiYd0FRLERtWbK61Rk/zzNt12Ezy/5wwM8JbBNJavPzmnrz/PxxTeIZx2m1UZ3OZ0LwHJ+OFHnJ/damNJsjXd/RdxNfX76Kg8OwLpgFvjMwDBeaphEgVPKeLVnn4zhyOZ/Z5hVBLe4Bkk9QgRsJsyFakeEHH5jCjPKOiOZ67xjHgUNVUBaG0+nEPE7s5z1KG6qsXG8Nvtm/KSXqjK4bpIcaB4wtcSGS5fkaxjNOE0VZctztyI1kRhQHw6aq2NaNEMiIxETwMkoewrosqaoqQZOUYEqUJmoZwgzHAbcI6OeRn15+5nKTkrFqaoZsEAeL1uzqhnKXy0qC9xXVgu8bRnl+rtcbXVLmqDmiZsfGFOTWUqqSvBjR2mOsoTQl0yRtQV3XVE0tlYYP66RTlDIDeV6IdIwAiDRxs9nQDx1DO5DnGVVVpuizd9nZMAx0XcfDw56HhwORSP+14+Fhh7EZfd/S9bf12VhWKdqIs3/qJkIMPH34QFUUjPOMirDZbvEucrlcGIaWp+cnhmFMsw69skrfXuXmFFmoYugHtNEc9wdGN3O9XTFKLFi2qkpCCuokjYxFv6h4e3tbX8Dl4V50nksPcjgcGMeRl5c36qpmmiLGlNzvvTTOh12q1Q1GGfq+Q0VNllthnkwzVVWKw9iaxA/JuN1uKzajrisya5M8SFiegASampEQPG+vJ6q6Ypo84ygN+exnDsc9WZExjyMmaoxVxOjwRGyR86Fu6G8tXduRxRqV9jnCnLRoI77FGCWVeJonVK4Js4IbFJlm6nqMUuTa0N97TBQ9ZKEzsccqLcEv+MUwhPfQ9j3X+43JBZRyTNNMVZZCCnAzZZbzvD/yvH8ghMhD02AVbKsqAZsdOAkCXYjSMcj/nqaJ8dYxTqNMabMMZTTaGIo8oywkBg08EHGzZ+zf6K+tJAi7wLzZfJN0LHrYZdA0TRPd0NFPI/040Y8TXd8zzZFaB2qj2e/2hNwQ2hmFaHDxnoDgEKs6ZxoGxmEkL+rkfHd0bb8uxZ2bRSQePfMwEPNCVkNFQZ4JlnDoe8qySAd0Rd/faDZVyryMoD3BxRS049k2jThkrOZ8OjP0E8bk5FnFOMwMY0fT1JJM7Tzt0CeniWYch6RzVmS5DBiXkl6nQ6DthC8juYqyaXBpLRaVIPiN1SnY6A1rjNxe+/0O5wKfP3/GOcfThyf2+/3K0l/ox/M8r9O9RclireV4eGAcJ778/FXsRbmEZ2Q2k4Z3doTke8vzgr7viCEkBFy+Mi9fX1+53W4JrHMUMXLC2WU2Y5pHnCvTTk6zaSqu1xv73Z5be+fzTz9jTcbj4yNRR7QVFUqWmeS8dvILSCenmh1lVQkz9XPP6XziN5XjeHyQVKepx/mZqDKiNgQ1E5TCRcWtHXGZIRrNrRi4FgNjPvCwP4pDoXAiQUti9qWU86lcvnct/TAg3lRFnD3KeYqq5HF/kIjsw5FtXuCmibLI8ePI8PbGqe24Xa64caIqS2z6wMdxxM8uIdzf92NhwWrEiM4sWVmwPR4o6pLjZsd4mAjjzPV+o7931IUAm9VqDH63Nk3DwDD2krLcT7T9xPnW0g6jhLooT11YqsMGX1raU4ev5SUM3oEOmEwJbMmUGG0ZXOTtdGK73bDb7oSY5yYp+bzHJ6ubS+ZlrcE7Jwsha/HOc7+3lGXJw+OeZlMIksNEqQjSIFBraV2cn6h0JcM1XfD5s8Rlf/zuQ2KJ6nUCK3LHJYZNgFw204Rg2W53WGv59OkT8zzzu9/+jseHR1BxNaVnWUaRotyUEZGDVoq8yPlQldgY5ebr+o6hH1DAbrdjnmdsZlbOxy/2g/9BI7kMcYZhABXZbJp1UBKCTLwW+ZOkMfVoo9jUJedeFp1t15FlAkOVnu0mZafV32qi11JXlvRymvngGCdxYxyPR8pS/GQ2N5S2/MXPLL/YmazKk/9PuCNt22JSKM0w9BR5Rq4MVpZmstwmCgJCa8F8uAlblfhccbv3nLILx10lA6iuoy5LrC5W5MPi6nDevU8cY8RNc4rYyqjynIf9gWazEQBV2/Hjz1+5n9/o7nf6+w03jLhpYhpHog/kWbYO1UCRm0IyH73s/2YfmIMH/W5BmuYJU+ZsHw54NLd+IDhHloBJCggpRszXFRZxw8/zzOQky6HvBq63jut9oJ8DcwTtI9pCDjTbikk5Ru0h02gv6pqoSGgPGNxACBAw1Gld0La3FUMfY8B5t84cfqnuiWk4J3j7w2FPJDKOE0Vpkyh7xtoiURFE4zrNIRmIpTe/jx1ZbqnqwwqYyqwhLwqyTPTQIXi8C+jCJOaOo+t7YkoN1kon9cydGGuy3K7Pv1aGcRil3w9iZLCZkWdhGLHOe7q+w2jFdltLiEdaPdxvd64pFg31rh5YQkQXZYX0WRnH4xalBL++GCunaaLZ1mR5gZvmb8pZn1Toisv1QoiRh8cHYlpLXG9nxmnAdW6NRDseH1b7TpaJe8B3M7f7jeOh4MOHD2l5K8vT0/XM5CcJKDEZxlj6fiazpZRwC9HLeeqqZqsqBvUjbXvDZoYwO4LzeDTRZuK1iDFBp8SWNM4BayJ2dty6jqqwDONA37cMfUmeyY1NUnss8q8xsV6jD2S5pbQ5FoXynu564X5+5Xa90V47xq4jzl6UNk5oAviwQmu10uRZJhgSpRj0uBpil4c+aIXOMmxeMDvHMPZcXl+Yf/wLKivJyxJTZEQlqbMxBG7XC5fziaau0t+LeCdEuHGeGaaRez9wvg30o2eKijIaigil1jzudpy+vhAXOltUGJuhlfgqu7ZPLKMdx+1RRBxNwzyPTONIiLJHVk6tZABjBDOolGAqtNFsqw273W49oEFmG1VVUNcbyjJLFDlLVeXYLCRxf4cxiofHPVrJ89psKvquS66TSJ4XeOfJM4vXkGUFKFG8FLmUps9Pz9yqWxJs5ILhH4ZUCcouuSwqzIqMMdy7O9M8SUr15XKhKAuappFcvSgIAJV4mkpr7rfr+hIuY+N5CQNNS/0l58FmmqKQl+Dh4YEQPdf7VdQuRjj+eWZ4u90gyst8PB4F4pROuLzIOWbHtMCXJnhZsK9TTLzcWEXO8/Mzm2aPDyIEEz1rzfFwYPIz59OZptxQllUKTokMrQw+tlVNtdmgnUHdNVM7YSqd/iwW3wo1WhUymPAqMgXBYiilmQLoyaOiJzdQZZ3YsRIQybkZo9/tNdZaSMmui/mWAG4aud86vqYEoK67MgwTVluZhNqCDENeNALMnWe0canMTUbipNzRCprthrws319+a4gSKSyKlqEj77Y4FdBZgTYGbQxjwi2y5gO+/wUO7yfmWdY3w+S5tSP3fmT0kSkEMhdR3rHZFOzyjM9fPxE2E0SZRup0+A3TiPeSW7mI8qdxXPeSRVFwb9s1VDPPbFolVGngNlBVJbvdjmHovrFEqVT+WeZZ0CmwSc6gmKLfb4QokrgF1Rmj7ESLvMAmcO8wjrR36TNJ6zbnHMPYEnxgs92kdsvLIZhathDEINx2PcNw5uPzR8kgScv+2+1GiIHNbiMV0PPH53V6J0vHmWEIK51su93SbARHcbvdGIZhHdIssb+y31FJASI8zWXloTTs93sJkLx3YoVCpnbNZkuWS5Panq80zQZjlZCmyXHpRdgdD3TXlre3N4ZhYJomtpsNeZ5T1w0+BvqhpSiqxOaURt57Wd5v6oaxmzi9Xej6lrZtqXcbjg9HikS1RgXGy0yuch73j/z06UeocqZzFHxDiHg/E30ScSktuH2lmINnmBVtP3HPc8bJ4WPAuQnvCmKWrZpHgQEFMqsocsOYSSXhp4m2v+CmWVKutGK727Pf7WnKil3ZcNjsqMsNKrUHC+xKpzVS9NLfKvNO1/Yx4pBydAoS0jK6GRdmHCJ/E1WUTDkX9AIqUpY5TVOhdSTEmRg80+TwLuCCpu1nrm1PN87084ALHhMNRs80VcF2V9KEmjd/4n67c9cOFxzKiINlbub0UHfJiRAFna9kZbGQGxaFzNLzZlmWpvU6TcSFtJ0XBTbLsJlBm0hVV0Qc3k1M48Q0ObLcJNf8Yd2DArj5vb1yfkZrRVUVZNZwu9+ZRiHg1XVNUWbYyiZjb4JaBbdWiUtq2X5/xM1fud/vdEO/huVuNhuiimKgF2K8WUlZmiwtkt9vu67r5M1OjX/fyxeTX0K+nkDLLbV4wS6XF56fnxjGUXDiWQYK+qGnygrqVNpKv+nX8jXL33u15WvN80xZVYxJ7ZLl0ugKT1SsT/f7nTwrUvxUlkJTWGFH1mbcXc/tdpPUWp1JnJmf0SpiomXoRp6PT5zfTvz89pW3caRTmjF6yhDQPsgv3hiiUcxR3BG5VVilGZxj9I4ZUe679LPneb5CW6wVnHxVVb8AGVFWHLc7mrphu9+hjEErYYXWeUFGgQkpNizPEslN9G5WiaN8Qd9HJSoQv5C6E25Qh0hmM7YJUBWNhqjSizCtQZZdVxKjl91cnhHihPcSnyarCUk3Ot+uXLuWMTrRwE5yEOSZpmlyXBY5DXfULieagfvtjtluKWyRnARL/Nh7lSB+VLPG3Tkngul5lhdwu92tsjSlZMmfZZkY0FczupijZd5hIOQMbqDvRx4et+gUx9310gsKMEqtYgqj9epoyfKczE6c3k4YI9CxPLOJBLmwhOL6jiwaYMEn+nVw2bYtOpEN8lzsd0sPb/u+l8lkUGkEDdYWVFW+lpVd14qJUplv9oGe6/VCXW0oilJ8X0S0kczvrhcef1mUXNINWhU1H58/YhR07Z3b9SoMG2WxZaJQOY9bp1AKA7RdT/SaIpMHd7ttGKeBy/XM09MTCkPXDhz2MbnqzYrdC7MMEIKH4/5AlZJoL9crV05UVUmewTxpnJ/Z5w98fn3lL3/9kZ+vZyZkmjmMy5g6Ciw3mXZ9CASfEVRMQacz97bj3vVUZYaLGeOsyFWJVnYdTpVluRpYl6y7XbPhsNtT17XcvhG0KlA+gFP4MaDixBRkmCHwYGGL4jwhOuIcky1K1EYBwGpsJnRwbQQD6HlfiC/pwErJAKmpSgITNtdEHNOU9oPBME2O+63n9Hblcr4z9APOCTg3jiNRaWrb8Pj9E13sOcUrY3SYTc1zVWC0Ypp7xjGClpyKqAJoEayH5CuRWIYpqWBkYKeSq2ZMetWmqdEYeea8CMWFwD4zO4+1mvYq8Xr744F6U6KNpe1u+BjIcysok9TrK2VYfzMRQWLMjmEYBceSFRJpdm1THqZcItM8r5iRGM0yb6PtOq73GwdreHr6uCql3t7esHlGXhRopbDz7GnvV6qqoCyy1cI0z4p5luZeKcuHDx8I0dHeu/UHMEZKqbYb2Wy2K6s0yyybZo+bxeWdF7mQkBPZ2xjFttii0Vwv14SIKNLUsyME834TX08URcHmsKHvejabGm0Mu+12jRzOs3KVyllr8SgmL7X/5XzmMeUQGKtw3ci2qHn8sIeQ0/ZnmAw7XzJ2Acj4cm7568uFqzOUNicoGcKs3r+ktVwkb0EF5iAv5jiOXG832vbAvtkw57LEVWiMITklzJpZt0xu8zxf/0zaWDkQfcAnxo/SEaMMcc4EthS/sej4SbS/XrAZSmu0SbwaozG5xVnF5CZIWX959m5IXiSHeZbLEC45KYx9X1HIbTExDC3dJNFo13vLMEwMc2TygSxqSgL7suT4+MypPWMqR7UvcJkhzKOIo6uKfhi43zrKsiArZMdmdJZis6FrB4ahk4SrdGPOybtKmtxeLhc2O6HqrfarFP19v9/RGvb7A1Ul/eg0B8Eg5g84N3O93mnKirJSLIaxEPTqyu/7nu+++15ChzKL0oGqqmmouN1unG9n9rv92o4RNYoM5wLn8xWj87Tnlom7MZosz6mpOV3OCTPaYJuqorCefuhpb3cJ/7CRaewZp4GHhw9UZSOOtm/0mPLh2dU90PdDAroKsS3LC7q+k11j4vTrlBiUZfnqln58euZ6vdH3I9Prq1zV08TlckqaVeGY+ijcRmO0sFfSfma73Yqbuh0gjhgtAZBd15FnNT/8aosxcmuFMOHmCf//s/Vmu5UlWZreZ8Mezj4TSZ/CI3KuQVUlVJdaLQHSKwiQBEGvqCvd6A10IwEtXZS6u9CdlZlVOUaEz06eaU826mLZPqRHdQCOiHA66eQ5ts2WrfX/309kciP7rqNp7giXM5d396iz3EXfHi4cfSTpoj20tZx4U2T2npBlIK6Voipd15gycwq4pDhfzpxPZ4ZNR2vNdcZmcyYjKPRMcdFXlgpV0I0rjJZOdMpB/JIu4nJG+Uj0Au+V+3bClzlW8E4wGVEi5XIpv7V1pJwJWUq52blCnV5xs7+lWXVf6GsTUUyw0RNToFEFIp413knk9OyEJHY4HuQ98wkfi34YzarS7LYd3XbNQz6hqkzSGZ8Dx+FE1VUF4GUlbVkpxnHG6BmQABg3S6l2e3t71dc+1awuZIf9fi9Yi0nm2Npoxn5gmns2WxnWS2daSADGaHHxVRVVbWhXDf35wvHzEdPIxjY9jMVcsOH58+clP2OD9yI/REnPY73ZUDUrhr4vpaWiaWqGSRpb+xvZ+IfxXATiqRi8Q7HrbQg+0J9OWK2E01HXNd4H/vjH70gx8NXXLwqxqnmSBsSVOrzsnqoMJbfbBu8C372RzLuvv35drDAKX9wNIbgvKMbTNGNtVbilGy6XCx8/fmSz3XB3txcOpy0PlHnE++13e+G3aEnN2W53rNoNh4czb9++JWd4/vw5WsM4D8QUaeqm4ALLz5E8zo80lcR5q+xJ3nI59rz9dM9kLKt1J149F673A58iPgSy1iVWTNiXwQfJR3eKUy+C5u2qQbwBXfEyRlK26NJ9W0TzlZF7wzWOWwFJ5Gaz9xxPR8ZLj5+z8GhSkoZQcbNfhkE0lk4aBaaqZSal0nWcFMoM8PVXL/jJT74hxhmory6OkLxobMtoIARpaOTcPPYDBsfheOHTw5HDZWBOiSDfKlZb1kqzbuHlszu63Yo3nweadctFq5JyxHVW2zSC3JCMjDXznPj06RN3d3JyLKS/5RReehdX8UDZOtpWothPpyNv377hpz/9Cfv9nrqxBc680OG43hcv5xObTXdtlNC0fPvuW87nM1+9+oq7Z3c4P199q8IqjQXtnAVAXO6B641En719+5aHhwNff/31tVJc9LHW2msexSJry6VPst1usSE6TM6Mo0Q23d6U0NAYOB57tK6xRjqYMobgP8MhkdjhGCSaum1XzONITuFKkY4xlNJWl8aPKchEhStysBgDt3e3dCvBxVWVQptK1CBFt1jVNc47WlYl+65mmCfmScqTu7s7Npsdp9NFTJbtimnqH+eTORFzKoGYgZwVvg+Mbz/zVfoZv/zDGz4/nHG2JiglDZbi4Lclr8/HeOVqWZxVAAAgAElEQVRMUsBMlbak5EkqcZkd98cTXVNRGUVVKWyJG085otMjOGlxmSxvTEqpED+FNZNSYBx6zv2F/jzx4eMHjqcLs/NMzjE6zzjO14cnZ1AFy2AqVbqklsZabjYbtpcLbppwrmV2FbngI1wIjNNMP054N5OzE5q40+gs99Z+mPj8cOLjw4FhdriY8TkRU6arKzbGcLuqeHF3Q9aJWSVyZTC1wegkyUlK0a46Ua4U18IcPClJjHpV1fT98OgHzUioCiL9W07Ep+77Yehpmvqq8DqdTuxv1lTV6npY5CT4ypwT6669nrA+ZcZLz7rbsmrXGGs5HEXcXzc1tTXFUF6M0phijMmFcqdw3rMu6b7TPF9dQYtiJpbewTLiWDbbkLzEej8c7klR0TYd292GS57IObHd7pjnitPpxHrd0aiaEPKViLx0kkIIjOOhNEz2aD0WyrVlHAceHh5Ydd1Vnc6T3SEl4VP2/YX1esPdszvOpwvrdUcm8e7dezovYmS0wtayw0zzzL6cpm/fvaNqG57dvaIylstpYFsc98PQMw6JupEyNqWEURaLJUZHiAF3PMKHmWayrPSKdx/ec/Yzk20ZvGfOYgNaakpVkAexzAlTsWJVVQvG4GNk9InPp4vM7KxFW30N4DQmo7QvbwxPlCEi6QshkEv5HmLA+UGI2UqaQ/04cbgMnC49/TAxxchcrFZ5MSznWTCAlYSxdKuWrFp8CoKZH0baVStzOyP5juM0M4yiA43B4+ahUMY10ctCOl1GHi49x35g9AEXMzEKHbjSmq3RPOs6dvstU5o5hpFcGXHkayvkupCo2/oKkVZKcXf7DKWqEghTU9dGosSKNHJp+T+1qPnCEl0iq5tGWDNN05Cyou8vhODZ32xk0F9YOMYIzuR8PokypmrYbDeoLAbl3W5NCIHj+UxWmdWqweiKcRwfWbFZ0n0PhwO7neSFjNN0zcToLxceHh6uJvhlYyWXAFLF1XBc1zU2xcR6vaWp23JvKh43N5NJ1zufZHQLbm5hxMxluLrZrMuQNUr9nSMpa9quRVsJTDTWsGpaFqrRMIxMk2j9hIolO+CS6d20tUCH245xmNBqZrveEGJis9tzGQZyhpu7W1adDOK9NlwuA6iEMYrNZk1Knvv7T7RtTddt0NkSpoAbHNPkua1uqMKaVdfycB/57nJgUBmnsmhEY5ZSKmfmKNHZXMNfHgfazpXk1QTDHMhRmhshBiqjZUGX9rUPMzpncoFdpaou7oEkToMkaU4xzpCCgJWKSGHygTnIv8cgd9CojNC7C0gJlchKkcjM3ovQwtpr+TpOI2snqVraakLKDP3I6dJzPp3IOZJzEGHDMDNoT0qZ42XkPIwMs2P0Hpc0SQmtVKVMaxS7rubZ8z0XN6A6GQv5AJVaie1HmeI68IUbui3oFGSml4SMsNl0pTMprpcll1Ao6k6yQ4rI2hT/ZUZYsHVr6Sp5cI7HI9qqYnmj+EQv5JzZ7Xa0rZS+KcaFN0zVVNzaPZf+zPFwZNVtaRtBfEpWhogDbm5vpJozqnhTJbKgXQmhYnYT0zix2ayJUWGNVJjTMF7vtEqBlZauDDFTknpXpXz9giFGGaIbzcPDgf4yoI1mt92x3qyFlqVTmY04UeWrSC7xWk1b05Sd7/D5yOxmFIbNdsV+v78aggXGtMG5B/TSratratvQ7FfE2XM+XDifRyYf6bo1+9s9xnCNa0uAiw4fZurGQMooGl5/9TXjOHA69MxjoHeZrm3pzA57yXCvuNl+w//1//0D3zvHQ4RRB4KpSVnKhuxl7lNSjh8ZK6U0DfEJALlgAFXuscCubWmLC0T8jpFNW6NqiRaPMV3vlk3TkDFSJgaPUZqubRlG4dMk72T+ZDSV1YLTW1J9a4uOlWS3x4SxSsYAWqFTInovEWVGi4IjZ1JwnMaZy3liGEYJdY1elCCViBFciMQQuT+cOfcjLmSyUmQj4akVYEno7GmtZdO1fD5+Qq8tq01XhOEXpmnmdLqw3a2xVkJQnXNUTYMP7qoiyhmsUSV0taydw6FkZka6dUPXdktQsTRMci5NPEVdWbSBbt1e54EPDw+CNEyR9UbyAZfS1hhDjIJEVGYhsMN6vSbFzDg6Tsej5NGvK25uirHBO2Y3s7IrMlE2kyJgalbS1Ksrsey5We617aqibYTZJIopjV2XgfE8z6XhorG2pW1rQhSJl7EWymV66Ee8E+NugSSXXTqVmCgntiVjHgfKiisuzntPZR9byTJb4REVWNr81so8LQNWa1TxFzrnWa23GFMxTzOrrmYYBlbNirpuZQhdvrEYArWp5GF0Gu018TTT3GzIvSIcM/qU+ab5Md/99oHfvbvnXYz0pkI1ls1uB9NIPmd8nAhxCU7hejKl5MVcmmVOlFLAkMkW5pjpZ8/DeWDTjaSsSrhNQ589cZIhuBlnmkYG+CK5a1EJdM5yH06J4CW3sFvV+CiZi0pnfCoM1+2G29sbam05n05cLmeyljtrt2q53W652e253e8F+1eE0VFF7k9HTscJNzvmOTAOg0SeF+WO85F5dhzPA8d+ZIoJnxRJqZIhqKnLw3633dMYy8Vd4CajjCEbGZt4768pVnKfi5K+u+quM+IlTkxOJ5nJ5vSIkTBGyjrnPFVlcbMreSlXMkaJHngM3Knrmmny18gDaytRGmlTHvz0pOnDE8eEjJXklBa/o9bNF1wgXZisSsk9ngzBB1ErlbFJ07TM01n8+npZ1yImTzFh+35g23XkEHA54Z2nbju0tRiViMkxToP80HUtIusYMSpxevjE5mZfaNzp6pvLCamBkyTJXvoL8zyzWW/QRnCFKSUOJRFqvX5UnC/uZsmilwy70/FAjrDb3ZBQbPY7hr7neP9AY1/StR2dbglByiq0odY1Q+/IIXF6d0B5uLUb7Az1h4rP3z6w17f8+Ku/4N3vj/zyn7/nzQyj2ZC6iKks7WpFiJFoK3TLtWsYokcldY1EyzGgVLx2X5WS0BSfYfKJQz/S3J8Y5oC1hrE0qbTKvDY1bVNjdcIxkZZMP2PF8UAma8Xtbof5MZyfT/RTYHKeh/MZFzJdt+bu5pbb3Q6FEuxgf5SAmCw+uu12x6brWDWt7MIqEgAXEuPkmYJHWUvQhouXu2maIy5FptHjnZTvo/dMKTLFjE4KZ0GrjE2ZTWX55tkL+rFnZsalyOU441Jm1RQBSG0Zh4uAqQrJXWUBAOYoD49gIqWjOgz9NfKsqgzdqpVxyxTZ7dbM81Tu+yK5hAalyhDdzZwGEePf3uyIKbDbbwt7NkojqF667vl6d9OlgxujUN+apuHmZnO9j97f39O2JUUYyCFjKFjQbDACbMJPM5fLWOxVt9fPP516IQgqxeRmbAyR+/t7lNLcPHsBmKIuzxir+PjxI3d3z9is12UmNWGtYbOWDPmQIsfjkaZZyRjCe+pauKHTOOG8l4z5gief5klmb01D27ZC6Doepd3ctE88XCtxYeRI1664WW0gJXJ0WBLbVcu6rvHDxDDM5J3BNA22aXHTTGM10/nE5cGx9hvWec/KbbhzP8Z4y6vGMIbIv/+H93w49rxVhoe6w3cJNU3XDAg3u+uO+rQzLJd8C3wZzGmNwSpTgLieMUFvA4dzzxwiTVNDL3K2rqlpu57tRjarNmlaBXUI2CKBUogcar+Xze7We1xMhATDPOMj1HXLqm1ZVZLVsN2ucG5HZbmKloXVIom9SilB/s8zl2HmMs2cSmyYC4nJR2YXcDEyeU/wFBZOYvTyd6ekxLakpOlRK8VNs+LFs1vO04nRD/QusNo0rEyFz5m2raibCmPECT8Vd75W5iqBXEr8y0Uevqapr6395bWXGDKhOvggWtJr9JhWOCcMXO9nsbatGtE7R7CV5dmzO87nM+fLGWt1EU2oL9AdfS8Rf7vd7sqxycXVsTSBluSlqsooba5BQGKNO1NVVQFaxauYoK5rrJWm5TgKyt9uNlsqbbh/eODDxw+s2g2mshyORxSBympWjTRJdK7QJQnVFWZktappmpZx8HweHkobWZQ2bdtyd7vj873M/nKWNnVVW4yWUcVut5Mwj8kxTWc5WZLm4f5At+poG4tPARFgJZyfmP0ks6aqYrNuqNuK82lgPN7TYpk/HonjCTMq2nHPN+uf4z4rxk+Jy3HgfAkMfeDt+YHBWnj1nO/OR85oTFOhZkc2qmgtLcl53DRfiVlPxzOmdBcXGFK1pBuHTMLgUjkNJ8dxdlTWUlfi8J9jIn984NIPrCrDbrtmvenIylA1K6wtmMAsYgNjLZXW6KLvbVcdSUnS7SIkvqYs1YqsU3HbK1JCWELalIbSxGkY+fRw4NxPHE9nRpfQpmb0cBkDPkVCSKU5FQlKM2OYgyNnTTk3qJVli+Xl7XPaVcefLt9Do9huNqSKkuqs0DlRGzEXK6XZbDqGQUzIKSisqZlGqbw2m/X1ztbUjYR7kqRnoaBpLG27ZRgFW7/b7tHaEkNinEaeP79hu11f2aipBJCSI5lE3Vg22xXD0AuVoYxNTqcT0zRdcS7L97BINZdR13q9FjZvP/Hx04MM76uK+SSn7Hq9K5JEMZI/dnYl+3Kz6VitJFDUNnVNCpH9zZ6H00myu3PiRz/6ivV6w+l04nC8Z7vdXrGIy7xQFbMj5fhv25Zf/eo3rNcbfvGLX1y9f11RZlwDMp/EK18zLdqWGBO//O2v2G23fPPVSzarDp88WWliFkmWbmqSFcWJi0HkaMay3mRMD2/++S1V3PPN+qdsuaMKOz7+auLT+4HT0fHd/QMHPzIpqG6es/n6NUNlOPQ9A+KEANjvdlitBBYUZXfUWokq5Qk9TetHSJb3HpJYsTBVgfgG+hhxo4iNUZ7KWKpK01QWF3p6F9msKkYX6IaRrDVV09G2FqulpW5yIusCwCpvaEpRfi/HEj5Tl5lYvMraxJWemWd/fY988NxfLnw+nHm4jIxzYAqZYz/iQ0/KMM0OH1Lp8Bbsu9ZkLfItkiEpjVHQZE2DYVe32EoRbMJsVswWtEqPycxewMfW1uWhkgdkd3PDNAY+ffrE8+fPy7zQXhe+UqIrrarqidtffn+zXrPd7vn08Z7ZXWjbmt12V9aVvE8himUsxSh33fz4/oksbsX7dx8YhoHXX78QPfISrVdOwKciE55El7dNW8KJ3hNC4NWrV0UNM18rkLquGcfx2kd4akzY7XZYHxyqzLqmaWS328hA2s187o80dYVWmuncl/RXeYObdiUzLiNdtvPliDGWu2c37LY7xqknRsd6s6Zbd2W+uLiiVcm311fh6+VywWjDVy+eUVc1nz6+JwZP3YrwOMVIVBmMkfxE24JP4DOkyPT5gVXU/IjnVEPHjXkJ05rff/uJNx/PfPdp4N2p52ITYbOivX3Os6++YtqsucwT2Rp0VtQoBucE299tUEDfS05e0zSEMr9aDKY5F2dFfqSpqWIwiklyA7PSuNKQklRf8FHIbSE6XEw4bxkby46Efjgz+8zN7ZZ122BItFVzdbZrpQsRLzGNjhSlRa6VZKOnFAjel2ho0Vz64Ak5MoZIP830s+cwOI6XmWEOpGyJGS7zLHFyQYbwWksOfcpZuqIRMlYoAyi0hpw8JhpWqzVYxf3lM0OniFNVtKgJq2SWmEIAawRtnBUherl31Q2vX7/GWsvpeGa322IrgzGqYOql8SHPRipReC0+BIbhQNdVbLbPqeqa8+WA0luRrVl7pTMIBiOVCOuE0oZhcozDSLdZ023XYDT3xwP7YlTAyPccctEN66VxJGqaYR5wc+DmZlf4p45TcLSrepFmfQGcXh7AJfmg78/Yy+XC2Pdsd1vJ654jTWskyOWU6AsRq6oqpnEsZsru2q0a57GUnpviCjhT1RXbzRbnHPf39+IJmybWm+5q7TEFueecu76gq3aFTnIqNrWRoEkv5s2mXZOtgaRRQ8TMjnh2zLNG5Yp9vIVLwr2x/OTF33D8lPj17/7In+6PvB1mTtpw7hpiU1Hvbqhv94yrhkuYxQakFS5HyV1XkH3ADSPJhyv3NOZM08Tr7ii801QcG/9ylwwhkHIU9zwZmw0xKZKCGL3AlHySgM0UmUIkaMPo7rm/73kxebZdS2UUm4J+CAWMJcVIxrmAj1KK5iTwIclkn4pfzuJDYpojeQ5k7flwf+TUj7iYOfUz53GCqHAuMo4zPoQi8xLFjbJGEB8plSuwPAzSwYYKaExNt+rIILCqPDINMzYbbKVlPQYJ8nUuoqzh/kGIZPvdnrqq8X64hm6O44SaJKrMWEOIgRAePaLGmDK7ttzd3qJ0EtFHt8LaXIQAsoksVyFjLdZWj7S4w4GmbVlv1qQkG9Vms6bv4XA8XiMAeXIFWUrSxeO4GIOnSU6+zWZD3184n4v7o8S0L+Ly5Z9h6PFe+DVWKc12u6Fd1czBMbsea8F6MFbTtg05Jy7nvvi4HpmT1lpsLZfPqu7wQZgmS6hj3VQMYy9m4HHC1tU1AGUY5GtsNh3rzarMrCTbIiWPNopdsyHrTD9OuNCLIico6qCIby+4jz37+jnb9o5W31LrFe5O8d0f7/mHP3zP95eJzwkeVMVcW7w11EpRmYROiuQC3jni7CBkTGUJJb8vuYhHvJOVMlRWYrdS3aKNfF4IrrTFDblgzjMa5yNoCcFRWi4xMaYSQJmplHytiMigbCjgIgXp4nhwZ2qjOU8jq9pys1mxWa9oKrk6VP2AKmGm2ihCjjgnDZTVqpXGRRKO6NSfGQaxYfkY8Flzfzrz+XDGRwhZM82OFLMM0Z2/wnSVMeK9yzIWQGvp3pb/tnWNraQzKqZu8S9aZdg2a4zN+DEw9DO2qbG6QivD2I8khdz56xYiRCUQqBwDmky3EofJNEokdb1aUTQTXC4XUMILFStcEvzGOZa+g5D8mrqin2bO57PApAtPdpoHtMnstmsROWgBiYUgs9imrUt31RVVziPQd548h+M9dV0XooQuNL5YZq/Fh9loxnHmeDxLuEwZf4zjzDBc6Nar0rTx2Lqu0GS8n9FGUHmNNiRrSqhGkHhilZknJ4oUMm3XyJPeSgaF0hpbibTMza4IWFPR0NVwA8fzpSDqfBFpP5M5jM4EF5gmd80PnCZH9oFus2K73pCzYfx8Zn5zYPYrVhfLC/UTunhDOK+5PyXOHz7x6eHEHw9H3vjEZ2oOxjCQSUGG7UEb4ujodhBDxs3umq2glaayFbmuiMGjqppVXTEMDpMFUb/8meVkSKkAg7OUpyJ+iJQ5jZwkKRN94OwlYFXXFVmLQjTkxOQDMYNJMIVIdBNaJfoQ6JqKyzhRPxxpjKWubLnnCNrCVhZlJNU4o1g5TzPMQndWin4Y6Mfxqnk9z47jZWCYJmJUhCLKTylJVZMCPseSUZ+JQbEqhuyY5GS3WQsrxRihGOjMOXkOlx6VLU1q8MczTWNokgVvmO5H9OcRpR3rdY3urJywtSJlhfYJ5RImKio0OE+z6mi7WiLXHk5c+gu6dEzrti5ZmIGq1szO0U8Te+/ROjDNFzbrl2xrMRZ8vj8QgufZsxu6dUtVG7TOV/K3UjKwV6XfQZl7K6UYx5GH84HgBb9/e3t7BWstJgalpV8iWSIRrXMRG7ScjkfGfiiytob9foskFAj82IqUZ6ZpBTe+Xa9RKcndLwnwNkYnthUnu29VF2No9IxjZtPscW5Ga4tCsVlvyoDesFmvAcXsHApD22wAUVqQkmAfksIkg0UYKCTJUqgqgc4SIV1mmvvA/GYmu4pvXv8Nea740z+94935nvcXeOg9owr0KI5VR183+CxpuSkosbl4z93dHaqqiTEzTBMuOEHxReFiCvYl4ucZSpacmUeUylhrrrhEUE8yGyk79UJSk1Mqp0yKAZ+ksaIrkY9lMnXTklNmnJ0kLYVYeDGBTODiAl1dcxlmtJKMv/2mu96JFJJ5kZW+Oro5Dde8CNu0xe4UCGFiDp7z7OTOmyShKqRYhN8ZnxIhZ2JeJt/F3Vr8kDkM12SrRU6rMoQMp5x4+/DA/WHgL3/0l/z27T9yPE589eJrXj17CUHzx+Y7vju9ZZwnwfgrQXPkCLUHNUCtPXVtiSqhQyYQIUUqrWmMJfuIbU2RuAMhoSvJAsFoVGXQKlBZRYwz2q6ILtA1HWPuCSFep0rWiDLJWINVFqOrR3FJySW0xqKyaHCNfowQX65T4qivi8A8FVOwuDyUkobYpe8lFwRJFK5rkfpIJGHCDsOA1RB8otEVtanwSXgaKkvM1jh4LpeBVy+/Ee2kgkykHy6sVxtCSCgrb5TWphhfwWiDD55huBBjZLPdUtUynA5x5uHzR4zS3N3eYdH4lLBKM/QXlBG/Vxg97qEnHyKbueNHzc94/dXP+fRu5De/+RMf7ifeh8xRr7i0DUHXjDExJgu2QidN9pF5miU9J3pB/cfAaRiZJwmYmd1cmh6KFOTjptiFqpUYT7vcMsVIcqlgC4xwZ67BIHL5F7OvvNkpRlGCaE1TVdRVjZsnESYYAfaGENDFZ6ZKDmDKkUxg9oHeWJTK1NoyzkGin2N8LIXV4jYw5Z4oYmJt64J9WFB/AZ+zRIIXrMVi9cmlUaJNhUE0xJmMKlkR1jYi+yKVDMAkOEtjcDkxkPj9/T2/+dM7tH7BT+7+BtvWXM4zv/uHD6SgefX11/z8z/+c//jtf+DDd+8xNzWVVlReoYdEnjKVy6hW461iGhxT9ugWdl1FZVqqdiXXJj/RVjWrqiK7IGL3yROCKLzaes3D589UVvSl667D2o5uI0G1uY/sthtWK5k5hlk2phhiOR0Nzk3M40Rd3reYVUFVXK6NHrl3VyW6QZHTogwTDMhcmjaVFrVMioFhOBFjESqgsOv1mvPxgb7vudnfoZTBGGjbNafDPX3fc3u34+XLV3TdimkSo6ixFbaSB2/oe7CG7UYczm0rnbxjfyR4z6oTJ4S8gYGYkPa72jD2A4fjkaZqpEHhPTprVrHi/Nv3rMOKdW9o4y2v9z/FJ82//w9v+e79wL2zHKo7jrVmXq2Y64Ih94l1tsScuAxHxmnEuVlGHEpdFRG+kMUkd8CJLMoa2tUKP4p2VisZS1hbiQOiUOGEwmzxXn/Rxr6OL2K6jhNyOfHrur6m2gJEstzVkuAMm6Yp3jfZS68NG18gtnhmH7FGHCiCftdFp/soD4wpFGx9KOGeT1AcShOynNDOxS+aDkUDVNiqihDFQSIUN1XuRUEMyTmTsgJd4VLgnBXfzY5/9/075qR5sd8QcuLh04k3bz4TUuDr95/4qx99xX/953/Hw/iBX/7un8A7fvHjn3Gz2dC8XBEbg68V3x/e8e7hPetKg0vEOUk2iVW0dYtTQmc7zyO7/Q1WtUSfsKaGFLmcexSNjDsaEU5H77H1mq3d4NzM8XDkfD5zV2LXQ6HWjePI5dLTNC27/Q6VBa9IVlhrrhEPHz9+oOvWrNqFVK7QuuJyuTCXwN26buQ9nya0UjR1zW6/pe/laqaUxrarBpUF9vvp84fi/7OcTkdiitzdPWNVgkdSEu1e8o6qbkizLKy6arlMjsP9g8SMFePpbr/j5vYWSFeiW8oBbSwWg6mhrvegFKfTwDx61BxIpwk1OqpecdfecrP+ijru+MM/vucPf/zMwbQcNrdc6hWzbai0JcRMl+NVxxpjZJgGQg6gM5l0baQYhZyABQgrptdSYibBSXgMc5poqgZrakKUnT94X7yP8V+kLS3pUIucTSmR7imUjBVSLqzQkuZTWbI1uOBRRqHKnZwlBYn8iLgPkUobok9PkqeENuZjKJwauZsrbcppFa9SqZQyGU1KSpivKRFDJl7LajAl78FaS1XXmOKHE0e4p6IiazHIKm2otRYIU0wMOfExWfT9xNvPv+NuU1NVNQ+nE3OErBTffzdy//nM6eORP/+z1/z3P/s3ZB8ZneePv/+AT58xXUu9qrm5e86Pvv4xxkSG8czHywc+DwfipEhtoFllclsTKoM7H7FtxaZSuNMBjeZmuyNXCVNLylXGoAwoo7FGHoZ1s+LUX/ju2zc0RRA+jxN1o7nb36C1YPCFZi4Ciabakor2dXnIPn78dN1g53nGWMOuYC/meSQGATGbugYVr6IKydzw2MXbZ4zl5uaGT58+41zgxYvn7Pc75oIYVIqCO1wWtNCxnHMYXbPdbpmrwJs3bzkreP36delIcU0keso0AcRBEAJKWZ61N5wOBz794R59UWzb17zevmZbveIPf7zn99/9js8TjM0NcXOLa9a4lJjiTJhGhsvM4CdSjvR+Ypwn/DyjS238ND4txiind0jEgn5Y7gFulruhvEByN9aNdHO983JKpUfp2jIzXMyaTyVs15Z0GQ4vXcenr8MSfrKcpvKxTEqhlJu2jD2kgRG08FWUUuKi0IrgkxiNg5zSpmqp60bcH3AVIS8lc4iBkORn1/B4hYj5iWFbXU3Xsnk4cjLlZ8pX97jW0hwaQ+DeJQIz68pwDC2VgrPR5NoyTZlmjozzxDC94XAa+MmPXjG4me/uP/HxPDNGScRt6prGGjat5dXtjh8/v+Mnz/6Cn91Ygp45+SOfTm853/dkq9iuW07nI/n+RG133O52NDOMbsSojFItOiZBbUaBSlHGF9vtlq7r+O77t5xOJ77+5iva1frKElp+zmmar8S3pALW2Kv00rnA8XgghMDLl69EF6rzFQ8arxmGEdVYEeOXtWOtRf1v/8ff5mmS6OG+7+m6DoWmv1ywlbzoXddebTqLCqCqistZaSrbErL0eaqqpq4r+qFn1bVsNlsq87ij9v2Fpm1pjAWd0HNG94nh7QUeIuZs2VR3vLj5CacT/PZ3H3g/RI665WA1Z61JVIQIU0EynoYDMUSCEXX9eRzx8wgxYkqzKMd4vVTv93u6phNjMYlpFny/yhE3DiQfqbUBHN55Yax4zxw8zntCGbZ676+Xc+/9NbBS7pGtjvMAACAASURBVFk8BmuSiwMfKltJSVwMoLLLyr1weWgzsuiV1tgCMQqTL+6D6gc5kppplJ02lXkUWYTwT/Pz1DJw906sTiwldBHPKy0E8JyLP0+x3rRYWzGN4qOT5oMCreiaFasiYp5mx+R9WbAV2VTcbiS63AdH0zb05xHfX3jeVfx03fEiJ7Za8/l04f10JK623N19xRyEILdZtRg/YdzArjLctjV3Nxu+enbDqxd7bu/WmEbx0D/w5tO3BDUzzz2tNUStaG5WxE1GrQP11uI1hEqz3nfoSoE2jH6GVOBjti4KmYmUHdvNlpxFpGGsuHdQVTENz1fj7zw75tkVlU91TWKqKvmzviQ2zfOIoGQaiSco8+RxHLHeP9rx27ZlHEfIEqqpNByPR2IM3Nzsxco/izta64aYIpd+pKk7trd3tO3mKnjebkXxcD6daOsVq25FrTUTCoMi+YhOivP7E/oYqO8NL9NL7lbPCLHl1/904p8+XPjsNGPTcMFw8jBmYZ+EIPKsEAOqkibJHBxjcILbnz0pBhxeTq4npaJSCruXE8anJTQlk6OXe6KLYCzGGubo8H4qptHHVCpTMhuWsnRZ6MvfYZ90z0SIXUTf1mCL9GoRqy/l5cJSEbKbJsdMGcqRtXBelA/XHDyyJmVVHkhTPKAJjbp+X8sJvaQfy/fCfyZXRO6h5np3XaIO8jXHYZErgtwX53kuVYRCm4xSqXRbFV5lss6ECGqOOO+YmDnoTK1XfLo48rlnjIlBN5gAk4J6t6UfHA8JrKlwAczYs5lGNocTmz+85/VuzavbHdtuxfNnt/z85b+mazU5OubxgmkMZl1x5sSn+7cwe5J15JWDtiIqw+hGBjex22wlPiEk5mniZnvHNJ1xzhOTJPmuq+4L8oGx8t5ppdjttoK1v/SFedNeo9mmaWLbra9MnEWL6n26mha22y1WknXvMFYzjbIg6srIhT8nnj+/I0bZ8a1piqHRktJMiI71es3d7R26bgqNXTptKXlaW3F3e8t8GTndP7DpdqgAZo7404S/n6inmpXf86L7CnPf8rs/3fN+vOePHt6bHee2JmiFz1k6m0qRlcJUmpgQF3gs9xwXMCFhs0iSQimFXXCE2X0hul61K2KOknsXI8Qog+Ks0ZVwQ7IvqiNtBAFY1dhr9ryMa5aH+mlTRusSLFq8jZL8rdHKoLCkLP5Dif2uRIEfnTS2lQyPTclaDCFdF34GXAJCpqm0REw/MUWrGPA+kIqCZ0nBDVEMp9oYtLLoJHrSp+BdktCvF5SEtbU49dNjgu5yjQAZXc1JvKNVbamMxU2RmCKmyagYpTUUBJvvSrKVC4Y+ZrLVXMqppVQl4605cNspvIHeyxVo1hqP5k5XjNbwbhj4/uPI7enCXd2x+sMHtpuKXWvYmIqbdUu1qkk68OLFLX/24m9JJnA/v+Vz/5bz8EDcZla7Nc+3t5hKkZQnu1gqCPFftmScTxwPJzSaQMYYGC8DOYsReb/bly6yuuI2F2CX1RIWen88lE3W4oIiJMd4GahMxeRHUvbYqeDPnz17XgCviZwl+3uepVRKObDb7kkJ3r17z6pd8/LVHZu6kzz0GGiiwGNNhkppjqeRdS2lrYRyrBnPEw/fHnCqYR827MeOr7rXVGnFx4+O3//pwJtjzyel+bzqmOoGnzXJyILSBnSKGCULtD9JhPI8j+W+VbLbtSGpAvIJgVgo108FwbMTcYIyUoKF4PHzTN0ID3TIktknBsyiwF/uT+VFX8qO5cRZTrJFlJ5KBNZySkrqcXjivpD7V/SeGJfSsbpCYpfTbClpF71iLt/D8s+ScGuloCyqo3Rt8Fhrr6d4TLGIX8wX91PUY3d3+TmkI2zKiCOQkkgOU8zXZF3p/ubi0JCNR+nF+Kyp65I770uAi9ZEZTFVRTIeF2ZQEZM0c/S4FLB1JYoNBcpqsjUcc2JUkOoKXOQhJ+41VCqx8pENmtTfo71j1zTs1ys2b87sVi1fv7jhxasX/Gz/kofxDafpPbWKoB8wXYVPkFwqlYQlZ7keNHbF7eaGfhi5Px1AKZ7vb1lvNqjKkIjXQf/CTNIFhamNSOualVSX33/3lrpuePnyjv3+BnKijcLPsdvdtpQUAosNMWGisDxkyOtpV1WRNimsEUzdPDt8yHL0W0tGWv/LJbSqLDmrKxouDDPx00B3rGDK3O1e8GLziofvL3z33QfenD3vs+WjbTla8MqSEkRENKC1IimJ3hYvlnBSQ5ASMoQgfsOcJZlomhinSXDr5XL99N4WQukoZkXyMieKT5sjPDZOZjcVO45+ApgVUfFiUBbZmvA+hXsib8y1fC1/vwSrcL2vLd3Z5f+Xj12pXI/PhjSZCnVOnPHx+rBaLSelEpnTVUguf7cIyFMWTavK5esuqpgS1Wb0lxat5ddS7molv7KSxbdAqhY3vDEi9hYfugy6bV1BCKhJXWeLEomhSNqQtMCxTHRU3uNDwNgKF3wZkYh8TmVLMgoXMk5FJjQXMpXStBjWWFKJcdjblpvcYHpP/XDgu8OFH9/f8s3zO/7s579gHWs+v/2ePM+ESmaLEt/nSB50pbEVGJvwSlRVTd1gtSLME2Odqe0Kyma3XE2WtROCl/ejCOmDEwtV1za4eUJZsZQ1dUNWAeucKw+RDDlFIpZp2xVpIxjBYTiz3kiIRgyKVbvGVorD4TPEAuBViqQ0WAsqc7vfolIiXHrC0VGdNbu+4bl9ye7FCz7fB/7fX/6J+4fAg1pxUDUPRnFIE87o0snyEvGcYZ4jrkB2+uHCPMkgVUrDUEyb6dppXBodT+PcFm5NLq6RGKPkyJWFmMqiZnhSVi6LvOx0yz3vMa9RXYHGy+8trM+nD9Vjpl66ft2npeTyeU9zIJdB+vJxozUG+VznvTgBirJlkbItX/dRSI6Ii9WXZbMqJdNir1k+Z0G7Lw2m5XVqmprKtk9SsfgX3e4YfXE6iJBcyHgDzjt0eaBZmlaIPSkkUROlIMqteZ5Z2YqYE3OJzlYoKmMEJWEsHkNMMM2eVBuqyhJ0w2Aj5ylwCvBZZ2wMVCpyzAo3zfTvD0QfeP3VM15t97z9/o/oNlIRCLOn8hFzBL9yxHXmaM7MRpRNdVWjVGZla06XE+M8sd1tr13vpxmeWililEjsnBXrdce669jtNsQwM80SHbDZdGgbsKv1RmjKk3Tjpn6mW63ohxFtxMzZNDXPnz2jqjpOh170ek3Fzd0tAQnIbJJht1kDTspB53HHAXf03IZbtv2aV5sf4T8rfvXrt/z2OHGfDBe94qQrxpjog8dljTYV2RhS9AwhMHvPPM7M01ROEwnInGcJtoSMDx4/P540y2J6RC1CVVflxSqYCj+RshhleTJGWRomi/oF9TgLXErap6r4BaW3cCVDCfu4xnQ1zVXm9BRgG1MSOrkWAl0s97fl7/1hKKZWJYP+yebwQ4X+U9HAdRD/dFxypac/PvzL1/jh7wkTJl8/tpTZj3fDxw1mATO7GFHJMAwSf5BSifHOy68leOVRswqZFCU8c54czUoE2fMs34PRmtqaMlZQRbweiWSitvgQCVXEthU4zXG6MOJpMzTWgu1YqRo/DoRvj4yXDTe3a7755q+l8aUcuvbUTaZtLB/zZ/7w9k+0L1fUN5lkMnOcSCSa2mCN5F+cDjJLp2RkaKWLwmzAuVEcEtbKunAzKQSaRqIGhnHkeDxQ1RabtOXm7g7vPPMc8GnhYsjA9sWLF5zO91eQTt1WglyoRQPZ1hWr1Ro/J/xpJA6OcIE8RtZsaM+Jdt7yfP1T/vCrj/zhT0c+pMyl3XBuOy5ZMYTEXKK7lLHoqiZajZsd58vA1PfEWbqYrlhIXBma6+QJJUM9xnxFZyz3sKcLJmdBAC4jAWNBReGCqOKd0wVI9PRUSjleL95LKbqEqCynogCM5N72FPr69KFYFmuMUU4Ga4R8VsJdZCCcSD5jnuYZgvgDSzbFDx+qZUj8xQMIZcGqoprJX2wAT3ERy8/9w+/zKcrDew/ZfLGpqXLffWrx8cFfJY1Kb4rPUoQSKckYJcaAMXXJn9AEH8hZE7xcg4L3mKrwUEdBbapKy6hLZTCqICMyKntcEstULhWNymJFCxlMNFyy4VBVRBKn/sKHfuBH4y2n2dLaBuVmXH9hUxusDnQva/7uZ/+GD+NbTvmeuC+zYBuF5tZUuDmx3WwZxoH7hwMxSjiuWM1W7HZ7nHMi8CdTa4NOCWvE6N3UFXZ/i3cZq6hQylE3TVGAnzgdzvz0Z99gKwmwaNqWkAK1EqZIZkFSSQu3yYaVFp3i2/dn1FTzsn6OGQ2v2hds2lf84y/f89t3Jx50x3m9YqpWeNVIi95KmahTIhcXthsGhuHC1Pf4cSIWi41zs8QMh1CUCDK7U1rTFrR60zxmXSxD8KVxEhbaV1UVwrUYinTOEmVcStlFyStBH49DbCl3/RcLenmhl7nhsjCflnTLZrCcpJW1aGtESlbURFopQmEqmpKetJSskv24POzyYH1ZXH4ZT/e0o/qUg3N9AFMmq4wtOA6lH8vShW799KFc5H1PcfS2km5gLptAXBzsS2+gAImVWqafpWNcXgdbJHRcG1DycR98kTjK6zu7mcrVUo7rR5FIjBI/N4eA9b5ANtX13um0Fg8oE4domWtLsC3v3My3H448P3tuNyv2hQeqLz3T5zP77y1/do785d/9jPAwM7gJbyaqF8J2FbbQhNKKruvQuubbb78nhIHtbltmibJJ1LWIwre7nSSXXcdkBrLgGW2KW+b5gywgH9ntV7TriMszU5/BKrKx9HOPUhXRlTtYV4GBOq/I58z5eMC6imfTnnXc8kK/Zn/3guPHmf/n99/y7hS4rPac2xVzuyGbmkppsquIBnz0pNkxeyfavdOpzKFG3DgJbzOLsDoFLx3FsuiVUnRNi6mr6wkgcdyirdRamm1PRwoqZ4kOSxLwQZaHbWmI5Lw0QUr3scjAHh80g1KSdz/P87UkfJwFPcaJ56f3OmMeMx29nLaxNH1UFubrEh65nLJKSXhMLug9RL25zD6IkS/U/UtJnXKRuOUv74MsDgglnTwW/F56dIEv3+fy+poCKla6dIsWvGCKpTsKVQm/CWRCysXdkYgp4IMTI3Ol8dFT1RZIxBwKolIM1SFL0M3y9Zf3LYUozSSlQHQ+5b2SRKqgDU1VYZRiTiJa11oRVSKrxJg8KSm8NmBqTinxec7s7ciuthgqvFektmLTz3z6T98xTfC3/+1f893wzxzUgVgHTNWSjEYZ8c3O80zMiZu7dUFWRh4eTtS1pW1X5OSlAsieEBUEgS0rpYkpMQ0D9qtn/5p/+t3/yXqn0Cup5fGKnANdt8U5T98PtKsKrWuUSYwx44NCR+gPJ+rJsosdz9QLXjz/Gh073r098/fv3/HuOHPJlrTfM687AepaK3cA55ijZ5odwzwyTzND3zMOQ7mzedw8EpyH4hpY3Piu6FMXrqStqpL+xJVqFWK4dhN1ks5lKm54Oc1sYaPm60BVIYJopR6bG2JTilcH/bJAny7sJWPwhx8LMWKN+RflXXyi4Hla/i0l3nJiLif4EkC5LK7HAX8qGwbX8nX5Ok+RCoLsT6TlAUKBSnLyZiDJSbx8/8smsjSzlpL1qfxviYdeTidjxOalnzakysb12CwzVylXKqfCtQEWFoFAcz0xdCF8p5i+yEB5mkmhtZaUYGyho5c7fBm1LHELWVTMKA1TSvQKHJYxQ6M0c10RFQxJJG/x129IKvOv/ru/5PTxQBgmqtBgjOIwnzkeD7x+/ZoQI/3Ql+H7hpQUh8OJ4DNt3ZCYiWkgBEVWFT4kQpjJsePrl/8N9r/6L/9XfBy5H/6tQHkuHW02WDVjYqBrW/LsGA4jdezBGC6jg6DZUNFly3qy/HT9F6hpzZtfn3nz+QMfp0xvLL7bEtY7xqpiSJn7YWSaYsHoj3g/46OTX04aMLJInZxmsdh9Yrji+WMxtC6JrRhddtOy0WtkMK0pGfaSca+1QsskQ1r8IUg0d1mEaXkolpKhLI5FPbLszssCW0qiZdE//e+sKHGTj6lCT+9iT8FBy+L64f8//ZzHj1WFMVNuecYI9l9r8b49Ob0eu7DqmqEQk6AwUI9uEKUUuqnQ15FFvG4iV3tV+Z6W8n55WGXDq8jW4oNn7CXiTNtEdPNjIMrSVS6kvqaphKuqFdEtVYNCpYjOGZWEzyLjFFE8qXLiqiQft0qL4CKFIijRGCvA3pwDKidS8IzREWNzfe+C94TC6vF1R68jITsCmqDAN4Y5V0ze4/7xN7Sblh/94q/57fv/yGzOhF1ms12zrleYXKLztMcog3cyT769WePmyOl8ROvIHCDmJIgRApt1x6b5OX/3V/8LtrN/yd/9zf/M//333xLSG7TxYAxt22GsOISthdu7HSlp3nz7njh7nr98xctqT/gIr9ufo857fvn7j7w7Bk66Y9pv8E3DZDSX6Hk4nTkcj1wuE8kLTDZEUVPEQt5KMRJLdzMmUa6ryLVbudzHlsjpZjn9tPqBaPox+ljoY498kMcWfvmzqsQTX+8++UoCf/oAiPZS6vylAbOUnU9LtmXRWWMwSYDBWT0ZP1wBwV92K5/u8k87sU9nkz9U5/xwWP+05H0qmbuajp+Is5d74nKSYLSg91P+onz+4V1yGdU8LVdjjBgtZAGtNXMI4vZ/IpK4NqRU+GKzetogyk8oaE/tYctr6pz7Yjb5NK5vmePWdf1FVfF081gkgj74QiIARkWna5JRZRxmuITMIQc6IjlE/u3f/4b/cfWvuHV7PoUP7P5ija4lm4RWNoLHkKSycWdHxLPeWOax5s2fPrPqIq+/bmiaHVW15a//6n/gdv+vsdpY7rb/BX/7F/8T/+4//e/086+xSdOqjqg80VQ4nZmOR1S0/P/NfWuMXdd13rcf59w7dzhDihRNipQpShQlWSVomo5NUu9AdYJWhh0XTeIiqNIqtVRIsQTbihzHUK26dRUpSpE0BQyn/lUUgWWrCPovD7UCBKXxo5JhmS+RUvU0RXE4c+d1n+fsvftjrbX3PveOmgox3BCgaXs4w3vP3Y+1vvU9OtZixitUby6gV5XYVVyFwu3A8TfO4a1xgbW5S9HvzKHSBVb661hdWcHy6jJW+z0MByQf0s5RuEqoo0tZynXwxNpxxHSppA+rSCRLcL+FLUhqY6xl1YGHWKGorOyjUYDL4HA/VRqSNV62QUD/WwVBEgNsYZjdlmLR8s0ioSWTGz8uIs6oCGy5JwtG+re8dBTwI0ci801KTt90c+cloqs47QoBnp278wWebyJJcJJnUdc1LBQzplLJl/ixiqhlfCAR+EQWjD7Q1K9oWZixhu/1MezVMABCqxXzFJVScJ5jvUPqP2mDjqFNQAgtHmXwZxBf3xhVlT5rGX3A09jDVTWCLSi/saYyHsYLIxaaHb6d8whc2vrgMawGCAMHzBi6OZ1HPRqhGlNcn/IK7WEfz//1Cdx27O9hsNRD7+Q6ip0OYZ70mKYwTBEEXCACi6s8tAIGwwGGQ2B+8xyUceiuvoNL5q/Bvvffjt07jkD7GVjnhzCYw97Lbsegt4LvrZyDKSo4FaCchXYaYV2jGLawpTMPjMYwQwe7prFj09XYOXc9Xjj+Jt5WFqMt29CfmcVycOh3l7B0cRG9fg/9YR9Dhq5NCKgdwdWYOLFyyL0ak/dLFVxckJapQHK6hjinCuxNGeIJ31iwPjTGFbTgERFU5z20lDogTqdnlDK/AdKMMKGRlq0QBUFM6KOPi89wdLUOdEOFOtHbcvAlSoOsbbBV8t6wqQ8MDeKA8jQvVdnPFZR0EiDyoVmOegX42nF2u2oM+2lDes6XVKk/VQpeK4wd9WM+sMA4ZO+LS0dh/qQZqWPEVw4qHzdmrtOcIi80vpbd9t4z15Uqqmo8Rh1LakKrC+sajnjO11A1EUyEPhhqB1/VcNUY48qhCkCrrnDJxS6ueLWLD33kVvxk8AbOnT+Den0NeuyhOiWMMlBtyqpEDVQDh1GvAoqATqeN2vVRzigEvxlb567HdXs/AYudCNrDHD588JFrrrkWWhfYsnknuisXMBgtoW0N6pUR9FqFS8wcOuMOil4LZm0GO8xe7N95BD68Dz88cw7nnEZvdgtWiwIXBgMsLCxiZWkJa+vrGLKjmRgfOe9R+ZopVoZLMymlFOoxD+KHY8pzKymtqLA2SoCEKBs3L9+eIsoNjppyBHKIxgTzBCBxJzXqhLiq4NkJDpE9H0LNGQd+qtyV/y6kAInNigN9huKVJmOosijJ4iD7Pgm/EYAjL8+kvJRDKp9biv+rd17SvLjArDn5qaaYuriBDDuCsZVFjPvWCfY3BL9vNDM0poDShOZVdU3UOK0Jp2XUVhsSVldsNaE4W7DkaAQhMQh4RFpFw5TDiiPRAoqiRFGkQy1nKQn5Qp7RZCsgz1BKT2odaA0ojieXnzsej8nKInDkeUHZH1oRObCqKowrRzcaKNa87wLGTsF7g727rsR8+xKMlyu4foCqARWobx30BhitDzAzuxlFm8rn0Xgd1sxi25YP4ejhf4r5ztXwweClM6dgnn/hhUduu+1GbH/fDmg1j83z2/D2+bPorVzAbD2L+bqEWR6jXG9jz6brsG/zh1EOd+GVVxZx6vwiFlstDLZsw5K1+Ml6D+90lyK6CWtQK41aedTKwynAaXosRVHGiC7NDmXDwQC9tTXUFVPOWi3Ygm4FzXMxY5obUHNPJ2EskXrG7mmkBsH0KRvFOwT7K7Y2kDIPLD9SaJauuZiXXoNvLAb5mgtcEvL8kT5cfr0KjV4n7wXzmzH//yY3oZz+WgUGBNn5DQk8UoqRWumRuSclXiwtNq0UyqLgEQ2yBGE5aDT/piACpRTbXzDBOhLACRGjQ6ymf4slXTTsH8f3pQ3xJunwGvPzo99QlGKUl8m54Llxkzk39TXZhDS+YO6sjGIyxJgc8QANUnDAEBPJ8OEwHpP5F4WvKujOLOqyhcXeOla661hbGqDl53HVpVdhtrUJixcWMFhfx1p3CVs2zWKuVUK3gcobrK32ECoFi8tx7MN3YvvWAwhBYWVlGffd95swK6trj5w6eRYfv+MT6HRm0Zm5BHOzm3HhrTcRumvYHt6HPZuux47ZA1hbKPHymQWcfWsRS77A+pYtWG7PYEFpdPtDrA+GGI0rKM3XMp+ehVGwWsEqBe2JAykcQ5qXVej3e+itr1N0GlO9iqKgn8UPUTYVlYNJ1JoirUKMqdLaZA06Gos6bSjPbtnk6iy7Q8U/NW1DrajxkfmabK6sNMpLLbJ7pB+peP4Yh9HeU84gD/jruuJ8BWK1OB/iYpH+UBab5PEZmddxfrrWId58FEtXcEwXHXAQumbwgEay+WPSt7UFwBFfUALahOyOTSMRpcnhTSkQ55iNpAwjs5LG7GrSIoo6v67rOLzXMlYylkTGY2YxOQrZ6czMsomWi6r+vBTPDzDnSY6mjeYqAywzc+wIp+JBQc8z5UTS+9WwZYuj94hAoaHg6xrVeETvw2jU7Q5cp426KOFtG6PaYGlpBUsXVlCqDvbsuBKlKxCGNUxQ0F7DwcG4Gqby0OESfODqj+Pa/b8IhTnUVcDvPvoE/uRPvgNjtHnk7bfPo6or3HjzDdDaYvPsNtihhl0KuLy1F903+jh9ZhGvLqyiW5RYnZ9Fb24WPWvRG9RYXeujV41JJsOLvKrqCIRA0UOy2tDXeSY0Ho4w6PWxvraGQb8fCddxAyrKbVeZIkA2FDlAF2QzGEEKlc3qdAJcGmhaiOpznW9ART4oItFRmsYenrzr4k0WApk9UV+VXMcERIg3bQCs4g9UUFG5+VTN7BAXc+sBj9rRqUtu2r7BfkmbErzxVGQsSS4DkQostC543yfOp+ZNrqIPjY6AkbGWbCh5VkqJy6ScKIoy24Aajo1hLWcsyK1iTZGICIEsOALHsilF7nBVRfYgYnpljMZ4TCCI91QxGGPRbrfIWpL7YOEDS2/eqBBcjaBCNPCiEj4BaNJfi/mugo6Edycmx7Ygt0AFGneMRhgPBhiz5aWxFrpVwkGjdoButYCyxLoGlsYjdJfXMVweYNfcdly5cw/63XX0V3qwI8rFDGoL9u3/GD50+JfgcQkUDP70T/8bvva1R9Hv92AAPOK9x4sv/gibNs/i8M8dgTGbsG3LXhTYgu/91Ys4d34VK2oW/fktWJmbxdJsC10oLPUHWF1fQ38wwDoriYdCspYwElfHYJLAtbhET1GufJ8lRoaz7suICiqVoPR8QcomBFOU8pOb/p7JbsgwNQpI8hsfb0ojJS4QhcMeNNvx/BokhyOAchpqRl3zmzaWiphUsYeY3kRkUf55CBOIqoLRiY+Z37Raa2ij4uxRZmtSEdDBkHpWIRpkryD+e/lzMIboc8GxGRcTGnQcwtt4MBlL0dwS8UWfa4ihsAQ2ueijYoyOh09V1fz+yTbCWstlNgE10rdLiIqE2hD7SYx6dUo89oHmhMHH/la+XteOv88nII8PGTqQiCyPQBs/qAqDwTrW1lawutzFYDCgcl8rts9vwbmAce1h2y3UpcGqUugZjXHQGKyPsLawivGgwp7d+3Bp5zJsC1vQDtsxf/nP4eANn4Zp7YZGC88991e49977sLCwQM9IKfWIUgrj8Rjf/973sf/a/dh/3fUItoPOll043+vjleUuRls2Y9TuYN15LKysYmGxi4XFi+j2VrA2GGLYH8bm27EzGz1g2oj9fh+9tTVyhO716E0yIGEtyVFk8+XULulP8g2Y1/9CnZJ+KAoruSzKg1pySDxovl35PyPaynM96nfYLjC74dnVlQMlE3dTEl6lB413LEPhzrv4MxWlpxJazFnnRNGi12O0nXgGSa0gBIQQ0c1069MwPMQbML9FaXblOSQmNMAMrdkm0fs43pGqRA5COJBYuwAAGKlJREFUYotx/87POCcT6CjkZTYdk9ETsyVDeAGURRn9c2SNOC7RrS0ohl2pCNykdZDPcBMXVbGeVbi8kppMxPGkckmEfMf2jlRdDMd9rK2tYNjroxqPKeqOMQtK7LVwtUNVj2HKFmy7A90u4IJGZSzGRmOoNcbOYH1xgPXlGr0+UO68Fgf//qehOpchhAIvv3Qad/3GXXj1tdfT7Z5OWYvVlQEeeuhBbL90G47edAt0p8DRO+7AxVDj9Ev/G+u9AS5cXEB3dRnD8YDCGOsRlLIw/EEQEpey3Bx7evZ6PQx7/Yb5kGw6suZLavOcxiWn+uRwN1em5yTjkJGtG5D8hFpdGd0oXRqzuKz3EClKqIhqIwtLyqIcsMlh/fxmTHNQD6X454XmoSCD58ALPneny99HxbYPkyV2em+5Pbue4ozmt3XzhlBpPiogBpoAkmd/U6+bFQUmeuONRMEyToifr9YRKRbUNvbtQgDIrObzUVGD5hdUTE2eRHVzp4DRaISybMWYAmM0b2y6Ufv9PsW0Kx2rMYAyKrxSsMGjGlUYjcZot2cwPz8PjRZUq6RE5rZGVxM763y3i2ppBZsv24k77/wFqM27MFYKi+fexH33fganT50GYOA8Wa4YAI9EFbYyWF1exQv/6/u47cZj2HnpDhTGYs/le/DSS6dw+qVTWF5bwbgeU/niAwpFgIsKfIo6T03taIxqVGHIaoh6nHR+UnbKKSwNM/UfJv4G5ORvkopz57fmANtlPWBCCXN0Mw8cV3z7QSvSpgXumVRo6OSQlTEqg3KU8vHGnSx/4+bn21BubcWRWHGiyTenZ9IxOWmTf0x+2+TzNbHaz8GmBESAea+erRZ9vMmkJ8wFvLJI4/JVPFjXbEEBwAVGe5l2Bs6VlHI011fGqsULD5ZkXeNRDVenA6rVaqFVtgAfUI1GTNCgcUBhLdqtkgyrKuaThnT45VWR480tsqhcSO0DZWcY9mHVrBShrAiudHTAkHtArYCZFjGxlAa5sruaM0U0RqMhxuMKJfetndlZmNLCzpQwVmMwHqHbW8f5lWXUM5vwa/c/gCsOHEYwGqvdRTz4+fvxF3/23+GD4RbHNzdhZK2rAhcvLOL06ZfxsY99DHNzcyiKAlfsvQInTp3C4tISbFmibHWoGdeMKrFhUFVRVHGv38egP8BoNIRzdQRc5JSZHEzLn/kJRg/bxzIkvxmkX2qgkxqxV0z2gdO/mjctEtIZy19MfU1y1WWWpiKgkk/qOLrBNKF0YbiQGLVmtodv9LuC8EpVYrSdYsuk3z5DL9EYasu8lVBc03jPUnLn5WhunSH2/VR+FdCmJN6pVvDQ0X0cmQBYPoecYECIbFO/WFc1zTUZIBIEnJDfiscwLpIBiqKAAjgOjQjflnvRSTqaz27yvO0QLKIsSgaCiimCvfjOBkdzyE57BkqR0RcJyGvWfloMRj3U3sMUGqbQKFuEpoYADAcD9Nd76HZXoKzB3ffeh0PHjkErDzcc4t/866/gP/+XJ+GUhQ+OEe0wcRMqlc25NF57/XW8/vqruOXWWzC7aRbz8/O47trr8Nqrr6Hf69HsCR7aFoAJJLKtKywvr2C910ftKmgFWE6Hbbfb8RSTYbvQthqLQXw7MyYF+aJoqEB1P0JA4CATl80FafGZhumujBbE3JeIyxBPOIBNcOtsjiiloVHkilZoA6MS40RpWohkQS/jDDYKUgHQxNb3gXo02qKOSp/g4DNNZs4MCXTdEvihA6cg8XxPkQmX8xX3uZgqh4PSURUiakKjGXgyckgleZZsJHqdDnVVwwVPJkVFwbemJ0Y8U/WoT1JZK0FUMK2k/KRkYedqkjhJT8gAnYiLc1G0q2r6t7PqhsI9LRA4psDR+6a5sRzENca80XSGmlOAalb+aqLZla3ML9eLWHmEKvMKtdamW9+T2sby+INwDKIG2sIg6IBxPab4v9UVXLywADjg8597ELfc+vNE6B6O8O+f+H38wX/4OkajGgiOI+Q22IR5sxt47nLm7BlcuHABt99+O1qtFjbNbsIVV+zFj0+cwIWFBaz3e2S+u7aCbreLtbU1Mlfik67Nowb5sPNha24PN/krVxFEdgqaeQkhI0JPE4ETWGCUjlxJntTFHkWG7Z5HCpInQCa3mt2padgrZSkmSN1yu4ABj7EkujL1jXBSl9J6WGERS+L8tbNqIHiW+ngH7ysqq3zNf/oNSdw5Ipt0i56SdEEJUaYwcI4Er7LojCGrd9E2IjqFFZEWp5SnSG4u4RV/rzgIkK1+Ak7kveRlYz50l8+fZogaNd86QhcUXi05tTGuwIa51k4DTgHpJhQ0VtoFeoZp5hr9cxiRHbFLdpwjZiW2zGeLgvr4Yb8HjYBW0Ua7bMGxSXOv18Pq8jLqcY1/efc9+MQdH48ElD/+T9/E1x59FL1Bj0J+QlOSNbUJmx8qLdnjx4/j7bffxq233oqZmRls3bYVl+/Zg2effRZvnXsLyysrGPT7pN3iN9pqt2nWZ4uGAiC/5SY9WiZ7vLTQfLOUgvRUPNzmhzVVmsZRAd10VQRtWCngOSLLK+7bGNHkAbsUmNZYsoBhepzMLumvJi0iFFgfJ25tXPaRK2WjHxUmzkabKUAUD/mHlUjYsehSTVU9iwTpxuTeVU8BOKBMDYdGv0nVRAUEQhGNKWkGGz8LNEAVzbeYbEIZhUjfpZTiKG3dcI/Lq5aiIARUs3Yx2jFmhHi5KeuabuiNDm/PI5IQAilXsqoKPD+uK8evzWQ6Tw56lSQux9RHraJRl2zOsqT3WY3H5KJdkPETFMmi1tfWUA1HeOjzX8Cnf+VXYQ1t5G9+85t4+OGH0ev3pjZe/utdN2EOLpw8eRL9fh833XQTbGGx7dJLsXv3bjz31/8Tg16PTrWyJH4ku5ulBNPQmHnlrmM5L3LqVJ9YgGnDugZsn0t28u8nNM/DZbRuz7mBCIGBJOqfYsVKsvFIkUvqgxApX3SbE8vL8Ykf+PZTPNQXACcdKCGSzGX0uZExU7zV1YRhE5qbNVYDikYdFFJJTBaAXhucZ9U8RdQBivIqXIjAV6O/9jUCPIqyRFG24zA/L8+dk6yL1JvJfFPobdqoGGs4qdKIeQxKwTJ1Lc/okEpB1p4AP56TqmQT5uBLVVXwmd+r9KnpUEfDECv1klXchBF0Y0R4MhukLEvamDWFGbXKFgpbwiiNQa+Pelzh3rvvxq//2p2U1FVX+K9PPYUvfelLWFtbm5KqvadNmLtuPf/88+j3+7j55ptRFgX27Hk/Dn3wgzh1/ARvROoHPJdSWhE9LcHndTZwVQxQ+PghRIg++AackpOYxYY8lp1IJzU5YOmklFMB0DQPpAG4SdB/UJFM7qhBirQnsHlCTiAOoNtFGDvk9QKayWXvScV/VicKnFjMM0WOyusQVRaJn6mmDsAcrGrGlyXVgYpWEyqW1J47VRN1lmLhTyQD+tnyefk4B1XcwxOBWkf9YZRKieV/UcDaIlvUUf/VCNjMbSNlo+XyrxYf2HF8lFUxubGy3Gi5WXGjl46tS1ovwtYSK38hZcgaq2tHOSPxZzZhPJlxC8JbVxXpEaHpsrEFvKuhA/DQgw/in93562iVJUIAvvPtb+Nzn/scut3u1Iz6PW/CyTnciy++CAA4euQIrDW4bMcO7L9mP06ePIFud4mBA8cLQGfZBckMSeZF3ruGhlC+ltsnNC0VZADr4g0paCgFNWruR9Lg23LWeCLvyiYkm/oAIDARWUpBBE+6Mu9IHaAV/R0tdCcHFXwqWwWNDMx4YZiddzIN9rkXmOaehoacKO/nyPu1jU6n05yJhrxk1wAMZUpqQyMW4UqyXQWYj+pYSxelVUZoffRcFYSt0oKxZWZNOCGX4p6xKEr2wknEAaWFOqeZ05AkX9ITyudtrcVsp9PwYHXZZhXgLm6KrOLJhcLyM3NxczLf8o01FRpAWGZpwr1sZGhN6DUVm0mDmUGFIYPnmZkZfPa++/BPfuVXuTT3+PM/+3Pcf//9WFpaaqLj77IB/59vwtwH5Lvf/S56/R4+8tGPoixLXHbZZTh48CBOnDiOCxcvsg26aXxvrmzIX1TeF+bhKrkSWyhK0jM4pnrlVhNS+tEci9kcDKgYUREIz5OpSiJwCyp/TVzegTY9NEuFdCp/AiNxgWk1AvlrGY0ExAQkGXzIz0U2AsHU5lMNIvokDS4O4zO3LgUTS2ilaPYkFDotB6FKr5H4yjrycifj2qIyXZN9YINSl91ERdGCLSQdqrlB4wggYGqklJtfzczMYH5uPlZaYkyVtymCnkc6YcbUMVrzunKN9ZSTKBSEIRQvaVofJtHbtNLxs8+ftQ8+OxBB5lPMRZ1pz+LSS7fjt7/42/hHn/xU/FlPPvlt3H//A1hcXGys57/p13vahPKhPf/88+it93DTjTeiM9PBtq1bceDAAZw6fRoLi4tcxvgoqA3MG4VWG96wmEgJyhkgdT2mGzDIEFlFhFMWpBakkf9MQ3U+2CS8JWRyJbmRuUyhD1OGp1w4Gg+tLIJKZkrKByDoaFTkGV1V8nJ8AAKNbxJK6iYsCrPXn1ttZCCL1qrB3IiKCh9SnryaBnS00jBBehwN7+gmjCZShsxrfWYjIaU03T4tUqq7EH14cgUDhZumvl/6VxqAqwYCnm/ASXSUytFWk83km2r7siihmMggw3goai2Yvcc9o2+QKxILhw6t4AgIs8aAsW8WAOesotDQKYroWRB6V7sopbtsx278zpd+B//wF/9BLKeffPJJfOELX8DSUvf/euv9rTZhTslyzuGHP/whLly4gBtuvBEzMzN437bt+PDhw3jllVdw7txPGjbu8fQ2TaQ0wcwh3mr56dHoJdmkQPMprzKbh4zD0iBTE8Hb8YJtnnhgTxvpK+PCCSFWkl55BK8IgAkqavFiOekc/30V7RJ8kGFEyMruTHzbkAolKDpXmSME2MJiZqYT/UzzQXyD+RNP/VwOqOj1TpSROe92UstoBJEsS4pb84i2+nmZTDOykjWF4BBRHz13Yqk4lVwcsg3rG+OGJEvyDcUI2Uoq1HWVemQoWE2E86qqEFRWLisCodK6o/chouy8x5YKIH/uEdBjlBTxZidfGqM09u3bh3/3bx/FbbfdhoIFy9/4xjfw5S9/GUtL3Wh98l424nvahJMf/I9+9COcf/ttHPnoEWzatAmb5+fxkSNHcP6dd/Da66+hFjaF5odtqRfTWQkmqFuC4V0mQQownJlntEmwf0QiVVSwQ3OSrfOkA/Tg4QArIjSNKpD9XK00DGiKHRpXC4t+ORbMBuKeKFns/PrMBgin45wFFzdfQBrph1g+K6WztBc+RkLaqCrrh8lY18cbc7LMiaVrhpwKHUH6UjrVLYxu0fMJjktz+jwK20ZRtOm1uxCtQwJ71YCftzEGZWFRWC4Jg5/qyZRSlFOYgUPOO/qsQmoZWmzWXNee3QzYhVzWDYcPSbkqN7nKOIm14AQgZ26lsyM5JOG1gDc5K8v7HLn3DfCpsAVKW7JLAlU6Bw4cxO89/gSOHTlGQUH9Ab7+9a/jK195BKur639j7/dT34TysI8fP46zZ8/i5ptvxvz8PDqdGdxw9Ch85XDyxEkZwFEpm2nuVIaC5bdXXpsrLj3yglU1TcD4lgpxaCzavfizZaYXkst1LjGSIXeS+PgGm2EyGUmWeCyPJrip0d9JJXqAmiDPqWwWK8p3ZAp+NVHOhRAwMzMTpT/v1mu8W4mfgmdyxUWzNLSGSkyyEEy5LTnRwag08BaNnmzCPIw0fpY8vgghwElvn/nYSFxBpKbFmS9tfqMNyqJAXVHsgSj16d+WWxUI0PzcDc91m2OSjaqBphyuSe4nZpeJrY4OCrfdfAt+//EncP11H4CBwmgwxGOPPYbHHnsM/X5/SlDwM9uE8gbPnj2LF55/AceOHsXWrVvRac/g8OHDmJubw4mTJzEYDxFMAgiUpugsMJJJMzRBOieY8BmjX873IAZMujkQlocetEIwmv5N2YB+oo9U0rsRQ4j6Vr4ZQphkhKaTVUYYYEoXfBxmA8nQFqqm9zUx54xzdU13JJDQWekjc16oOJt1GEkUCdhUOaqmlQ3pMDMwuozqd7nr48zOWkJFZSEhW5zBx1vZapOFnNBCFxe52ntqGBQNUaPVhigoMjW7CJZjUI4nZ70gQIoYNmuy3vBMUXMcdmoL9ldl0n1w5ESu+KAgVD5ZWebo6GTOhmWABxnwo9jqw2iNdtnGJ+/4JB7/3cdw+a7dMEqju7SMrzz8r/BH//GPKNl6ol37mW3CSXDlrTffxLPPPouDBw/i8ve/H0ZrXP+B67B71y4cP34cg+Ewzp2iwnsD75eN5io5fC+olUhdmm+eTzjmL+awtMp6k0RB40DNXHMovjXv8ktNxJahQarm0lKraLqkJr5n0j9Uxi1yMyaoXE3JtIbD4RSxYXLQP5kaTAeOKFOyPjwkyJ9YKGV2w7B9X+Re6kjfEyZLTGJi1Jo0jAUsjz58hgaDh+3OEy0vL0cFdRcTptx6QtzVlVKoMo+doizoFpYN5kXLSRmJ9PzpMJXRx2QFNyntkts5ZzJ1Oh3c8y/uxhd/6yHMzc0BAM6dO4f7f/N+fOtb36Lwm40UOj+rTbgRs+adC+/gL/7yL7F3715cddVVKGyB/Vfvx8FDh3D2pTNY6i6ichX3Y3RaRn+VKU5mM402150JGJCPO4TdTx4mOpa5gVeUjioIDQ12CnOezX5DdgsHhq2bmy0vSeNDD5hSQvh4g8XMHHL7ivxTKXLClMIBEXKaVk/kfdHkzZoLoHVUl+eOBKZB2aLZWdUgBVhTxBuSrCZCTPUlIjebQkWhLyIHNjB6mea1OmPTJD9XAXpETSE2JtNGWqncpqRkUUTUmV2/pUPcBUak6XCX8QXNe5H5yqYMDjnglCIkPGpBHeVdGK2xe9flePjLD+Ouf34Xo7gKJ0+ewl13/QaeeeZ/UAQ5HyB/218/lU2YL4a1tTU8/fTT2LRpEw4dOgRjDHbu2IEbjh3FxYsX8PLLLyf0iPPmZFbTrNdNpIxN3oSRoTI5a1M6qSUiWZvEuMTw8giOTuLa+8QR1WjchgrJsEhBxb5mysY+Ai65n2aIr4VmeWpC7qRibasyT5T8rtUb9IT5psyfh9rw1g7xuSXLQz2hPXQZUbqM3pxxo4TkHhBUmooUGVPGsCrGi2nxlCsCovoiBpj6JOCVPlfmh7kJsszwyrJE8AG1q+DqOoJX1haEhLKHETU4PO+U0BvBDbgPjXYmuXO5POOY8mxw6IOH8MTvPYHbb7+dU6eAZ555Bp/5zGfw4x//eEOxwN+JTZiTs4fDIZ577jn0ej0cPnwYnZkZzM3N4dabb0ZZljh95gxGozG1Q8JozwI0VTa4hgL3MoSweefiraV5biS/tUkLWsYDEBsItmWQCGajKdQxcj41y6Sg4kKL/akS6leAd5kOMDqzJaSX5EN880E3SkwZ8AMAXfRZ6chvI7dhiHYYrAyQEk9r3uT8/puUtnxYISAU3bBVLQlBMgMrURZtWFuSGwKHlHqptCdodcYYaGvYGCpZCMoNLTn3ArDl5IIUZ8eu1dagzabJNMNNKLGQOzR70SgF+MwaI4TAZAFL/SYCE7wDPxuVRj8hKVQ8R3oLsk6/EXMhy7LEp37pU/jDP/hDXHvNtVBQGI8rPPWdp/DZz34Wb7zxxoZmxH9nNmGj/2IY/Qc/+AGOHz+OAwcOYPv27bDG4uChQ7h639U489JLWF1d5RKhWT4FhDgTVNFmgU47hEDSIuSgDf3ZzJpIPZhshriotaKbMSDexJoXmoqaRJ30fgwWyN8hxk7eQ2RZEcFn9ozJnyXdSuymFsnlIR4gKmOdyGv38r382nWib0ckVrF7nEJeqk6SvtlhXAmPVcPaFoqCfDaDZ5ADqTKhm1DmZRamsLBFkQ9AGrNdGoFY1uq5ePNNGVoFsj2UTVhXjj8Lk9zLnaOYbGt4o9QTayxT0YdAo6GQfFCVpgpGKiCeYiU8IKtkvA/YsnkLHnjgATz0W1/EJZdsBaDR7S7jq1/9Kh599NH3REP7/1qOTt6Kzjm88sorePrpp7Fv3z7svXIvrLG48oorcOPRYzh//jzO/eQc6qpKd4osOF7sESZnJNVocdWihVY7F6lejY2XzcfysiP1SWz6m/VTCTyNzQ4DCm4D8CNEgyE5cZv8lZxknaUfRfQ3sLlBQjDFYkT0boh65CRmjgoMJmXLia+VgtqwLEVUfjT6Ia1JCWBsrDp81ms6nwJJY99Y2JhBIdqlZEBlIm9USBa5EbFHs48trCXk03sGVhKFTtzelALfhKph5CUHTxQWZ89eeKvgmxzc+8WNx3NLrYR9o7F//7V4/PHH8cv/+JcxM9NBCAEnT57CPffcg6eeeioioJPufT+tX/8H1rUZz/iaXcEAAAAASUVORK5CYII="
 # result = comparer.compare_faces_from_base64(base64_string, padded_base64)
 # print(result)
@@ -25,5 +32,109 @@ def recognizeFace(image_url, base64_string):
         base64_string = base64_string.split(",", 1)[1]
         
     image_url_to_base64 = image_to_base64(image_url)
+    _, comparer = registry.get("face")
     result = comparer.compare_faces_from_base64(image_url_to_base64, base64_string)
     return result
+
+
+def _strip_data_url(base64_string):
+    if base64_string.startswith("data:image"):
+        base64_string = base64_string.split(",", 1)[1]
+    return base64_string
+
+
+def encodeFaceFromBase64(base64_string):
+    """Return the encoding of the first face found in a base64 image, or None.
+
+    Raises binascii.Error (a ValueError) when the payload is not valid base64.
+    """
+    return encodeFaceFromBytes(base64.b64decode(_strip_data_url(base64_string), validate=True))
+
+
+def encodeFaceFromImage(image):
+    """Return the encoding of the first face found in a PIL image, or None."""
+    face_recognition, _ = registry.get("face")
+    encodings = face_recognition.face_encodings(np.asarray(image.convert("RGB")))
+    return encodings[0] if encodings else None
+
+
+def encodeFaceFromBytes(image_bytes):
+    """Return the encoding of the first face found in encoded image bytes, or None."""
+    return encodeFaceFromImage(bytes_to_image(image_bytes))
+
+
+def encodeFaceFromUrl(image_url, timeout=None):
+    """Return the encoding of the first face at an image URL, or None; unchanged images come from the cache."""
+    return face_embedding_cache.encode_url(image_url, encodeFaceFromBytes, timeout=timeout)
+
+
+def _clamped_region(region, width, height):
+    left, top = max(0, int(region["xmin"])), max(0, int(region["ymin"]))
+    right, bottom = min(width, int(region["xmax"])), min(height, int(region["ymax"]))
+    if right - left < 8 or bottom - top < 8:
+        return None
+    return left, top, right, bottom
+
+
+def locateFaces(image, regions=None):
+    """Detect every face in a PIL image once and return xmin/ymin/xmax/ymax boxes.
+
+    With regions (e.g. detector "person" boxes) only those crops are searched;
+    overlapping hits from neighbouring crops are merged. Without regions, or
+    when none of them is usable, the whole frame is searched.
+    """
+    face_recognition, _ = registry.get("face")
+    pixels = np.asarray(image.convert("RGB"))
+    height, width = pixels.shape[:2]
+    crops = [crop for crop in (_clamped_region(region, width, height) for region in regions or []) if crop]
+    if not crops:
+        crops = [(0, 0, width, height)]
+
+    boxes = []
+    for left, top, right, bottom in crops:
+        for face_top, face_right, face_bottom, face_left in face_recognition.face_locations(pixels[top:bottom, left:right]):
+            box = {
+                "xmin": face_left + left, "ymin": face_top + top,
+                "xmax": face_right + left, "ymax": face_bottom + top,
+            }
+            if all(box_iou(box, kept) < 0.5 for kept in boxes):
+                boxes.append(box)
+    return boxes
+
+
+def encodeFacesAt(image, boxes):
+    """Encode the faces at boxes returned by locateFaces, in the same order."""
+    if not boxes:
+        return []
+    face_recognition, _ = registry.get("face")
+    locations = [(box["ymin"], box["xmax"], box["ymax"], box["xmin"]) for box in boxes]
+    return face_recognition.face_encodings(np.asarray(image.convert("RGB")), known_face_locations=locations)
+
+
+def _verify(reference, probe, threshold):
+    if reference is None or probe is None:
+        return {
+            "isMatch": False,
+            "confidence": 0.0,
+            "distance": None,
+            "result": "No faces found in one or both images.",
+        }
+
+    distance = float(face_distances(probe, reference[None, :])[0])
+    is_match = distance <= threshold
+    return {
+        "isMatch": is_match,
+        "confidence": float(distance_to_confidence(distance, threshold)),
+        "distance": distance,
+        "result": "OK" if is_match else "The faces do not match.",
+    }
+
+
+def verifyFace(image_url, base64_string, threshold=DEFAULT_MATCH_THRESHOLD):
+    """Compare a base64 capture with the face at image_url and return a scored verdict."""
+    return _verify(encodeFaceFromUrl(image_url), encodeFaceFromBase64(base64_string), threshold)
+
+
+def verifyFaceImage(image_url, image, threshold=DEFAULT_MATCH_THRESHOLD):
+    """Same as verifyFace for an already decoded PIL image."""
+    return _verify(encodeFaceFromUrl(image_url), encodeFaceFromImage(image), threshold)
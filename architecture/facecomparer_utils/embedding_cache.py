@@ -0,0 +1,208 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import unquote, urlsplit
+
+import numpy as np
+
+from ..utils.http_client import fetch_response
+
+CACHE_DIR = Path(os.getenv("DEEPVISION_CACHE_DIR", str(Path.home() / ".cache" / "deepvision")))
+FACE_CACHE_MAX_ENTRIES = int(os.getenv("FACE_CACHE_MAX_ENTRIES", "4096"))
+FACE_CACHE_REVALIDATE_SECONDS = float(os.getenv("FACE_CACHE_REVALIDATE_SECONDS", "30"))
+_PUBLIC_MARKER = "/storage/v1/object/public/"
+
+
+def storage_key(url_or_bucket: str, path: Optional[str] = None) -> str:
+    """Cache key of a storage object: "bucket/path" for a public storage URL or a bucket + path pair."""
+    if path is not None:
+        return f"{url_or_bucket}/{path.lstrip('/')}"
+    parts = urlsplit(url_or_bucket)
+    marker = parts.path.find(_PUBLIC_MARKER)
+    if marker >= 0:
+        return unquote(parts.path[marker + len(_PUBLIC_MARKER):])
+    return f"{parts.netloc}{parts.path}"
+
+
+class FaceEmbeddingCache:
+    """Face encodings of stored images keyed by storage path and content, in memory and on disk.
+
+    A cached encoding is trusted for ``revalidate_seconds``; after that the
+    image is re-requested with If-None-Match so an unchanged object costs a
+    304 and no decode. A changed ETag whose body hashes to the same content
+    also skips decoding. Both tiers hold at most ``max_entries`` encodings and
+    evict the least recently used ones (on disk, the least recently written or
+    read back from disk). Images without a face are cached too.
+    """
+
+    def __init__(self, directory: Path, max_entries: int = FACE_CACHE_MAX_ENTRIES,
+                 revalidate_seconds: float = FACE_CACHE_REVALIDATE_SECONDS):
+        self.directory = directory
+        self.max_entries = max(1, int(max_entries))
+        self.revalidate_seconds = float(revalidate_seconds)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+        self._counters = {
+            "hits": 0, "disk_hits": 0, "revalidated": 0, "content_matches": 0,
+            "misses": 0, "evicted": 0, "invalidated": 0,
+        }
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".npz")
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evicted"] += 1
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        path = self._path(key)
+        if not path.is_file():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                embedding = data["embedding"]
+                entry = {
+                    "embedding": embedding if embedding.size else None,
+                    "etag": str(data["etag"]) or None,
+                    "content_hash": str(data["content_hash"]),
+                    # Another process may have written it; revalidate before trusting it.
+                    "checked_at": float("-inf"),
+                }
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as exc:
+            # A truncated or corrupt entry is dropped so the image is fetched and encoded again.
+            print(f"Discarding unreadable face embedding cache entry {path}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            # Disk eviction goes by mtime, so a read marks the entry as recently used.
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("disk_hits")
+        self._remember(key, entry)
+        return entry
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        self._remember(key, entry)
+        path = self._path(key)
+        partial = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Every writer gets its own temp file, so threads and workers caching the same face never interleave.
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.stem + ".", suffix=".tmp", delete=False) as handle:
+                partial = handle.name
+                np.savez(
+                    handle,
+                    embedding=entry["embedding"] if entry["embedding"] is not None else np.empty(0),
+                    etag=np.asarray(entry["etag"] or ""),
+                    content_hash=np.asarray(entry["content_hash"]),
+                )
+            os.replace(partial, path)
+        except OSError as exc:
+            print(f"Failed to persist face embedding for {key}: {exc}")
+            if partial is not None:
+                Path(partial).unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._disk_writes += 1
+            prune = self._disk_writes % 64 == 0
+        if prune:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        files = []
+        for item in self.directory.glob("*.npz"):
+            try:
+                files.append((item.stat().st_mtime, item))
+            except OSError:
+                continue  # removed by another worker meanwhile
+        files.sort(key=lambda pair: pair[0])
+        for _, stale in files[:max(0, len(files) - self.max_entries)]:
+            stale.unlink(missing_ok=True)
+
+    def encode_url(self, url: str, encode: Callable[[bytes], Optional[np.ndarray]],
+                   timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Encoding of the image at url, downloading and encoding it only when its content changed."""
+        key = storage_key(url)
+        entry = self._load(key)
+        now = time.monotonic()
+        if entry is not None and now - entry["checked_at"] < self.revalidate_seconds:
+            self._count("hits")
+            return entry["embedding"]
+
+        headers = {"If-None-Match": entry["etag"]} if entry is not None and entry["etag"] else None
+        response = fetch_response(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            self._remember(key, {**entry, "checked_at": now})
+            return entry["embedding"]
+        response.raise_for_status()
+
+        body = response.content
+        content_hash = hashlib.sha1(body).hexdigest()
+        etag = response.headers.get("ETag")
+        if entry is not None and entry["content_hash"] == content_hash:
+            self._count("content_matches")
+            self._store(key, {**entry, "etag": etag, "checked_at": now})
+            return entry["embedding"]
+
+        self._count("misses")
+        embedding = encode(body)
+        self._store(key, {"embedding": embedding, "etag": etag, "content_hash": content_hash, "checked_at": now})
+        return embedding
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            removed = self._entries.pop(key, None) is not None
+        try:
+            self._path(key).unlink()
+            removed = True
+        except FileNotFoundError:
+            pass
+        if removed:
+            self._count("invalidated")
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = counters["hits"] + counters["revalidated"] + counters["content_matches"] + counters["misses"]
+        served = lookups - counters["misses"]
+        return {
+            **counters,
+            "size": size,
+            "disk_entries": len(list(self.directory.glob("*.npz"))) if self.directory.is_dir() else 0,
+            "max_entries": self.max_entries,
+            "hit_ratio": round(served / lookups, 4) if lookups else None,
+        }
+
+
+face_embedding_cache = FaceEmbeddingCache(CACHE_DIR / "face_embeddings")
+
+
+def invalidateFaceAsset(bucket: str, path: str) -> None:
+    """Forget the cached encoding of a storage object after it was replaced or deleted."""
+    face_embedding_cache.invalidate(storage_key(bucket, path))
+
+
+__all__ = ["FaceEmbeddingCache", "face_embedding_cache", "invalidateFaceAsset", "storage_key"]
@@ -0,0 +1,264 @@
+import copy
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from requests import RequestException
+
+from .ann_index import IVFIndex
+from .compare import encodeFaceFromUrl
+from .matcher import DEFAULT_MATCH_THRESHOLD, DEFAULT_TOP_K, distance_to_confidence, match_embedding
+
+CACHE_DIR = Path(os.getenv("DEEPVISION_CACHE_DIR", str(Path.home() / ".cache" / "deepvision")))
+ANN_ENABLED = os.getenv("FACE_ANN_ENABLED", "false").strip().lower() in ("1", "true", "yes")
+ANN_MIN_SIZE = int(os.getenv("FACE_ANN_MIN_SIZE", "2000"))
+FACE_ENCODE_WORKERS = int(os.getenv("FACE_ENCODE_WORKERS", "8"))
+FACE_FETCH_TIMEOUT_SECONDS = float(os.getenv("FACE_FETCH_TIMEOUT_SECONDS", "5"))
+
+_encode_executor = ThreadPoolExecutor(max_workers=max(1, FACE_ENCODE_WORKERS), thread_name_prefix="face-encode")
+
+
+def _face_key(face: Dict[str, Any]) -> Tuple[str, str]:
+    face_id = face.get("face_id")
+    return (str(face_id) if face_id is not None else "", str(face.get("face_url") or ""))
+
+
+def _index_id(key: Tuple[str, str]) -> str:
+    return f"{key[0]}|{key[1]}"
+
+
+def _stored_embedding(face: Dict[str, Any]) -> Optional[np.ndarray]:
+    embedding = face.get("embedding")
+    if not isinstance(embedding, list) or not embedding:
+        return None
+    try:
+        return np.asarray(embedding, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+class FaceGallery:
+    """Encoded roster of a single system, ready for vectorised matching."""
+
+    def __init__(self, signature: Tuple[Tuple[str, str], ...], entries: List[Dict[str, Any]],
+                 embeddings: np.ndarray, failed: List[Dict[str, Any]], complete: bool = True):
+        self.signature = signature
+        self.entries = entries
+        self.embeddings = embeddings
+        self.failed = failed
+        # False when faces were still encoding at the build deadline or failed to fetch or
+        # encode; the next call rebuilds and retries only those faces.
+        self.complete = complete
+        self.index: Optional[IVFIndex] = None
+        self._positions = {
+            (entry["face_id"] or "", entry["face_url"]): index
+            for index, entry in enumerate(entries)
+        }
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def embedding_for(self, key: Tuple[str, str]) -> Optional[np.ndarray]:
+        index = self._positions.get(key)
+        return self.embeddings[index] if index is not None else None
+
+    def match(self, probe: np.ndarray, top_k: Optional[int] = DEFAULT_TOP_K,
+              threshold: float = DEFAULT_MATCH_THRESHOLD) -> List[Dict[str, Any]]:
+        """Rank the roster against one probe encoding and attach each identity."""
+        if self.index is not None:
+            results = self._search_index(probe, top_k, threshold)
+        else:
+            results = match_embedding(probe, self.embeddings, top_k=top_k, threshold=threshold)
+        return [self._identify(result) for result in results]
+
+    def match_among(self, probe: np.ndarray, keys: List[Tuple[str, str]], confident_distance: float,
+                    top_k: Optional[int] = DEFAULT_TOP_K,
+                    threshold: float = DEFAULT_MATCH_THRESHOLD) -> Optional[List[Dict[str, Any]]]:
+        """Rank only the faces under keys; None unless the best of them is within confident_distance.
+
+        Lets callers try a short list of likely faces first and fall back to
+        ``match`` over the whole roster when none of them is a confident hit.
+        """
+        positions = [self._positions[key] for key in keys if key in self._positions]
+        if not positions:
+            return None
+        subset = np.asarray(positions, dtype=np.intp)
+        results = match_embedding(probe, self.embeddings[subset], top_k=top_k, threshold=threshold)
+        if not results or results[0]["distance"] > confident_distance:
+            return None
+        return [self._identify({**result, "index": int(subset[result["index"]])}) for result in results]
+
+    def _identify(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **self.entries[result["index"]],
+            "isMatch": result["isMatch"],
+            "confidence": result["confidence"],
+            "distance": result["distance"],
+        }
+
+    def _search_index(self, probe: np.ndarray, top_k: Optional[int], threshold: float) -> List[Dict[str, Any]]:
+        ids, distances = self.index.search(probe, top_k=top_k)
+        confidences = distance_to_confidence(distances, threshold)
+        results = []
+        for index_id, distance, confidence in zip(ids, distances, confidences):
+            face_id, _, face_url = index_id.partition("|")
+            position = self._positions.get((face_id, face_url))
+            if position is None:
+                continue
+            results.append({
+                "index": position,
+                "distance": float(distance),
+                "confidence": float(confidence),
+                "isMatch": bool(distance <= threshold),
+            })
+        return results
+
+
+def _encode_outcome(face_url: str) -> Tuple[Optional[np.ndarray], Optional[Exception]]:
+    try:
+        return encodeFaceFromUrl(face_url, timeout=FACE_FETCH_TIMEOUT_SECONDS), None
+    except Exception as exc:
+        return None, exc
+
+
+_galleries: Dict[str, FaceGallery] = {}
+_galleries_lock = threading.Lock()
+
+
+def _build_gallery(faces: List[Dict[str, Any]], previous: Optional[FaceGallery],
+                   deadline: Optional[float] = None) -> FaceGallery:
+    entries: List[Dict[str, Any]] = []
+    vectors: List[np.ndarray] = []
+    failed: List[Dict[str, Any]] = []
+    signature = []
+    complete = True
+
+    # Fetch and encode every face that still needs an encoding in parallel.
+    missing_urls = list(dict.fromkeys(
+        face["face_url"] for face in faces
+        if isinstance(face.get("face_url"), str) and face["face_url"].strip()
+        and _stored_embedding(face) is None
+        and (previous is None or previous.embedding_for(_face_key(face)) is None)
+    ))
+    # Faces still running at the deadline keep going in the background and land
+    # in the embedding cache, so the next build picks them up.
+    pending = {face_url: _encode_executor.submit(_encode_outcome, face_url) for face_url in missing_urls}
+    if pending:
+        wait(pending.values(), timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    for face in faces:
+        face_url = face.get("face_url")
+        if not isinstance(face_url, str) or not face_url.strip():
+            continue
+
+        key = _face_key(face)
+        signature.append(key)
+        entry = {
+            "face_id": key[0] or None,
+            "name_of_person": face.get("name_of_person") if isinstance(face.get("name_of_person"), str) else None,
+            "face_url": face_url,
+        }
+
+        # Faces enrolled before embeddings were stored are encoded once here
+        # and then carried over between rebuilds of the same system.
+        embedding = _stored_embedding(face)
+        if embedding is None and previous is not None:
+            embedding = previous.embedding_for(key)
+        if embedding is None:
+            future = pending.get(face_url)
+            if future is not None and not future.done():
+                failed.append({**entry, "error": "Face encoding timed out"})
+                complete = False
+                continue
+            embedding, error = future.result() if future is not None else (None, None)
+            # Fetch and encode errors may be transient, so leave the gallery incomplete to retry them.
+            if isinstance(error, RequestException):
+                failed.append({**entry, "error": f"Face asset fetch failed: {error}"})
+                complete = False
+                continue
+            if error is not None:
+                failed.append({**entry, "error": f"Face encoding failed: {error}"})
+                complete = False
+                continue
+        if embedding is None:
+            failed.append({**entry, "error": "No faces found in enrolled image."})
+            continue
+
+        entries.append(entry)
+        vectors.append(embedding)
+
+    embeddings = np.vstack(vectors) if vectors else np.empty((0, 128), dtype=np.float64)
+    return FaceGallery(tuple(signature), entries, embeddings, failed, complete=complete)
+
+
+def _index_path(system_id: Any) -> Path:
+    return CACHE_DIR / "face_index" / f"system_{system_id}.npz"
+
+
+def _sync_index(system_id: Any, gallery: FaceGallery, previous: Optional[FaceGallery]) -> Optional[IVFIndex]:
+    """Bring the on-disk ANN index in line with the gallery by adding and removing only changed faces."""
+    if not ANN_ENABLED or len(gallery) < ANN_MIN_SIZE:
+        return None
+
+    keys = [_index_id((entry["face_id"] or "", entry["face_url"])) for entry in gallery.entries]
+    path = _index_path(system_id)
+    source = previous.index if previous is not None and previous.index is not None else IVFIndex.load(path)
+
+    if source is None or source.dim != gallery.embeddings.shape[1]:
+        index = IVFIndex(dim=gallery.embeddings.shape[1])
+        index.train(keys, gallery.embeddings)
+    else:
+        # Copy so captures still searching the previous gallery never see a half-applied update.
+        index = copy.copy(source)
+        indexed = set(index.ids.tolist())
+        current = set(keys)
+        added = [position for position, key in enumerate(keys) if key not in indexed]
+        removed = indexed - current
+        if not added and not removed:
+            return index
+        index.remove(removed)
+        index.add([keys[position] for position in added], gallery.embeddings[added])
+        if index.needs_retrain():
+            index.train(keys, gallery.embeddings)
+
+    try:
+        index.save(path)
+    except OSError as exc:
+        print(f"Failed to persist face index for system {system_id}: {exc}")
+    return index
+
+
+def getSystemGallery(system_id: Any, faces: List[Dict[str, Any]], deadline: Optional[float] = None) -> FaceGallery:
+    """Return the encoded gallery for a system, rebuilding it only when its faces changed.
+
+    deadline (a time.monotonic() value) bounds how long a rebuild waits for
+    faces that still need encoding; the ones not done by then are returned as
+    timed-out failures. Those, and faces whose fetch or encoding failed, are
+    retried on the next call.
+    """
+    key = str(system_id)
+    signature = tuple(
+        _face_key(face) for face in faces
+        if isinstance(face.get("face_url"), str) and face.get("face_url").strip()
+    )
+    with _galleries_lock:
+        cached = _galleries.get(key)
+    if cached is not None and cached.signature == signature and cached.complete:
+        return cached
+
+    gallery = _build_gallery(faces, cached, deadline=deadline)
+    if gallery.complete:
+        gallery.index = _sync_index(key, gallery, cached)
+    with _galleries_lock:
+        _galleries[key] = gallery
+    return gallery
+
+
+__all__ = [
+    "FaceGallery",
+    "getSystemGallery",
+]
@@ -0,0 +1,92 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ..utils.frame_prep import box_iou
+
+FACE_RECENT_SIZE = int(os.getenv("FACE_RECENT_SIZE", "32"))
+FACE_TRACK_IOU = float(os.getenv("FACE_TRACK_IOU", "0.7"))
+FACE_TRACK_MAX_AGE_SECONDS = float(os.getenv("FACE_TRACK_MAX_AGE_SECONDS", "2"))
+FACE_TRACK_MAX_REUSES = int(os.getenv("FACE_TRACK_MAX_REUSES", "10"))
+
+FaceKey = Tuple[str, str]
+
+
+class MatchTracker:
+    """Per-system memory of who was matched recently and where their faces were.
+
+    ``recent`` lists the roster keys of the last ``recent_size`` matched faces,
+    most recent first, so they can be compared before the rest of the roster.
+    ``tracked`` returns the previous frame's match for a face box that overlaps
+    one of its boxes by at least ``track_iou``, as long as the track is younger
+    than ``track_max_age_seconds`` and has been re-used fewer than
+    ``track_max_reuses`` times in a row (after that the face is encoded again).
+    """
+
+    def __init__(self, recent_size: int = FACE_RECENT_SIZE, track_iou: float = FACE_TRACK_IOU,
+                 track_max_age_seconds: float = FACE_TRACK_MAX_AGE_SECONDS,
+                 track_max_reuses: int = FACE_TRACK_MAX_REUSES):
+        self.recent_size = max(1, int(recent_size))
+        self.track_iou = float(track_iou)
+        self.track_max_age_seconds = float(track_max_age_seconds)
+        self.track_max_reuses = max(0, int(track_max_reuses))
+        self._recent: Dict[Hashable, "OrderedDict[FaceKey, None]"] = {}
+        self._tracks: Dict[Hashable, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._counters = {"recent_hits": 0, "full_scans": 0, "tracked_reuses": 0}
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] += amount
+
+    def recent(self, system_id: Hashable) -> List[FaceKey]:
+        with self._lock:
+            return list(reversed(self._recent.get(system_id, ())))
+
+    def tracked(self, system_id: Hashable, box: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The previous frame's track whose box best overlaps box, if it may still be re-used."""
+        now = time.monotonic()
+        with self._lock:
+            tracks = self._tracks.get(system_id, [])
+            candidates = [
+                (box_iou(box, track["box"]), track) for track in tracks
+                if now - track["seen_at"] <= self.track_max_age_seconds and track["reuses"] < self.track_max_reuses
+            ]
+        if not candidates:
+            return None
+        overlap, track = max(candidates, key=lambda candidate: candidate[0])
+        return track if overlap >= self.track_iou else None
+
+    def observe(self, system_id: Hashable, matched: List[Tuple[Dict[str, Any], Dict[str, Any], int]]) -> None:
+        """Record a frame's identified faces as (box, match, reuses) and make them the most recent."""
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent.setdefault(system_id, OrderedDict())
+            for _, match, _ in matched:
+                key = (str(match.get("face_id") or ""), str(match.get("face_url") or ""))
+                recent[key] = None
+                recent.move_to_end(key)
+            while len(recent) > self.recent_size:
+                recent.popitem(last=False)
+            self._tracks[system_id] = [
+                {"box": box, "match": match, "reuses": reuses, "seen_at": now}
+                for box, match, reuses in matched
+            ]
+
+    def forget(self, system_id: Hashable) -> None:
+        with self._lock:
+            self._recent.pop(system_id, None)
+            self._tracks.pop(system_id, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "systems": len(self._recent),
+                "tracked_faces": sum(len(tracks) for tracks in self._tracks.values()),
+            }
+
+
+__all__ = ["MatchTracker"]
@@ -0,0 +1,65 @@
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_MATCH_THRESHOLD = float(os.getenv("FACE_MATCH_THRESHOLD", "0.6"))
+DEFAULT_TOP_K = int(os.getenv("FACE_MATCH_TOP_K", "5"))
+
+
+def face_distances(probe: np.ndarray, gallery: np.ndarray) -> np.ndarray:
+    """Euclidean distance between one (D,) probe and every row of an (N, D) gallery."""
+    if gallery.shape[0] == 0:
+        return np.empty((0,), dtype=np.float64)
+    return np.linalg.norm(gallery - probe, axis=1)
+
+
+def distance_to_confidence(distances: np.ndarray, threshold: float = DEFAULT_MATCH_THRESHOLD) -> np.ndarray:
+    """Map face distances to a [0, 1] similarity that crosses 0.5 exactly at the threshold."""
+    return np.clip(1.0 - distances / (2.0 * threshold), 0.0, 1.0)
+
+
+def match_embedding(
+    probe: np.ndarray,
+    gallery: np.ndarray,
+    top_k: Optional[int] = DEFAULT_TOP_K,
+    threshold: float = DEFAULT_MATCH_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Return the top-k closest gallery rows to the probe, best first.
+
+    Each result holds the gallery row ``index``, its ``distance``, a ``confidence``
+    derived from it and ``isMatch`` when the distance is within ``threshold``.
+    ``top_k=None`` ranks the whole gallery.
+    """
+    distances = face_distances(probe, gallery)
+    count = distances.shape[0]
+    if count == 0:
+        return []
+
+    k = count if top_k is None else max(0, min(int(top_k), count))
+    if k < count:
+        candidates = np.argpartition(distances, k - 1)[:k] if k else np.empty((0,), dtype=np.intp)
+    else:
+        candidates = np.arange(count)
+    order = candidates[np.argsort(distances[candidates], kind="stable")]
+
+    ranked = distances[order]
+    confidences = distance_to_confidence(ranked, threshold)
+    return [
+        {
+            "index": int(index),
+            "distance": float(distance),
+            "confidence": float(confidence),
+            "isMatch": bool(distance <= threshold),
+        }
+        for index, distance, confidence in zip(order, ranked, confidences)
+    ]
+
+
+__all__ = [
+    "DEFAULT_MATCH_THRESHOLD",
+    "DEFAULT_TOP_K",
+    "face_distances",
+    "distance_to_confidence",
+    "match_embedding",
+]
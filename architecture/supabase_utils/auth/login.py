@@ -6,7 +6,9 @@ def loginUser(email: str, password: str):
             "email": email,
             "password": password
         })
-        token = supabase_client.auth.get_session().access_token
+        # Read the token from this sign-in rather than the client's shared session,
+        # which another request thread may have replaced in the meantime.
+        token = user.session.access_token
         return {"success": True,
                  "token": token,
                  "user": user.user.dict()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from ..main import supabase_client
 
 def getUserProfile(user_id: str):
@@ -7,3 +9,12 @@ def getUserProfile(user_id: str):
 def getSystemInfo(user_id: str):
     res = supabase_client.table("systems_data").select("*").eq("owner_id", user_id).execute()
     return res.data
+
+def getMonitoringEvents(system_id: int, since: Optional[str] = None, until: Optional[str] = None, limit: int = 100):
+    query = supabase_client.table("monitoring_events").select("*").eq("system_id", system_id)
+    if since is not None:
+        query = query.gte("captured_at", since)
+    if until is not None:
+        query = query.lt("captured_at", until)
+    res = query.order("captured_at", desc=True).limit(limit).execute()
+    return res.data
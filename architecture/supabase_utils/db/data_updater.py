@@ -1,5 +1,4 @@
-import random
-from typing import Any
+from typing import Any, Optional, Sequence
 
 from ..main import supabase_client
 def updateUserImage(user_id: int, image_url: str):
@@ -20,21 +19,22 @@ def updateUserBio(user_id: int, new_bio: str):
     }).eq("id", user_id).execute()
     return res
 
-def updateFaceToSystem(system_id: int, face_url: str, name_of_person: str):
-    system_data = supabase_client.table("systems_data").select("faces").eq("id", system_id).single().execute()
-    record = getattr(system_data, "data", None)
-    faces_data = record.get("faces") if isinstance(record, dict) else None
-    faces = list(faces_data) if isinstance(faces_data, list) else []
-    new_face_id = random.randint(1000, 9999)
-    faces.append({
-        "face_id": new_face_id,
+def addFacesToSystem(system_id: int, faces: Sequence[dict]):
+    """Append faces to a system's roster in one atomic write; the database assigns each face_id."""
+    res = supabase_client.rpc("append_system_faces", {
+        "p_system_id": system_id,
+        "p_faces": [{key: value for key, value in face.items() if key != "face_id"} for face in faces],
+    }).execute()
+    return res.data
+
+def updateFaceToSystem(system_id: int, face_url: str, name_of_person: str, embedding: Optional[Sequence[float]] = None):
+    face = {
         "face_url": face_url,
         "name_of_person": name_of_person
-    })
-    res = supabase_client.table("systems_data").update({
-        "faces": faces
-    }).eq("id", system_id).execute()
-    return res.data
+    }
+    if embedding is not None:
+        face["embedding"] = [float(value) for value in embedding]
+    return addFacesToSystem(system_id, [face])
 
 def alertSystem(system_id: int, alert_status: bool):
     res = supabase_client.table("systems_data").update({
@@ -49,6 +49,12 @@ def addRoomCode(system_id: int, room_code: str):
     }).eq("id", system_id).execute()
     return res.data
 
+def updateSystemCaptureSettings(system_id: int, capture_settings: dict):
+    res = supabase_client.table("systems_data").update({
+        "capture_settings": capture_settings
+    }).eq("id", system_id).execute()
+    return res.data
+
 def addMonitoredImageURL(system_id: int, image_url: str):
     res = supabase_client.table("systems_data").update({
         "monitored_image_url": image_url
@@ -60,4 +66,11 @@ def addMonitoredDataJSONB(system_id: int, data: Any):
         "monitored_data": data
     }).eq("id", system_id).execute()
     print(res)
-    return res.data
\ No newline at end of file
+    return res.data
+
+def updateMonitoredSnapshot(system_id: int, image_url: Optional[str], data: Any):
+    changes = {"monitored_data": data}
+    if image_url:
+        changes["monitored_image_url"] = image_url
+    res = supabase_client.table("systems_data").update(changes).eq("id", system_id).execute()
+    return res.data
@@ -5,3 +5,7 @@ def create_system(user_id: str, system_name: str):
         "system_name": system_name
     }).execute()
     return res.data
+
+def insertMonitoringEvents(events: list):
+    res = supabase_client.table("monitoring_events").insert(events).execute()
+    return res.data
@@ -0,0 +1,10 @@
+-- Per-system capture configuration read alongside the roster on every capture.
+-- Keys: "labels" (list of detector prompts, defaults to the built-in set when absent),
+--       "roi" ({xmin, ymin, xmax, ymax} as fractions of the frame, cropped before inference),
+--       "inference_max_side" (longest side in pixels frames are downscaled to before inference),
+--       "motion" ({enabled, pixel_delta, min_changed_fraction, max_static_seconds} for skipping static frames),
+--       "face_regions" ("frame" searches the whole frame for faces, "person" only the detector's person boxes),
+--       "face_matching" ("exhaustive" ranks the whole roster, "recent" tries recently matched people first
+--                        and stops on a confident hit, "tracked" also re-uses the last identity of a face that barely moved).
+alter table systems_data
+    add column if not exists capture_settings jsonb not null default '{}'::jsonb;
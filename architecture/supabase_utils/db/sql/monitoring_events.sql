@@ -0,0 +1,16 @@
+-- Append-only history of what each capture saw. The backend buffers events
+-- in memory and inserts them in batches, so a busy camera costs one INSERT
+-- per batch instead of one UPDATE of systems_data per frame.
+-- detections: [{label, score, box}]; faces: [{face_id, name_of_person, confidence, face_box}]
+-- for recognised faces only, with unidentified_faces counting the rest.
+create table if not exists monitoring_events (
+    id bigint generated always as identity primary key,
+    system_id bigint not null references systems_data (id) on delete cascade,
+    captured_at timestamptz not null,
+    detections jsonb not null default '[]'::jsonb,
+    faces jsonb not null default '[]'::jsonb,
+    unidentified_faces integer not null default 0
+);
+
+create index if not exists monitoring_events_system_time
+    on monitoring_events (system_id, captured_at desc);
@@ -0,0 +1,58 @@
+-- Atomic roster edits. Each call is one UPDATE on the systems_data row, so
+-- concurrent enrolments and removals no longer overwrite each other the way
+-- a read-modify-write of the whole faces array did, and a batch of faces is
+-- appended in a single write. Both return the updated row (as setof, like a
+-- PostgREST update) so the backend can write it through to its roster cache.
+
+-- face_id values come from this sequence. It starts above the 1000-9999 range
+-- the old random IDs were drawn from, so it never collides with them.
+create sequence if not exists system_face_id_seq start with 10000;
+
+create or replace function append_system_faces(p_system_id bigint, p_faces jsonb)
+returns setof systems_data as $$
+begin
+    if jsonb_typeof(p_faces) is distinct from 'array' then
+        raise exception 'p_faces must be a JSON array of faces';
+    end if;
+
+    return query
+    update systems_data
+       set faces = coalesce(faces, '[]'::jsonb) || coalesce((
+               select jsonb_agg(face || jsonb_build_object('face_id', nextval('system_face_id_seq'))
+                                order by position)
+                 from jsonb_array_elements(p_faces) with ordinality as added(face, position)
+           ), '[]'::jsonb)
+     where id = p_system_id
+    returning *;
+
+    if not found then
+        raise exception 'system % not found', p_system_id;
+    end if;
+end;
+$$ language plpgsql;
+
+create or replace function remove_system_faces(p_system_id bigint, p_face_ids text[])
+returns setof systems_data as $$
+declare
+    current_faces jsonb;
+    kept_faces jsonb;
+begin
+    select faces into current_faces from systems_data where id = p_system_id for update;
+    if not found then
+        raise exception 'system % not found', p_system_id;
+    end if;
+
+    select coalesce(jsonb_agg(face order by position), '[]'::jsonb)
+      into kept_faces
+      from jsonb_array_elements(coalesce(current_faces, '[]'::jsonb)) with ordinality as kept(face, position)
+     where jsonb_typeof(face) is distinct from 'object'
+        or coalesce(trim(face->>'face_id'), '') <> all(p_face_ids);
+
+    if jsonb_array_length(kept_faces) = jsonb_array_length(coalesce(current_faces, '[]'::jsonb)) then
+        raise exception 'face_id not found in system faces';
+    end if;
+
+    return query
+    update systems_data set faces = kept_faces where id = p_system_id returning *;
+end;
+$$ language plpgsql;
@@ -0,0 +1,20 @@
+-- Version counter the backend's roster cache revalidates against instead of
+-- re-reading faces on every capture. It only moves when faces or
+-- capture_settings change, so the frequent monitored_* writes do not bust caches.
+alter table systems_data
+    add column if not exists roster_version bigint not null default 0;
+
+create or replace function bump_roster_version() returns trigger as $$
+begin
+    if new.faces is distinct from old.faces
+       or new.capture_settings is distinct from old.capture_settings then
+        new.roster_version := old.roster_version + 1;
+    end if;
+    return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists systems_data_roster_version on systems_data;
+create trigger systems_data_roster_version
+    before update on systems_data
+    for each row execute function bump_roster_version();
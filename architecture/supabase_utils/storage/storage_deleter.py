@@ -1,17 +1,30 @@
 from ..main import supabase_client
+from .storage_uploader import forgetUploadedObject
+from ...facecomparer_utils.embedding_cache import invalidateFaceAsset, storage_key
 
 def deleteFaceImage(email):
     try:
         path = f"public/{email}/face.jpg"
         supabase_client.storage.from_("user_data_bucket").remove([path])
+        invalidateFaceAsset("user_data_bucket", path)
+        forgetUploadedObject("user_data_bucket", path)
         return {"success": True}
     except Exception as e:
         return {"success": False, "error": str(e)}
     
-def deleteFaceImageFromSystem(system_id, face_id):
+def _system_face_path(face_url):
+    bucket, _, path = storage_key(face_url).partition("/")
+    if bucket != "system_faces_bucket" or not path:
+        raise ValueError(f"face_url is not a system_faces_bucket object: {face_url}")
+    return path
+
+def deleteFaceImageFromSystem(system_id, face_id, face_url=None):
+    # The roster's face_url names the stored object; face_id is the file name the image was uploaded under.
     try:
-        path = f"public/{system_id}/{face_id}.jpg"
+        path = _system_face_path(face_url) if face_url else f"public/{system_id}/{face_id}.jpg"
         supabase_client.storage.from_("system_faces_bucket").remove([path])
+        invalidateFaceAsset("system_faces_bucket", path)
+        forgetUploadedObject("system_faces_bucket", path)
         return {"success": True}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1,8 +1,14 @@
-from ..main import supabase_client
+from urllib.parse import quote
+
+from ..main import project_url
+
+def getPublicUrl(bucket: str, path: str) -> str:
+    """Public URL of a storage object, built locally from the project URL, bucket and path."""
+    return f"{project_url.rstrip('/')}/storage/v1/object/public/{bucket}/{quote(path.lstrip('/'))}"
 
 def getFaceImage(email):
     try:
-        url = supabase_client.storage.from_('user_data_bucket').get_public_url("public/" + email + "/face.jpg")
+        url = getPublicUrl("user_data_bucket", "public/" + email + "/face.jpg")
         return {"success": True, "url": url}
     except Exception as e:
-        return {"success": False, "error": str(e)}
\ No newline at end of file
+        return {"success": False, "error": str(e)}
@@ -1,40 +1,98 @@
+import base64
+import hashlib
+import os
+import threading
+from typing import Dict, Tuple
+
 from ..main import supabase_client
-import base64, io
+from .storage_reader import getPublicUrl
+from ...facecomparer_utils.embedding_cache import invalidateFaceAsset
 
-def uploadFaceImage(email: str, base64_image: str):
-    b64 = base64_image
-    b64 = b64.split(",", 1)[-1]
-    data = base64.b64decode(b64)
-    supabase_client.storage.from_("user_data_bucket").remove(["public/" + email + "/face.jpg"])
+# Skipping re-uploads of identical bytes is only safe when this process is the sole
+# writer of a path (one worker, or captures of a system pinned to one worker).
+STORAGE_SKIP_UNCHANGED = os.getenv("STORAGE_SKIP_UNCHANGED", "false").strip().lower() in ("1", "true", "yes")
+
+_uploaded_hashes: Dict[Tuple[str, str], str] = {}
+_uploaded_hashes_lock = threading.Lock()
+
+
+def _decode(base64_image: str) -> bytes:
+    return base64.b64decode(base64_image.split(",", 1)[-1])
+
+
+def _content_type(data: bytes) -> str:
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+def upsertObject(bucket: str, path: str, data: bytes, skip_unchanged: bool = STORAGE_SKIP_UNCHANGED):
+    """Write data to bucket/path in one upsert call and return its locally built public URL.
+
+    Returns {"success", "url", "skipped"}; skipped is True when skip_unchanged
+    is set and this process last wrote exactly these bytes to the path.
+    """
+    key = (bucket, path)
+    content_hash = hashlib.sha1(data).hexdigest()
+    if skip_unchanged:
+        with _uploaded_hashes_lock:
+            if _uploaded_hashes.get(key) == content_hash:
+                return {"success": True, "url": getPublicUrl(bucket, path), "skipped": True}
     try:
-        supabase_client.storage.from_("user_data_bucket").upload("public/" + email + "/face.jpg", file=data)
-        return {"success": True, "url": supabase_client.storage.from_("user_data_bucket").get_public_url("public/" + email + "/face.jpg")}
+        supabase_client.storage.from_(bucket).upload(path, file=data, file_options={
+            "upsert": "true",
+            "content-type": _content_type(data),
+        })
     except Exception as e:
+        with _uploaded_hashes_lock:
+            _uploaded_hashes.pop(key, None)
         return {"success": False, "error": str(e)}
-    
+    with _uploaded_hashes_lock:
+        _uploaded_hashes[key] = content_hash
+    return {"success": True, "url": getPublicUrl(bucket, path), "skipped": False}
+
+
+def forgetUploadedObject(bucket: str, path: str) -> None:
+    """Drop the remembered content hash of an object that was deleted."""
+    with _uploaded_hashes_lock:
+        _uploaded_hashes.pop((bucket, path), None)
+
+
+def _upsert_face_asset(bucket: str, path: str, data: bytes):
+    result = upsertObject(bucket, path, data)
+    if result["success"] and not result["skipped"]:
+        invalidateFaceAsset(bucket, path)
+    return result
+
+
+def uploadFaceImage(email: str, base64_image: str):
+    return _upsert_face_asset("user_data_bucket", "public/" + email + "/face.jpg", _decode(base64_image))
+
 
 def uploadFaceImageToSystem(system_id: str, base64_image: str, face_id: str):
-    b64 = base64_image
-    b64 = b64.split(",", 1)[-1]
-    data = base64.b64decode(b64)
-    supabase_client.storage.from_("system_faces_bucket").remove(["public/" + system_id + "/" + face_id + ".jpg"])
-    try:
-        supabase_client.storage.from_("system_faces_bucket").upload("public/" + system_id + "/" + face_id + ".jpg", file=data)
-        return {"success": True, "url": supabase_client.storage.from_("system_faces_bucket").get_public_url("public/" + system_id + "/" + face_id + ".jpg")}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return uploadFaceImageBytesToSystem(system_id=system_id, data=_decode(base64_image), face_id=face_id)
+
+
+def uploadFaceImageBytesToSystem(system_id: str, data: bytes, face_id: str):
+    return _upsert_face_asset("system_faces_bucket", "public/" + system_id + "/" + face_id + ".jpg", data)
+
 
 def uploadImageToDetectSafetyMeasure(system_id: str, base64_image: str):
-    b64 = base64_image
-    b64 = b64.split(",", 1)[-1]
-    data = base64.b64decode(b64)
-    supabase_client.storage.from_("system_monitored_images_bucket").remove(["public/" + system_id + "/image.jpg"])
-    try:
-        supabase_client.storage.from_("system_monitored_images_bucket").upload("public/" + system_id + "/image.jpg", file=data)
-        return {"success": True, "url": supabase_client.storage.from_("system_monitored_images_bucket").get_public_url("public/" + system_id + "/image.jpg")}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return uploadImageBytesToDetectSafetyMeasure(system_id=system_id, data=_decode(base64_image))
+
 
+def uploadImageBytesToDetectSafetyMeasure(system_id: str, data: bytes):
+    return upsertObject("system_monitored_images_bucket", "public/" + system_id + "/image.jpg", data)
 
-__all__ = ["uploadFaceImage", "uploadImageToDetectSafetyMeasure"]
 
+__all__ = [
+    "upsertObject",
+    "forgetUploadedObject",
+    "uploadFaceImage",
+    "uploadFaceImageToSystem",
+    "uploadFaceImageBytesToSystem",
+    "uploadImageToDetectSafetyMeasure",
+    "uploadImageBytesToDetectSafetyMeasure",
+]
@@ -0,0 +1,145 @@
+import os
+from pathlib import Path
+
+DETECTOR_BACKEND = os.getenv("DETECTOR_BACKEND", "torch").strip().lower()
+# Intra-op threads per process; the production server splits the cores between its workers.
+INFERENCE_THREADS = int(os.getenv("INFERENCE_THREADS", "0"))
+ONNX_CACHE_DIR = Path(os.getenv("DEEPVISION_CACHE_DIR", str(Path.home() / ".cache" / "deepvision"))) / "onnx"
+
+
+class TorchDetectorBackend:
+    """Float32 PyTorch forward of the OWLv2 image tower and detection heads."""
+
+    name = "torch"
+
+    def __init__(self, model):
+        self.model = model
+
+    def run(self, pixel_values, queries, query_mask):
+        import torch
+
+        with torch.no_grad():
+            feature_map = self.model.image_embedder(pixel_values=pixel_values)[0]
+            batch_size, height, width, hidden = feature_map.shape
+            image_feats = feature_map.reshape(batch_size, height * width, hidden)
+            logits, _ = self.model.class_predictor(image_feats, queries, query_mask)
+            pred_boxes = self.model.box_predictor(image_feats, feature_map)
+        return logits, pred_boxes
+
+
+class QuantizedTorchDetectorBackend(TorchDetectorBackend):
+    """Same forward with every nn.Linear dynamically quantised to int8 weights."""
+
+    name = "torch-int8"
+
+    def __init__(self, model):
+        import torch
+
+        quantized = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        super().__init__(quantized)
+
+
+def _image_heads_module(model):
+    import torch
+
+    class ImageHeads(torch.nn.Module):
+        def __init__(self, detector):
+            super().__init__()
+            self.detector = detector
+
+        def forward(self, pixel_values, queries, query_mask):
+            feature_map = self.detector.image_embedder(pixel_values=pixel_values)[0]
+            batch_size, height, width, hidden = feature_map.shape
+            image_feats = feature_map.reshape(batch_size, height * width, hidden)
+            logits, _ = self.detector.class_predictor(image_feats, queries, query_mask)
+            pred_boxes = self.detector.box_predictor(image_feats, feature_map)
+            return logits, pred_boxes
+
+    return ImageHeads(model).eval()
+
+
+class OnnxDetectorBackend:
+    """ONNX Runtime session over the exported image tower and heads.
+
+    The graph is exported once per model name into DEEPVISION_CACHE_DIR/onnx and
+    reused on later starts; text queries still come from the PyTorch text tower.
+    """
+
+    name = "onnx"
+
+    def __init__(self, model, model_name, sample_pixel_values, sample_queries):
+        import onnxruntime
+
+        path = ONNX_CACHE_DIR / (model_name.replace("/", "--") + ".onnx")
+        if not path.is_file():
+            self._export(model, path, sample_pixel_values, sample_queries)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if INFERENCE_THREADS > 0:
+            options.intra_op_num_threads = INFERENCE_THREADS
+        self.session = onnxruntime.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+
+    @staticmethod
+    def _export(model, path, sample_pixel_values, sample_queries):
+        import torch
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".tmp")
+        sample_mask = torch.ones(sample_queries.shape[:2], dtype=torch.bool)
+        with torch.no_grad():
+            torch.onnx.export(
+                _image_heads_module(model),
+                (sample_pixel_values, sample_queries, sample_mask),
+                str(partial),
+                input_names=["pixel_values", "queries", "query_mask"],
+                output_names=["logits", "pred_boxes"],
+                dynamic_axes={
+                    "pixel_values": {0: "batch"},
+                    "queries": {0: "batch", 1: "num_queries"},
+                    "query_mask": {0: "batch", 1: "num_queries"},
+                    "logits": {0: "batch", 2: "num_queries"},
+                    "pred_boxes": {0: "batch"},
+                },
+                opset_version=17,
+                dynamo=False,
+            )
+        os.replace(partial, path)
+
+    def run(self, pixel_values, queries, query_mask):
+        import torch
+
+        logits, pred_boxes = self.session.run(
+            ["logits", "pred_boxes"],
+            {
+                "pixel_values": pixel_values.numpy(),
+                "queries": queries.numpy(),
+                "query_mask": query_mask.numpy(),
+            },
+        )
+        return torch.from_numpy(logits), torch.from_numpy(pred_boxes)
+
+
+def build_detector_backend(name, model, model_name, sample_pixel_values=None, sample_queries=None):
+    """Create the inference backend selected by name (DETECTOR_BACKEND by default)."""
+    if INFERENCE_THREADS > 0:
+        import torch
+
+        torch.set_num_threads(INFERENCE_THREADS)
+    if name == "torch":
+        return TorchDetectorBackend(model)
+    if name == "torch-int8":
+        return QuantizedTorchDetectorBackend(model)
+    if name == "onnx":
+        return OnnxDetectorBackend(model, model_name, sample_pixel_values, sample_queries)
+    raise ValueError(f"unknown detector backend: {name} (expected torch, torch-int8 or onnx)")
+
+
+__all__ = [
+    "DETECTOR_BACKEND",
+    "INFERENCE_THREADS",
+    "TorchDetectorBackend",
+    "QuantizedTorchDetectorBackend",
+    "OnnxDetectorBackend",
+    "build_detector_backend",
+]
@@ -0,0 +1,75 @@
+"""Parity and latency check of the detector inference backends against float32 PyTorch.
+
+Run from the repository root:
+
+    python -m architecture.transformers_utils.benchmark --backends torch-int8 onnx
+
+Every backend runs on the fixture images next to this file. Each one must stay
+within --score-tol (sigmoid score) and --box-tol (pixels) of the reference on
+every patch and query. The command exits non-zero when a backend drifts further.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from .backends import build_detector_backend
+from .main import DETECTOR_MODEL, _boxes_to_pixels, _stack_queries, candidate_labels, load_detector
+
+FIXTURES = [Path(__file__).parent / "knife.jpeg", Path(__file__).parent / "sharjeel.jpeg"]
+
+
+def _timed_run(backend, pixel_values, queries, query_mask, runs):
+    backend.run(pixel_values, queries, query_mask)
+    start = time.perf_counter()
+    for _ in range(runs):
+        backend.run(pixel_values, queries, query_mask)
+    return (time.perf_counter() - start) / runs * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", nargs="+", default=["torch-int8", "onnx"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--score-tol", type=float, default=0.05)
+    parser.add_argument("--box-tol", type=float, default=8.0)
+    args = parser.parse_args()
+
+    import torch
+
+    processor, model, reference = load_detector("torch")
+    images = [Image.open(path).convert("RGB") for path in FIXTURES]
+    pixel_values = processor(images=images, return_tensors="pt")["pixel_values"]
+    queries, query_mask = _stack_queries([tuple(candidate_labels)] * len(images))
+
+    ref_logits, ref_boxes = reference.run(pixel_values, queries, query_mask)
+    ref_scores = torch.sigmoid(ref_logits)
+    ref_pixels = [_boxes_to_pixels(ref_boxes[i], image) for i, image in enumerate(images)]
+    ref_ms = _timed_run(reference, pixel_values, queries, query_mask, args.runs)
+    print(f"{'backend':>12} {'ms/batch':>10} {'speedup':>8} {'max dscore':>11} {'max dbox px':>12} {'parity':>7}")
+    print(f"{'torch':>12} {ref_ms:>10.1f} {1.0:>8.2f} {0.0:>11.4f} {0.0:>12.2f} {'ok':>7}")
+
+    failed = False
+    for name in args.backends:
+        backend = build_detector_backend(
+            name, model, DETECTOR_MODEL,
+            sample_pixel_values=pixel_values[:1], sample_queries=queries[:1],
+        )
+        logits, boxes = backend.run(pixel_values, queries, query_mask)
+        score_diff = float((torch.sigmoid(logits) - ref_scores).abs().max())
+        box_diff = max(
+            float((_boxes_to_pixels(boxes[i], image) - ref_pixels[i]).abs().max())
+            for i, image in enumerate(images)
+        )
+        ms = _timed_run(backend, pixel_values, queries, query_mask, args.runs)
+        ok = score_diff <= args.score_tol and box_diff <= args.box_tol
+        failed = failed or not ok
+        print(f"{name:>12} {ms:>10.1f} {ref_ms / ms:>8.2f} {score_diff:>11.4f} {box_diff:>12.2f} {'ok' if ok else 'FAIL':>7}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,20 @@
-from transformers import pipeline
-import torch
+import os
+import threading
+from collections import OrderedDict
+
 from PIL import Image
 import requests
 
-detector = pipeline(
-    task="zero-shot-object-detection",
-    model="google/owlv2-base-patch16-ensemble",
-)
+from .backends import DETECTOR_BACKEND, build_detector_backend
+from .batcher import MicroBatcher
+from ..utils.model_registry import registry
+
+DETECTOR_MAX_BATCH_SIZE = int(os.getenv("DETECTOR_MAX_BATCH_SIZE", "8"))
+DETECTOR_MAX_WAIT_MS = float(os.getenv("DETECTOR_MAX_WAIT_MS", "10"))
+
+DETECTOR_MODEL = "google/owlv2-base-patch16-ensemble"
+DETECTOR_THRESHOLD = 0.25
+QUERY_CACHE_SIZE = int(os.getenv("DETECTOR_QUERY_CACHE_SIZE", "64"))
 
 # image = Image.open("knife.jpeg").convert("RGB")
 # image = Image.open(requests.get("https://www.shutterstock.com/image-photo/bearded-man-holding-sharp-knife-260nw-1108925567.jpg", stream=True).raw).convert("RGB")
@@ -19,12 +27,7 @@ candidate_labels = [
     "fighting person",
 ]
 
-def predict_safety_measure(image):
-    predictions = detector(
-    image,
-    candidate_labels=candidate_labels,
-    threshold=0.25
-)
+def _format_predictions(predictions):
     results = []
     for p in predictions:
         # print(p["label"], p["score"], p["box"])
@@ -36,6 +39,146 @@ def predict_safety_measure(image):
             "score": float(p["score"]),
             "box": formatted_box,
         })
+    return results
+
+
+_query_cache = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+
+def normalize_labels(labels):
+    """Return a clean, de-duplicated label tuple, falling back to the default set."""
+    if not labels:
+        return tuple(candidate_labels)
+    cleaned = []
+    for label in labels:
+        if isinstance(label, str) and label.strip() and label.strip() not in cleaned:
+            cleaned.append(label.strip())
+    return tuple(cleaned) or tuple(candidate_labels)
+
+
+def _encode_queries(processor, model, key):
+    import torch
+
+    text_inputs = processor(text=list(key), return_tensors="pt")
+    with torch.no_grad():
+        embeddings = model.owlv2.get_text_features(
+            input_ids=text_inputs["input_ids"],
+            attention_mask=text_inputs["attention_mask"],
+        )
+    if not torch.is_tensor(embeddings):
+        # Newer transformers releases wrap the projected features in a model output.
+        embeddings = embeddings.pooler_output
+
+    with _query_cache_lock:
+        _query_cache[key] = embeddings
+        _query_cache.move_to_end(key)
+        while len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return embeddings
+
+
+def load_detector(backend_name=DETECTOR_BACKEND):
+    """Build (processor, model, backend) with the requested inference backend."""
+    from transformers import Owlv2ForObjectDetection, Owlv2Processor
+
+    processor = Owlv2Processor.from_pretrained(DETECTOR_MODEL)
+    model = Owlv2ForObjectDetection.from_pretrained(DETECTOR_MODEL).eval()
+    # Encode the default label prompts with the model; frames only run the image tower.
+    default_queries = _encode_queries(processor, model, normalize_labels(candidate_labels))
+    sample_pixels = processor(images=[Image.new("RGB", (64, 64))], return_tensors="pt")["pixel_values"]
+    backend = build_detector_backend(
+        backend_name, model, DETECTOR_MODEL,
+        sample_pixel_values=sample_pixels, sample_queries=default_queries[None],
+    )
+    return processor, model, backend
+
+
+def _load_detector():
+    return load_detector()
+
+
+registry.register("detector", _load_detector)
+
+
+def get_query_embeddings(labels):
+    """Text-tower embeddings for a label set, encoded once and kept in an LRU cache."""
+    key = normalize_labels(labels)
+    with _query_cache_lock:
+        cached = _query_cache.get(key)
+        if cached is not None:
+            _query_cache.move_to_end(key)
+            return cached
+
+    processor, model, _ = registry.get("detector")
+    return _encode_queries(processor, model, key)
+
+
+def _stack_queries(label_sets):
+    """Pad every frame's query embeddings to the same count and mask the padding."""
+    import torch
+
+    embeddings = [get_query_embeddings(labels) for labels in label_sets]
+    width = max(e.shape[0] for e in embeddings)
+    queries = torch.zeros((len(embeddings), width, embeddings[0].shape[1]), dtype=embeddings[0].dtype)
+    mask = torch.zeros((len(embeddings), width), dtype=torch.bool)
+    for i, e in enumerate(embeddings):
+        queries[i, :e.shape[0]] = e
+        mask[i, :e.shape[0]] = True
+    return queries, mask
+
+
+def _boxes_to_pixels(pred_boxes, image):
+    import torch
+
+    # OWLv2 pads frames to a square, so normalised boxes scale by the longer side.
+    side = float(max(image.width, image.height))
+    cx, cy, w, h = pred_boxes.unbind(-1)
+    return torch.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], dim=-1) * side
+
+
+def _detect_batch(items, detector=None):
+    """Run the image tower once for a batch of (image, labels) items against cached text queries."""
+    import torch
+
+    processor, _, backend = detector or registry.get("detector")
+    images = [image for image, _ in items]
+    label_sets = [normalize_labels(labels) for _, labels in items]
+    queries, query_mask = _stack_queries(label_sets)
+    pixel_values = processor(images=images, return_tensors="pt")["pixel_values"]
+    logits, pred_boxes = backend.run(pixel_values, queries, query_mask)
+
+    scores = torch.sigmoid(logits)
+    batch_results = []
+    for i, (image, labels) in enumerate(zip(images, label_sets)):
+        boxes = _boxes_to_pixels(pred_boxes[i], image)
+        frame_scores = scores[i, :, :len(labels)]
+        patch_ids, label_ids = torch.nonzero(frame_scores > DETECTOR_THRESHOLD, as_tuple=True)
+        predictions = [
+            {
+                "label": labels[int(label_id)],
+                "score": float(frame_scores[patch_id, label_id]),
+                "box": dict(zip(("xmin", "ymin", "xmax", "ymax"), boxes[patch_id].tolist())),
+            }
+            for patch_id, label_id in zip(patch_ids, label_ids)
+        ]
+        predictions.sort(key=lambda p: p["score"], reverse=True)
+        batch_results.append(_format_predictions(predictions))
+    return batch_results
+
+
+_batcher = (
+    MicroBatcher(_detect_batch, max_batch_size=DETECTOR_MAX_BATCH_SIZE,
+                 max_wait_ms=DETECTOR_MAX_WAIT_MS, name="owlv2-batcher")
+    if DETECTOR_MAX_BATCH_SIZE > 1 else None
+)
+
+
+def predict_safety_measure(image, labels=None):
+    if _batcher is not None:
+        results = _batcher((image, labels))
+    else:
+        results = _detect_batch([(image, labels)])[0]
     print(results)
     return results
     
@@ -44,4 +187,4 @@ def predict_safety_measure(image):
 # res = predict_safety_measure(detector, image, candidate_labels)
 # print(res)
 
-__all__ = ["predict_safety_measure"]
+__all__ = ["predict_safety_measure", "get_query_embeddings", "normalize_labels", "load_detector"]
@@ -0,0 +1,153 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Optional
+
+ALERT_WINDOW_FRAMES = int(os.getenv("ALERT_WINDOW_FRAMES", "5"))
+ALERT_RAISE_SCORE = float(os.getenv("ALERT_RAISE_SCORE", "0.25"))
+ALERT_RAISE_FRAMES = int(os.getenv("ALERT_RAISE_FRAMES", "3"))
+ALERT_CLEAR_SCORE = float(os.getenv("ALERT_CLEAR_SCORE", "0.15"))
+ALERT_CLEAR_MAX_FRAMES = int(os.getenv("ALERT_CLEAR_MAX_FRAMES", "0"))
+ALERT_STATE_TTL_SECONDS = float(os.getenv("ALERT_STATE_TTL_SECONDS", "60"))
+ALERT_SAFE_LABELS = tuple(
+    label.strip().lower()
+    for label in os.getenv("ALERT_SAFE_LABELS", "normal person,no human").split(",")
+    if label.strip()
+)
+
+
+def threat_score(detections: Any, safe_labels: Iterable[str] = ALERT_SAFE_LABELS) -> float:
+    """Highest detector score among a frame's detections whose label is not a safe one."""
+    if not isinstance(detections, list):
+        return 0.0
+    safe = set(safe_labels)
+    scores = [
+        float(item["score"]) for item in detections
+        if isinstance(item, dict) and isinstance(item.get("score"), (int, float))
+        and str(item.get("label") or "").strip().lower() not in safe
+    ]
+    return max(scores, default=0.0)
+
+
+class AlertStateMachine:
+    """Per-system alert state smoothed over the last ``window_frames`` frames.
+
+    A clear system raises once at least ``raise_frames`` frames of the window
+    scored ``raise_score`` or more; an alerting system clears once no more
+    than ``clear_max_frames`` frames of the window still score
+    ``clear_score`` or more. The gap between the two thresholds keeps a
+    single noisy frame, or a score hovering around one threshold, from
+    flipping the state. ``observe`` and ``set`` report only real changes so
+    callers write the alert flag on transitions alone.
+
+    Every worker keeps its own windows, so the stored flag may have been
+    changed elsewhere (``/systems/alert``, an admin, another worker).
+    ``observe`` therefore starts from the stored state and re-reads it once it
+    is older than ``state_ttl_seconds``; a system whose stored state cannot be
+    read adopts its smoothed state silently instead of overwriting the flag.
+    """
+
+    def __init__(self, window_frames: int = ALERT_WINDOW_FRAMES, raise_score: float = ALERT_RAISE_SCORE,
+                 raise_frames: int = ALERT_RAISE_FRAMES, clear_score: float = ALERT_CLEAR_SCORE,
+                 clear_max_frames: int = ALERT_CLEAR_MAX_FRAMES, state_ttl_seconds: float = ALERT_STATE_TTL_SECONDS):
+        self.window_frames = max(1, int(window_frames))
+        self.raise_score = float(raise_score)
+        self.raise_frames = min(self.window_frames, max(1, int(raise_frames)))
+        self.clear_score = min(float(clear_score), self.raise_score)
+        self.clear_max_frames = max(0, min(int(clear_max_frames), self.raise_frames - 1))
+        self.state_ttl_seconds = float(state_ttl_seconds)
+        self._windows: Dict[Hashable, Deque[float]] = {}
+        self._states: Dict[Hashable, bool] = {}
+        self._set_at: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self._counters = {"frames": 0, "transitions": 0, "coalesced": 0}
+
+    def _stale(self, system_id: Hashable, now: float) -> bool:
+        with self._lock:
+            return (system_id not in self._states
+                    or now - self._set_at.get(system_id, float("-inf")) >= self.state_ttl_seconds)
+
+    def observe(self, system_id: Hashable, score: float,
+                load_state: Optional[Callable[[], Optional[bool]]] = None) -> Optional[bool]:
+        """Add a frame's threat score; returns the new state on a transition, otherwise None.
+
+        load_state reads the stored flag; it is called when the system's state
+        is unknown or older than ``state_ttl_seconds``.
+        """
+        now = time.monotonic()
+        if load_state is not None and self._stale(system_id, now):
+            try:
+                stored = load_state()
+            except Exception as exc:
+                print(f"Failed to read stored alert state for system {system_id}: {exc}")
+                stored = None
+            if stored is not None:
+                with self._lock:
+                    self._states[system_id] = bool(stored)
+                    self._set_at[system_id] = now
+
+        with self._lock:
+            self._counters["frames"] += 1
+            window = self._windows.setdefault(system_id, deque(maxlen=self.window_frames))
+            window.append(float(score))
+            current = self._states.get(system_id)
+            raised = sum(value >= self.raise_score for value in window) >= self.raise_frames
+            lingering = sum(value >= self.clear_score for value in window)
+
+            if current is None:
+                # Nothing is known about the stored flag, so adopt the smoothed state without writing it.
+                if raised or len(window) >= self.window_frames:
+                    self._states[system_id] = raised
+                    self._set_at[system_id] = now
+                return None
+            if current:
+                # Clearing needs a full window of quiet frames, not just the few seen so far.
+                desired = len(window) < self.window_frames or lingering > self.clear_max_frames
+            else:
+                desired = raised
+
+            if desired == current:
+                return None
+            self._states[system_id] = desired
+            self._set_at[system_id] = now
+            self._counters["transitions"] += 1
+            return desired
+
+    def set(self, system_id: Hashable, state: bool) -> bool:
+        """Record an externally requested state; False when it repeats the state written recently.
+
+        Other workers may have written the flag since, so a repeat older than
+        ``state_ttl_seconds`` is let through again.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (self._states.get(system_id) == state
+                    and now - self._set_at.get(system_id, float("-inf")) < self.state_ttl_seconds):
+                self._counters["coalesced"] += 1
+                return False
+            self._states[system_id] = state
+            self._set_at[system_id] = now
+            return True
+
+    def forget(self, system_id: Hashable) -> None:
+        """Drop the remembered state after a write of it failed, so the next request retries it."""
+        with self._lock:
+            self._states.pop(system_id, None)
+            self._set_at.pop(system_id, None)
+
+    def state(self, system_id: Hashable) -> Optional[bool]:
+        with self._lock:
+            return self._states.get(system_id)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "systems": len(self._windows),
+                "alerting": sum(1 for state in self._states.values() if state),
+                "window_frames": self.window_frames,
+            }
+
+
+__all__ = ["AlertStateMachine", "threat_score"]
@@ -11,4 +11,8 @@ def base64_to_image(b64_string: str):
     print("Converted base64 string to image: ", image)
     return image
 
-__all__ = ["base64_to_image"]
\ No newline at end of file
+def bytes_to_image(image_bytes: bytes):
+    """Decode raw encoded image bytes (JPEG, PNG, ...) into an RGB PIL image."""
+    return Image.open(BytesIO(image_bytes)).convert("RGB")
+
+__all__ = ["base64_to_image", "bytes_to_image"]
\ No newline at end of file
@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+class EventBuffer:
+    """In-memory buffer that hands events to ``flush`` in batches.
+
+    A batch is written as soon as ``max_batch`` events are waiting or the
+    oldest waiting event is ``flush_interval_seconds`` old, whichever comes
+    first. A failed batch is put back and retried on the next flush; when more
+    than ``max_pending`` events pile up the oldest are dropped and counted, so
+    a database outage cannot grow memory without bound.
+    """
+
+    def __init__(self, name: str, flush: Callable[[List[Dict[str, Any]]], Any], max_batch: int = 200,
+                 flush_interval_seconds: float = 2.0, max_pending: int = 10000):
+        self.name = name
+        self._flush = flush
+        self.max_batch = max(1, int(max_batch))
+        self.flush_interval_seconds = max(0.05, float(flush_interval_seconds))
+        self.max_pending = max(self.max_batch, int(max_pending))
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._writing: List[Dict[str, Any]] = []
+        self._oldest_at: Optional[float] = None
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._counters = {"added": 0, "flushed": 0, "batches": 0, "failed_batches": 0, "dropped": 0}
+        self._last_error: Optional[str] = None
+        self._thread = threading.Thread(target=self._run, name=f"{name}-flusher", daemon=True)
+        self._thread.start()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        with self._cond:
+            if not self._pending:
+                self._oldest_at = time.monotonic()
+            self._pending.append(event)
+            self._counters["added"] += 1
+            while len(self._pending) > self.max_pending:
+                self._pending.popleft()
+                self._counters["dropped"] += 1
+            # Wake the flusher to start the interval timer on the first event, or to write a full batch.
+            if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+                self._cond.notify()
+
+    def pending(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
+        """Events not written yet (including the batch being written), oldest first, optionally filtered."""
+        with self._cond:
+            return [event for event in (*self._writing, *self._pending) if predicate is None or predicate(event)]
+
+    def _due(self) -> bool:
+        return bool(self._pending) and (
+            len(self._pending) >= self.max_batch
+            or time.monotonic() - self._oldest_at >= self.flush_interval_seconds
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._due():
+                    if self._pending:
+                        remaining = self.flush_interval_seconds - (time.monotonic() - self._oldest_at)
+                        self._cond.wait(timeout=max(0.01, remaining))
+                    else:
+                        self._cond.wait()
+            if not self.flush():
+                # Back off before retrying a failed batch instead of spinning on it.
+                time.sleep(self.flush_interval_seconds)
+
+    def flush(self) -> bool:
+        """Write everything waiting, batch by batch; returns False when a batch failed."""
+        with self._flush_lock:
+            while True:
+                with self._cond:
+                    batch = [self._pending.popleft() for _ in range(min(self.max_batch, len(self._pending)))]
+                    self._writing = batch
+                    self._oldest_at = time.monotonic() if self._pending else None
+                if not batch:
+                    return True
+                try:
+                    self._flush(batch)
+                except Exception as exc:
+                    with self._cond:
+                        self._writing = []
+                        self._pending.extendleft(reversed(batch))
+                        self._oldest_at = time.monotonic()
+                        self._counters["failed_batches"] += 1
+                        self._last_error = str(exc)
+                    print(f"[{self.name}] failed to write {len(batch)} events: {exc}")
+                    return False
+                with self._cond:
+                    self._writing = []
+                    self._counters["flushed"] += len(batch)
+                    self._counters["batches"] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self._counters,
+                "pending": len(self._pending),
+                "max_batch": self.max_batch,
+                "flush_interval_seconds": self.flush_interval_seconds,
+                "last_error": self._last_error,
+            }
+
+
+__all__ = ["EventBuffer"]
@@ -0,0 +1,100 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+
+DEFAULT_INFERENCE_MAX_SIDE = int(os.getenv("CAPTURE_INFERENCE_MAX_SIDE", "0"))
+
+
+class FrameTransform:
+    """Records how a prepared frame was cut out of and scaled from the original."""
+
+    def __init__(self, offset_x: int = 0, offset_y: int = 0, scale: float = 1.0):
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.scale = scale
+
+    @property
+    def is_identity(self) -> bool:
+        return self.offset_x == 0 and self.offset_y == 0 and self.scale == 1.0
+
+    def box_to_original(self, box: Dict[str, Any]) -> Dict[str, int]:
+        """Map an xmin/ymin/xmax/ymax box from prepared-frame pixels back to the original frame."""
+        mapped = {}
+        for key, offset in (("xmin", self.offset_x), ("ymin", self.offset_y),
+                            ("xmax", self.offset_x), ("ymax", self.offset_y)):
+            if key in box:
+                mapped[key] = int(round(box[key] / self.scale + offset))
+        return mapped
+
+
+def _roi_pixels(roi: Any, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+    """Turn a fractional {xmin, ymin, xmax, ymax} ROI into a clamped pixel crop box."""
+    if not isinstance(roi, dict):
+        return None
+    try:
+        xmin, ymin = float(roi.get("xmin", 0.0)), float(roi.get("ymin", 0.0))
+        xmax, ymax = float(roi.get("xmax", 1.0)), float(roi.get("ymax", 1.0))
+    except (TypeError, ValueError):
+        return None
+
+    left = int(round(min(max(xmin, 0.0), 1.0) * width))
+    top = int(round(min(max(ymin, 0.0), 1.0) * height))
+    right = int(round(min(max(xmax, 0.0), 1.0) * width))
+    bottom = int(round(min(max(ymax, 0.0), 1.0) * height))
+    if right - left < 1 or bottom - top < 1:
+        return None
+    return left, top, right, bottom
+
+
+def prepare_frame(image: Image.Image, roi: Any = None,
+                  max_side: Optional[int] = None) -> Tuple[Image.Image, FrameTransform]:
+    """Crop a frame to its ROI (fractions of the frame) and downscale it to max_side.
+
+    Returns the prepared image and the transform that maps its coordinates back
+    to the original frame. With no ROI and no max_side the image is returned as is.
+    """
+    max_side = DEFAULT_INFERENCE_MAX_SIDE if max_side is None else max_side
+    offset_x = offset_y = 0
+
+    crop = _roi_pixels(roi, image.width, image.height)
+    if crop is not None and crop != (0, 0, image.width, image.height):
+        image = image.crop(crop)
+        offset_x, offset_y = crop[0], crop[1]
+
+    scale = 1.0
+    longest = max(image.width, image.height)
+    if max_side and max_side > 0 and longest > max_side:
+        scale = max_side / float(longest)
+        size = (max(1, int(round(image.width * scale))), max(1, int(round(image.height * scale))))
+        image = image.resize(size, Image.BILINEAR)
+
+    return image, FrameTransform(offset_x, offset_y, scale)
+
+
+def detections_to_original(detections: Any, transform: FrameTransform, key: str = "box") -> Any:
+    """Rewrite the boxes (under key) of detector or face results into original-frame coordinates."""
+    if transform.is_identity or not isinstance(detections, list):
+        return detections
+    mapped = []
+    for item in detections:
+        if isinstance(item, dict) and isinstance(item.get(key), dict):
+            item = {**item, key: transform.box_to_original(item[key])}
+        mapped.append(item)
+    return mapped
+
+
+def box_iou(first: Dict[str, Any], second: Dict[str, Any]) -> float:
+    """Intersection over union of two xmin/ymin/xmax/ymax boxes."""
+    width = min(first["xmax"], second["xmax"]) - max(first["xmin"], second["xmin"])
+    height = min(first["ymax"], second["ymax"]) - max(first["ymin"], second["ymin"])
+    if width <= 0 or height <= 0:
+        return 0.0
+    intersection = width * height
+    area_first = (first["xmax"] - first["xmin"]) * (first["ymax"] - first["ymin"])
+    area_second = (second["xmax"] - second["xmin"]) * (second["ymax"] - second["ymin"])
+    union = area_first + area_second - intersection
+    return float(intersection / union) if union > 0 else 0.0
+
+
+__all__ = ["FrameTransform", "prepare_frame", "detections_to_original", "box_iou"]
@@ -0,0 +1,80 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class LatestFrameSlot:
+    """Single-slot mailbox between a stream's reader and its inference worker.
+
+    ``put`` replaces a frame that is still waiting, so the worker always picks
+    up the newest frame and stale ones are dropped instead of queueing up
+    behind slow inference.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[int, Any]] = None
+        self._closed = False
+        self._sequence = 0
+        self.received = 0
+        self.dropped = 0
+        self.processed = 0
+
+    def put(self, frame: Any) -> int:
+        """Offer a frame to the worker and return its sequence number."""
+        with self._cond:
+            self._sequence += 1
+            self.received += 1
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = (self._sequence, frame)
+            self._cond.notify()
+            return self._sequence
+
+    def take(self) -> Optional[Tuple[int, Any]]:
+        """Block until a frame is waiting; returns None once the slot is closed."""
+        with self._cond:
+            while self._pending is None and not self._closed:
+                self._cond.wait()
+            if self._pending is None:
+                return None
+            item, self._pending = self._pending, None
+            self.processed += 1
+            return item
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._pending = None
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {"received": self.received, "dropped": self.dropped, "processed": self.processed}
+
+
+class StreamMetrics:
+    """Process-wide counters for streaming sessions, reported by /metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self._totals = {"sessions": 0, "received": 0, "dropped": 0, "processed": 0}
+
+    def opened(self) -> None:
+        with self._lock:
+            self._active += 1
+            self._totals["sessions"] += 1
+
+    def closed(self, slot: LatestFrameSlot) -> None:
+        stats = slot.stats()
+        with self._lock:
+            self._active -= 1
+            for key in ("received", "dropped", "processed"):
+                self._totals[key] += stats[key]
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {"active_sessions": self._active, **self._totals}
+
+
+__all__ = ["LatestFrameSlot", "StreamMetrics"]
@@ -0,0 +1,57 @@
+import os
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "3"))
+HTTP_READ_TIMEOUT_SECONDS = float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_SECONDS = float(os.getenv("HTTP_BACKOFF_SECONDS", "0.2"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "32"))
+HTTP_MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", "16"))
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_fetch_slots = threading.BoundedSemaphore(max(1, HTTP_MAX_CONCURRENCY))
+
+
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session with pooled connections and retry/backoff on GETs."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=HTTP_MAX_RETRIES,
+                    backoff_factor=HTTP_BACKOFF_SECONDS,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET", "HEAD"]),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def fetch_response(url: str, headers: Optional[Dict[str, str]] = None,
+                   timeout: Optional[float] = None) -> requests.Response:
+    """GET a URL through the shared session without raising on HTTP error statuses."""
+    read_timeout = HTTP_READ_TIMEOUT_SECONDS if timeout is None else timeout
+    with _fetch_slots:
+        return get_session().get(url, headers=headers, timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, read_timeout))
+
+
+def fetch_bytes(url: str, timeout: Optional[float] = None) -> bytes:
+    """GET a URL through the shared session and return its body; raises requests exceptions."""
+    response = fetch_response(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+__all__ = ["get_session", "fetch_response", "fetch_bytes"]
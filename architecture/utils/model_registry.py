@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class ModelNotServedError(RuntimeError):
+    """Raised when a worker is asked for a model outside its DEEPVISION_MODELS set."""
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _parse_names(value: Optional[str]) -> Optional[set]:
+    if value is None or not value.strip():
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class ModelRegistry:
+    """Loads each registered model on first use, or up front through warm().
+
+    ``DEEPVISION_MODELS`` (comma separated) limits which models this process
+    may load, so a worker pool only ever pays for the model it serves.
+    """
+
+    def __init__(self, served: Optional[Iterable[str]] = None):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        self.served = set(served) if served is not None else _parse_names(os.getenv("DEEPVISION_MODELS"))
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        with self._registry_lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def get(self, name: str) -> Any:
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        if name not in self._loaders:
+            raise KeyError(f"unknown model: {name}")
+        if self.served is not None and name not in self.served:
+            raise ModelNotServedError(f"model '{name}' is not served by this worker")
+
+        with self._locks[name]:
+            model = self._models.get(name)
+            if model is not None:
+                return model
+            rss_before = _rss_bytes()
+            start = time.perf_counter()
+            model = self._loaders[name]()
+            load_seconds = time.perf_counter() - start
+            rss_after = _rss_bytes()
+            self._stats[name] = {
+                "load_seconds": round(load_seconds, 3),
+                "rss_delta_mb": (
+                    round((rss_after - rss_before) / (1024 * 1024), 1)
+                    if rss_before is not None and rss_after is not None else None
+                ),
+            }
+            self._models[name] = model
+            print(f"Loaded model '{name}' in {load_seconds:.2f}s")
+        return model
+
+    def warm(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Eagerly load the given models (default: every served model) and return their stats."""
+        targets = list(names) if names is not None else [
+            name for name in self._loaders if self.served is None or name in self.served
+        ]
+        for name in targets:
+            self.get(name)
+        return self.stats()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "loaded": name in self._models,
+                "served": self.served is None or name in self.served,
+                **self._stats.get(name, {}),
+            }
+            for name in self._loaders
+        }
+
+
+registry = ModelRegistry()
+
+__all__ = ["ModelNotServedError", "ModelRegistry", "registry"]
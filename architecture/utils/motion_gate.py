@@ -0,0 +1,77 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+from PIL import Image
+
+MOTION_GATE_ENABLED = os.getenv("MOTION_GATE_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+DEFAULT_PIXEL_DELTA = int(os.getenv("MOTION_PIXEL_DELTA", "25"))
+DEFAULT_MIN_CHANGED_FRACTION = float(os.getenv("MOTION_MIN_CHANGED_FRACTION", "0.01"))
+DEFAULT_MAX_STATIC_SECONDS = float(os.getenv("MOTION_MAX_STATIC_SECONDS", "30"))
+THUMBNAIL_SIZE = (64, 48)
+
+
+def frame_thumbnail(image: Image.Image) -> np.ndarray:
+    """Downscaled grayscale copy of a frame used for cheap change detection."""
+    return np.asarray(image.convert("L").resize(THUMBNAIL_SIZE, Image.BILINEAR), dtype=np.int16)
+
+
+class MotionGate:
+    """Remembers the last processed frame per system and spots frames that did not change.
+
+    A frame counts as changed when more than ``min_changed_fraction`` of its
+    thumbnail pixels moved by more than ``pixel_delta`` grey levels. Static
+    frames are still re-processed every ``max_static_seconds`` so results
+    never go stale.
+    """
+
+    def __init__(self):
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _settings(settings: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        motion = settings.get("motion") if isinstance(settings, dict) else None
+        motion = motion if isinstance(motion, dict) else {}
+        return {
+            "enabled": bool(motion.get("enabled", MOTION_GATE_ENABLED)),
+            "pixel_delta": int(motion.get("pixel_delta", DEFAULT_PIXEL_DELTA)),
+            "min_changed_fraction": float(motion.get("min_changed_fraction", DEFAULT_MIN_CHANGED_FRACTION)),
+            "max_static_seconds": float(motion.get("max_static_seconds", DEFAULT_MAX_STATIC_SECONDS)),
+        }
+
+    def previous_result(self, system_id: Any, thumbnail: np.ndarray,
+                        settings: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Return the last result if this frame is unchanged from the last processed one."""
+        config = self._settings(settings)
+        if not config["enabled"]:
+            return None
+
+        with self._lock:
+            state = self._state.get(str(system_id))
+        if state is None or state["thumbnail"].shape != thumbnail.shape:
+            return None
+        if time.monotonic() - state["processed_at"] > config["max_static_seconds"]:
+            return None
+
+        changed = np.abs(thumbnail - state["thumbnail"]) > config["pixel_delta"]
+        if float(changed.mean()) > config["min_changed_fraction"]:
+            return None
+        return state["result"]
+
+    def remember(self, system_id: Any, thumbnail: np.ndarray, result: Any) -> None:
+        with self._lock:
+            self._state[str(system_id)] = {
+                "thumbnail": thumbnail,
+                "result": result,
+                "processed_at": time.monotonic(),
+            }
+
+    def forget(self, system_id: Any) -> None:
+        with self._lock:
+            self._state.pop(str(system_id), None)
+
+
+__all__ = ["MotionGate", "frame_thumbnail"]
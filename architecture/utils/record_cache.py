@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable
+
+
+def _is_older(version: Any, other: Any) -> bool:
+    try:
+        return version is not None and other is not None and version < other
+    except TypeError:
+        return False
+
+
+class VersionedRecordCache:
+    """Keeps whole records in memory and revalidates them by a version column.
+
+    A cached record is served as is for ``check_interval_seconds``. After that
+    the next read asks only for the record's version and reloads the full
+    record when it changed (or when no version is known). Writers that already
+    hold the new record push it in with ``store`` so reads never go stale
+    locally.
+    """
+
+    def __init__(self, name: str, version_field: str, check_interval_seconds: float = 5.0):
+        self.name = name
+        self.version_field = version_field
+        self.check_interval_seconds = float(check_interval_seconds)
+        self._entries: Dict[Hashable, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "version_checks": 0, "reloads": 0, "write_throughs": 0}
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def get(self, key: Hashable, load_record: Callable[[], Dict[str, Any]],
+            load_version: Callable[[], Any]) -> Dict[str, Any]:
+        """Return the record for key, loading or revalidating it when due."""
+        with self._lock:
+            entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if now - entry["checked_at"] < self.check_interval_seconds:
+                self._count("hits")
+                return entry["record"]
+            version = entry["record"].get(self.version_field)
+            if version is not None:
+                self._count("version_checks")
+                if load_version() == version:
+                    with self._lock:
+                        entry["checked_at"] = now
+                    return entry["record"]
+
+        self._count("reloads")
+        record = load_record()
+        self.store(key, record, write_through=False)
+        return record
+
+    def store(self, key: Hashable, record: Dict[str, Any], write_through: bool = True) -> None:
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and _is_older(record.get(self.version_field),
+                                                 current["record"].get(self.version_field)):
+                # A slow reload finished after a newer write-through; keep the newer record.
+                return
+            self._entries[key] = {"record": record, "checked_at": time.monotonic()}
+            if write_through:
+                self._counters["write_throughs"] += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "size": len(self._entries),
+                "check_interval_seconds": self.check_interval_seconds,
+            }
+
+
+__all__ = ["VersionedRecordCache"]
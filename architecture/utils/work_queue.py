@@ -0,0 +1,96 @@
+import queue
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+
+class BackgroundWorkQueue:
+    """Bounded, retrying background executor for fire-and-forget side effects.
+
+    Jobs are sharded across worker threads by ``key`` so jobs for the same key
+    (e.g. one system) run in submission order. When a shard is full the job is
+    rejected instead of blocking the caller, and the rejection shows up in
+    ``metrics()`` as backpressure.
+    """
+
+    def __init__(self, name: str, max_size: int = 256, workers: int = 2,
+                 max_retries: int = 3, backoff_seconds: float = 0.5):
+        self.name = name
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_seconds = max(0.0, float(backoff_seconds))
+        workers = max(1, int(workers))
+        shard_size = max(1, int(max_size) // workers)
+        self._shards: List["queue.Queue[Optional[tuple]]"] = [queue.Queue(maxsize=shard_size) for _ in range(workers)]
+        self._lock = threading.Lock()
+        self._counters = {"submitted": 0, "rejected": 0, "completed": 0, "failed": 0, "retries": 0}
+        self._in_flight = 0
+        self._last_error: Optional[str] = None
+        self._threads = [
+            threading.Thread(target=self._run, args=(shard,), name=f"{name}-{index}", daemon=True)
+            for index, shard in enumerate(self._shards)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] += amount
+
+    def submit(self, fn: Callable[..., Any], *args: Any, key: Any = None, **kwargs: Any) -> bool:
+        """Queue fn(*args, **kwargs); returns False when the queue is full and the job was dropped."""
+        shard = self._shards[zlib.crc32(str(key).encode("utf-8")) % len(self._shards)]
+        try:
+            shard.put_nowait((fn, args, kwargs, time.monotonic()))
+        except queue.Full:
+            self._count("rejected")
+            return False
+        self._count("submitted")
+        return True
+
+    def _run(self, shard: "queue.Queue[Optional[tuple]]") -> None:
+        while True:
+            fn, args, kwargs, _ = shard.get()
+            with self._lock:
+                self._in_flight += 1
+            try:
+                self._execute(fn, args, kwargs)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                shard.task_done()
+
+    def _execute(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                fn(*args, **kwargs)
+                self._count("completed")
+                return
+            except Exception as exc:
+                with self._lock:
+                    self._last_error = f"{getattr(fn, '__name__', fn)}: {exc}"
+                if attempt == self.max_retries:
+                    self._count("failed")
+                    print(f"[{self.name}] giving up after {attempt + 1} attempts: {exc}")
+                    return
+                self._count("retries")
+                time.sleep(self.backoff_seconds * (2 ** attempt))
+
+    def join(self) -> None:
+        """Block until every queued job has finished."""
+        for shard in self._shards:
+            shard.join()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "queued": sum(shard.qsize() for shard in self._shards),
+                "capacity": sum(shard.maxsize for shard in self._shards),
+                "in_flight": self._in_flight,
+                "workers": len(self._threads),
+                "last_error": self._last_error,
+            }
+
+
+__all__ = ["BackgroundWorkQueue"]
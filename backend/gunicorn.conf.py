@@ -0,0 +1,43 @@
+"""Production server settings.
+
+Run from the backend directory:
+
+    gunicorn -c gunicorn.conf.py main:app
+
+Each worker is a separate process that imports the app and loads its own
+models after the fork. Inside a worker, request threads serve the I/O-bound
+routes (auth, profiles, Supabase reads and writes) concurrently, while the
+detector's batching thread and the face-match pool do the CPU work with
+INFERENCE_THREADS intra-op threads. The gthread worker also carries the
+/systems/stream WebSocket sessions.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("DEEPVISION_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_WORKERS", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("WEB_THREADS", "32"))
+# Long enough for a cold model load on the first capture of a worker.
+timeout = int(os.getenv("WEB_TIMEOUT", "180"))
+graceful_timeout = 30
+keepalive = 5
+preload_app = False
+
+
+def post_fork(server, worker):
+    # Split the cores between workers so their torch pools do not oversubscribe the CPU.
+    os.environ.setdefault("INFERENCE_THREADS", str(max(1, multiprocessing.cpu_count() // workers)))
+
+
+def post_worker_init(worker):
+    import main
+
+    main.warm_configured_models()
+
+
+def worker_exit(server, worker):
+    import main
+
+    # Write out monitoring events still buffered in this worker.
+    main.monitoring_events.flush()
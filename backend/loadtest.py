@@ -0,0 +1,135 @@
+"""Mixed auth + capture load test for a running backend.
+
+Start the Supabase stand-in and a backend pointed at it, then drive traffic:
+
+    python backend/supabase_standin.py --users 50 --systems 20
+    cd backend && SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_KEY=standin \\
+        gunicorn -c gunicorn.conf.py main:app
+    python backend/loadtest.py --duration 30 --concurrency 32 --mix login=1,capture=4
+
+Each client thread keeps its own keep-alive session, picks a request kind by
+weight, and cycles the fixture frames so the motion gate does not skip them.
+The report lists requests/sec and latency percentiles per kind.
+"""
+import argparse
+import base64
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import requests
+
+from supabase_standin import STANDIN_PASSWORD, seeded_email, seeded_room_code
+
+FIXTURES = sorted((Path(__file__).parent.parent / "architecture" / "transformers_utils").glob("*.jpeg"))
+
+
+def _parse_mix(text: str) -> List[Tuple[str, float]]:
+    mix = []
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        mix.append((name.strip(), float(weight or 1)))
+    return mix
+
+
+class LoadClient:
+    def __init__(self, base_url: str, users: int, systems: int, binary: bool, frames: List[bytes]):
+        self.base_url = base_url.rstrip("/")
+        self.users = users
+        self.systems = systems
+        self.binary = binary
+        self.frames = frames
+        self.frame_index = random.randrange(len(frames))
+        self.session = requests.Session()
+
+    def _next_frame(self) -> bytes:
+        self.frame_index = (self.frame_index + 1) % len(self.frames)
+        return self.frames[self.frame_index]
+
+    def login(self) -> requests.Response:
+        return self.session.post(f"{self.base_url}/auth/login", json={
+            "email": seeded_email(random.randrange(self.users)),
+            "password": STANDIN_PASSWORD,
+        }, timeout=30)
+
+    def capture(self) -> requests.Response:
+        room_code = seeded_room_code(random.randrange(self.systems) + 1)
+        frame = self._next_frame()
+        if self.binary:
+            return self.session.post(
+                f"{self.base_url}/systems/capture/binary", data=frame,
+                headers={"Content-Type": "image/jpeg", "X-Room-Code": room_code}, timeout=120,
+            )
+        return self.session.post(f"{self.base_url}/systems/capture", json={
+            "room_code": room_code,
+            "base64_image": "data:image/jpeg;base64," + base64.b64encode(frame).decode("ascii"),
+        }, timeout=120)
+
+    def profile(self) -> requests.Response:
+        return self.session.get(f"{self.base_url}/users/profile",
+                                params={"email": seeded_email(random.randrange(self.users))}, timeout=30)
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mix", default="login=1,capture=4",
+                        help="comma separated kind=weight; kinds are login, capture and profile")
+    parser.add_argument("--users", type=int, default=10, help="seeded stand-in users to sign in as")
+    parser.add_argument("--systems", type=int, default=10, help="seeded stand-in systems to capture for")
+    parser.add_argument("--binary", action="store_true", help="send captures to /systems/capture/binary")
+    args = parser.parse_args()
+
+    mix = _parse_mix(args.mix)
+    kinds, weights = [name for name, _ in mix], [weight for _, weight in mix]
+    frames = [path.read_bytes() for path in FIXTURES]
+    latencies: Dict[str, List[float]] = {kind: [] for kind in kinds}
+    errors: Dict[str, int] = {kind: 0 for kind in kinds}
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    def run_client() -> None:
+        client = LoadClient(args.base_url, args.users, args.systems, args.binary, frames)
+        while time.monotonic() < deadline:
+            kind = random.choices(kinds, weights)[0]
+            start = time.perf_counter()
+            try:
+                ok = getattr(client, kind)().status_code < 400
+            except requests.RequestException:
+                ok = False
+            elapsed = (time.perf_counter() - start) * 1000.0
+            with lock:
+                latencies[kind].append(elapsed)
+                if not ok:
+                    errors[kind] += 1
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=run_client, daemon=True) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.monotonic() - started
+
+    print(f"{'kind':>8} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for kind in kinds:
+        values = latencies[kind]
+        print(f"{kind:>8} {len(values):>9} {errors[kind]:>7} {len(values) / wall:>8.1f} "
+              f"{_percentile(values, 0.50):>8.1f} {_percentile(values, 0.95):>8.1f} {_percentile(values, 0.99):>8.1f}")
+    total = sum(len(values) for values in latencies.values())
+    print(f"{'total':>8} {total:>9} {sum(errors.values()):>7} {total / wall:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
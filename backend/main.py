@@ -1,28 +1,53 @@
+import atexit
 import base64
+import io
+import json
+import os
 import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from flask import Flask, request
 from flask_cors import CORS
-import requests
+from flask_sock import Sock
+from simple_websocket import ConnectionClosed
 from requests import RequestException
+from werkzeug.exceptions import RequestEntityTooLarge
 
 # Add parent directory to path to import architecture module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from architecture.supabase_utils.auth.login import loginUser
 from architecture.supabase_utils.auth.register import registerUser
-from architecture.facecomparer_utils.compare import recognizeFace
-from architecture.supabase_utils.storage.storage_uploader import uploadFaceImage, uploadFaceImageToSystem, uploadImageToDetectSafetyMeasure
+from architecture.facecomparer_utils.compare import verifyFace, verifyFaceImage, encodeFaceFromBase64, encodeFaceFromBytes, encodeFacesAt, locateFaces
+from architecture.facecomparer_utils.embedding_cache import face_embedding_cache
+from architecture.facecomparer_utils.gallery import getSystemGallery
+from architecture.facecomparer_utils.match_tracker import MatchTracker
+from architecture.supabase_utils.storage.storage_uploader import uploadFaceImage, uploadFaceImageToSystem, uploadFaceImageBytesToSystem, uploadImageBytesToDetectSafetyMeasure
+from architecture.supabase_utils.storage.storage_reader import getPublicUrl
 from architecture.supabase_utils.storage.storage_deleter import deleteFaceImage, deleteFaceImageFromSystem
-from architecture.supabase_utils.db.data_reader import getUserProfile, getSystemInfo
-from architecture.supabase_utils.db.data_writer import create_system
+from architecture.supabase_utils.db.data_reader import getUserProfile, getSystemInfo, getMonitoringEvents
+from architecture.supabase_utils.db.data_writer import create_system, insertMonitoringEvents
 from architecture.supabase_utils.db.data_deleter import deleteFaceFromSystem
-from architecture.supabase_utils.db.data_updater import updateFaceToSystem, alertSystem, addRoomCode, addMonitoredImageURL, addMonitoredDataJSONB, updateUserBio, updateUserImage, updateUserName
+from architecture.supabase_utils.db.data_updater import addFacesToSystem, updateFaceToSystem, alertSystem, addRoomCode, updateMonitoredSnapshot, updateUserBio, updateUserImage, updateUserName, updateSystemCaptureSettings
 from architecture.supabase_utils.main import supabase_client
-from architecture.utils.b64_to_image import base64_to_image
-from architecture.transformers_utils.main import predict_safety_measure
+from architecture.utils.b64_to_image import bytes_to_image
+from architecture.utils.http_client import fetch_bytes
+from architecture.utils.alert_state import AlertStateMachine, threat_score
+from architecture.utils.event_buffer import EventBuffer
+from architecture.utils.frame_stream import LatestFrameSlot, StreamMetrics
+from architecture.utils.frame_prep import prepare_frame, detections_to_original
+from architecture.utils.motion_gate import MotionGate, frame_thumbnail
+from architecture.utils.record_cache import VersionedRecordCache
+from architecture.utils.ttl_cache import TTLCache
+from architecture.utils.work_queue import BackgroundWorkQueue
+from architecture.utils.model_registry import ModelNotServedError, registry
+from architecture.transformers_utils.main import predict_safety_measure, get_query_embeddings
 from supabase_auth.types import Options
 
 
@@ -35,9 +60,7 @@ def _normalize_base64_payload(image_data: str) -> str:
 
 def _download_image_as_base64(image_url: str) -> str:
     """Download an image URL and return its base64 representation."""
-    response = requests.get(image_url, timeout=10)
-    response.raise_for_status()
-    return base64.b64encode(response.content).decode("utf-8")
+    return base64.b64encode(fetch_bytes(image_url)).decode("utf-8")
 
 
 def _format_face_result(raw_result: Any) -> Dict[str, Any]:
@@ -83,6 +106,10 @@ def _resolve_system_id(system_id: Any, room_code: Optional[str]) -> Any:
         raise ValueError("system_id or room_code required")
 
     normalized_code = room_code.strip()
+    cached_system_id = room_code_cache.get(normalized_code)
+    if cached_system_id is not None:
+        return cached_system_id
+
     try:
         response = (
             supabase_client
@@ -105,28 +132,79 @@ def _resolve_system_id(system_id: Any, room_code: Optional[str]) -> Any:
     if system_record_id is None:
         raise LookupError("system not found for provided room_code")
 
-    return _coerce_system_identifier(system_record_id)
+    resolved_system_id = _coerce_system_identifier(system_record_id)
+    room_code_cache.set(normalized_code, resolved_system_id)
+    return resolved_system_id
+
+
+def _query_system_record(identifier: Any) -> Dict[str, Any]:
+    response = (
+        supabase_client
+        .table("systems_data")
+        .select("faces, capture_settings, roster_version")
+        .eq("id", identifier)
+        .single()
+        .execute()
+    )
+    record = getattr(response, "data", None)
+    if not isinstance(record, dict):
+        raise LookupError(f"system {identifier} not found")
+    return record
+
+
+def _query_system_version(identifier: Any) -> Any:
+    response = (
+        supabase_client
+        .table("systems_data")
+        .select("roster_version")
+        .eq("id", identifier)
+        .single()
+        .execute()
+    )
+    record = getattr(response, "data", None)
+    return record.get("roster_version") if isinstance(record, dict) else None
+
+
+def _query_system_alert(identifier: Any) -> Optional[bool]:
+    response = (
+        supabase_client
+        .table("systems_data")
+        .select("alert")
+        .eq("id", identifier)
+        .single()
+        .execute()
+    )
+    record = getattr(response, "data", None)
+    value = record.get("alert") if isinstance(record, dict) else None
+    return bool(value) if value is not None else None
 
 
-def _fetch_system_faces(system_id: Any) -> List[Dict[str, Any]]:
+def _fetch_system_record(system_id: Any) -> Dict[str, Any]:
+    """Roster and capture settings for a capture, served from memory while roster_version is unchanged."""
     identifier = _coerce_system_identifier(system_id)
     try:
-        response = (
-            supabase_client
-            .table("systems_data")
-            .select("faces")
-            .eq("id", identifier)
-            .single()
-            .execute()
+        return roster_cache.get(
+            identifier,
+            load_record=lambda: _query_system_record(identifier),
+            load_version=lambda: _query_system_version(identifier),
         )
     except Exception as exc:
         print(f"Failed to fetch faces for system {system_id}: {exc}")
-        return []
+        return {}
+
+
+def _store_system_record(system_id: Any, rows: Any) -> Optional[Dict[str, Any]]:
+    """Write a systems_data row returned by an update through to the roster cache."""
+    record = rows[0] if isinstance(rows, list) and rows else rows
+    if not isinstance(record, dict) or not isinstance(record.get("faces", []), list):
+        roster_cache.invalidate(_coerce_system_identifier(system_id))
+        return None
+    cached = {key: record.get(key) for key in ("faces", "capture_settings", "roster_version")}
+    roster_cache.store(_coerce_system_identifier(system_id), cached)
+    return cached
 
-    record = getattr(response, "data", None)
-    if not isinstance(record, dict):
-        return []
 
+def _system_faces(record: Dict[str, Any]) -> List[Dict[str, Any]]:
     faces = record.get("faces") or []
     if not isinstance(faces, list):
         return []
@@ -134,52 +212,264 @@ def _fetch_system_faces(system_id: Any) -> List[Dict[str, Any]]:
     return [face for face in faces if isinstance(face, dict)]
 
 
-def _compare_system_faces(system_id: Any, capture_base64: str) -> List[Dict[str, Any]]:
+def _capture_settings(record: Dict[str, Any]) -> Dict[str, Any]:
+    settings = record.get("capture_settings")
+    return settings if isinstance(settings, dict) else {}
+
+
+def _validate_capture_settings(settings: Dict[str, Any]) -> Optional[str]:
+    """Return an error message when capture settings are malformed, otherwise None."""
+    labels = settings.get("labels")
+    if labels is not None:
+        if not isinstance(labels, list) or not all(isinstance(label, str) and label.strip() for label in labels):
+            return "capture_settings.labels must be a list of non-empty strings"
+
+    roi = settings.get("roi")
+    if roi is not None:
+        keys = ("xmin", "ymin", "xmax", "ymax")
+        if not isinstance(roi, dict) or not all(isinstance(roi.get(key), (int, float)) for key in keys):
+            return "capture_settings.roi must hold numeric xmin, ymin, xmax and ymax"
+        if not all(0.0 <= roi[key] <= 1.0 for key in keys) or roi["xmin"] >= roi["xmax"] or roi["ymin"] >= roi["ymax"]:
+            return "capture_settings.roi must be fractions of the frame with xmin < xmax and ymin < ymax"
+
+    motion = settings.get("motion")
+    if motion is not None:
+        if not isinstance(motion, dict):
+            return "capture_settings.motion must be an object"
+        for key in ("pixel_delta", "min_changed_fraction", "max_static_seconds"):
+            value = motion.get(key)
+            if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0):
+                return f"capture_settings.motion.{key} must be a non-negative number"
+
+    face_matching = settings.get("face_matching")
+    if face_matching is not None and face_matching not in ("exhaustive", "recent", "tracked"):
+        return "capture_settings.face_matching must be 'exhaustive', 'recent' or 'tracked'"
+
+    face_regions = settings.get("face_regions")
+    if face_regions is not None and face_regions not in ("frame", "person"):
+        return "capture_settings.face_regions must be 'frame' or 'person'"
+
+    max_side = settings.get("inference_max_side")
+    if max_side is not None and (not isinstance(max_side, int) or isinstance(max_side, bool) or max_side < 32):
+        return "capture_settings.inference_max_side must be an integer of at least 32"
+
+    return None
+
+
+def _compare_system_faces(system_id: Any, capture_image: Any, faces: List[Dict[str, Any]],
+                          deadline: Optional[float] = None,
+                          regions: Optional[List[Dict[str, Any]]] = None,
+                          matching: str = "exhaustive") -> List[Dict[str, Any]]:
+    """Locate and encode every face in the capture once, then rank the roster for each of them.
+
+    matching "recent" first compares each face with the system's recently
+    matched people and stops there on a confident hit; "tracked" additionally
+    re-uses the previous frame's identity for a face whose box barely moved,
+    without encoding it.
+    """
     matches: List[Dict[str, Any]] = []
-    if not capture_base64:
+    if capture_image is None:
         return matches
 
-    faces = _fetch_system_faces(system_id)
-    for face in faces:
-        face_url = face.get("face_url")
-        if not isinstance(face_url, str) or not face_url.strip():
-            continue
+    gallery = getSystemGallery(system_id, faces, deadline=deadline)
+    failed = [{**entry, "isMatch": False, "confidence": 0.0} for entry in gallery.failed]
+    if len(gallery) == 0:
+        return failed
 
-        name = face.get("name_of_person") if isinstance(face.get("name_of_person"), str) else None
-        face_id = face.get("face_id")
-        face_identifier = str(face_id) if face_id is not None else None
+    unidentified = {"face_id": None, "name_of_person": None, "face_url": None, "isMatch": False, "confidence": 0.0}
+    try:
+        boxes = locateFaces(capture_image, regions=regions)
+        tracks = [
+            _tracked_match(system_id, gallery, box) if matching == "tracked" else None
+            for box in boxes
+        ]
+        probes = iter(encodeFacesAt(capture_image, [box for box, track in zip(boxes, tracks) if track is None]))
+    except Exception as exc:
+        return [{**unidentified, "error": str(exc)}] + failed
 
-        try:
-            raw_result = recognizeFace(face_url, capture_base64)
-            formatted = _format_face_result(raw_result)
-            match_payload = {
-                "face_id": face_identifier,
-                "name_of_person": name,
-                "face_url": face_url,
-                **formatted,
-            }
-        except RequestException as exc:
-            match_payload = {
-                "face_id": face_identifier,
-                "name_of_person": name,
-                "face_url": face_url,
-                "isMatch": False,
-                "confidence": 0.0,
-                "error": f"Face asset fetch failed: {exc}",
-            }
-        except Exception as exc:
-            match_payload = {
-                "face_id": face_identifier,
-                "name_of_person": name,
-                "face_url": face_url,
-                "isMatch": False,
-                "confidence": 0.0,
-                "error": str(exc),
+    if not boxes:
+        return [{**unidentified, "result": "No faces found in one or both images."}] + failed
+
+    recent = match_tracker.recent(system_id) if matching != "exhaustive" else []
+    identified = []
+    for face_index, (box, track) in enumerate(zip(boxes, tracks)):
+        if track is not None:
+            match_tracker.count("tracked_reuses")
+            ranked, reuses = [{**track["match"], "tracked": True}], track["reuses"] + 1
+        else:
+            probe = next(probes)
+            ranked = gallery.match_among(probe, recent, FACE_EARLY_EXIT_DISTANCE) if recent else None
+            if ranked is not None:
+                match_tracker.count("recent_hits")
+            else:
+                ranked = gallery.match(probe)
+                if matching != "exhaustive":
+                    match_tracker.count("full_scans")
+            reuses = 0
+        if ranked and ranked[0]["isMatch"]:
+            identified.append((box, {key: value for key, value in ranked[0].items() if key != "tracked"}, reuses))
+        for match in ranked:
+            matches.append({
+                **match,
+                "face_index": face_index,
+                "face_box": box,
+                "result": "OK" if match["isMatch"] else "The faces do not match.",
+            })
+
+    if matching != "exhaustive":
+        match_tracker.observe(system_id, identified)
+    return matches + failed
+
+
+def _tracked_match(system_id: Any, gallery: Any, box: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The previous frame's track for box, unless its face has since left the roster."""
+    track = match_tracker.tracked(system_id, box)
+    if track is None:
+        return None
+    key = (str(track["match"].get("face_id") or ""), str(track["match"].get("face_url") or ""))
+    return track if gallery.embedding_for(key) is not None else None
+
+
+def _refresh_system_gallery(system_id: Any, rows: Any) -> None:
+    """Cache the written roster and re-encode its gallery (and ANN index) as soon as a roster write returns."""
+    motion_gate.forget(_coerce_system_identifier(system_id))
+    record = _store_system_record(system_id, rows)
+    faces = record.get("faces") if record else None
+    if not isinstance(faces, list):
+        return
+    try:
+        getSystemGallery(_coerce_system_identifier(system_id), [face for face in faces if isinstance(face, dict)])
+    except Exception as exc:
+        print(f"Failed to refresh face gallery for system {system_id}: {exc}")
+
+
+def _write_monitored_snapshot(system_id: int, image_url: Optional[str], payload: Any) -> None:
+    updateMonitoredSnapshot(system_id=system_id, image_url=image_url, data=payload)
+    _snapshot_written_at[system_id] = time.monotonic()
+    _snapshot_pending.pop(system_id, None)
+
+
+def _schedule_snapshot_flush(system_id: int, delay: float) -> None:
+    """Queue a trailing snapshot write for system_id once delay has passed, unless one is already scheduled."""
+    with _snapshot_timers_lock:
+        if system_id in _snapshot_timers:
+            return
+        timer = threading.Timer(delay, _submit_snapshot_flush, args=(system_id,))
+        timer.daemon = True
+        _snapshot_timers[system_id] = timer
+    timer.start()
+
+
+def _submit_snapshot_flush(system_id: int) -> None:
+    with _snapshot_timers_lock:
+        _snapshot_timers.pop(system_id, None)
+    # Same key as the capture jobs, so the flush runs in order with them on one queue worker.
+    if not persistence_queue.submit(_flush_monitored_snapshot, system_id, key=system_id):
+        print(f"Persistence queue full; trailing snapshot for system {system_id} waits for the next capture")
+
+
+def _flush_monitored_snapshot(system_id: int) -> None:
+    """Write the newest result skipped by the snapshot interval; raises so the queue can retry."""
+    pending = _snapshot_pending.get(system_id)
+    if pending is None:
+        return
+    wait = MONITORED_SNAPSHOT_INTERVAL_SECONDS - (time.monotonic() - _snapshot_written_at.get(system_id, float("-inf")))
+    if wait > 0:
+        _schedule_snapshot_flush(system_id, wait)
+        return
+    _write_monitored_snapshot(system_id, *pending)
+
+
+def _persist_capture(system_id: int, frame_bytes: bytes, payload: Any) -> None:
+    """Upload the monitored frame and, at most every MONITORED_SNAPSHOT_INTERVAL_SECONDS, store its URL and results.
+
+    Raises so the queue can retry. Per-frame history lives in monitoring_events;
+    systems_data only keeps a recent snapshot, written in a single UPDATE. A
+    result that falls inside the interval is kept and written when the
+    interval ends, so the last frame of a burst is never lost.
+    """
+    upload = uploadImageBytesToDetectSafetyMeasure(system_id=str(system_id), data=frame_bytes)
+    upload_success = isinstance(upload, dict) and upload.get('success') is True
+    upload_url = upload.get('url') if isinstance(upload, dict) else None
+    if not upload_success:
+        error_detail = upload.get('error') if isinstance(upload, dict) else "unknown upload response"
+        raise ValueError(f"Failed to upload monitored image: {error_detail}")
+    image_url = upload_url if isinstance(upload_url, str) and upload_url.strip() else None
+
+    # Jobs for one system run in order on one queue worker, so this check-then-write does not race.
+    wait = MONITORED_SNAPSHOT_INTERVAL_SECONDS - (time.monotonic() - _snapshot_written_at.get(system_id, float("-inf")))
+    if wait > 0:
+        _snapshot_pending[system_id] = (image_url, payload)
+        _schedule_snapshot_flush(system_id, wait)
+        return
+    _write_monitored_snapshot(system_id, image_url, payload)
+
+
+def _monitoring_event(system_id: int, detections: Any, face_matches: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compact record of one capture: detector hits plus the best roster match of every recognised face."""
+    compact_detections = [
+        {
+            "label": item.get("label"),
+            "score": round(float(item["score"]), 3) if isinstance(item.get("score"), (int, float)) else None,
+            "box": item.get("box"),
+        }
+        for item in detections if isinstance(item, dict)
+    ] if isinstance(detections, list) else []
+
+    recognised: Dict[int, Dict[str, Any]] = {}
+    located = set()
+    for match in face_matches:
+        face_index = match.get("face_index")
+        if face_index is None:
+            continue
+        located.add(face_index)
+        if match.get("isMatch") and face_index not in recognised:
+            recognised[face_index] = {
+                "face_id": match.get("face_id"),
+                "name_of_person": match.get("name_of_person"),
+                "confidence": round(float(match.get("confidence") or 0.0), 3),
+                "face_box": match.get("face_box"),
             }
 
-        matches.append(match_payload)
+    return {
+        "system_id": system_id,
+        "captured_at": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+        "detections": compact_detections,
+        "faces": list(recognised.values()),
+        "unidentified_faces": len(located) - len(recognised),
+    }
 
-    return matches
+
+def _parse_event_time(value: Optional[str], name: str) -> Optional[str]:
+    """Normalise an ISO-8601 query bound to the UTC form events are stored with."""
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO-8601 timestamp")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _event_time(value: Any) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _event_key(event: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Identify a monitoring event by its content, whether it is still buffered or read back from the table."""
+    return (
+        str(event.get("system_id")),
+        _event_time(event.get("captured_at")),
+        json.dumps(event.get("detections"), sort_keys=True),
+        json.dumps(event.get("faces"), sort_keys=True),
+        event.get("unidentified_faces"),
+    )
 
 
 def _merge_detections_with_faces(detections: Any, face_matches: List[Dict[str, Any]]) -> Any:
@@ -213,13 +503,277 @@ def _merge_detections_with_faces(detections: Any, face_matches: List[Dict[str, A
     return {"recognized_faces": matches_payload}
 
 
+def _frame_metadata(name: str) -> Optional[str]:
+    """Read capture metadata from the query string, a multipart form field or an X- header."""
+    header = "X-" + "-".join(part.capitalize() for part in name.split("_"))
+    value = request.args.get(name) or request.form.get(name) or request.headers.get(header)
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def _read_binary_frame() -> Optional[bytes]:
+    """Return the raw encoded frame from a multipart 'image' field or an image/* request body."""
+    upload = request.files.get('image')
+    if upload is not None:
+        return upload.read() or None
+    content_type = (request.content_type or "").split(";", 1)[0].strip().lower()
+    if content_type.startswith("image/") or content_type == "application/octet-stream":
+        return request.get_data(cache=False) or None
+    return None
+
+
+def _enrollment_item(name_of_person: Any, data: Optional[bytes]) -> Dict[str, Any]:
+    if not isinstance(name_of_person, str) or not name_of_person.strip():
+        return {"name_of_person": None, "error": "name_of_person required"}
+    if not data:
+        return {"name_of_person": name_of_person.strip(), "error": "image required"}
+    if len(data) > ENROLL_MAX_IMAGE_BYTES:
+        return {"name_of_person": name_of_person.strip(), "error": f"image larger than {ENROLL_MAX_IMAGE_BYTES} bytes"}
+    return {"name_of_person": name_of_person.strip(), "data": data}
+
+
+def _read_enrollment_archive(archive_bytes: bytes, max_faces: int) -> List[Dict[str, Any]]:
+    """One enrollment item per image in a zip archive, named after the file (e.g. "Jane Doe.jpg").
+
+    The entry count and total uncompressed size come from the zip directory
+    and are checked before anything is decompressed, so a small archive cannot
+    expand into more than ENROLL_MAX_ARCHIVE_BYTES of memory.
+    """
+    items = []
+    with zipfile.ZipFile(io.BytesIO(archive_bytes)) as archive:
+        entries = []
+        for info in archive.infolist():
+            path = Path(info.filename)
+            if info.is_dir() or path.name.startswith(".") or path.suffix.lower() not in ENROLL_IMAGE_SUFFIXES:
+                continue
+            entries.append((info, path))
+        if len(entries) > max_faces:
+            raise RequestEntityTooLarge(f"at most {ENROLL_MAX_FACES} faces per request")
+        if sum(info.file_size for info, _ in entries if info.file_size <= ENROLL_MAX_IMAGE_BYTES) > ENROLL_MAX_ARCHIVE_BYTES:
+            raise RequestEntityTooLarge(f"archive images expand to more than {ENROLL_MAX_ARCHIVE_BYTES} bytes")
+        for info, path in entries:
+            if info.file_size > ENROLL_MAX_IMAGE_BYTES:
+                items.append({"name_of_person": path.stem, "error": f"image larger than {ENROLL_MAX_IMAGE_BYTES} bytes"})
+                continue
+            items.append(_enrollment_item(path.stem, archive.read(info)))
+    return items
+
+
+def _read_enrollment_items() -> Tuple[Optional[Any], List[Dict[str, Any]]]:
+    """Return the system_id and the faces of a JSON, multipart or zip enrollment request.
+
+    JSON bodies carry {"system_id", "faces": [{"name_of_person", "face_base64"}]}.
+    Multipart requests carry repeated 'faces' files (named by the matching
+    'names' field or else by their file name) and/or a zip 'archive'; a bare
+    application/zip body is read as the archive. Entries that cannot be read
+    come back with an "error" instead of "data".
+    """
+    if request.is_json:
+        payload = request.get_json(silent=True) or {}
+        faces = payload.get('faces')
+        if isinstance(faces, list) and len(faces) > ENROLL_MAX_FACES:
+            raise RequestEntityTooLarge(f"at most {ENROLL_MAX_FACES} faces per request")
+        items = []
+        for face in faces if isinstance(faces, list) else []:
+            if not isinstance(face, dict):
+                items.append({"name_of_person": None, "error": "faces entries must be objects"})
+                continue
+            face_base64 = face.get('face_base64')
+            try:
+                data = base64.b64decode(_normalize_base64_payload(face_base64), validate=True) if isinstance(face_base64, str) else None
+            except ValueError:
+                items.append({"name_of_person": face.get('name_of_person'), "error": "face_base64 is not valid base64"})
+                continue
+            items.append(_enrollment_item(face.get('name_of_person'), data))
+        return payload.get('system_id'), items
+
+    names = request.form.getlist('names')
+    uploads = request.files.getlist('faces')
+    if len(uploads) > ENROLL_MAX_FACES:
+        raise RequestEntityTooLarge(f"at most {ENROLL_MAX_FACES} faces per request")
+    items = []
+    for index, upload in enumerate(uploads):
+        name_of_person = names[index] if index < len(names) and names[index].strip() else Path(upload.filename or "").stem
+        items.append(_enrollment_item(name_of_person, upload.read()))
+
+    archive = request.files.get('archive')
+    content_type = (request.content_type or "").split(";", 1)[0].strip().lower()
+    archive_bytes = archive.read() if archive is not None else (
+        request.get_data(cache=False) if content_type in ("application/zip", "application/x-zip-compressed") else None
+    )
+    if archive_bytes:
+        try:
+            items.extend(_read_enrollment_archive(archive_bytes, ENROLL_MAX_FACES - len(items)))
+        except zipfile.BadZipFile as exc:
+            items.append({"name_of_person": None, "error": f"archive is not a valid zip file: {exc}"})
+    return _frame_metadata('system_id'), items
+
+
+def _prepare_enrollment(system_id: Any, item: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode one enrollment image and, when it holds a face, upload it to the system's bucket."""
+    try:
+        embedding = encodeFaceFromBytes(item["data"])
+    except ModelNotServedError:
+        raise
+    except Exception as exc:
+        return {"error": f"Failed to decode face image: {exc}"}
+    if embedding is None:
+        return {"error": "No face found in image"}
+
+    upload = uploadFaceImageBytesToSystem(
+        system_id=str(system_id), data=item["data"], face_id=str(system_id) + "_" + item["name_of_person"],
+    )
+    stored_face_url = upload.get('url') if isinstance(upload, dict) else None
+    if not isinstance(stored_face_url, str) or not stored_face_url.strip():
+        return {"error": f"Failed to persist face image: {upload.get('error') if isinstance(upload, dict) else upload}"}
+    return {"face": {
+        "face_url": stored_face_url,
+        "name_of_person": item["name_of_person"],
+        "embedding": [float(value) for value in embedding],
+    }}
+
+
+def _discard_enrollment_uploads(system_id: Any, futures: Dict[int, Any], items: List[Dict[str, Any]]) -> None:
+    """Stop a failed batch: cancel faces not started yet, wait for the rest and delete what they uploaded."""
+    for future in futures.values():
+        future.cancel()
+    wait(futures.values())
+    for index, future in futures.items():
+        if future.cancelled() or future.exception() is not None or "face" not in future.result():
+            continue
+        deleted = deleteFaceImageFromSystem(
+            system_id=str(system_id), face_id=str(system_id) + "_" + items[index]["name_of_person"],
+        )
+        if not deleted.get('success'):
+            print(f"Failed to delete face image of {items[index]['name_of_person']!r} for system {system_id}: {deleted.get('error')}")
+
+
+def _verify_user_face(email: str, image: Any) -> Tuple[Dict[str, Any], int]:
+    """Verify a decoded frame against the face stored for a user's email."""
+    try:
+        storage_path = f"public/{email}/face.jpg"
+        stored_face_url = getPublicUrl("user_data_bucket", storage_path)
+
+        raw_result = verifyFaceImage(stored_face_url, image)
+        return _format_face_result(raw_result), 200
+    except RequestException as exc:
+        return {"error": f"Failed to reach storage asset: {exc}"}, 502
+    except ModelNotServedError as exc:
+        return {"error": str(exc)}, 503
+    except Exception as exc:
+        return {"error": str(exc)}, 500
+
+
+motion_gate = MotionGate()
+# Room codes rarely change; other workers' entries age out after the TTL.
+room_code_cache = TTLCache(
+    name="room-codes",
+    max_size=int(os.getenv("ROOM_CODE_CACHE_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("ROOM_CODE_CACHE_TTL_SECONDS", "300")),
+)
+persistence_queue = BackgroundWorkQueue(
+    name="capture-persistence",
+    max_size=int(os.getenv("PERSISTENCE_QUEUE_SIZE", "256")),
+    workers=int(os.getenv("PERSISTENCE_WORKERS", "4")),
+    max_retries=int(os.getenv("PERSISTENCE_MAX_RETRIES", "3")),
+)
+roster_cache = VersionedRecordCache(
+    name="rosters",
+    version_field="roster_version",
+    check_interval_seconds=float(os.getenv("ROSTER_CHECK_INTERVAL_SECONDS", "5")),
+)
+face_match_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("FACE_MATCH_WORKERS", "4")),
+    thread_name_prefix="face-match",
+)
+stream_metrics = StreamMetrics()
+alert_states = AlertStateMachine()
+monitoring_events = EventBuffer(
+    name="monitoring-events",
+    flush=insertMonitoringEvents,
+    max_batch=int(os.getenv("MONITORING_BATCH_SIZE", "200")),
+    flush_interval_seconds=float(os.getenv("MONITORING_FLUSH_SECONDS", "2")),
+    max_pending=int(os.getenv("MONITORING_MAX_PENDING", "10000")),
+)
+atexit.register(monitoring_events.flush)
+# How often the latest capture result is copied onto systems_data for clients that read it there.
+MONITORED_SNAPSHOT_INTERVAL_SECONDS = float(os.getenv("MONITORED_SNAPSHOT_INTERVAL_SECONDS", "5"))
+_snapshot_written_at: Dict[int, float] = {}
+# Newest (image_url, payload) per system held back by the interval, and the timers that will write it.
+_snapshot_pending: Dict[int, Tuple[Optional[str], Any]] = {}
+_snapshot_timers: Dict[int, threading.Timer] = {}
+_snapshot_timers_lock = threading.Lock()
+enrollment_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ENROLL_WORKERS", "8")),
+    thread_name_prefix="face-enroll",
+)
+ENROLL_MAX_FACES = int(os.getenv("ENROLL_MAX_FACES", "500"))
+ENROLL_MAX_IMAGE_BYTES = int(os.getenv("ENROLL_MAX_IMAGE_BYTES", str(10 * 1024 * 1024)))
+ENROLL_IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp", ".bmp")
+# Total uncompressed size of the images in one enrollment archive.
+ENROLL_MAX_ARCHIVE_BYTES = int(os.getenv("ENROLL_MAX_ARCHIVE_BYTES", str(512 * 1024 * 1024)))
+# Largest request body (multipart, zip or JSON) Flask reads before answering 413.
+MAX_REQUEST_BYTES = int(os.getenv("MAX_REQUEST_BYTES", str(256 * 1024 * 1024)))
+match_tracker = MatchTracker()
+# Upper bound on how long a capture waits for face matching (including legacy face encoding).
+CAPTURE_FACE_DEADLINE_SECONDS = float(os.getenv("CAPTURE_FACE_DEADLINE_SECONDS", "8"))
+# "frame" searches the whole prepared frame for faces, "person" only the detector's person boxes.
+DEFAULT_FACE_REGIONS = os.getenv("FACE_REGIONS", "frame").strip().lower()
+# "exhaustive" ranks the whole roster per face; "recent" and "tracked" try recently seen people first.
+DEFAULT_FACE_MATCHING = os.getenv("FACE_MATCHING", "exhaustive").strip().lower()
+# A recently seen person this close to a face ends matching without scanning the rest of the roster.
+FACE_EARLY_EXIT_DISTANCE = float(os.getenv("FACE_EARLY_EXIT_DISTANCE", "0.45"))
+STREAM_HELLO_TIMEOUT_SECONDS = float(os.getenv("STREAM_HELLO_TIMEOUT_SECONDS", "10"))
+
 app = Flask(__name__)
+app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BYTES
 CORS(app, resources={r"/*": {"origins": "*"}}, supports_credentials=False)
+sock = Sock(app)
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(exc):
+    return {"error": exc.description}, 413
+
 
 @app.route("/")
 def hello_world():
     return "<p>Hello, World!</p>"
 
+@app.route('/models/status', methods=['GET'])
+def models_status_route():
+    return {"data": registry.stats()}, 200
+
+
+@app.route('/models/warm', methods=['POST'])
+def models_warm_route():
+    payload = request.get_json(silent=True) or {}
+    names = payload.get('models')
+    if names is not None and not isinstance(names, list):
+        return {"error": "models must be a list of model names"}, 400
+
+    try:
+        return {"data": registry.warm(names)}, 200
+    except KeyError as exc:
+        return {"error": str(exc)}, 400
+    except ModelNotServedError as exc:
+        return {"error": str(exc)}, 503
+    except Exception as exc:
+        return {"error": str(exc)}, 500
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics_route():
+    return {"data": {
+        "persistence": persistence_queue.metrics(),
+        "room_codes": room_code_cache.metrics(),
+        "rosters": roster_cache.metrics(),
+        "face_assets": face_embedding_cache.metrics(),
+        "streams": stream_metrics.metrics(),
+        "face_matching": match_tracker.metrics(),
+        "monitoring_events": monitoring_events.metrics(),
+        "alerts": alert_states.metrics(),
+    }}, 200
+
+
 @app.route('/auth/login', methods=['POST'])
 def login_route():
     payload = request.get_json() or {}
@@ -257,29 +811,21 @@ def recognize_face_route():
     # Preferred flow: verify a captured frame against the user's stored face.
     if email and image_data:
         try:
-            storage_path = f"public/{email}/face.jpg"
-            stored_face_url = (
-                supabase_client.storage
-                .from_("user_data_bucket")
-                .get_public_url(storage_path)
-            )
-
-            webcam_base64 = _normalize_base64_payload(image_data)
-            raw_result = recognizeFace(stored_face_url, webcam_base64)
-            return _format_face_result(raw_result), 200
-        except RequestException as exc:
-            return {"error": f"Failed to reach storage asset: {exc}"}, 502
+            image = bytes_to_image(base64.b64decode(_normalize_base64_payload(image_data)))
         except Exception as exc:
-            return {"error": str(exc)}, 500
+            return {"error": f"Invalid image_data: {exc}"}, 400
+        return _verify_user_face(email, image)
 
     # Legacy flow: accept two public URLs directly.
     if image_url_1 and image_url_2:
         try:
             base64_image = _download_image_as_base64(image_url_2)
-            raw_result = recognizeFace(image_url_1, base64_image)
+            raw_result = verifyFace(image_url_1, base64_image)
             return _format_face_result(raw_result), 200
         except RequestException as exc:
             return {"error": f"Failed to download comparison image: {exc}"}, 502
+        except ModelNotServedError as exc:
+            return {"error": str(exc)}, 503
         except Exception as exc:
             return {"error": str(exc)}, 500
 
@@ -288,6 +834,22 @@ def recognize_face_route():
     }, 400
 
 
+@app.route('/face/recognize/binary', methods=['POST'])
+def recognize_face_binary_route():
+    email = _frame_metadata('email')
+    if not email:
+        return {"error": "email required (query, form field or X-Email header)"}, 400
+
+    frame_bytes = _read_binary_frame()
+    if not frame_bytes:
+        return {"error": "image body required"}, 400
+    try:
+        image = bytes_to_image(frame_bytes)
+    except Exception as exc:
+        return {"error": f"Invalid image body: {exc}"}, 400
+    return _verify_user_face(email, image)
+
+
 @app.route('/face/add', methods=['POST'])
 def add_face_route():
     payload = request.get_json() or {}
@@ -415,17 +977,105 @@ def add_face_to_system_route():
     name_of_person = payload.get('name_of_person')
     if not system_id or not face_base64 or not name_of_person:
         return {"error": "system_id, face_base64 and name_of_person required"}, 400
+    try:
+        embedding = encodeFaceFromBase64(_normalize_base64_payload(face_base64))
+    except ModelNotServedError as exc:
+        return {"error": str(exc)}, 503
+    except Exception as exc:
+        return {"error": f"Failed to decode face image: {exc}"}, 400
+    if embedding is None:
+        return {"error": "No face found in face_base64"}, 400
     try:
         upload = uploadFaceImageToSystem(system_id=str(system_id), base64_image=face_base64, face_id=str(system_id)+"_"+name_of_person)
         stored_face_url = upload.get('url') if isinstance(upload, dict) else None
         if not isinstance(stored_face_url, str) or not stored_face_url.strip():
             return {"error": "Failed to persist face image"}, 500
 
-        result = updateFaceToSystem(system_id=system_id, face_url=stored_face_url, name_of_person=name_of_person)
+        result = updateFaceToSystem(
+            system_id=system_id,
+            face_url=stored_face_url,
+            name_of_person=name_of_person,
+            embedding=embedding.tolist(),
+        )
+        _refresh_system_gallery(system_id, result)
         return {"data": result}, 200
     except Exception as exc:
         return {"error": str(exc)}, 500
     
+@app.route('/systems/add-faces', methods=['POST'])
+def add_faces_to_system_route():
+    system_id, items = _read_enrollment_items()
+    if not system_id or not items:
+        return {"error": "system_id and at least one face required"}, 400
+    if len(items) > ENROLL_MAX_FACES:
+        return {"error": f"at most {ENROLL_MAX_FACES} faces per request"}, 413
+
+    # Storage paths are derived from the name, so a repeated name would overwrite an earlier image,
+    # whether it comes earlier in the batch or is already on the system's roster.
+    enrolled_names = {face.get("name_of_person") for face in _system_faces(_fetch_system_record(system_id))}
+    seen_names = set()
+    for item in items:
+        if "data" in item and item["name_of_person"] in enrolled_names:
+            item.pop("data")
+            item["error"] = "name_of_person already enrolled in this system"
+        elif "data" in item and item["name_of_person"] in seen_names:
+            item.pop("data")
+            item["error"] = "duplicate name_of_person in batch"
+        seen_names.add(item["name_of_person"])
+    if not any("data" in item for item in items):
+        return {"error": "no face in the request could be enrolled", "data": {"items": [
+            {"index": index, "name_of_person": item["name_of_person"], "error": item["error"], "success": False}
+            for index, item in enumerate(items)
+        ]}}, 400
+
+    # Each face is encoded and uploaded on the pool; the roster is then written once for the whole batch.
+    futures = {
+        index: enrollment_executor.submit(_prepare_enrollment, system_id, item)
+        for index, item in enumerate(items) if "data" in item
+    }
+    results = []
+    try:
+        for index, item in enumerate(items):
+            outcome = futures[index].result() if index in futures else {"error": item["error"]}
+            results.append({"index": index, "name_of_person": item["name_of_person"], **outcome})
+    except ModelNotServedError as exc:
+        _discard_enrollment_uploads(system_id, futures, items)
+        return {"error": str(exc)}, 503
+    except Exception as exc:
+        _discard_enrollment_uploads(system_id, futures, items)
+        return {"error": f"Failed to enroll faces: {exc}"}, 500
+
+    enrolled = [result for result in results if "face" in result]
+    if enrolled:
+        try:
+            rows = addFacesToSystem(system_id, [result["face"] for result in enrolled])
+        except Exception as exc:
+            _discard_enrollment_uploads(system_id, futures, items)
+            return {"error": f"Failed to add faces to system: {exc}", "data": {"items": [
+                {key: value for key, value in result.items() if key != "face"} for result in results
+            ]}}, 500
+        _refresh_system_gallery(system_id, rows)
+        record = rows[0] if isinstance(rows, list) and rows else rows
+        stored = record.get("faces") if isinstance(record, dict) else None
+        face_ids = {
+            face.get("face_url"): face.get("face_id")
+            for face in stored if isinstance(face, dict)
+        } if isinstance(stored, list) else {}
+        for result in enrolled:
+            result["face_id"] = face_ids.get(result["face"]["face_url"])
+            result["face_url"] = result["face"]["face_url"]
+
+    items_payload = []
+    for result in results:
+        result.pop("face", None)
+        items_payload.append({**result, "success": "error" not in result})
+    return {"data": {
+        "enrolled": len(enrolled),
+        "failed": len(results) - len(enrolled),
+        "items": items_payload,
+    }}, 200
+
+
 @app.route('/systems/remove-face', methods=['POST'])
 def remove_face_from_system_route():
     payload = request.get_json() or {}
@@ -436,13 +1086,28 @@ def remove_face_from_system_route():
         return {"error": "system_id and face_id required"}, 400
 
     try:
-        # First delete the face image from storage
-        delete_result = deleteFaceImageFromSystem(system_id=system_id, face_id=face_id)
+        record = _query_system_record(_coerce_system_identifier(system_id))
+    except LookupError as exc:
+        return {"error": str(exc)}, 404
+    except Exception as exc:
+        return {"error": str(exc)}, 500
+    face = next((face for face in _system_faces(record) if str(face.get("face_id")).strip() == str(face_id).strip()), None)
+    if face is None:
+        return {"error": "face_id not found in system faces"}, 404
+
+    try:
+        # First delete the face image from storage; it was uploaded as {system_id}_{name}, not under the face_id
+        delete_result = deleteFaceImageFromSystem(
+            system_id=system_id,
+            face_id=f"{system_id}_{face.get('name_of_person')}",
+            face_url=face.get("face_url"),
+        )
         if not delete_result.get('success'):
             return {"error": f"Failed to delete face image: {delete_result.get('error')}"}, 500
 
         # Then delete the face record from the database
         result = deleteFaceFromSystem(system_id=system_id, face_id=face_id)
+        _refresh_system_gallery(system_id, result)
         return {"data": result}, 200
     except Exception as exc:
         return {"error": str(exc)}, 500
@@ -459,6 +1124,7 @@ def delete_face_from_system_route():
 
     try:
         result = deleteFaceFromSystem(system_id=system_id, face_id=face_id)
+        _refresh_system_gallery(system_id, result)
         return {"data": result}, 200
     except Exception as exc:
         return {"error": str(exc)}, 500
@@ -472,6 +1138,12 @@ def alert_system_route():
 
     if alert_status is None:
         return {"error": "alert_status required"}, 400
+    if isinstance(alert_status, str) and alert_status.strip().lower() in ("true", "false", "1", "0"):
+        alert_status = alert_status.strip().lower() in ("true", "1")
+    elif isinstance(alert_status, int) and alert_status in (0, 1):
+        alert_status = bool(alert_status)
+    else:
+        return {"error": "alert_status must be a boolean"}, 400
 
     try:
         resolved_system_id = _resolve_system_id(system_id, room_code)
@@ -482,12 +1154,114 @@ def alert_system_route():
     except Exception as exc:
         return {"error": str(exc)}, 500
 
+    # Repeating the state this worker wrote moments ago would only rewrite the same value.
+    if not alert_states.set(resolved_system_id, alert_status):
+        return {"data": [], "unchanged": True}, 200
+
     try:
         result = alertSystem(system_id=resolved_system_id, alert_status=alert_status)
         return {"data": result}, 200
     except Exception as exc:
+        alert_states.forget(resolved_system_id)
         return {"error": str(exc)}, 500
     
+def _resolve_capture_system(system_id: Any, room_code: Optional[str]) -> Tuple[Optional[int], Optional[Tuple[Dict[str, Any], int]]]:
+    """Resolve a capture's numeric system id, or return the error response to send."""
+    try:
+        resolved_system_id = _resolve_system_id(system_id, room_code)
+    except ValueError as exc:
+        return None, ({"error": str(exc)}, 400)
+    except LookupError as exc:
+        return None, ({"error": str(exc)}, 404)
+    except Exception as exc:
+        return None, ({"error": str(exc)}, 500)
+
+    try:
+        return int(resolved_system_id), None
+    except (ValueError, TypeError):
+        return None, ({"error": "invalid system_id"}, 400)
+
+
+def _run_capture(numeric_system_id: int, frame_bytes: bytes, image: Any = None) -> Tuple[Dict[str, Any], int]:
+    """Share one decoded frame between the gate, detector, face matcher and upload; decodes frame_bytes unless image is given."""
+    if image is None:
+        try:
+            image = bytes_to_image(frame_bytes)
+        except Exception as exc:
+            return {"error": f"Invalid image: {exc}"}, 400
+
+    try:
+        system_record = _fetch_system_record(numeric_system_id)
+        capture_settings = _capture_settings(system_record)
+        inference_image, frame_transform = prepare_frame(
+            image,
+            roi=capture_settings.get("roi"),
+            max_side=capture_settings.get("inference_max_side"),
+        )
+
+        # Unchanged frames reuse the last result and skip inference, upload and DB writes.
+        thumbnail = frame_thumbnail(inference_image)
+        previous_payload = motion_gate.previous_result(numeric_system_id, thumbnail, capture_settings)
+        if previous_payload is not None:
+            return {"data": previous_payload, "skipped": True, "alert": alert_states.state(numeric_system_id)}, 200
+
+        faces = _system_faces(system_record)
+        labels = capture_settings.get("labels")
+        deadline = time.monotonic() + CAPTURE_FACE_DEADLINE_SECONDS
+        matching = capture_settings.get("face_matching", DEFAULT_FACE_MATCHING)
+        if capture_settings.get("face_regions", DEFAULT_FACE_REGIONS) == "person":
+            # Faces are only searched inside the detector's person boxes, so detection goes first.
+            raw_detections = predict_safety_measure(image=inference_image, labels=labels)
+            regions = [
+                item["box"] for item in raw_detections
+                if isinstance(item, dict) and "person" in str(item.get("label") or "") and isinstance(item.get("box"), dict)
+            ] if isinstance(raw_detections, list) else None
+            face_future = face_match_executor.submit(
+                _compare_system_faces, system_id=numeric_system_id, capture_image=inference_image,
+                faces=faces, deadline=deadline, regions=regions, matching=matching,
+            )
+        else:
+            # Face matching runs beside the detector; persistence happens after the response.
+            face_future = face_match_executor.submit(
+                _compare_system_faces, system_id=numeric_system_id, capture_image=inference_image,
+                faces=faces, deadline=deadline, matching=matching,
+            )
+            raw_detections = predict_safety_measure(image=inference_image, labels=labels)
+        detections = detections_to_original(raw_detections, frame_transform)
+        try:
+            face_matches = face_future.result(timeout=max(0.0, deadline - time.monotonic()) + 1.0)
+        except FutureTimeoutError:
+            face_matches = [{
+                "face_id": None, "name_of_person": None, "face_url": None,
+                "isMatch": False, "confidence": 0.0, "error": "Face matching timed out",
+            }]
+        face_matches = detections_to_original(face_matches, frame_transform, key="face_box")
+        combined_payload = _merge_detections_with_faces(detections, face_matches)
+        motion_gate.remember(numeric_system_id, thumbnail, combined_payload)
+        monitoring_events.add(_monitoring_event(numeric_system_id, detections, face_matches))
+
+        # The alert flag follows the smoothed detections and is only written when it flips.
+        alert_transition = alert_states.observe(
+            numeric_system_id, threat_score(detections),
+            load_state=lambda: _query_system_alert(numeric_system_id),
+        )
+        if alert_transition is not None and not persistence_queue.submit(
+            alertSystem, numeric_system_id, alert_transition, key=numeric_system_id,
+        ):
+            print(f"Persistence queue full; dropped alert transition for system {numeric_system_id}")
+
+        queued = persistence_queue.submit(
+            _persist_capture, numeric_system_id, frame_bytes, combined_payload, key=numeric_system_id,
+        )
+        if not queued:
+            print(f"Persistence queue full; dropped monitored frame for system {numeric_system_id}")
+        return {"data": combined_payload, "alert": alert_states.state(numeric_system_id)}, 200
+    except ModelNotServedError as exc:
+        return {"error": str(exc)}, 503
+    except Exception as exc:
+        return {"error": str(exc)}, 500
+
+
 @app.route('/systems/capture', methods=['POST'])
 def capture_safety_measure_route():
     payload = request.get_json() or {}
@@ -497,44 +1271,198 @@ def capture_safety_measure_route():
     if not image_data:
         return {"error": "base64_image required"}, 400
 
+    numeric_system_id, error_response = _resolve_capture_system(system_id, room_code)
+    if error_response is not None:
+        return error_response
+
     try:
-        resolved_system_id = _resolve_system_id(system_id, room_code)
+        frame_bytes = base64.b64decode(_normalize_base64_payload(image_data))
+        image = bytes_to_image(frame_bytes)
+    except Exception as exc:
+        return {"error": f"Invalid base64_image: {exc}"}, 400
+    return _run_capture(numeric_system_id, frame_bytes, image)
+
+
+@app.route('/systems/capture/binary', methods=['POST'])
+def capture_safety_measure_binary_route():
+    frame_bytes = _read_binary_frame()
+    if not frame_bytes:
+        return {"error": "image body required (image/* body or multipart 'image' field)"}, 400
+
+    numeric_system_id, error_response = _resolve_capture_system(
+        _frame_metadata('system_id'), _frame_metadata('room_code'),
+    )
+    if error_response is not None:
+        return error_response
+    try:
+        image = bytes_to_image(frame_bytes)
+    except Exception as exc:
+        return {"error": f"Invalid image body: {exc}"}, 400
+    return _run_capture(numeric_system_id, frame_bytes, image)
+
+
+def _stream_send(ws: Any, send_lock: threading.Lock, message: Dict[str, Any]) -> None:
+    with send_lock:
+        ws.send(json.dumps(message))
+
+
+def _stream_worker(ws: Any, send_lock: threading.Lock, slot: LatestFrameSlot, numeric_system_id: int) -> None:
+    """Run the capture pipeline on the newest frame of a stream and push each result back."""
+    while True:
+        item = slot.take()
+        if item is None:
+            return
+        sequence, frame_bytes = item
+        body, status = _run_capture(numeric_system_id, frame_bytes)
+        try:
+            _stream_send(ws, send_lock, {
+                "type": "result",
+                "frame": sequence,
+                "status": status,
+                "dropped": slot.dropped,
+                **body,
+            })
+        except ConnectionClosed:
+            slot.close()
+            return
+
+
+def _stream_hello(ws: Any) -> Tuple[Any, Optional[str]]:
+    """Read the system_id / room_code of a stream from its URL or its first text message."""
+    system_id = request.args.get('system_id')
+    room_code = request.args.get('room_code')
+    if system_id or room_code:
+        return system_id, room_code
+
+    message = ws.receive(timeout=STREAM_HELLO_TIMEOUT_SECONDS)
+    if not isinstance(message, str):
+        return None, None
+    try:
+        hello = json.loads(message)
+    except ValueError:
+        return None, None
+    if not isinstance(hello, dict):
+        return None, None
+    return hello.get('system_id'), hello.get('room_code')
+
+
+@sock.route('/systems/stream')
+def capture_stream_route(ws):
+    """One long-lived capture session per camera.
+
+    The system is resolved once, from the system_id / room_code query args or a
+    first {"system_id" | "room_code"} text message. After a "ready" reply the
+    camera sends binary JPEG frames (or {"base64_image": ...} text frames) and
+    receives one "result" message per processed frame. Frames that arrive
+    while inference is busy replace the pending one and count as dropped.
+    """
+    send_lock = threading.Lock()
+    try:
+        system_id, room_code = _stream_hello(ws)
+    except ConnectionClosed:
+        return
+    numeric_system_id, error_response = _resolve_capture_system(system_id, room_code)
+    if error_response is not None:
+        body, status = error_response
+        _stream_send(ws, send_lock, {"type": "error", "status": status, **body})
+        return
+
+    slot = LatestFrameSlot()
+    stream_metrics.opened()
+    worker = threading.Thread(
+        target=_stream_worker,
+        args=(ws, send_lock, slot, numeric_system_id),
+        name=f"stream-{numeric_system_id}",
+        daemon=True,
+    )
+    worker.start()
+    try:
+        _stream_send(ws, send_lock, {"type": "ready", "system_id": numeric_system_id})
+        while True:
+            message = ws.receive()
+            if isinstance(message, bytes):
+                slot.put(message)
+                continue
+            try:
+                payload = json.loads(message)
+                slot.put(base64.b64decode(_normalize_base64_payload(payload['base64_image'])))
+            except Exception as exc:
+                _stream_send(ws, send_lock, {"type": "error", "status": 400, "error": f"Invalid frame: {exc}"})
+    except ConnectionClosed:
+        pass
+    finally:
+        slot.close()
+        stream_metrics.closed(slot)
+
+
+@app.route('/systems/events', methods=['GET'])
+def system_events_route():
+    try:
+        resolved_system_id = _resolve_system_id(request.args.get('system_id'), request.args.get('room_code'))
+        since = _parse_event_time(request.args.get('since'), "since")
+        until = _parse_event_time(request.args.get('until'), "until")
+        limit = int(request.args.get('limit', 100))
     except ValueError as exc:
         return {"error": str(exc)}, 400
     except LookupError as exc:
         return {"error": str(exc)}, 404
     except Exception as exc:
         return {"error": str(exc)}, 500
-
-    numeric_system_id = resolved_system_id
+    if not 1 <= limit <= 1000:
+        return {"error": "limit must be between 1 and 1000"}, 400
+
+    # Snapshot this worker's buffer before reading the table: an event flushed in between then
+    # shows up in both and is dropped from the buffered side, instead of being missed by both.
+    buffered = monitoring_events.pending(lambda event: (
+        str(event["system_id"]) == str(resolved_system_id)
+        and (since is None or event["captured_at"] >= since)
+        and (until is None or event["captured_at"] < until)
+    ))
     try:
-        numeric_system_id = int(numeric_system_id)
-    except (ValueError, TypeError):
-        return {"error": "invalid system_id"}, 400
+        stored = list(getMonitoringEvents(resolved_system_id, since=since, until=until, limit=limit) or [])
+    except Exception as exc:
+        return {"error": str(exc)}, 500
 
-    try:
-        normalized_frame_b64 = _normalize_base64_payload(image_data)
-        image = base64_to_image(normalized_frame_b64)
+    stored_keys = {_event_key(event) for event in stored}
+    events = [{**event, "buffered": True} for event in buffered if _event_key(event) not in stored_keys] + stored
+    events.sort(key=lambda event: _event_time(event["captured_at"]), reverse=True)
+    return {"data": events[:limit]}, 200
 
-        storage_system_id = str(numeric_system_id)
-        upload = uploadImageToDetectSafetyMeasure(system_id=storage_system_id, base64_image=image_data)
-        upload_success = isinstance(upload, dict) and upload.get('success') is True
-        upload_url = upload.get('url') if isinstance(upload, dict) else None
-        if not upload_success:
-            error_detail = upload.get('error') if isinstance(upload, dict) else "unknown upload response"
-            raise ValueError(f"Failed to upload monitored image: {error_detail}")
-        if isinstance(upload_url, str) and upload_url.strip():
-            addMonitoredImageURL(system_id=numeric_system_id, image_url=upload_url)
 
-        detections = predict_safety_measure(image=image.convert("RGB"))
-        face_matches = _compare_system_faces(system_id=numeric_system_id, capture_base64=normalized_frame_b64)
-        combined_payload = _merge_detections_with_faces(detections, face_matches)
+@app.route('/systems/capture-settings', methods=['POST'])
+def capture_settings_route():
+    payload = request.get_json() or {}
+    system_id = payload.get('system_id')
+    capture_settings = payload.get('capture_settings')
+
+    if not system_id or not isinstance(capture_settings, dict):
+        return {"error": "system_id and capture_settings required"}, 400
+
+    validation_error = _validate_capture_settings(capture_settings)
+    if validation_error:
+        return {"error": validation_error}, 400
 
-        addMonitoredDataJSONB(system_id=numeric_system_id, data=combined_payload)
-        return {"data": combined_payload}, 200
+    labels = capture_settings.get('labels')
+
+    try:
+        result = updateSystemCaptureSettings(system_id=system_id, capture_settings=capture_settings)
+        _store_system_record(system_id, result)
+        motion_gate.forget(_coerce_system_identifier(system_id))
     except Exception as exc:
         return {"error": str(exc)}, 500
-    
+
+    if labels:
+        # Encode the new prompts now so the next capture only runs the image tower. The settings are
+        # already saved, so a worker without the detector (or a failed encode) just skips the warm-up.
+        try:
+            get_query_embeddings(labels)
+        except ModelNotServedError:
+            pass
+        except Exception as exc:
+            print(f"Failed to warm label embeddings for system {system_id}: {exc}")
+    return {"data": result}, 200
+
+
 @app.route('/systems/add-room-code', methods=['POST'])
 def add_room_code_route():
     payload = request.get_json() or {}
@@ -546,6 +1474,10 @@ def add_room_code_route():
 
     try:
         result = addRoomCode(system_id=system_id, room_code=room_code)
+        # Drop the system's old code and any stale owner of the new one.
+        room_code_cache.invalidate_where(
+            lambda code, cached_id: code == str(room_code).strip() or str(cached_id) == str(system_id)
+        )
         return {"data": result}, 200
     except Exception as exc:
         return {"error": str(exc)}, 500
@@ -605,6 +1537,15 @@ def update_user_info_route():
         return {"error": str(exc)}, 500
 
 
+def warm_configured_models() -> None:
+    """Load the models named in DEEPVISION_WARM_MODELS (comma separated, e.g. "detector,face")."""
+    warm_models = os.getenv("DEEPVISION_WARM_MODELS", "")
+    if warm_models.strip():
+        print(registry.warm([name.strip() for name in warm_models.split(",") if name.strip()]))
+
+
 if __name__ == "__main__":
+    # Development server; see gunicorn.conf.py for the production entry point.
+    warm_configured_models()
     app.run(debug=True)
     
\ No newline at end of file
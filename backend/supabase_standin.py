@@ -0,0 +1,509 @@
+"""In-memory stand-in for the parts of Supabase the backend talks to.
+
+Run it, then point the backend at it:
+
+    python backend/supabase_standin.py --port 54321 --users 50 --systems 20
+    SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_KEY=standin python backend/main.py
+
+It speaks enough of the real wire protocols for supabase-py:
+
+ - /auth/v1: password sign-in, sign-up, get user, logout and recovery emails.
+ - /rest/v1: select / insert / upsert / update / delete with eq, neq, gt, gte,
+   lt, lte, in and is filters, order, limit, offset and single-object reads,
+   plus /rest/v1/rpc/<name> for the functions registered in RPC_HANDLERS.
+ - /storage/v1: upload (with x-upsert), update, remove, list and public reads.
+
+Everything lives in memory and is lost on exit. Seeded users sign in as
+user<N>@standin.local / STANDIN_PASSWORD and own systems with room codes
+ROOM<N>, which is what backend/loadtest.py drives.
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+STANDIN_PASSWORD = "standin-password"
+JWT_SECRET = b"standin-jwt-secret"
+SESSION_SECONDS = 3600
+
+
+def seeded_email(index: int) -> str:
+    return f"user{index}@standin.local"
+
+
+def seeded_room_code(system_id: int) -> str:
+    return f"ROOM{system_id}"
+
+
+def _now_iso() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _jwt(claims: Dict[str, Any]) -> str:
+    header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    payload = _b64url(json.dumps(claims).encode())
+    signature = hmac.new(JWT_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64url(signature)}"
+
+
+class StandinState:
+    """Tables, auth users and storage objects shared by every request."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.passwords: Dict[str, str] = {}
+        self.tokens: Dict[str, str] = {}
+        self.objects: Dict[Tuple[str, str], Tuple[bytes, str]] = {}
+        self.sequences: Dict[str, int] = {}
+
+    def table(self, name: str) -> List[Dict[str, Any]]:
+        return self.tables.setdefault(name, [])
+
+    def next_id(self, name: str) -> int:
+        ids = [row["id"] for row in self.table(name) if isinstance(row.get("id"), int)]
+        return max(ids, default=0) + 1
+
+    def nextval(self, sequence: str, start: int = 1) -> int:
+        value = self.sequences.get(sequence, start - 1) + 1
+        self.sequences[sequence] = value
+        return value
+
+    def update_row(self, table_name: str, row: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply changes to row the way an UPDATE would, including the table's trigger."""
+        changes = dict(changes)
+        trigger = UPDATE_TRIGGERS.get(table_name)
+        if trigger is not None:
+            trigger(row, changes)
+        row.update(changes)
+        return row
+
+    def create_user(self, email: str, password: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        user = {
+            "id": str(uuid.uuid4()),
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": email,
+            "app_metadata": {"provider": "email", "providers": ["email"]},
+            "user_metadata": metadata or {},
+            "created_at": _now_iso(),
+            "updated_at": _now_iso(),
+            "confirmed_at": _now_iso(),
+            "email_confirmed_at": _now_iso(),
+        }
+        self.users[email] = user
+        self.passwords[email] = password
+        return user
+
+    def session_for(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        expires_at = int(time.time()) + SESSION_SECONDS
+        token = _jwt({
+            "sub": user["id"], "email": user["email"], "aud": "authenticated",
+            "role": "authenticated", "exp": expires_at, "iat": int(time.time()),
+        })
+        self.tokens[token] = user["email"]
+        return {
+            "access_token": token,
+            "token_type": "bearer",
+            "expires_in": SESSION_SECONDS,
+            "expires_at": expires_at,
+            "refresh_token": uuid.uuid4().hex,
+            "user": user,
+        }
+
+    def seed(self, users: int, systems: int) -> None:
+        """Create users user0..user{n-1} and systems 1..n with room codes ROOM1..ROOMn."""
+        with self.lock:
+            owners = []
+            for index in range(users):
+                user = self.create_user(seeded_email(index), STANDIN_PASSWORD)
+                owners.append(user["id"])
+                self.table("user_data").append({
+                    "id": user["id"], "email": user["email"], "name": f"User {index}",
+                    "bio": "", "image": None,
+                })
+            for system_id in range(1, systems + 1):
+                self.table("systems_data").append({
+                    "id": system_id,
+                    "owner_id": owners[(system_id - 1) % len(owners)] if owners else None,
+                    "system_name": f"System {system_id}",
+                    "room_code": seeded_room_code(system_id),
+                    "faces": [],
+                    "capture_settings": {},
+                    "roster_version": 0,
+                    "alert": 0,
+                    "monitored_image_url": None,
+                    "monitored_data": None,
+                })
+
+
+def _system_row(state: StandinState, system_id: Any) -> Dict[str, Any]:
+    for row in state.table("systems_data"):
+        if _as_text(row.get("id")) == _as_text(system_id):
+            return row
+    raise LookupError(f"system {system_id} not found")
+
+
+def _append_system_faces(state: StandinState, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    faces = params.get("p_faces")
+    if not isinstance(faces, list):
+        raise ValueError("p_faces must be a JSON array of faces")
+    row = _system_row(state, params.get("p_system_id"))
+    added = [{**face, "face_id": state.nextval("system_face_id_seq", start=10000)} for face in faces]
+    return [state.update_row("systems_data", row, {"faces": list(row.get("faces") or []) + added})]
+
+
+def _remove_system_faces(state: StandinState, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    face_ids = {str(face_id) for face_id in params.get("p_face_ids") or []}
+    row = _system_row(state, params.get("p_system_id"))
+    faces = list(row.get("faces") or [])
+    kept = [face for face in faces
+            if not isinstance(face, dict) or str(face.get("face_id") or "").strip() not in face_ids]
+    if len(kept) == len(faces):
+        raise LookupError("face_id not found in system faces")
+    return [state.update_row("systems_data", row, {"faces": kept})]
+
+
+# Functions reachable at /rest/v1/rpc/<name>: handler(state, params) -> JSON result.
+# Roster functions mirror architecture/supabase_utils/db/sql/roster_faces.sql.
+RPC_HANDLERS: Dict[str, Callable[[StandinState, Dict[str, Any]], Any]] = {
+    "check_user_verification": lambda state, params: None,
+    "create_user_profile": lambda state, params: None,
+    "append_system_faces": _append_system_faces,
+    "remove_system_faces": _remove_system_faces,
+}
+
+
+def _bump_roster_version(row: Dict[str, Any], changes: Dict[str, Any]) -> None:
+    if any(key in changes and changes[key] != row.get(key) for key in ("faces", "capture_settings")):
+        changes["roster_version"] = int(row.get("roster_version") or 0) + 1
+
+
+# Per-table before-update hooks mirroring the triggers in architecture/supabase_utils/db/sql.
+UPDATE_TRIGGERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    "systems_data": _bump_roster_version,
+}
+
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _parse_filter_value(value: str) -> Tuple[str, str]:
+    operator, _, operand = value.partition(".")
+    return operator, operand
+
+
+def _matches(row: Dict[str, Any], column: str, expression: str) -> bool:
+    operator, operand = _parse_filter_value(expression)
+    negate = operator == "not"
+    if negate:
+        operator, operand = _parse_filter_value(operand)
+    value = row.get(column)
+
+    if operator == "is":
+        result = {"null": value is None, "true": value is True, "false": value is False}.get(operand, False)
+    elif operator == "in":
+        choices = [item.strip().strip('"') for item in operand.strip("()").split(",")]
+        result = _as_text(value) in choices
+    elif operator in ("eq", "neq"):
+        result = value is not None and _as_text(value) == operand
+        result = result if operator == "eq" else not result
+    elif operator in ("gt", "gte", "lt", "lte"):
+        try:
+            left, right = float(value), float(operand)
+        except (TypeError, ValueError):
+            left, right = str(value), operand
+        result = {"gt": left > right, "gte": left >= right, "lt": left < right, "lte": left <= right}[operator]
+    else:
+        raise ValueError(f"unsupported filter operator: {operator}")
+    return not result if negate else result
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StandinState = StandinState()
+    quiet = True
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    # -- plumbing ---------------------------------------------------------
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _json_body(self) -> Any:
+        raw = self._body()
+        return json.loads(raw) if raw else None
+
+    def _send(self, status: int, payload: Any = None, content_type: str = "application/json",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        if isinstance(payload, bytes):
+            body = payload
+        else:
+            body = b"" if payload is None and status == 204 else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _route(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        try:
+            if path.startswith("/auth/v1/"):
+                return self._auth(method, path[len("/auth/v1/"):], dict(query))
+            if path.startswith("/rest/v1/rpc/"):
+                return self._rpc(path[len("/rest/v1/rpc/"):])
+            if path.startswith("/rest/v1/"):
+                return self._rest(method, path[len("/rest/v1/"):], query)
+            if path.startswith("/storage/v1/object/"):
+                return self._storage(method, path[len("/storage/v1/object/"):])
+            return self._send(404, {"message": f"no stand-in route for {path}"})
+        except ValueError as exc:
+            return self._send(400, {"code": "PGRST100", "message": str(exc), "details": None, "hint": None})
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PATCH(self):
+        self._route("PATCH")
+
+    def do_PUT(self):
+        self._route("PUT")
+
+    def do_DELETE(self):
+        self._route("DELETE")
+
+    # -- auth -------------------------------------------------------------
+
+    def _auth(self, method: str, endpoint: str, query: Dict[str, str]) -> None:
+        state = self.state
+        if endpoint == "token" and query.get("grant_type") == "password":
+            body = self._json_body() or {}
+            with state.lock:
+                email = body.get("email")
+                if email not in state.users or state.passwords.get(email) != body.get("password"):
+                    return self._send(400, {"error": "invalid_grant", "error_description": "Invalid login credentials",
+                                            "code": 400, "msg": "Invalid login credentials"})
+                return self._send(200, state.session_for(state.users[email]))
+        if endpoint == "signup":
+            body = self._json_body() or {}
+            with state.lock:
+                email = body.get("email")
+                if email in state.users:
+                    return self._send(422, {"code": 422, "error_code": "user_already_exists",
+                                            "msg": "User already registered"})
+                user = state.create_user(email, body.get("password", ""), body.get("data"))
+                return self._send(200, state.session_for(user))
+        if endpoint == "user" and method == "GET":
+            token = (self.headers.get("Authorization") or "").replace("Bearer ", "", 1)
+            with state.lock:
+                email = state.tokens.get(token)
+                if email is None:
+                    return self._send(401, {"code": 401, "msg": "invalid JWT"})
+                return self._send(200, state.users[email])
+        if endpoint in ("logout", "recover", "otp"):
+            self._body()
+            return self._send(204 if endpoint == "logout" else 200, None if endpoint == "logout" else {})
+        return self._send(404, {"code": 404, "msg": f"no stand-in auth route for {endpoint}"})
+
+    # -- PostgREST --------------------------------------------------------
+
+    def _rpc(self, name: str) -> None:
+        handler = RPC_HANDLERS.get(name)
+        if handler is None:
+            return self._send(404, {"code": "PGRST202", "message": f"Could not find the function public.{name}",
+                                    "details": None, "hint": None})
+        params = self._json_body() or {}
+        try:
+            with self.state.lock:
+                result = handler(self.state, params)
+        except (LookupError, ValueError) as exc:
+            return self._send(400, {"code": "P0001", "message": str(exc), "details": None, "hint": None})
+        return self._send(200, result)
+
+    def _rest(self, method: str, table_name: str, query: List[Tuple[str, str]]) -> None:
+        options = {key: value for key, value in query if key in ("select", "limit", "offset", "order", "on_conflict", "columns")}
+        filters = [(key, value) for key, value in query if key not in options]
+        prefer = self.headers.get("Prefer") or ""
+        state = self.state
+
+        with state.lock:
+            table = state.table(table_name)
+            if method == "POST":
+                payload = self._json_body()
+                rows = payload if isinstance(payload, list) else [payload]
+                merge = "resolution=merge-duplicates" in prefer
+                conflict = [column.strip() for column in options.get("on_conflict", "id").split(",")]
+                written = []
+                for row in rows:
+                    existing = None
+                    if merge and all(column in row for column in conflict):
+                        existing = next((item for item in table
+                                         if all(item.get(column) == row[column] for column in conflict)), None)
+                    if existing is not None:
+                        existing.update(row)
+                        written.append(existing)
+                        continue
+                    row = dict(row)
+                    row.setdefault("id", state.next_id(table_name))
+                    table.append(row)
+                    written.append(row)
+                return self._respond_rows(written, options, status=201)
+
+            matched = [row for row in table if all(_matches(row, column, expression) for column, expression in filters)]
+            if method == "PATCH":
+                changes = self._json_body() or {}
+                for row in matched:
+                    state.update_row(table_name, row, changes)
+            elif method == "DELETE":
+                state.tables[table_name] = [row for row in table if row not in matched]
+            return self._respond_rows(matched, options)
+
+    def _respond_rows(self, rows: List[Dict[str, Any]], options: Dict[str, str], status: int = 200) -> None:
+        order = options.get("order")
+        if order:
+            for clause in reversed(order.split(",")):
+                column, _, direction = clause.partition(".")
+                rows = sorted(rows, key=lambda row: (row.get(column) is None, row.get(column)),
+                              reverse=direction.startswith("desc"))
+        offset = int(options.get("offset") or 0)
+        limit = options.get("limit")
+        rows = rows[offset:offset + int(limit)] if limit else rows[offset:]
+
+        select = options.get("select", "*")
+        columns = [column.strip() for column in select.split(",") if column.strip()]
+        if "*" not in columns:
+            rows = [{column: row.get(column) for column in columns} for row in rows]
+        rows = json.loads(json.dumps(rows))
+
+        headers = {"Content-Range": f"{offset}-{offset + len(rows) - 1}/*" if rows else "*/0"}
+        if "application/vnd.pgrst.object+json" in (self.headers.get("Accept") or ""):
+            if len(rows) != 1:
+                return self._send(406, {
+                    "code": "PGRST116",
+                    "details": f"The result contains {len(rows)} rows",
+                    "hint": None,
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                })
+            return self._send(status, rows[0], headers=headers)
+        return self._send(status, rows, headers=headers)
+
+    # -- storage ----------------------------------------------------------
+
+    def _file_from_request(self) -> Tuple[bytes, str]:
+        content_type = self.headers.get("Content-Type") or "application/octet-stream"
+        body = self._body()
+        if not content_type.startswith("multipart/form-data"):
+            return body, content_type
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body
+        )
+        for part in message.iter_parts():
+            if part.get_param("name", header="content-disposition") == "file":
+                return part.get_payload(decode=True) or b"", part.get_content_type()
+        return b"", content_type
+
+    def _storage(self, method: str, rest: str) -> None:
+        state = self.state
+        if method == "GET" and rest.startswith("public/"):
+            bucket, _, path = rest[len("public/"):].partition("/")
+            with state.lock:
+                stored = state.objects.get((bucket, path))
+            if stored is None:
+                return self._send(400, {"statusCode": "404", "error": "not_found", "message": "Object not found"})
+            etag = '"' + hashlib.md5(stored[0]).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, b"", content_type=stored[1], headers={"ETag": etag})
+            return self._send(200, stored[0], content_type=stored[1], headers={"ETag": etag})
+
+        if method == "POST" and rest.startswith("list/"):
+            bucket = rest[len("list/"):]
+            prefix = (self._json_body() or {}).get("prefix", "").strip("/")
+            with state.lock:
+                names = sorted(path for stored_bucket, path in state.objects
+                               if stored_bucket == bucket and path.startswith(prefix))
+            return self._send(200, [{"name": path[len(prefix):].lstrip("/"), "id": path} for path in names])
+
+        bucket, _, path = rest.partition("/")
+        if method == "DELETE" and not path:
+            prefixes = (self._json_body() or {}).get("prefixes", [])
+            removed = []
+            with state.lock:
+                for prefix in prefixes:
+                    if state.objects.pop((bucket, prefix), None) is not None:
+                        removed.append({"name": prefix, "bucket_id": bucket})
+            return self._send(200, removed)
+
+        if method in ("POST", "PUT") and path:
+            data, content_type = self._file_from_request()
+            upsert = (self.headers.get("x-upsert") or "").lower() == "true"
+            with state.lock:
+                if method == "POST" and not upsert and (bucket, path) in state.objects:
+                    return self._send(400, {"statusCode": "409", "error": "Duplicate",
+                                            "message": "The resource already exists"})
+                state.objects[(bucket, path)] = (data, content_type)
+            return self._send(200, {"Key": f"{bucket}/{path}", "Id": str(uuid.uuid4())})
+
+        return self._send(404, {"statusCode": "404", "error": "not_found", "message": f"no stand-in storage route for {rest}"})
+
+
+def serve(host: str = "127.0.0.1", port: int = 54321, users: int = 10, systems: int = 10,
+          verbose: bool = False) -> ThreadingHTTPServer:
+    """Seed a fresh state and build the server; call serve_forever() on the result."""
+    state = StandinState()
+    state.seed(users, systems)
+    handler = type("SeededStandinHandler", (StandinHandler,), {"state": state, "quiet": not verbose})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--systems", type=int, default=10)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.users, args.systems, args.verbose)
+    print(f"Supabase stand-in on http://{args.host}:{args.port} "
+          f"({args.users} users, {args.systems} systems, password {STANDIN_PASSWORD!r})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()